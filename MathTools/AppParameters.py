@@ -0,0 +1,513 @@
+"""
+Parameter classes of the app functions declared in rcapp.xml. This file is generated, run
+    python -m rcapp.ParameterClasses rcapp.xml -o AppParameters.py
+again after changing rcapp.xml.
+"""
+
+from dataclasses import dataclass
+from typing import ClassVar
+from rcapp.ParameterClasses import DecodeParameters
+from rcapp import robotcontrolapp_pb2
+
+
+@dataclass
+class JointToCartParameters:
+    """Parameters of the app function 'jointToCart' (Convert Joint to Cart)"""
+
+    FUNCTION_NAME: ClassVar[str] = "jointToCart"
+    SIGNATURE: ClassVar[tuple] = (
+        ("source_variable", "string_value"),
+        ("target_variable", "string_value"),
+        ("abort_on_error", "bool_value"),
+        ("success_gsig", "int64_value"),
+    )
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    source_variable: str = ""
+    """Source position variable"""
+    target_variable: str = ""
+    """Target position variable"""
+    abort_on_error: bool = False
+    """Abort on error"""
+    success_gsig: int = 0
+    """Success GSig"""
+
+    @staticmethod
+    def FromGrpc(function: robotcontrolapp_pb2.AppFunction) -> "JointToCartParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != JointToCartParameters.SIGNATURE
+        ):
+            return DecodeParameters(JointToCartParameters, function)
+        return JointToCartParameters(
+            parameters[0].string_value,
+            parameters[1].string_value,
+            parameters[2].bool_value,
+            parameters[3].int64_value,
+        )
+
+
+@dataclass
+class CartToJointParameters:
+    """Parameters of the app function 'cartToJoint' (Convert Cart to Joint)"""
+
+    FUNCTION_NAME: ClassVar[str] = "cartToJoint"
+    SIGNATURE: ClassVar[tuple] = (
+        ("source_variable", "string_value"),
+        ("target_variable", "string_value"),
+        ("abort_on_error", "bool_value"),
+        ("success_gsig", "int64_value"),
+    )
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    source_variable: str = ""
+    """Source position variable"""
+    target_variable: str = ""
+    """Target position variable"""
+    abort_on_error: bool = False
+    """Abort program on error"""
+    success_gsig: int = 0
+    """Success GSig"""
+
+    @staticmethod
+    def FromGrpc(function: robotcontrolapp_pb2.AppFunction) -> "CartToJointParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != CartToJointParameters.SIGNATURE
+        ):
+            return DecodeParameters(CartToJointParameters, function)
+        return CartToJointParameters(
+            parameters[0].string_value,
+            parameters[1].string_value,
+            parameters[2].bool_value,
+            parameters[3].int64_value,
+        )
+
+
+@dataclass
+class XyzDistanceParameters:
+    """Parameters of the app function 'xyz_distance' (Calculate XYZ Distance)"""
+
+    FUNCTION_NAME: ClassVar[str] = "xyz_distance"
+    SIGNATURE: ClassVar[tuple] = (
+        ("position_a", "string_value"),
+        ("position_b", "string_value"),
+        ("target_variable", "string_value"),
+    )
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    position_a: str = ""
+    """Position variable A"""
+    position_b: str = ""
+    """Position variable B"""
+    target_variable: str = ""
+    """Target number variable"""
+
+    @staticmethod
+    def FromGrpc(function: robotcontrolapp_pb2.AppFunction) -> "XyzDistanceParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != XyzDistanceParameters.SIGNATURE
+        ):
+            return DecodeParameters(XyzDistanceParameters, function)
+        return XyzDistanceParameters(
+            parameters[0].string_value,
+            parameters[1].string_value,
+            parameters[2].string_value,
+        )
+
+
+@dataclass
+class IsNearParameters:
+    """Parameters of the app function 'is_near' (Check XYZ Distance)"""
+
+    FUNCTION_NAME: ClassVar[str] = "is_near"
+    SIGNATURE: ClassVar[tuple] = (
+        ("position_a", "string_value"),
+        ("position_b", "string_value"),
+        ("dist_max", "string_value"),
+        ("success_gsig", "int64_value"),
+    )
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    position_a: str = ""
+    """Position variable A"""
+    position_b: str = ""
+    """Position variable B"""
+    dist_max: str = ""
+    """Max. distance"""
+    success_gsig: int = 0
+    """Result GSig"""
+
+    @staticmethod
+    def FromGrpc(function: robotcontrolapp_pb2.AppFunction) -> "IsNearParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != IsNearParameters.SIGNATURE
+        ):
+            return DecodeParameters(IsNearParameters, function)
+        return IsNearParameters(
+            parameters[0].string_value,
+            parameters[1].string_value,
+            parameters[2].string_value,
+            parameters[3].int64_value,
+        )
+
+
+@dataclass
+class SqrtParameters:
+    """Parameters of the app function 'sqrt' (Square Root)"""
+
+    FUNCTION_NAME: ClassVar[str] = "sqrt"
+    SIGNATURE: ClassVar[tuple] = (
+        ("number", "string_value"),
+        ("result", "string_value"),
+    )
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    number: str = ""
+    """Number"""
+    result: str = ""
+    """Result"""
+
+    @staticmethod
+    def FromGrpc(function: robotcontrolapp_pb2.AppFunction) -> "SqrtParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != SqrtParameters.SIGNATURE
+        ):
+            return DecodeParameters(SqrtParameters, function)
+        return SqrtParameters(
+            parameters[0].string_value,
+            parameters[1].string_value,
+        )
+
+
+@dataclass
+class PowParameters:
+    """Parameters of the app function 'pow' (Exponentiation)"""
+
+    FUNCTION_NAME: ClassVar[str] = "pow"
+    SIGNATURE: ClassVar[tuple] = (
+        ("base", "string_value"),
+        ("exponent", "string_value"),
+        ("result", "string_value"),
+    )
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    base: str = ""
+    """Base"""
+    exponent: str = ""
+    """Exponent"""
+    result: str = ""
+    """Result"""
+
+    @staticmethod
+    def FromGrpc(function: robotcontrolapp_pb2.AppFunction) -> "PowParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != PowParameters.SIGNATURE
+        ):
+            return DecodeParameters(PowParameters, function)
+        return PowParameters(
+            parameters[0].string_value,
+            parameters[1].string_value,
+            parameters[2].string_value,
+        )
+
+
+@dataclass
+class MinParameters:
+    """Parameters of the app function 'min' (Minimum)"""
+
+    FUNCTION_NAME: ClassVar[str] = "min"
+    SIGNATURE: ClassVar[tuple] = (
+        ("value_a", "string_value"),
+        ("value_b", "string_value"),
+        ("result", "string_value"),
+    )
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    value_a: str = ""
+    """Number A"""
+    value_b: str = ""
+    """Number B"""
+    result: str = ""
+    """Result"""
+
+    @staticmethod
+    def FromGrpc(function: robotcontrolapp_pb2.AppFunction) -> "MinParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != MinParameters.SIGNATURE
+        ):
+            return DecodeParameters(MinParameters, function)
+        return MinParameters(
+            parameters[0].string_value,
+            parameters[1].string_value,
+            parameters[2].string_value,
+        )
+
+
+@dataclass
+class MaxParameters:
+    """Parameters of the app function 'max' (Maximum)"""
+
+    FUNCTION_NAME: ClassVar[str] = "max"
+    SIGNATURE: ClassVar[tuple] = (
+        ("value_a", "string_value"),
+        ("value_b", "string_value"),
+        ("result", "string_value"),
+    )
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    value_a: str = ""
+    """Number A"""
+    value_b: str = ""
+    """Number B"""
+    result: str = ""
+    """Result"""
+
+    @staticmethod
+    def FromGrpc(function: robotcontrolapp_pb2.AppFunction) -> "MaxParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != MaxParameters.SIGNATURE
+        ):
+            return DecodeParameters(MaxParameters, function)
+        return MaxParameters(
+            parameters[0].string_value,
+            parameters[1].string_value,
+            parameters[2].string_value,
+        )
+
+
+@dataclass
+class CopyPositionParameters:
+    """Parameters of the app function 'copy_position' (Copy Position)"""
+
+    FUNCTION_NAME: ClassVar[str] = "copy_position"
+    SIGNATURE: ClassVar[tuple] = (
+        ("from", "string_value"),
+        ("to", "string_value"),
+        ("copy_x", "bool_value"),
+        ("copy_y", "bool_value"),
+        ("copy_z", "bool_value"),
+        ("copy_a", "bool_value"),
+        ("copy_b", "bool_value"),
+        ("copy_c", "bool_value"),
+        ("copy_a1", "bool_value"),
+        ("copy_a2", "bool_value"),
+        ("copy_a3", "bool_value"),
+        ("copy_a4", "bool_value"),
+        ("copy_a5", "bool_value"),
+        ("copy_a6", "bool_value"),
+        ("copy_e1", "bool_value"),
+        ("copy_e2", "bool_value"),
+        ("copy_e3", "bool_value"),
+    )
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    from_: str = ""
+    """From variable"""
+    to: str = ""
+    """From variable"""
+    copy_x: bool = True
+    """Copy X"""
+    copy_y: bool = True
+    """Copy Y"""
+    copy_z: bool = True
+    """Copy Z"""
+    copy_a: bool = True
+    """Copy A"""
+    copy_b: bool = True
+    """Copy B"""
+    copy_c: bool = True
+    """Copy C"""
+    copy_a1: bool = True
+    """Copy A1"""
+    copy_a2: bool = True
+    """Copy A2"""
+    copy_a3: bool = True
+    """Copy A3"""
+    copy_a4: bool = True
+    """Copy A4"""
+    copy_a5: bool = True
+    """Copy A5"""
+    copy_a6: bool = True
+    """Copy A6"""
+    copy_e1: bool = True
+    """Copy E1"""
+    copy_e2: bool = True
+    """Copy E2"""
+    copy_e3: bool = True
+    """Copy E3"""
+
+    @staticmethod
+    def FromGrpc(function: robotcontrolapp_pb2.AppFunction) -> "CopyPositionParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != CopyPositionParameters.SIGNATURE
+        ):
+            return DecodeParameters(CopyPositionParameters, function)
+        return CopyPositionParameters(
+            parameters[0].string_value,
+            parameters[1].string_value,
+            parameters[2].bool_value,
+            parameters[3].bool_value,
+            parameters[4].bool_value,
+            parameters[5].bool_value,
+            parameters[6].bool_value,
+            parameters[7].bool_value,
+            parameters[8].bool_value,
+            parameters[9].bool_value,
+            parameters[10].bool_value,
+            parameters[11].bool_value,
+            parameters[12].bool_value,
+            parameters[13].bool_value,
+            parameters[14].bool_value,
+            parameters[15].bool_value,
+            parameters[16].bool_value,
+        )
+
+
+@dataclass
+class GetTimeSecondsParameters:
+    """Parameters of the app function 'get_time_seconds' (Get Seconds)"""
+
+    FUNCTION_NAME: ClassVar[str] = "get_time_seconds"
+    SIGNATURE: ClassVar[tuple] = (("target", "string_value"),)
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    target: str = ""
+    """Target variable"""
+
+    @staticmethod
+    def FromGrpc(
+        function: robotcontrolapp_pb2.AppFunction,
+    ) -> "GetTimeSecondsParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != GetTimeSecondsParameters.SIGNATURE
+        ):
+            return DecodeParameters(GetTimeSecondsParameters, function)
+        return GetTimeSecondsParameters(
+            parameters[0].string_value,
+        )
+
+
+@dataclass
+class GetTimeMinutesParameters:
+    """Parameters of the app function 'get_time_minutes' (Get Minutes)"""
+
+    FUNCTION_NAME: ClassVar[str] = "get_time_minutes"
+    SIGNATURE: ClassVar[tuple] = (("target", "string_value"),)
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    target: str = ""
+    """Target variable"""
+
+    @staticmethod
+    def FromGrpc(
+        function: robotcontrolapp_pb2.AppFunction,
+    ) -> "GetTimeMinutesParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != GetTimeMinutesParameters.SIGNATURE
+        ):
+            return DecodeParameters(GetTimeMinutesParameters, function)
+        return GetTimeMinutesParameters(
+            parameters[0].string_value,
+        )
+
+
+@dataclass
+class GetTimeHoursParameters:
+    """Parameters of the app function 'get_time_hours' (Get Hours)"""
+
+    FUNCTION_NAME: ClassVar[str] = "get_time_hours"
+    SIGNATURE: ClassVar[tuple] = (("target", "string_value"),)
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    target: str = ""
+    """Target variable"""
+
+    @staticmethod
+    def FromGrpc(function: robotcontrolapp_pb2.AppFunction) -> "GetTimeHoursParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != GetTimeHoursParameters.SIGNATURE
+        ):
+            return DecodeParameters(GetTimeHoursParameters, function)
+        return GetTimeHoursParameters(
+            parameters[0].string_value,
+        )
+
+
+@dataclass
+class WaitByVariableParameters:
+    """Parameters of the app function 'wait_by_variable' (Wait by variable)"""
+
+    FUNCTION_NAME: ClassVar[str] = "wait_by_variable"
+    SIGNATURE: ClassVar[tuple] = (("duration", "string_value"),)
+    """Tuples of parameter name and value field as declared in rcapp.xml"""
+
+    duration: str = ""
+    """Duration variable (seconds)"""
+
+    @staticmethod
+    def FromGrpc(
+        function: robotcontrolapp_pb2.AppFunction,
+    ) -> "WaitByVariableParameters":
+        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""
+        parameters = function.parameters
+        if (
+            tuple((p.name, p.WhichOneof("value")) for p in parameters)
+            != WaitByVariableParameters.SIGNATURE
+        ):
+            return DecodeParameters(WaitByVariableParameters, function)
+        return WaitByVariableParameters(
+            parameters[0].string_value,
+        )
+
+
+PARAMETER_CLASSES = {
+    "jointToCart": JointToCartParameters,
+    "cartToJoint": CartToJointParameters,
+    "xyz_distance": XyzDistanceParameters,
+    "is_near": IsNearParameters,
+    "sqrt": SqrtParameters,
+    "pow": PowParameters,
+    "min": MinParameters,
+    "max": MaxParameters,
+    "copy_position": CopyPositionParameters,
+    "get_time_seconds": GetTimeSecondsParameters,
+    "get_time_minutes": GetTimeMinutesParameters,
+    "get_time_hours": GetTimeHoursParameters,
+    "wait_by_variable": WaitByVariableParameters,
+}
+"""Parameter class by app function name"""
@@ -1,8 +1,23 @@
 import math
 import datetime
-import time
-from AppClient import AppClient
-from robotcontrolapp_pb2 import AppFunction, AppUIElement, KinematicState
+from rcapp.AppClient import AppClient
+from AppParameters import (
+    JointToCartParameters,
+    CartToJointParameters,
+    XyzDistanceParameters,
+    IsNearParameters,
+    SqrtParameters,
+    PowParameters,
+    MinParameters,
+    MaxParameters,
+    CopyPositionParameters,
+    GetTimeSecondsParameters,
+    GetTimeMinutesParameters,
+    GetTimeHoursParameters,
+    WaitByVariableParameters,
+)
+from rcapp.HandlerRegistry import app_function
+from rcapp.robotcontrolapp_pb2 import AppFunction, AppUIElement, KinematicState
 from google.protobuf.internal import containers as protobufContainers
 
 
@@ -20,43 +35,6 @@ class MathToolsApp(AppClient):
         """Gets called on remote UI update requests received from the robot control"""
         return
 
-    def _AppFunctionHandler(self, function: AppFunction):
-        """Gets called on remote app function calls received from the robot control"""
-        try:
-            # Select the app function to call
-            if function.name == "jointToCart":
-                self.JointToCart(function)
-            elif function.name == "cartToJoint":
-                self.CartToJoint(function)
-            elif function.name == "xyz_distance":
-                self.XYZDistance(function)
-            elif function.name == "is_near":
-                self.IsNear(function)
-            elif function.name == "sqrt":
-                self.SquareRoot(function)
-            elif function.name == "pow":
-                self.Exponentiation(function)
-            elif function.name == "min":
-                self.Minimum(function)
-            elif function.name == "max":
-                self.Maximum(function)
-            elif function.name == "copy_position":
-                self.CopyPosition(function)
-            elif function.name == "get_time_seconds":
-                self.GetTimeSeconds(function)
-            elif function.name == "get_time_minutes":
-                self.GetTimeMinutes(function)
-            elif function.name == "get_time_hours":
-                self.GetTimeHours(function)
-            elif function.name == "wait_by_variable":
-                self.WaitByVariable(function)
-            else:
-                self.SendFunctionFailed(function.call_id, "unknown function")
-        except Exception as ex:
-            print(f"Function call failed: {ex}")
-            self.SendFunctionFailed(function.call_id, str(ex))
-            # raise # uncomment for debugging
-
     def GetNumber(self, statement: str) -> float:
         """
         Evaluates the statement for a number or scalar variable, returns the number or variable value. This allows entering
@@ -72,35 +50,14 @@ class MathToolsApp(AppClient):
         variable = self.GetNumberVariable(statement)
         return variable.GetValue()
 
-    def GetParameter(
-        self, function: AppFunction, parameterName: str, fieldType: str
-    ) -> AppFunction.Parameter:
-        """Helper function to get the requested parameter from the parameter list"""
-        for parameter in function.parameters:
-            if parameter.name == parameterName:
-                if parameter.HasField(fieldType + "_value"):
-                    return parameter
-                else:
-                    raise RuntimeError(
-                        "invalid parameter type '"
-                        + fieldType
-                        + "' for '"
-                        + parameterName
-                        + "'"
-                    )
-        raise RuntimeError("missing parameter '" + parameterName + "'")
-
-    def JointToCart(self, function: AppFunction):
+    @app_function("jointToCart")
+    def JointToCart(self, function: AppFunction, parameters: JointToCartParameters):
         """Translates the joint components of a variable to cartesian position"""
         # Get parameters
-        sourceVariableName = self.GetParameter(
-            function, "source_variable", "string"
-        ).string_value
-        targetVariableName = self.GetParameter(
-            function, "target_variable", "string"
-        ).string_value
-        abortOnError = self.GetParameter(function, "abort_on_error", "bool").bool_value
-        successGSig = self.GetParameter(function, "success_gsig", "int64").int64_value
+        sourceVariableName = parameters.source_variable
+        targetVariableName = parameters.target_variable
+        abortOnError = parameters.abort_on_error
+        successGSig = parameters.success_gsig
 
         # Get variables
         sourceVariable = self.GetPositionVariable(sourceVariableName)
@@ -138,17 +95,14 @@ class MathToolsApp(AppClient):
                 return
         self.SendFunctionDone(function.call_id)
 
-    def CartToJoint(self, function: AppFunction):
+    @app_function("cartToJoint")
+    def CartToJoint(self, function: AppFunction, parameters: CartToJointParameters):
         """Translates the cartesian components of a variable to joint positions"""
         # Get parameters
-        sourceVariableName = self.GetParameter(
-            function, "source_variable", "string"
-        ).string_value
-        targetVariableName = self.GetParameter(
-            function, "target_variable", "string"
-        ).string_value
-        abortOnError = self.GetParameter(function, "abort_on_error", "bool").bool_value
-        successGSig = self.GetParameter(function, "success_gsig", "int64").int64_value
+        sourceVariableName = parameters.source_variable
+        targetVariableName = parameters.target_variable
+        abortOnError = parameters.abort_on_error
+        successGSig = parameters.success_gsig
 
         # Get variables
         sourceVariable = self.GetPositionVariable(sourceVariableName)
@@ -195,14 +149,13 @@ class MathToolsApp(AppClient):
                 return
         self.SendFunctionDone(function.call_id)
 
-    def XYZDistance(self, function: AppFunction):
+    @app_function("xyz_distance")
+    def XYZDistance(self, function: AppFunction, parameters: XyzDistanceParameters):
         """Calculates the cartesian distance"""
         # Get parameters
-        posAVarName = self.GetParameter(function, "position_a", "string").string_value
-        posBVarName = self.GetParameter(function, "position_b", "string").string_value
-        posResultVarName = self.GetParameter(
-            function, "target_variable", "string"
-        ).string_value
+        posAVarName = parameters.position_a
+        posBVarName = parameters.position_b
+        posResultVarName = parameters.target_variable
 
         # Get variables
         posAVar = self.GetPositionVariable(posAVarName)
@@ -217,15 +170,14 @@ class MathToolsApp(AppClient):
 
         self.SendFunctionDone(function.call_id)
 
-    def IsNear(self, function: AppFunction):
+    @app_function("is_near")
+    def IsNear(self, function: AppFunction, parameters: IsNearParameters):
         """Sets a global signal depending on whether two positions are within a given distance"""
         # Get parameters
-        posAVarName = self.GetParameter(function, "position_a", "string").string_value
-        posBVarName = self.GetParameter(function, "position_b", "string").string_value
-        distMaxStatement = self.GetParameter(
-            function, "dist_max", "string"
-        ).string_value
-        successGSig = self.GetParameter(function, "success_gsig", "int64").int64_value
+        posAVarName = parameters.position_a
+        posBVarName = parameters.position_b
+        distMaxStatement = parameters.dist_max
+        successGSig = parameters.success_gsig
 
         # Get variables
         posAVar = self.GetPositionVariable(posAVarName)
@@ -244,11 +196,12 @@ class MathToolsApp(AppClient):
 
         self.SendFunctionDone(function.call_id)
 
-    def SquareRoot(self, function: AppFunction):
+    @app_function("sqrt")
+    def SquareRoot(self, function: AppFunction, parameters: SqrtParameters):
         """Calculates the square root"""
         # Get parameters
-        numberStatement = self.GetParameter(function, "number", "string").string_value
-        resultVar = self.GetParameter(function, "result", "string").string_value
+        numberStatement = parameters.number
+        resultVar = parameters.result
 
         # Get values
         number = self.GetNumber(numberStatement)
@@ -259,14 +212,13 @@ class MathToolsApp(AppClient):
 
         self.SendFunctionDone(function.call_id)
 
-    def Exponentiation(self, function: AppFunction):
+    @app_function("pow")
+    def Exponentiation(self, function: AppFunction, parameters: PowParameters):
         """Calculates the exponentiation"""
         # Get parameters
-        baseStatement = self.GetParameter(function, "base", "string").string_value
-        expnentStatement = self.GetParameter(
-            function, "exponent", "string"
-        ).string_value
-        resultVar = self.GetParameter(function, "result", "string").string_value
+        baseStatement = parameters.base
+        expnentStatement = parameters.exponent
+        resultVar = parameters.result
 
         # Get values
         base = self.GetNumber(baseStatement)
@@ -278,12 +230,13 @@ class MathToolsApp(AppClient):
 
         self.SendFunctionDone(function.call_id)
 
-    def Minimum(self, function: AppFunction):
+    @app_function("min")
+    def Minimum(self, function: AppFunction, parameters: MinParameters):
         """Copies the minimum value to the result variable"""
         # Get parameters
-        valueAStatement = self.GetParameter(function, "value_a", "string").string_value
-        valueBStatement = self.GetParameter(function, "value_b", "string").string_value
-        resultVar = self.GetParameter(function, "result", "string").string_value
+        valueAStatement = parameters.value_a
+        valueBStatement = parameters.value_b
+        resultVar = parameters.result
 
         # Get values
         valueA = self.GetNumber(valueAStatement)
@@ -295,12 +248,13 @@ class MathToolsApp(AppClient):
 
         self.SendFunctionDone(function.call_id)
 
-    def Maximum(self, function: AppFunction):
+    @app_function("max")
+    def Maximum(self, function: AppFunction, parameters: MaxParameters):
         """Copies the maximum value to the result variable"""
         # Get parameters
-        valueAStatement = self.GetParameter(function, "value_a", "string").string_value
-        valueBStatement = self.GetParameter(function, "value_b", "string").string_value
-        resultVar = self.GetParameter(function, "result", "string").string_value
+        valueAStatement = parameters.value_a
+        valueBStatement = parameters.value_b
+        resultVar = parameters.result
 
         # Get values
         valueA = self.GetNumber(valueAStatement)
@@ -312,27 +266,28 @@ class MathToolsApp(AppClient):
 
         self.SendFunctionDone(function.call_id)
 
-    def CopyPosition(self, function: AppFunction):
+    @app_function("copy_position")
+    def CopyPosition(self, function: AppFunction, parameters: CopyPositionParameters):
         """Copies only the specified position components to the result variable"""
         # Get parameters
-        fromVariableName = self.GetParameter(function, "from", "string").string_value
-        toVariableName = self.GetParameter(function, "to", "string").string_value
-
-        copyX = self.GetParameter(function, "copy_x", "bool").bool_value
-        copyY = self.GetParameter(function, "copy_y", "bool").bool_value
-        copyZ = self.GetParameter(function, "copy_z", "bool").bool_value
-        copyA = self.GetParameter(function, "copy_a", "bool").bool_value
-        copyB = self.GetParameter(function, "copy_b", "bool").bool_value
-        copyC = self.GetParameter(function, "copy_c", "bool").bool_value
-        copyA1 = self.GetParameter(function, "copy_a1", "bool").bool_value
-        copyA2 = self.GetParameter(function, "copy_a2", "bool").bool_value
-        copyA3 = self.GetParameter(function, "copy_a3", "bool").bool_value
-        copyA4 = self.GetParameter(function, "copy_a4", "bool").bool_value
-        copyA5 = self.GetParameter(function, "copy_a5", "bool").bool_value
-        copyA6 = self.GetParameter(function, "copy_a6", "bool").bool_value
-        copyE1 = self.GetParameter(function, "copy_e1", "bool").bool_value
-        copyE2 = self.GetParameter(function, "copy_e2", "bool").bool_value
-        copyE3 = self.GetParameter(function, "copy_e3", "bool").bool_value
+        fromVariableName = parameters.from_
+        toVariableName = parameters.to
+
+        copyX = parameters.copy_x
+        copyY = parameters.copy_y
+        copyZ = parameters.copy_z
+        copyA = parameters.copy_a
+        copyB = parameters.copy_b
+        copyC = parameters.copy_c
+        copyA1 = parameters.copy_a1
+        copyA2 = parameters.copy_a2
+        copyA3 = parameters.copy_a3
+        copyA4 = parameters.copy_a4
+        copyA5 = parameters.copy_a5
+        copyA6 = parameters.copy_a6
+        copyE1 = parameters.copy_e1
+        copyE2 = parameters.copy_e2
+        copyE3 = parameters.copy_e3
 
         # Get variables
         fromVariable = self.GetPositionVariable(fromVariableName)
@@ -392,35 +347,35 @@ class MathToolsApp(AppClient):
 
         self.SendFunctionDone(function.call_id)
 
-    def GetTimeSeconds(self, function: AppFunction):
+    @app_function("get_time_seconds")
+    def GetTimeSeconds(
+        self, function: AppFunction, parameters: GetTimeSecondsParameters
+    ):
         """Gets a steadily counting time value"""
         seconds = (datetime.datetime.now() - self.__startTime).total_seconds()
-        self.SetNumberVariable(
-            self.GetParameter(function, "target", "string").string_value, seconds
-        )
+        self.SetNumberVariable(parameters.target, seconds)
         self.SendFunctionDone(function.call_id)
 
-    def GetTimeMinutes(self, function: AppFunction):
+    @app_function("get_time_minutes")
+    def GetTimeMinutes(
+        self, function: AppFunction, parameters: GetTimeMinutesParameters
+    ):
         """Gets a steadily counting time value"""
         seconds = (datetime.datetime.now() - self.__startTime).total_seconds()
-        self.SetNumberVariable(
-            self.GetParameter(function, "target", "string").string_value, seconds / 60
-        )
+        self.SetNumberVariable(parameters.target, seconds / 60)
         self.SendFunctionDone(function.call_id)
 
-    def GetTimeHours(self, function: AppFunction):
+    @app_function("get_time_hours")
+    def GetTimeHours(self, function: AppFunction, parameters: GetTimeHoursParameters):
         """Gets a steadily counting time value"""
         seconds = (datetime.datetime.now() - self.__startTime).total_seconds()
-        self.SetNumberVariable(
-            self.GetParameter(function, "target", "string").string_value,
-            seconds / (60 * 60),
-        )
+        self.SetNumberVariable(parameters.target, seconds / (60 * 60))
         self.SendFunctionDone(function.call_id)
 
-    def WaitByVariable(self, function: AppFunction):
-        """Gets a steadily counting time value"""
-        durationSeconds = self.GetNumberVariable(
-            self.GetParameter(function, "duration", "string").string_value
-        ).GetValue()
-        time.sleep(durationSeconds)
-        self.SendFunctionDone(function.call_id)
+    @app_function("wait_by_variable")
+    def WaitByVariable(
+        self, function: AppFunction, parameters: WaitByVariableParameters
+    ):
+        """Waits for the duration given by a number variable, this does not block a thread while waiting"""
+        durationSeconds = self.GetNumberVariable(parameters.duration).GetValue()
+        self.SendFunctionDoneAfter(function.call_id, durationSeconds)
@@ -1,5 +1,6 @@
 import sys
 from time import sleep
+from rcapp.AppFunctionDispatcher import AppFunctionDispatcher
 from MathToolsApp import MathToolsApp
 
 # Start the app
@@ -12,6 +13,8 @@ if len(sys.argv) > 1:
 
 # Create an instance of the app and connect. The name given here must be equal to the name in rcapp.xml.
 app = MathToolsApp("MathTools", connectionTarget)
+# Run the functions concurrently so that e.g. WaitByVariable in one robot program does not delay other calls
+app.functionDispatcher = AppFunctionDispatcher(8)
 app.Connect()
 
 try:
@@ -22,4 +25,5 @@ try:
 # Make sure to disconnect on exception
 finally:
     app.Disconnect()
+    app.functionDispatcher.Shutdown(wait=False)
     print("MathTools stopped")
@@ -1,7 +1,8 @@
 import os
-from AppClient import AppClient
-from DataTypes.Matrix44 import Matrix44
-from robotcontrolapp_pb2 import AppFunction, AppUIElement
+from rcapp.AppClient import AppClient
+from rcapp.HandlerRegistry import app_function
+from rcapp.DataTypes.Matrix44 import Matrix44
+from rcapp.robotcontrolapp_pb2 import AppFunction, AppUIElement
 from google.protobuf.internal import containers as protobufContainers
 
 
@@ -14,32 +15,14 @@ class PositionLogger(AppClient):
         """Initializes the app. Pass the app name (as defined in rcapp.xml) and socket to connect to (default: "localhost:5000")"""
         AppClient.__init__(self, appName, target)
 
-    def _AppFunctionHandler(self, function: AppFunction):
-        """Gets called on remote app function calls received from the robot control"""
-        # This prints the received function data
-        # print("Received app function:")
-        # print(function)
-
-        # Select the app function to call
-        try:
-            if function.name == "clear":
-                self.ClearLog(function)
-            elif function.name == "add_tcp":
-                self.AddTCPToLog(function)
-            elif function.name == "add_variable":
-                self.AddPosVarToLog(function)
-            else:
-                self.SendFunctionFailed(function.call_id, "unknown app function")
-        except Exception as ex:
-            self.SendFunctionFailed(function.call_id, ex)
-
     def _UiUpdateHandler(
         self, updates: protobufContainers.RepeatedCompositeFieldContainer[AppUIElement]
     ):
         """Gets called on remote UI update requests received from the robot control"""
         return
 
-    def ClearLog(self, function):
+    @app_function("clear")
+    def ClearLog(self, function: AppFunction):
         """Deletes the log file"""
         if os.path.isfile(self.logFile):
             os.remove(self.logFile)
@@ -60,22 +43,22 @@ class PositionLogger(AppClient):
                 )
             )
 
-    def AddTCPToLog(self, function):
+    @app_function("add_tcp")
+    def AddTCPToLog(self, function: AppFunction):
         """Adds the current TCP position to the CSV log"""
         self.AddToLog(self.GetTCP())
         self.SendFunctionDone(function.call_id)
 
-    def AddPosVarToLog(self, function):
+    @app_function("add_variable")
+    def AddPosVarToLog(self, function: AppFunction):
         """Adds a position from a variable to the CSV log"""
-        for parameter in function.parameters:
-            if parameter.name == "varname" and parameter.HasField("string_value"):
-                varName = parameter.string_value
+        varName = self.GetParameters(function).GetString("varname")
 
         try:
             posVar = self.GetPositionVariable(varName)
             self.AddToLog(posVar.GetCartesian())
         except RuntimeError as ex:
-            self.SendFunctionFailed(function.call_id, ex)
+            self.SendFunctionFailed(function.call_id, str(ex))
             return
 
         self.SendFunctionDone(function.call_id)
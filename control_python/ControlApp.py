@@ -1,13 +1,12 @@
-from AppClient import AppClient
-from robotcontrolapp_pb2 import (
+from rcapp.AppClient import AppClient, SNAPSHOT_MOTION_STATE, SNAPSHOT_ROBOT_STATE
+from rcapp.HandlerRegistry import MODE_POOL, UI_NUMBERFIELD, UI_TEXTFIELD, ui_event
+from rcapp.robotcontrolapp_pb2 import (
     AppFunction,
     AppUIElement,
-    ButtonState,
     ListFilesResponse,
     ReferencingState,
     RunState,
 )
-from google.protobuf.internal import containers as protobufContainers
 
 
 class ControlApp(AppClient):
@@ -34,143 +33,194 @@ class ControlApp(AppClient):
         """Gets called on remote app function calls received from the robot control"""
         return
 
-    def _UiUpdateHandler(
-        self, updates: protobufContainers.RepeatedCompositeFieldContainer[AppUIElement]
-    ):
-        """Gets called on remote UI update requests received from the robot control"""
-        for update in updates:
-            if update.state.HasField("button_state"):
-                # Handle buttons
-                isClicked = update.state.button_state == ButtonState.CLICKED
-                if isClicked:
-                    # Init
-                    if update.element_name == "buttonReset":
-                        self.ResetErrors()
-                    elif update.element_name == "buttonEnable":
-                        self.EnableMotors()
-                    elif update.element_name == "buttonDisable":
-                        self.DisableMotors()
-                    elif update.element_name == "buttonReferenceAll":
-                        self.ReferenceAllJoints(False)
-                    elif update.element_name == "buttonReferenceA1":
-                        self.ReferenceJoints([0], [])  # only A1 (index 0)
-                    elif update.element_name == "buttonReferenceProgram":
-                        self.ReferenceAllJoints(True)
-
-                    # Velocity override
-                    elif update.element_name == "buttonFaster":
-                        self.ExampleFaster()
-                    elif update.element_name == "buttonSlower":
-                        self.ExampleSlower()
-
-                    # Programs
-                    elif update.element_name == "buttonProgramStart":
-                        self.StartMotionProgram()
-                    elif update.element_name == "buttonProgramStop":
-                        self.StopMotionProgram()
-                    elif update.element_name == "buttonProgramPause":
-                        self.PauseMotionProgram()
-                    elif update.element_name == "buttonProgramSingle":
-                        self.SetMotionProgramSingle()
-                    elif update.element_name == "buttonProgramRepeat":
-                        self.SetMotionProgramRepeat()
-                    elif update.element_name == "buttonProgramStep":
-                        self.SetMotionProgramStep()
-                    elif update.element_name == "buttonMotionProgramLoad":
-                        self.LoadMotionProgram(self.__motionProgramFile)
-                    elif update.element_name == "buttonMotionProgramUnload":
-                        self.UnloadMotionProgram()
-                    elif update.element_name == "buttonLogicProgramLoad":
-                        self.LoadLogicProgram(self.__logicProgramFile)
-                    elif update.element_name == "buttonLogicProgramUnload":
-                        self.UnloadLogicProgram()
-
-                    # Move To
-                    elif update.element_name == "buttonMoveToStop":
-                        self.MoveToStop()
-                    elif update.element_name == "buttonMoveToJoint":
-                        self.ExampleMoveToJoint()
-                    elif update.element_name == "buttonMoveToJointRelative":
-                        self.ExampleMoveToJointRelative()
-                    elif update.element_name == "buttonMoveToCart":
-                        self.ExampleMoveToCart()
-                    elif update.element_name == "buttonMoveToCartBaseRelative":
-                        self.ExampleMoveToCartRelativeBase()
-                    elif update.element_name == "buttonMoveToCartToolRelative":
-                        self.ExampleMoveToCartRelativeTool()
-                    elif update.element_name == "buttonProgramUploadSampleFile":
-                        self.ExampleUploadSampleProgramFromFile()
-                    elif update.element_name == "buttonProgramUploadSampleMemory":
-                        self.ExampleUploadSampleProgramFromMemory()
-                    elif update.element_name == "buttonProgramDownloadSampleFile":
-                        self.ExampleDownloadSampleProgramToFile()
-                    elif update.element_name == "buttonProgramDownloadSampleMemory":
-                        self.ExampleDownloadSampleProgramToMemory()
-                    elif update.element_name == "buttonProgramList":
-                        self.ExampleListPrograms()
-
-                    # Digital IO
-                    elif update.element_name == "buttonDIn22True":
-                        self.SetDigitalInput(21, True)
-                    elif update.element_name == "buttonDIn22False":
-                        self.SetDigitalInput(21, False)
-                    elif update.element_name == "buttonDOut22True":
-                        self.SetDigitalOutput(21, True)
-                    elif update.element_name == "buttonDOut22False":
-                        self.SetDigitalOutput(21, False)
-                    elif update.element_name == "buttonGSig2True":
-                        self.SetGlobalSignal(1, True)
-                    elif update.element_name == "buttonGSig2False":
-                        self.SetGlobalSignal(1, False)
-
-            elif update.state.HasField("textfield_state"):
-                # Handle text boxes
-                if update.element_name == "textboxMotionProgramFile":
-                    self.__motionProgramFile = update.state.textfield_state.current_text
-                elif update.element_name == "textboxLogicProgramFile":
-                    self.__logicProgramFile = update.state.textfield_state.current_text
-
-            elif update.state.HasField("numberfield_state"):
-                # Handle number boxes
-                if update.element_name == "numberboxMoveToJointA1":
-                    self.__moveToJointsA1Target = (
-                        update.state.numberfield_state.current_number
-                    )
-                elif update.element_name == "numberboxMoveToJointE1":
-                    self.__moveToJointsE1Target = (
-                        update.state.numberfield_state.current_number
-                    )
-                elif update.element_name == "numberboxMoveToJointSpeed":
-                    self.__moveToJointSpeed = (
-                        update.state.numberfield_state.current_number
-                    )
-                    if self.__moveToJointSpeed < 0:
-                        self.__moveToJointSpeed = 0
-                        self.SetNumber(
-                            "numberboxMoveToJointSpeed", self.__moveToJointSpeed
-                        )
-                    elif self.__moveToJointSpeed > 100:
-                        self.__moveToJointSpeed = 100
-                        self.SetNumber(
-                            "numberboxMoveToJointSpeed", self.__moveToJointSpeed
-                        )
-                elif update.element_name == "numberboxMoveToLinearX":
-                    self.__moveToCartXTarget = (
-                        update.state.numberfield_state.current_number
-                    )
-                elif update.element_name == "numberboxMoveToLinearE1":
-                    self.__moveToCartE1Target = (
-                        update.state.numberfield_state.current_number
-                    )
-                elif update.element_name == "numberboxMoveToLinearSpeed":
-                    self.__moveToCartSpeed = (
-                        update.state.numberfield_state.current_number
-                    )
-                    if self.__moveToCartSpeed < 0:
-                        self.__moveToCartSpeed = 0
-                        self.SetNumber(
-                            "numberboxMoveToLinearSpeed", self.__moveToCartSpeed
-                        )
+    # Init
+    @ui_event("buttonReset")
+    def OnReset(self, update: AppUIElement):
+        self.ResetErrors()
+
+    @ui_event("buttonEnable")
+    def OnEnable(self, update: AppUIElement):
+        self.EnableMotors()
+
+    @ui_event("buttonDisable")
+    def OnDisable(self, update: AppUIElement):
+        self.DisableMotors()
+
+    @ui_event("buttonReferenceAll")
+    def OnReferenceAll(self, update: AppUIElement):
+        self.ReferenceAllJoints(False)
+
+    @ui_event("buttonReferenceA1")
+    def OnReferenceA1(self, update: AppUIElement):
+        self.ReferenceJoints([0], [])  # only A1 (index 0)
+
+    @ui_event("buttonReferenceProgram")
+    def OnReferenceProgram(self, update: AppUIElement):
+        self.ReferenceAllJoints(True)
+
+    # Velocity override
+    @ui_event("buttonFaster")
+    def OnFaster(self, update: AppUIElement):
+        self.ExampleFaster()
+
+    @ui_event("buttonSlower")
+    def OnSlower(self, update: AppUIElement):
+        self.ExampleSlower()
+
+    # Programs
+    @ui_event("buttonProgramStart")
+    def OnProgramStart(self, update: AppUIElement):
+        self.StartMotionProgram()
+
+    @ui_event("buttonProgramStop")
+    def OnProgramStop(self, update: AppUIElement):
+        self.StopMotionProgram()
+
+    @ui_event("buttonProgramPause")
+    def OnProgramPause(self, update: AppUIElement):
+        self.PauseMotionProgram()
+
+    @ui_event("buttonProgramSingle")
+    def OnProgramSingle(self, update: AppUIElement):
+        self.SetMotionProgramSingle()
+
+    @ui_event("buttonProgramRepeat")
+    def OnProgramRepeat(self, update: AppUIElement):
+        self.SetMotionProgramRepeat()
+
+    @ui_event("buttonProgramStep")
+    def OnProgramStep(self, update: AppUIElement):
+        self.SetMotionProgramStep()
+
+    @ui_event("buttonMotionProgramLoad")
+    def OnMotionProgramLoad(self, update: AppUIElement):
+        self.LoadMotionProgram(self.__motionProgramFile)
+
+    @ui_event("buttonMotionProgramUnload")
+    def OnMotionProgramUnload(self, update: AppUIElement):
+        self.UnloadMotionProgram()
+
+    @ui_event("buttonLogicProgramLoad")
+    def OnLogicProgramLoad(self, update: AppUIElement):
+        self.LoadLogicProgram(self.__logicProgramFile)
+
+    @ui_event("buttonLogicProgramUnload")
+    def OnLogicProgramUnload(self, update: AppUIElement):
+        self.UnloadLogicProgram()
+
+    # Move To
+    @ui_event("buttonMoveToStop")
+    def OnMoveToStop(self, update: AppUIElement):
+        self.MoveToStop()
+
+    @ui_event("buttonMoveToJoint")
+    def OnMoveToJoint(self, update: AppUIElement):
+        self.ExampleMoveToJoint()
+
+    @ui_event("buttonMoveToJointRelative")
+    def OnMoveToJointRelative(self, update: AppUIElement):
+        self.ExampleMoveToJointRelative()
+
+    @ui_event("buttonMoveToCart")
+    def OnMoveToCart(self, update: AppUIElement):
+        self.ExampleMoveToCart()
+
+    @ui_event("buttonMoveToCartBaseRelative")
+    def OnMoveToCartBaseRelative(self, update: AppUIElement):
+        self.ExampleMoveToCartRelativeBase()
+
+    @ui_event("buttonMoveToCartToolRelative")
+    def OnMoveToCartToolRelative(self, update: AppUIElement):
+        self.ExampleMoveToCartRelativeTool()
+
+    # File transfers may take a while, they run in a worker thread so that the UI events are not delayed
+    @ui_event("buttonProgramUploadSampleFile", mode=MODE_POOL)
+    def OnProgramUploadSampleFile(self, update: AppUIElement):
+        self.ExampleUploadSampleProgramFromFile()
+
+    @ui_event("buttonProgramUploadSampleMemory", mode=MODE_POOL)
+    def OnProgramUploadSampleMemory(self, update: AppUIElement):
+        self.ExampleUploadSampleProgramFromMemory()
+
+    @ui_event("buttonProgramDownloadSampleFile", mode=MODE_POOL)
+    def OnProgramDownloadSampleFile(self, update: AppUIElement):
+        self.ExampleDownloadSampleProgramToFile()
+
+    @ui_event("buttonProgramDownloadSampleMemory", mode=MODE_POOL)
+    def OnProgramDownloadSampleMemory(self, update: AppUIElement):
+        self.ExampleDownloadSampleProgramToMemory()
+
+    @ui_event("buttonProgramList", mode=MODE_POOL)
+    def OnProgramList(self, update: AppUIElement):
+        self.ExampleListPrograms()
+
+    # Digital IO
+    @ui_event("buttonDIn22True")
+    def OnDIn22True(self, update: AppUIElement):
+        self.SetDigitalInput(21, True)
+
+    @ui_event("buttonDIn22False")
+    def OnDIn22False(self, update: AppUIElement):
+        self.SetDigitalInput(21, False)
+
+    @ui_event("buttonDOut22True")
+    def OnDOut22True(self, update: AppUIElement):
+        self.SetDigitalOutput(21, True)
+
+    @ui_event("buttonDOut22False")
+    def OnDOut22False(self, update: AppUIElement):
+        self.SetDigitalOutput(21, False)
+
+    @ui_event("buttonGSig2True")
+    def OnGSig2True(self, update: AppUIElement):
+        self.SetGlobalSignal(1, True)
+
+    @ui_event("buttonGSig2False")
+    def OnGSig2False(self, update: AppUIElement):
+        self.SetGlobalSignal(1, False)
+
+    # Text boxes
+    @ui_event("textboxMotionProgramFile", UI_TEXTFIELD)
+    def OnMotionProgramFileChanged(self, update: AppUIElement):
+        self.__motionProgramFile = update.state.textfield_state.current_text
+
+    @ui_event("textboxLogicProgramFile", UI_TEXTFIELD)
+    def OnLogicProgramFileChanged(self, update: AppUIElement):
+        self.__logicProgramFile = update.state.textfield_state.current_text
+
+    # Number boxes
+    @ui_event("numberboxMoveToJointA1", UI_NUMBERFIELD)
+    def OnMoveToJointA1Changed(self, update: AppUIElement):
+        self.__moveToJointsA1Target = update.state.numberfield_state.current_number
+
+    @ui_event("numberboxMoveToJointE1", UI_NUMBERFIELD)
+    def OnMoveToJointE1Changed(self, update: AppUIElement):
+        self.__moveToJointsE1Target = update.state.numberfield_state.current_number
+
+    @ui_event("numberboxMoveToJointSpeed", UI_NUMBERFIELD)
+    def OnMoveToJointSpeedChanged(self, update: AppUIElement):
+        self.__moveToJointSpeed = update.state.numberfield_state.current_number
+        if self.__moveToJointSpeed < 0:
+            self.__moveToJointSpeed = 0
+            self.SetNumber("numberboxMoveToJointSpeed", self.__moveToJointSpeed)
+        elif self.__moveToJointSpeed > 100:
+            self.__moveToJointSpeed = 100
+            self.SetNumber("numberboxMoveToJointSpeed", self.__moveToJointSpeed)
+
+    @ui_event("numberboxMoveToLinearX", UI_NUMBERFIELD)
+    def OnMoveToLinearXChanged(self, update: AppUIElement):
+        self.__moveToCartXTarget = update.state.numberfield_state.current_number
+
+    @ui_event("numberboxMoveToLinearE1", UI_NUMBERFIELD)
+    def OnMoveToLinearE1Changed(self, update: AppUIElement):
+        self.__moveToCartE1Target = update.state.numberfield_state.current_number
+
+    @ui_event("numberboxMoveToLinearSpeed", UI_NUMBERFIELD)
+    def OnMoveToLinearSpeedChanged(self, update: AppUIElement):
+        self.__moveToCartSpeed = update.state.numberfield_state.current_number
+        if self.__moveToCartSpeed < 0:
+            self.__moveToCartSpeed = 0
+            self.SetNumber("numberboxMoveToLinearSpeed", self.__moveToCartSpeed)
 
     def translateReferencingState(self, state: ReferencingState) -> str:
         """Translates a referencing state to a human readable string"""
@@ -197,8 +247,12 @@ class ControlApp(AppClient):
     def UpdateUI(self):
         """Updates the status UI"""
 
+        # Get the robot state and the program states with one round trip
+        snapshot = self.GetSnapshot([SNAPSHOT_ROBOT_STATE, SNAPSHOT_MOTION_STATE])
+        robotState = snapshot.robotState
+        programState = snapshot.motionState
+
         # Section Initializing
-        robotState = self.GetRobotState()
         self.QueueSetText("textHardwareState", robotState.hardwareState)
         self.QueueSetText(
             "textReferencingStateAll",
@@ -225,7 +279,6 @@ class ControlApp(AppClient):
             self.QueueSetText("textGSig2", "OFF")
 
         # Section Motion Program
-        programState = self.GetMotionState()
         if len(programState.motionProgram.currentProgram) == 0:
             motionStr = "no program loaded"
         elif programState.motionProgram.runState != RunState.NOT_RUNNING:
@@ -260,13 +313,17 @@ class ControlApp(AppClient):
 
     def ExampleFaster(self):
         """Increases the velocity override"""
-        self.SetVelocityOverride(min(100, self.GetVelocityOverride() + 10))
-        self.SetText("textVelocityOverride", f"{self.GetVelocityOverride()} %")
+        velocityOverride = self.SetVelocityOverride(
+            min(100, self.GetVelocityOverride() + 10)
+        )
+        self.SetText("textVelocityOverride", f"{velocityOverride} %")
 
     def ExampleSlower(self):
         """Decreases the velocity override"""
-        self.SetVelocityOverride(max(0, self.GetVelocityOverride() - 10))
-        self.SetText("textVelocityOverride", f"{self.GetVelocityOverride()} %")
+        velocityOverride = self.SetVelocityOverride(
+            max(0, self.GetVelocityOverride() - 10)
+        )
+        self.SetText("textVelocityOverride", f"{velocityOverride} %")
 
     def ExampleMoveToJoint(self):
         """Example: Move to position by joint motion"""
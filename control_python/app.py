@@ -13,6 +13,8 @@ if len(sys.argv) > 1:
 
 # Create an instance of the app and connect. The name given here must be equal to the name in rcapp.xml.
 app = ControlApp("ControlApp-Python", connectionTarget)
+# Handle only the latest value while an operator types into a number box, button clicks are handled immediately
+app.uiCoalescingWindow = 0.1
 app.Connect()
 
 # time of the last example run
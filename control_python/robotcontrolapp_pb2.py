@@ -1,218 +0,0 @@
-# -*- coding: utf-8 -*-
-# Generated by the protocol buffer compiler.  DO NOT EDIT!
-# source: robotcontrolapp.proto
-# Protobuf Python Version: 5.26.1
-"""Generated protocol buffer code."""
-from google.protobuf import descriptor as _descriptor
-from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
-# @@protoc_insertion_point(imports)
-
-_sym_db = _symbol_database.Default()
-
-
-
-
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x15robotcontrolapp.proto\x12\x0frobotcontrolapp\"x\n\x13\x43\x61pabilitiesRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x19\n\x11\x61pi_version_major\x18\x02 \x01(\x05\x12\x19\n\x11\x61pi_version_minor\x18\x03 \x01(\x05\x12\x19\n\x11\x61pi_version_patch\x18\x04 \x01(\x05\"\x16\n\x14\x43\x61pabilitiesResponse\"%\n\x11SystemInfoRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\"\xca\x05\n\nSystemInfo\x12\x15\n\rversion_major\x18\x01 \x01(\x05\x12\x15\n\rversion_minor\x18\x02 \x01(\x05\x12\x15\n\rversion_patch\x18\x03 \x01(\x05\x12\x0f\n\x07version\x18\x04 \x01(\t\x12;\n\x0bsystem_type\x18\x05 \x01(\x0e\x32&.robotcontrolapp.SystemInfo.SystemType\x12\x15\n\ris_simulation\x18\x16 \x01(\x08\x12\x14\n\x0cproject_file\x18\x06 \x01(\t\x12\x15\n\rproject_title\x18\x07 \x01(\t\x12\x16\n\x0eproject_author\x18\x08 \x01(\t\x12\x12\n\nrobot_type\x18\t \x01(\t\x12\x34\n\x07voltage\x18\n \x01(\x0e\x32#.robotcontrolapp.SystemInfo.Voltage\x12\x11\n\tdevice_id\x18\x0b \x01(\t\x12\x19\n\x11\x63ycle_time_target\x18\x0c \x01(\x02\x12\x16\n\x0e\x63ycle_time_avg\x18\r \x01(\x02\x12\x16\n\x0e\x63ycle_time_max\x18\x0e \x01(\x02\x12\x16\n\x0e\x63ycle_time_min\x18\x0f \x01(\x02\x12\x10\n\x08workload\x18\x10 \x01(\x02\x12\x18\n\x10robot_axis_count\x18\x11 \x01(\r\x12\x1b\n\x13\x65xternal_axis_count\x18\x12 \x01(\r\x12\x17\n\x0ftool_axis_count\x18\x13 \x01(\r\x12\x1b\n\x13platform_axis_count\x18\x14 \x01(\r\x12\x1f\n\x17\x64igital_io_module_count\x18\x15 \x01(\r\"B\n\nSystemType\x12\t\n\x05Other\x10\x00\x12\x0b\n\x07Windows\x10\x01\x12\r\n\tRaspberry\x10\x02\x12\r\n\tLinux_x86\x10\x03\")\n\x07Voltage\x12\x0e\n\nVoltage24V\x10\x00\x12\x0e\n\nVoltage48V\x10\x01\"&\n\x12LicenseInfoRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\"\xf3\x01\n\x13LicenseInfoResponse\x12N\n\x11licensed_features\x18\x01 \x03(\x0b\x32\x33.robotcontrolapp.LicenseInfoResponse.LicenseDetails\x12\'\n\x1ftest_duration_remaining_seconds\x18\x03 \x01(\r\x1a\x63\n\x0eLicenseDetails\x12\x12\n\nfeature_id\x18\x01 \x01(\t\x12\x13\n\x0bis_licensed\x18\x02 \x01(\x08\x12\x18\n\x0b\x65xpiry_date\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_expiry_date\"%\n\x11RobotStateRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\"C\n\x17ProgramVariablesRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x16\n\x0evariable_names\x18\x02 \x03(\t\"c\n\x1aSetProgramVariablesRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x33\n\tvariables\x18\x02 \x03(\x0b\x32 .robotcontrolapp.ProgramVariable\"\x1d\n\x1bSetProgramVariablesResponse\"!\n\rGetTCPRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\")\n\x15GetMotionStateRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\"*\n\x07Vector3\x12\t\n\x01x\x18\x01 \x01(\x01\x12\t\n\x01y\x18\x02 \x01(\x01\x12\t\n\x01z\x18\x03 \x01(\x01\"\x18\n\x08Matrix44\x12\x0c\n\x04\x64\x61ta\x18\x01 \x03(\x01\"G\n\x03\x44In\x12\n\n\x02id\x18\x01 \x01(\r\x12(\n\x05state\x18\x03 \x01(\x0e\x32\x19.robotcontrolapp.DIOStateJ\x04\x08\x02\x10\x03J\x04\x08\n\x10\x0b\"y\n\x04\x44Out\x12\n\n\x02id\x18\x01 \x01(\r\x12(\n\x05state\x18\x03 \x01(\x0e\x32\x19.robotcontrolapp.DIOState\x12/\n\x0ctarget_state\x18\x04 \x01(\x0e\x32\x19.robotcontrolapp.DIOStateJ\x04\x08\x02\x10\x03J\x04\x08\n\x10\x0b\"m\n\x04GSig\x12\n\n\x02id\x18\x01 \x01(\r\x12(\n\x05state\x18\x03 \x01(\x0e\x32\x19.robotcontrolapp.DIOState\x12/\n\x0ctarget_state\x18\x04 \x01(\x0e\x32\x19.robotcontrolapp.DIOState\"\xe2\x02\n\x05Joint\x12\n\n\x02id\x18\x01 \x01(\r\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x36\n\x08position\x18\x03 \x01(\x0b\x32$.robotcontrolapp.Joint.JointPosition\x12-\n\x05state\x18\x05 \x01(\x0e\x32\x1e.robotcontrolapp.HardwareState\x12<\n\x11referencing_state\x18\x06 \x01(\x0e\x32!.robotcontrolapp.ReferencingState\x12\x19\n\x11temperature_board\x18\x07 \x01(\x02\x12\x19\n\x11temperature_motor\x18\x08 \x01(\x02\x12\x0f\n\x07\x63urrent\x18\t \x01(\x02\x12\x17\n\x0ftarget_velocity\x18\n \x01(\x02\x1a:\n\rJointPosition\x12\x10\n\x08position\x18\x01 \x01(\x01\x12\x17\n\x0ftarget_position\x18\x02 \x01(\x01\"K\n\x0cPlatformPose\x12*\n\x08position\x18\x01 \x01(\x0b\x32\x18.robotcontrolapp.Vector3\x12\x0f\n\x07heading\x18\x02 \x01(\x02\"\xad\x04\n\nRobotState\x12&\n\x03tcp\x18\x03 \x01(\x0b\x32\x19.robotcontrolapp.Matrix44\x12\x39\n\rplatform_pose\x18\x14 \x01(\x0b\x32\x1d.robotcontrolapp.PlatformPoseH\x00\x88\x01\x01\x12&\n\x06joints\x18\x04 \x03(\x0b\x32\x16.robotcontrolapp.Joint\x12\"\n\x04\x44Ins\x18\x05 \x03(\x0b\x32\x14.robotcontrolapp.DIn\x12$\n\x05\x44Outs\x18\x06 \x03(\x0b\x32\x15.robotcontrolapp.DOut\x12$\n\x05GSigs\x18\x07 \x03(\x0b\x32\x15.robotcontrolapp.GSig\x12\x1d\n\x15hardware_state_string\x18\x0b \x01(\t\x12\x38\n\x0fkinematic_state\x18\x0c \x01(\x0e\x32\x1f.robotcontrolapp.KinematicState\x12\x19\n\x11velocity_override\x18\r \x01(\x02\x12\x1a\n\x12\x63\x61rtesian_velocity\x18\x0e \x01(\x02\x12\x17\n\x0ftemperature_cpu\x18\x0f \x01(\x02\x12\x16\n\x0esupply_voltage\x18\x10 \x01(\x02\x12\x13\n\x0b\x63urrent_all\x18\x11 \x01(\x02\x12<\n\x11referencing_state\x18\x13 \x01(\x0e\x32!.robotcontrolapp.ReferencingStateB\x10\n\x0e_platform_pose\"\xdf\x06\n\x0bMotionState\x12\x41\n\x0e\x63urrent_source\x18\x01 \x01(\x0e\x32).robotcontrolapp.MotionState.MotionSource\x12\x42\n\nmotion_ipo\x18\x02 \x01(\x0b\x32..robotcontrolapp.MotionState.InterpolatorState\x12\x41\n\tlogic_ipo\x18\x03 \x01(\x0b\x32..robotcontrolapp.MotionState.InterpolatorState\x12\x43\n\x0bmove_to_ipo\x18\x04 \x01(\x0b\x32..robotcontrolapp.MotionState.InterpolatorState\x12O\n\x12position_interface\x18\x05 \x01(\x0b\x32\x33.robotcontrolapp.MotionState.PositionInterfaceState\x12\x1f\n\x12request_successful\x18\x06 \x01(\x08H\x00\x88\x01\x01\x1a\x93\x02\n\x11InterpolatorState\x12+\n\x08runstate\x18\x01 \x01(\x0e\x32\x19.robotcontrolapp.RunState\x12\x30\n\x0breplay_mode\x18\x02 \x01(\x0e\x32\x1b.robotcontrolapp.ReplayMode\x12\x19\n\x11main_program_name\x18\x03 \x01(\t\x12\x1c\n\x14\x63urrent_program_name\x18\x04 \x01(\t\x12\x1b\n\x13\x63urrent_program_idx\x18\x05 \x01(\x05\x12\x15\n\rprogram_count\x18\x06 \x01(\r\x12\x1b\n\x13\x63urrent_command_idx\x18\x07 \x01(\x05\x12\x15\n\rcommand_count\x18\x08 \x01(\r\x1aM\n\x16PositionInterfaceState\x12\x12\n\nis_enabled\x18\x01 \x01(\x08\x12\x11\n\tis_in_use\x18\x02 \x01(\x08\x12\x0c\n\x04port\x18\x03 \x01(\r\"S\n\x0cMotionSource\x12\x07\n\x03JOG\x10\x00\x12\x07\n\x03IPO\x10\x01\x12\x0b\n\x07MOVE_TO\x10\x02\x12\x16\n\x12POSITION_INTERFACE\x10\x03\x12\x0c\n\x08PLATFORM\x10\x04\x42\x15\n\x13_request_successful\"\xf5\x02\n\x19MotionInterpolatorRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x30\n\x08runstate\x18\x02 \x01(\x0e\x32\x19.robotcontrolapp.RunStateH\x00\x88\x01\x01\x12\x35\n\x0breplay_mode\x18\x03 \x01(\x0e\x32\x1b.robotcontrolapp.ReplayModeH\x01\x88\x01\x01\x12\x19\n\x0cmain_program\x18\x04 \x01(\tH\x02\x88\x01\x01\x12I\n\x08start_at\x18\x05 \x01(\x0b\x32\x32.robotcontrolapp.MotionInterpolatorRequest.StartAtH\x03\x88\x01\x01\x1a<\n\x07StartAt\x12\x14\n\x07program\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x0f\n\x07\x63ommand\x18\x02 \x01(\rB\n\n\x08_programB\x0b\n\t_runstateB\x0e\n\x0c_replay_modeB\x0f\n\r_main_programB\x0b\n\t_start_at\"X\n\x18LogicInterpolatorRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x19\n\x0cmain_program\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x0f\n\r_main_program\"S\n\x18PositionInterfaceRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x12\n\nis_enabled\x18\x02 \x01(\x08\x12\x11\n\tis_in_use\x18\x03 \x01(\x08\"\xf1\x05\n\rMoveToRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12;\n\x05joint\x18\x02 \x01(\x0b\x32*.robotcontrolapp.MoveToRequest.MoveToJointH\x00\x12\x44\n\x0ejoint_relative\x18\x03 \x01(\x0b\x32*.robotcontrolapp.MoveToRequest.MoveToJointH\x00\x12\x39\n\x04\x63\x61rt\x18\x04 \x01(\x0b\x32).robotcontrolapp.MoveToRequest.MoveToCartH\x00\x12G\n\x12\x63\x61rt_relative_base\x18\x05 \x01(\x0b\x32).robotcontrolapp.MoveToRequest.MoveToCartH\x00\x12G\n\x12\x63\x61rt_relative_tool\x18\x06 \x01(\x0b\x32).robotcontrolapp.MoveToRequest.MoveToCartH\x00\x12\x39\n\x04stop\x18\x07 \x01(\x0b\x32).robotcontrolapp.MoveToRequest.MoveToStopH\x00\x1a\x64\n\x0bMoveToJoint\x12\x14\n\x0crobot_joints\x18\x01 \x03(\x01\x12\x17\n\x0f\x65xternal_joints\x18\x02 \x03(\x01\x12\x10\n\x08velocity\x18\x03 \x01(\x02\x12\x14\n\x0c\x61\x63\x63\x65leration\x18\x04 \x01(\x02\x1a\xc6\x01\n\nMoveToCart\x12*\n\x08position\x18\x01 \x01(\x0b\x32\x18.robotcontrolapp.Vector3\x12-\n\x0borientation\x18\x02 \x01(\x0b\x32\x18.robotcontrolapp.Vector3\x12\x17\n\x0f\x65xternal_joints\x18\x03 \x03(\x01\x12\x10\n\x08velocity\x18\x04 \x01(\x02\x12\x14\n\x0c\x61\x63\x63\x65leration\x18\x05 \x01(\x02\x12\x12\n\x05\x66rame\x18\x06 \x01(\tH\x00\x88\x01\x01\x42\x08\n\x06_frame\x1a\x0c\n\nMoveToStopB\x06\n\x04type\"\xa7\x01\n\x15TargetVelocityRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x18\n\x0bvelocity_e1\x18\x02 \x01(\x02H\x00\x88\x01\x01\x12\x18\n\x0bvelocity_e2\x18\x03 \x01(\x02H\x01\x88\x01\x01\x12\x18\n\x0bvelocity_e3\x18\x04 \x01(\x02H\x02\x88\x01\x01\x42\x0e\n\x0c_velocity_e1B\x0e\n\x0c_velocity_e2B\x0e\n\x0c_velocity_e3\"\x96\x01\n\x16TargetVelocityResponse\x12\x18\n\x0bvelocity_e1\x18\x02 \x01(\x02H\x00\x88\x01\x01\x12\x18\n\x0bvelocity_e2\x18\x03 \x01(\x02H\x01\x88\x01\x01\x12\x18\n\x0bvelocity_e3\x18\x04 \x01(\x02H\x02\x88\x01\x01\x42\x0e\n\x0c_velocity_e1B\x0e\n\x0c_velocity_e2B\x0e\n\x0c_velocity_e3\"7\n\x13\x45nableMotorsRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x0e\n\x06\x65nable\x18\x02 \x01(\x08\"\x16\n\x14\x45nableMotorsResponse\"&\n\x12ResetErrorsRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\"\x15\n\x13ResetErrorsResponse\"\xa1\x01\n\x16ReferenceJointsRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x15\n\rreference_all\x18\x02 \x01(\x08\x12\x1b\n\x13referencing_program\x18\x03 \x01(\x08\x12\x1e\n\x16reference_robot_joints\x18\x04 \x03(\r\x12!\n\x19reference_external_joints\x18\x05 \x03(\r\"\x19\n\x17ReferenceJointsResponse\"I\n\x1aSetVelocityOverrideRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x19\n\x11velocity_override\x18\x02 \x01(\x02\"8\n\x1bSetVelocityOverrideResponse\x12\x19\n\x11velocity_override\x18\x01 \x01(\x02\"\x92\x01\n\x0eIOStateRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\"\n\x04\x44Ins\x18\x02 \x03(\x0b\x32\x14.robotcontrolapp.DIn\x12$\n\x05\x44Outs\x18\x03 \x03(\x0b\x32\x15.robotcontrolapp.DOut\x12$\n\x05GSigs\x18\x04 \x03(\x0b\x32\x15.robotcontrolapp.GSig\"\x11\n\x0fIOStateResponse\"6\n\x12JointToCartRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x0e\n\x06joints\x18\x02 \x03(\x01\"\x91\x01\n\x12\x43\x61rtToJointRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x0e\n\x06joints\x18\x02 \x03(\x01\x12*\n\x08position\x18\x03 \x01(\x0b\x32\x18.robotcontrolapp.Vector3\x12-\n\x0borientation\x18\x04 \x01(\x0b\x32\x18.robotcontrolapp.Vector3\"{\n\x13JointToCartResponse\x12\x37\n\x0ekinematicState\x18\x01 \x01(\x0e\x32\x1f.robotcontrolapp.KinematicState\x12+\n\x08position\x18\x02 \x01(\x0b\x32\x19.robotcontrolapp.Matrix44\"^\n\x13\x43\x61rtToJointResponse\x12\x37\n\x0ekinematicState\x18\x01 \x01(\x0e\x32\x1f.robotcontrolapp.KinematicState\x12\x0e\n\x06joints\x18\x02 \x03(\x01\"Z\n\x11UploadFileRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c\x12\x13\n\x0b\x62inary_mode\x18\x05 \x01(\x08\"C\n\x12UploadFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\x05\x65rror\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x08\n\x06_error\"9\n\x13\x44ownloadFileRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"S\n\x14\x44ownloadFileResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\x05\x65rror\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\x42\x08\n\x06_error\"2\n\x10ListFilesRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x0c\n\x04path\x18\x02 \x01(\t\"\x99\x02\n\x11ListFilesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x12\n\x05\x65rror\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x42\n\x07\x65ntries\x18\x03 \x03(\x0b\x32\x31.robotcontrolapp.ListFilesResponse.DirectoryEntry\x1a\x90\x01\n\x0e\x44irectoryEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x44\n\x04type\x18\x02 \x01(\x0e\x32\x36.robotcontrolapp.ListFilesResponse.DirectoryEntry.Type\"*\n\x04Type\x12\t\n\x05Other\x10\x00\x12\x08\n\x04\x46ile\x10\x01\x12\r\n\tDirectory\x10\x02\x42\x08\n\x06_error\"5\n\x12RemoveFilesRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\r\n\x05\x66iles\x18\x02 \x03(\t\"\xbb\x01\n\x13RemoveFilesResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x44\n\x07results\x18\x03 \x03(\x0b\x32\x33.robotcontrolapp.RemoveFilesResponse.DirectoryEntry\x1aM\n\x0e\x44irectoryEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x12\n\x05\x65rror\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x08\n\x06_error\"9\n\rDropdownState\x12\x0f\n\x07options\x18\x01 \x03(\t\x12\x17\n\x0fselected_option\x18\x02 \x01(\t\"&\n\x0eTextfieldState\x12\x14\n\x0c\x63urrent_text\x18\x01 \x01(\t\"*\n\x10NumberfieldState\x12\x16\n\x0e\x63urrent_number\x18\x01 \x01(\x01\"\x9c\x03\n\nImageState\x12>\n\nimage_data\x18\x01 \x01(\x0b\x32%.robotcontrolapp.ImageState.ImageDataH\x00\x88\x01\x01\x12>\n\nclicked_at\x18\x02 \x01(\x0b\x32%.robotcontrolapp.ImageState.ClickedAtH\x01\x88\x01\x01\x1a\x9a\x01\n\tImageData\x12\x45\n\x08\x65ncoding\x18\x01 \x01(\x0e\x32\x33.robotcontrolapp.ImageState.ImageData.ImageEncoding\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\x12\r\n\x05width\x18\x03 \x01(\r\x12\x0e\n\x06height\x18\x04 \x01(\r\"\x19\n\rImageEncoding\x12\x08\n\x04JPEG\x10\x00\x1aS\n\tClickedAt\x12\x30\n\nis_clicked\x18\x01 \x01(\x0e\x32\x1c.robotcontrolapp.ButtonState\x12\t\n\x01x\x18\x02 \x01(\x01\x12\t\n\x01y\x18\x03 \x01(\x01\x42\r\n\x0b_image_dataB\r\n\x0b_clicked_at\"\xf7\x03\n\x0c\x41ppUIElement\x12\x14\n\x0c\x65lement_name\x18\x01 \x01(\t\x12\x37\n\x05state\x18\x03 \x01(\x0b\x32(.robotcontrolapp.AppUIElement.AppUIState\x12\x17\n\nis_visible\x18\x04 \x01(\x08H\x00\x88\x01\x01\x1a\xef\x02\n\nAppUIState\x12\x34\n\x0c\x62utton_state\x18\x01 \x01(\x0e\x32\x1c.robotcontrolapp.ButtonStateH\x00\x12\x38\n\x0e\x63heckbox_state\x18\x02 \x01(\x0e\x32\x1e.robotcontrolapp.CheckboxStateH\x00\x12\x38\n\x0e\x64ropdown_state\x18\x03 \x01(\x0b\x32\x1e.robotcontrolapp.DropdownStateH\x00\x12:\n\x0ftextfield_state\x18\x04 \x01(\x0b\x32\x1f.robotcontrolapp.TextfieldStateH\x00\x12>\n\x11numberfield_state\x18\x05 \x01(\x0b\x32!.robotcontrolapp.NumberfieldStateH\x00\x12\x32\n\x0bimage_state\x18\x06 \x01(\x0b\x32\x1b.robotcontrolapp.ImageStateH\x00\x42\x07\n\x05stateB\r\n\x0b_is_visible\"\xf3\x02\n\x0b\x41ppFunction\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x63\x61ll_id\x18\x02 \x01(\x03\x12:\n\nparameters\x18\x03 \x03(\x0b\x32&.robotcontrolapp.AppFunction.Parameter\x12\r\n\x05label\x18\t \x01(\t\x12\x0f\n\x07ui_hint\x18\n \x01(\t\x1a\xe8\x01\n\tParameter\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x14\n\nbool_value\x18\x02 \x01(\x08H\x00\x12\x15\n\x0bint64_value\x18\x03 \x01(\x03H\x00\x12\x16\n\x0c\x64ouble_value\x18\x04 \x01(\x01H\x00\x12\x16\n\x0cstring_value\x18\x05 \x01(\tH\x00\x12\x31\n\rvector3_value\x18\x06 \x01(\x0b\x32\x18.robotcontrolapp.Vector3H\x00\x12\x34\n\x0f\x63\x61rtesian_value\x18\x07 \x01(\x0b\x32\x19.robotcontrolapp.Matrix44H\x00\x42\x07\n\x05value\"\xf1\x01\n\x05\x45vent\x12.\n\x08\x66unction\x18\x02 \x01(\x0b\x32\x1c.robotcontrolapp.AppFunction\x12\x31\n\nui_updates\x18\n \x03(\x0b\x32\x1d.robotcontrolapp.AppUIElement\x12I\n\x12\x64isconnect_request\x18\x03 \x01(\x0b\x32(.robotcontrolapp.Event.DisconnectRequestH\x00\x88\x01\x01\x1a#\n\x11\x44isconnectRequest\x12\x0e\n\x06reason\x18\x01 \x01(\tB\x15\n\x13_disconnect_request\"\x99\x02\n\x11ShowDialogRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12J\n\x0emessage_dialog\x18\x02 \x01(\x0b\x32\x30.robotcontrolapp.ShowDialogRequest.MessageDialogH\x00\x1al\n\rMessageDialog\x12;\n\x04type\x18\x01 \x01(\x0e\x32-.robotcontrolapp.ShowDialogRequest.DialogType\x12\r\n\x05title\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\".\n\nDialogType\x12\x08\n\x04INFO\x10\x00\x12\x0b\n\x07WARNING\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x42\x08\n\x06\x64ialog\"\x14\n\x12ShowDialogResponse\"\xd8\x04\n\x0fProgramVariable\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x06number\x18\x02 \x01(\x01H\x00\x12L\n\x08position\x18\x03 \x01(\x0b\x32\x38.robotcontrolapp.ProgramVariable.ProgramVariablePositionH\x00\x1a\xcd\x03\n\x17ProgramVariablePosition\x12W\n\x0crobot_joints\x18\x01 \x01(\x0b\x32?.robotcontrolapp.ProgramVariable.ProgramVariablePosition.JointsH\x00\x12.\n\tcartesian\x18\x02 \x01(\x0b\x32\x19.robotcontrolapp.Matrix44H\x00\x12V\n\x04\x62oth\x18\x03 \x01(\x0b\x32\x46.robotcontrolapp.ProgramVariable.ProgramVariablePosition.CartAndJointsH\x00\x12\x17\n\x0f\x65xternal_joints\x18\x04 \x03(\x01\x1a\x18\n\x06Joints\x12\x0e\n\x06joints\x18\x01 \x03(\x01\x1a\x94\x01\n\rCartAndJoints\x12U\n\x0crobot_joints\x18\x01 \x01(\x0b\x32?.robotcontrolapp.ProgramVariable.ProgramVariablePosition.Joints\x12,\n\tcartesian\x18\x02 \x01(\x0b\x32\x19.robotcontrolapp.Matrix44B\x07\n\x05valueB\x07\n\x05value\"1\n\x0e\x46\x61iledFunction\x12\x0f\n\x07\x63\x61ll_id\x18\x01 \x01(\x03\x12\x0e\n\x06reason\x18\x02 \x01(\t\"\xf6\x01\n\tAppAction\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x37\n\rset_variables\x18\x02 \x03(\x0b\x32 .robotcontrolapp.ProgramVariable\x12\x16\n\x0e\x64one_functions\x18\x05 \x03(\x03\x12\x39\n\x10\x66\x61iled_functions\x18\x06 \x03(\x0b\x32\x1f.robotcontrolapp.FailedFunction\x12\x31\n\nui_changes\x18\n \x03(\x0b\x32\x1d.robotcontrolapp.AppUIElement\x12\x18\n\x10request_ui_state\x18\x0b \x03(\t\"B\n\x11StatisticsRequest\x12\x10\n\x08\x61pp_name\x18\x01 \x01(\t\x12\x1b\n\x13reset_parts_counter\x18\x02 \x01(\x08\"\xc1\x02\n\x12StatisticsResponse\x12\x17\n\x0fuptime_complete\x18\x01 \x01(\r\x12\x13\n\x0buptime_last\x18\x02 \x01(\r\x12\x16\n\x0euptime_enabled\x18\x03 \x01(\r\x12\x15\n\ruptime_motion\x18\x04 \x01(\r\x12\x1c\n\x14program_starts_total\x18\x05 \x01(\r\x12\x1b\n\x13program_starts_last\x18\x06 \x01(\r\x12\x1d\n\x15program_duration_last\x18\x07 \x01(\x02\x12\x12\n\nparts_good\x18\x08 \x01(\x02\x12\x11\n\tparts_bad\x18\t \x01(\x02\x12$\n\x1crobot_axis_direction_changes\x18\n \x03(\r\x12\'\n\x1f\x65xternal_axis_direction_changes\x18\x0b \x03(\r*\x1d\n\x08\x44IOState\x12\x07\n\x03LOW\x10\x00\x12\x08\n\x04HIGH\x10\x01*\x97\x02\n\rHardwareState\x12\x08\n\x04OKAY\x10\x00\x12\x12\n\x0e\x45RROR_OVERTEMP\x10\x01\x12\x1b\n\x17\x45RROR_ESTOP_LOW_VOLTAGE\x10\x02\x12\x1b\n\x17\x45RROR_MOTOR_NOT_ENABLED\x10\x04\x12\x17\n\x13\x45RROR_COMMUNICATION\x10\x08\x12\x16\n\x12\x45RROR_POSITION_LAG\x10\x10\x12\x11\n\rERROR_ENCODER\x10 \x12\x15\n\x11\x45RROR_OVERCURRENT\x10@\x12\x11\n\x0c\x45RROR_DRIVER\x10\x80\x01\x12\x13\n\x0e\x45RROR_BUS_DEAD\x10\x80\x02\x12\x16\n\x11\x45RROR_MODULE_DEAD\x10\x80\x04\x12\x13\n\x0e\x45RROR_NOTREADY\x10\x80 *\xc2\x06\n\x0eKinematicState\x12\x14\n\x10KINEMATIC_NORMAL\x10\x00\x12\'\n\x1aKINEMATIC_ERROR_ErrGeneral\x10\xff\xff\xff\xff\xff\xff\xff\xff\xff\x01\x12#\n\x1fKINEMATIC_ERROR_LINKAGE_LIMITED\x10\x0c\x12#\n\x1fKINEMATIC_ERROR_JOINT_LIMIT_MIN\x10\r\x12#\n\x1fKINEMATIC_ERROR_JOINT_LIMIT_MAX\x10\x0e\x12\"\n\x1eKINEMATIC_ERROR_JOINT_DIFF_MIN\x10\x11\x12\"\n\x1eKINEMATIC_ERROR_JOINT_DIFF_MAX\x10\x12\x12&\n\"KINEMATIC_ERROR_CENTER_SINGULARITY\x10\x15\x12 \n\x1cKINEMATIC_ERROR_OUT_OF_REACH\x10\x16\x12%\n!KINEMATIC_ERROR_WRIST_SINGULARITY\x10\x17\x12!\n\x1dKINEMATIC_ERROR_TRILATERATION\x10\x1c\x12%\n!KINEMATIC_ERROR_VIRTUAL_BOX_X_POS\x10\x1e\x12%\n!KINEMATIC_ERROR_VIRTUAL_BOX_X_NEG\x10\x1f\x12%\n!KINEMATIC_ERROR_VIRTUAL_BOX_Y_POS\x10 \x12%\n!KINEMATIC_ERROR_VIRTUAL_BOX_Y_NEG\x10!\x12%\n!KINEMATIC_ERROR_VIRTUAL_BOX_Z_POS\x10\"\x12%\n!KINEMATIC_ERROR_VIRTUAL_BOX_Z_NEG\x10#\x12\x1d\n\x19KINEMATIC_ERROR_JOINT_NAN\x10\x32\x12+\n\'KINEMATIC_ERROR_VELOCITY_LIMIT_EXCEEDED\x10\x33\x12&\n\"KINEMATIC_ERROR_VARIABLE_NOT_FOUND\x10=\x12 \n\x1cKINEMATIC_ERROR_BRAKE_ACTIVE\x10\x62\x12&\n\"KINEMATIC_ERROR_MOTION_NOT_ALLOWED\x10\x63*M\n\x10ReferencingState\x12\x12\n\x0eNOT_REFERENCED\x10\x00\x12\x12\n\x0eIS_REFERENCING\x10\x01\x12\x11\n\rIS_REFERENCED\x10\x02*4\n\x08RunState\x12\x0f\n\x0bNOT_RUNNING\x10\x00\x12\x0b\n\x07RUNNING\x10\x01\x12\n\n\x06PAUSED\x10\x02*.\n\nReplayMode\x12\n\n\x06SINGLE\x10\x00\x12\n\n\x06REPEAT\x10\x01\x12\x08\n\x04STEP\x10\x02*+\n\x0b\x42uttonState\x12\x0f\n\x0bNOT_CLICKED\x10\x00\x12\x0b\n\x07\x43LICKED\x10\x01*+\n\rCheckboxState\x12\r\n\tUNCHECKED\x10\x00\x12\x0b\n\x07\x43HECKED\x10\x01\x32\x9f\x14\n\x0fRobotControlApp\x12^\n\x0fSetCapabilities\x12$.robotcontrolapp.CapabilitiesRequest\x1a%.robotcontrolapp.CapabilitiesResponse\x12H\n\x0eRecieveActions\x12\x1a.robotcontrolapp.AppAction\x1a\x16.robotcontrolapp.Event(\x01\x30\x01\x12\x43\n\x06GetTCP\x12\x1e.robotcontrolapp.GetTCPRequest\x1a\x19.robotcontrolapp.Matrix44\x12X\n\x13GetRobotStateStream\x12\".robotcontrolapp.RobotStateRequest\x1a\x1b.robotcontrolapp.RobotState0\x01\x12P\n\rGetRobotState\x12\".robotcontrolapp.RobotStateRequest\x1a\x1b.robotcontrolapp.RobotState\x12\x63\n\x13GetProgramVariables\x12(.robotcontrolapp.ProgramVariablesRequest\x1a .robotcontrolapp.ProgramVariable0\x01\x12p\n\x13SetProgramVariables\x12+.robotcontrolapp.SetProgramVariablesRequest\x1a,.robotcontrolapp.SetProgramVariablesResponse\x12[\n\x0c\x45nableMotors\x12$.robotcontrolapp.EnableMotorsRequest\x1a%.robotcontrolapp.EnableMotorsResponse\x12X\n\x0bResetErrors\x12#.robotcontrolapp.ResetErrorsRequest\x1a$.robotcontrolapp.ResetErrorsResponse\x12\x64\n\x0fReferenceJoints\x12\'.robotcontrolapp.ReferenceJointsRequest\x1a(.robotcontrolapp.ReferenceJointsResponse\x12V\n\x0eGetMotionState\x12&.robotcontrolapp.GetMotionStateRequest\x1a\x1c.robotcontrolapp.MotionState\x12\x61\n\x15SetMotionInterpolator\x12*.robotcontrolapp.MotionInterpolatorRequest\x1a\x1c.robotcontrolapp.MotionState\x12_\n\x14SetLogicInterpolator\x12).robotcontrolapp.LogicInterpolatorRequest\x1a\x1c.robotcontrolapp.MotionState\x12_\n\x14SetPositionInterface\x12).robotcontrolapp.PositionInterfaceRequest\x1a\x1c.robotcontrolapp.MotionState\x12\x46\n\x06MoveTo\x12\x1e.robotcontrolapp.MoveToRequest\x1a\x1c.robotcontrolapp.MotionState\x12\x64\n\x11SetTargetVelocity\x12&.robotcontrolapp.TargetVelocityRequest\x1a\'.robotcontrolapp.TargetVelocityResponse\x12\x61\n\x14TranslateJointToCart\x12#.robotcontrolapp.JointToCartRequest\x1a$.robotcontrolapp.JointToCartResponse\x12\x61\n\x14TranslateCartToJoint\x12#.robotcontrolapp.CartToJointRequest\x1a$.robotcontrolapp.CartToJointResponse\x12O\n\nSetIOState\x12\x1f.robotcontrolapp.IOStateRequest\x1a .robotcontrolapp.IOStateResponse\x12W\n\nUploadFile\x12\".robotcontrolapp.UploadFileRequest\x1a#.robotcontrolapp.UploadFileResponse(\x01\x12]\n\x0c\x44ownloadFile\x12$.robotcontrolapp.DownloadFileRequest\x1a%.robotcontrolapp.DownloadFileResponse0\x01\x12R\n\tListFiles\x12!.robotcontrolapp.ListFilesRequest\x1a\".robotcontrolapp.ListFilesResponse\x12X\n\x0bRemoveFiles\x12#.robotcontrolapp.RemoveFilesRequest\x1a$.robotcontrolapp.RemoveFilesResponse\x12P\n\rGetSystemInfo\x12\".robotcontrolapp.SystemInfoRequest\x1a\x1b.robotcontrolapp.SystemInfo\x12`\n\x13GetLicensedFeatures\x12#.robotcontrolapp.LicenseInfoRequest\x1a$.robotcontrolapp.LicenseInfoResponse\x12p\n\x13SetVelocityOverride\x12+.robotcontrolapp.SetVelocityOverrideRequest\x1a,.robotcontrolapp.SetVelocityOverrideResponse\x12U\n\nShowDialog\x12\".robotcontrolapp.ShowDialogRequest\x1a#.robotcontrolapp.ShowDialogResponse\x12X\n\rGetStatistics\x12\".robotcontrolapp.StatisticsRequest\x1a#.robotcontrolapp.StatisticsResponseb\x06proto3')
-
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'robotcontrolapp_pb2', _globals)
-if not _descriptor._USE_C_DESCRIPTORS:
-  DESCRIPTOR._loaded_options = None
-  _globals['_DIOSTATE']._serialized_start=10645
-  _globals['_DIOSTATE']._serialized_end=10674
-  _globals['_HARDWARESTATE']._serialized_start=10677
-  _globals['_HARDWARESTATE']._serialized_end=10956
-  _globals['_KINEMATICSTATE']._serialized_start=10959
-  _globals['_KINEMATICSTATE']._serialized_end=11793
-  _globals['_REFERENCINGSTATE']._serialized_start=11795
-  _globals['_REFERENCINGSTATE']._serialized_end=11872
-  _globals['_RUNSTATE']._serialized_start=11874
-  _globals['_RUNSTATE']._serialized_end=11926
-  _globals['_REPLAYMODE']._serialized_start=11928
-  _globals['_REPLAYMODE']._serialized_end=11974
-  _globals['_BUTTONSTATE']._serialized_start=11976
-  _globals['_BUTTONSTATE']._serialized_end=12019
-  _globals['_CHECKBOXSTATE']._serialized_start=12021
-  _globals['_CHECKBOXSTATE']._serialized_end=12064
-  _globals['_CAPABILITIESREQUEST']._serialized_start=42
-  _globals['_CAPABILITIESREQUEST']._serialized_end=162
-  _globals['_CAPABILITIESRESPONSE']._serialized_start=164
-  _globals['_CAPABILITIESRESPONSE']._serialized_end=186
-  _globals['_SYSTEMINFOREQUEST']._serialized_start=188
-  _globals['_SYSTEMINFOREQUEST']._serialized_end=225
-  _globals['_SYSTEMINFO']._serialized_start=228
-  _globals['_SYSTEMINFO']._serialized_end=942
-  _globals['_SYSTEMINFO_SYSTEMTYPE']._serialized_start=833
-  _globals['_SYSTEMINFO_SYSTEMTYPE']._serialized_end=899
-  _globals['_SYSTEMINFO_VOLTAGE']._serialized_start=901
-  _globals['_SYSTEMINFO_VOLTAGE']._serialized_end=942
-  _globals['_LICENSEINFOREQUEST']._serialized_start=944
-  _globals['_LICENSEINFOREQUEST']._serialized_end=982
-  _globals['_LICENSEINFORESPONSE']._serialized_start=985
-  _globals['_LICENSEINFORESPONSE']._serialized_end=1228
-  _globals['_LICENSEINFORESPONSE_LICENSEDETAILS']._serialized_start=1129
-  _globals['_LICENSEINFORESPONSE_LICENSEDETAILS']._serialized_end=1228
-  _globals['_ROBOTSTATEREQUEST']._serialized_start=1230
-  _globals['_ROBOTSTATEREQUEST']._serialized_end=1267
-  _globals['_PROGRAMVARIABLESREQUEST']._serialized_start=1269
-  _globals['_PROGRAMVARIABLESREQUEST']._serialized_end=1336
-  _globals['_SETPROGRAMVARIABLESREQUEST']._serialized_start=1338
-  _globals['_SETPROGRAMVARIABLESREQUEST']._serialized_end=1437
-  _globals['_SETPROGRAMVARIABLESRESPONSE']._serialized_start=1439
-  _globals['_SETPROGRAMVARIABLESRESPONSE']._serialized_end=1468
-  _globals['_GETTCPREQUEST']._serialized_start=1470
-  _globals['_GETTCPREQUEST']._serialized_end=1503
-  _globals['_GETMOTIONSTATEREQUEST']._serialized_start=1505
-  _globals['_GETMOTIONSTATEREQUEST']._serialized_end=1546
-  _globals['_VECTOR3']._serialized_start=1548
-  _globals['_VECTOR3']._serialized_end=1590
-  _globals['_MATRIX44']._serialized_start=1592
-  _globals['_MATRIX44']._serialized_end=1616
-  _globals['_DIN']._serialized_start=1618
-  _globals['_DIN']._serialized_end=1689
-  _globals['_DOUT']._serialized_start=1691
-  _globals['_DOUT']._serialized_end=1812
-  _globals['_GSIG']._serialized_start=1814
-  _globals['_GSIG']._serialized_end=1923
-  _globals['_JOINT']._serialized_start=1926
-  _globals['_JOINT']._serialized_end=2280
-  _globals['_JOINT_JOINTPOSITION']._serialized_start=2222
-  _globals['_JOINT_JOINTPOSITION']._serialized_end=2280
-  _globals['_PLATFORMPOSE']._serialized_start=2282
-  _globals['_PLATFORMPOSE']._serialized_end=2357
-  _globals['_ROBOTSTATE']._serialized_start=2360
-  _globals['_ROBOTSTATE']._serialized_end=2917
-  _globals['_MOTIONSTATE']._serialized_start=2920
-  _globals['_MOTIONSTATE']._serialized_end=3783
-  _globals['_MOTIONSTATE_INTERPOLATORSTATE']._serialized_start=3321
-  _globals['_MOTIONSTATE_INTERPOLATORSTATE']._serialized_end=3596
-  _globals['_MOTIONSTATE_POSITIONINTERFACESTATE']._serialized_start=3598
-  _globals['_MOTIONSTATE_POSITIONINTERFACESTATE']._serialized_end=3675
-  _globals['_MOTIONSTATE_MOTIONSOURCE']._serialized_start=3677
-  _globals['_MOTIONSTATE_MOTIONSOURCE']._serialized_end=3760
-  _globals['_MOTIONINTERPOLATORREQUEST']._serialized_start=3786
-  _globals['_MOTIONINTERPOLATORREQUEST']._serialized_end=4159
-  _globals['_MOTIONINTERPOLATORREQUEST_STARTAT']._serialized_start=4040
-  _globals['_MOTIONINTERPOLATORREQUEST_STARTAT']._serialized_end=4100
-  _globals['_LOGICINTERPOLATORREQUEST']._serialized_start=4161
-  _globals['_LOGICINTERPOLATORREQUEST']._serialized_end=4249
-  _globals['_POSITIONINTERFACEREQUEST']._serialized_start=4251
-  _globals['_POSITIONINTERFACEREQUEST']._serialized_end=4334
-  _globals['_MOVETOREQUEST']._serialized_start=4337
-  _globals['_MOVETOREQUEST']._serialized_end=5090
-  _globals['_MOVETOREQUEST_MOVETOJOINT']._serialized_start=4767
-  _globals['_MOVETOREQUEST_MOVETOJOINT']._serialized_end=4867
-  _globals['_MOVETOREQUEST_MOVETOCART']._serialized_start=4870
-  _globals['_MOVETOREQUEST_MOVETOCART']._serialized_end=5068
-  _globals['_MOVETOREQUEST_MOVETOSTOP']._serialized_start=5070
-  _globals['_MOVETOREQUEST_MOVETOSTOP']._serialized_end=5082
-  _globals['_TARGETVELOCITYREQUEST']._serialized_start=5093
-  _globals['_TARGETVELOCITYREQUEST']._serialized_end=5260
-  _globals['_TARGETVELOCITYRESPONSE']._serialized_start=5263
-  _globals['_TARGETVELOCITYRESPONSE']._serialized_end=5413
-  _globals['_ENABLEMOTORSREQUEST']._serialized_start=5415
-  _globals['_ENABLEMOTORSREQUEST']._serialized_end=5470
-  _globals['_ENABLEMOTORSRESPONSE']._serialized_start=5472
-  _globals['_ENABLEMOTORSRESPONSE']._serialized_end=5494
-  _globals['_RESETERRORSREQUEST']._serialized_start=5496
-  _globals['_RESETERRORSREQUEST']._serialized_end=5534
-  _globals['_RESETERRORSRESPONSE']._serialized_start=5536
-  _globals['_RESETERRORSRESPONSE']._serialized_end=5557
-  _globals['_REFERENCEJOINTSREQUEST']._serialized_start=5560
-  _globals['_REFERENCEJOINTSREQUEST']._serialized_end=5721
-  _globals['_REFERENCEJOINTSRESPONSE']._serialized_start=5723
-  _globals['_REFERENCEJOINTSRESPONSE']._serialized_end=5748
-  _globals['_SETVELOCITYOVERRIDEREQUEST']._serialized_start=5750
-  _globals['_SETVELOCITYOVERRIDEREQUEST']._serialized_end=5823
-  _globals['_SETVELOCITYOVERRIDERESPONSE']._serialized_start=5825
-  _globals['_SETVELOCITYOVERRIDERESPONSE']._serialized_end=5881
-  _globals['_IOSTATEREQUEST']._serialized_start=5884
-  _globals['_IOSTATEREQUEST']._serialized_end=6030
-  _globals['_IOSTATERESPONSE']._serialized_start=6032
-  _globals['_IOSTATERESPONSE']._serialized_end=6049
-  _globals['_JOINTTOCARTREQUEST']._serialized_start=6051
-  _globals['_JOINTTOCARTREQUEST']._serialized_end=6105
-  _globals['_CARTTOJOINTREQUEST']._serialized_start=6108
-  _globals['_CARTTOJOINTREQUEST']._serialized_end=6253
-  _globals['_JOINTTOCARTRESPONSE']._serialized_start=6255
-  _globals['_JOINTTOCARTRESPONSE']._serialized_end=6378
-  _globals['_CARTTOJOINTRESPONSE']._serialized_start=6380
-  _globals['_CARTTOJOINTRESPONSE']._serialized_end=6474
-  _globals['_UPLOADFILEREQUEST']._serialized_start=6476
-  _globals['_UPLOADFILEREQUEST']._serialized_end=6566
-  _globals['_UPLOADFILERESPONSE']._serialized_start=6568
-  _globals['_UPLOADFILERESPONSE']._serialized_end=6635
-  _globals['_DOWNLOADFILEREQUEST']._serialized_start=6637
-  _globals['_DOWNLOADFILEREQUEST']._serialized_end=6694
-  _globals['_DOWNLOADFILERESPONSE']._serialized_start=6696
-  _globals['_DOWNLOADFILERESPONSE']._serialized_end=6779
-  _globals['_LISTFILESREQUEST']._serialized_start=6781
-  _globals['_LISTFILESREQUEST']._serialized_end=6831
-  _globals['_LISTFILESRESPONSE']._serialized_start=6834
-  _globals['_LISTFILESRESPONSE']._serialized_end=7115
-  _globals['_LISTFILESRESPONSE_DIRECTORYENTRY']._serialized_start=6961
-  _globals['_LISTFILESRESPONSE_DIRECTORYENTRY']._serialized_end=7105
-  _globals['_LISTFILESRESPONSE_DIRECTORYENTRY_TYPE']._serialized_start=7063
-  _globals['_LISTFILESRESPONSE_DIRECTORYENTRY_TYPE']._serialized_end=7105
-  _globals['_REMOVEFILESREQUEST']._serialized_start=7117
-  _globals['_REMOVEFILESREQUEST']._serialized_end=7170
-  _globals['_REMOVEFILESRESPONSE']._serialized_start=7173
-  _globals['_REMOVEFILESRESPONSE']._serialized_end=7360
-  _globals['_REMOVEFILESRESPONSE_DIRECTORYENTRY']._serialized_start=7283
-  _globals['_REMOVEFILESRESPONSE_DIRECTORYENTRY']._serialized_end=7360
-  _globals['_DROPDOWNSTATE']._serialized_start=7362
-  _globals['_DROPDOWNSTATE']._serialized_end=7419
-  _globals['_TEXTFIELDSTATE']._serialized_start=7421
-  _globals['_TEXTFIELDSTATE']._serialized_end=7459
-  _globals['_NUMBERFIELDSTATE']._serialized_start=7461
-  _globals['_NUMBERFIELDSTATE']._serialized_end=7503
-  _globals['_IMAGESTATE']._serialized_start=7506
-  _globals['_IMAGESTATE']._serialized_end=7918
-  _globals['_IMAGESTATE_IMAGEDATA']._serialized_start=7649
-  _globals['_IMAGESTATE_IMAGEDATA']._serialized_end=7803
-  _globals['_IMAGESTATE_IMAGEDATA_IMAGEENCODING']._serialized_start=7778
-  _globals['_IMAGESTATE_IMAGEDATA_IMAGEENCODING']._serialized_end=7803
-  _globals['_IMAGESTATE_CLICKEDAT']._serialized_start=7805
-  _globals['_IMAGESTATE_CLICKEDAT']._serialized_end=7888
-  _globals['_APPUIELEMENT']._serialized_start=7921
-  _globals['_APPUIELEMENT']._serialized_end=8424
-  _globals['_APPUIELEMENT_APPUISTATE']._serialized_start=8042
-  _globals['_APPUIELEMENT_APPUISTATE']._serialized_end=8409
-  _globals['_APPFUNCTION']._serialized_start=8427
-  _globals['_APPFUNCTION']._serialized_end=8798
-  _globals['_APPFUNCTION_PARAMETER']._serialized_start=8566
-  _globals['_APPFUNCTION_PARAMETER']._serialized_end=8798
-  _globals['_EVENT']._serialized_start=8801
-  _globals['_EVENT']._serialized_end=9042
-  _globals['_EVENT_DISCONNECTREQUEST']._serialized_start=8984
-  _globals['_EVENT_DISCONNECTREQUEST']._serialized_end=9019
-  _globals['_SHOWDIALOGREQUEST']._serialized_start=9045
-  _globals['_SHOWDIALOGREQUEST']._serialized_end=9326
-  _globals['_SHOWDIALOGREQUEST_MESSAGEDIALOG']._serialized_start=9160
-  _globals['_SHOWDIALOGREQUEST_MESSAGEDIALOG']._serialized_end=9268
-  _globals['_SHOWDIALOGREQUEST_DIALOGTYPE']._serialized_start=9270
-  _globals['_SHOWDIALOGREQUEST_DIALOGTYPE']._serialized_end=9316
-  _globals['_SHOWDIALOGRESPONSE']._serialized_start=9328
-  _globals['_SHOWDIALOGRESPONSE']._serialized_end=9348
-  _globals['_PROGRAMVARIABLE']._serialized_start=9351
-  _globals['_PROGRAMVARIABLE']._serialized_end=9951
-  _globals['_PROGRAMVARIABLE_PROGRAMVARIABLEPOSITION']._serialized_start=9481
-  _globals['_PROGRAMVARIABLE_PROGRAMVARIABLEPOSITION']._serialized_end=9942
-  _globals['_PROGRAMVARIABLE_PROGRAMVARIABLEPOSITION_JOINTS']._serialized_start=9758
-  _globals['_PROGRAMVARIABLE_PROGRAMVARIABLEPOSITION_JOINTS']._serialized_end=9782
-  _globals['_PROGRAMVARIABLE_PROGRAMVARIABLEPOSITION_CARTANDJOINTS']._serialized_start=9785
-  _globals['_PROGRAMVARIABLE_PROGRAMVARIABLEPOSITION_CARTANDJOINTS']._serialized_end=9933
-  _globals['_FAILEDFUNCTION']._serialized_start=9953
-  _globals['_FAILEDFUNCTION']._serialized_end=10002
-  _globals['_APPACTION']._serialized_start=10005
-  _globals['_APPACTION']._serialized_end=10251
-  _globals['_STATISTICSREQUEST']._serialized_start=10253
-  _globals['_STATISTICSREQUEST']._serialized_end=10319
-  _globals['_STATISTICSRESPONSE']._serialized_start=10322
-  _globals['_STATISTICSRESPONSE']._serialized_end=10643
-  _globals['_ROBOTCONTROLAPP']._serialized_start=12067
-  _globals['_ROBOTCONTROLAPP']._serialized_end=14658
-# @@protoc_insertion_point(module_scope)
@@ -1,7 +1,12 @@
 import sys
-from AppClient import AppClient
-from DataTypes.Matrix44 import Matrix44
-from robotcontrolapp_pb2 import AppFunction, AppUIElement, ButtonState, CheckboxState
+from rcapp.AppClient import AppClient
+from rcapp.FunctionParameters import ParameterException
+from rcapp.robotcontrolapp_pb2 import (
+    AppFunction,
+    AppUIElement,
+    ButtonState,
+    CheckboxState,
+)
 from google.protobuf.internal import containers as protobufContainers
 
 
@@ -14,9 +19,8 @@ class MinimalApp(AppClient):
 
     def _AppFunctionHandler(self, function: AppFunction):
         """Gets called on remote app function calls received from the robot control"""
-        # This prints the received function data
-        print("Received app function:")
-        print(function)
+        # This logs the received function data, the message is formatted only if debug records are written
+        self.log.Debug("Received app function: %s", function)
 
         # Select the app function to call
         if function.name == "pow":
@@ -35,9 +39,8 @@ class MinimalApp(AppClient):
         self, updates: protobufContainers.RepeatedCompositeFieldContainer[AppUIElement]
     ):
         """Gets called on remote UI update requests received from the robot control"""
-        # This prints the received UI updates:
-        print("Received UI updates: ")
-        print(updates)
+        # This logs the received UI updates:
+        self.log.Debug("Received UI updates: %s", updates)
 
         # Example on how to handle UI events (button clicked, value changed etc)
         self.ExamplePrintUIEvents(updates)
@@ -51,56 +54,41 @@ class MinimalApp(AppClient):
             f"App function '{function.name}' called with call ID {function.call_id}, label = '{function.label}', ui hint = '{function.ui_hint}', number of parameters = {len(function.parameters)}"
         )
 
-        # print all parameters
-        for parameter in function.parameters:
-            if parameter.HasField("bool_value"):
-                # boolean
-                print(
-                    f"\tparameter '{parameter.name}', type 'bool' {parameter.bool_value}"
-                )
-            elif parameter.HasField("int64_value"):
-                # integer
-                print(
-                    f"\tparameter '{parameter.name}', type 'int64' {parameter.int64_value}"
-                )
-            elif parameter.HasField("double_value"):
+        # print all parameters, GetParameters() checks them against the function definition in rcapp.xml
+        try:
+            parameters = self.GetParameters(function)
+        except ParameterException as ex:
+            print(ex, file=sys.stderr)
+            return
+        for name in parameters.GetNames():
+            valueType = parameters.GetType(name)
+            value = parameters.Get(name)
+            if valueType == "double":
                 # double
-                print(
-                    f"\tparameter '{parameter.name}', type 'double' {parameter.double_value:.2f}"
-                )
-            elif parameter.HasField("string_value"):
-                # string
-                print(
-                    f"\tparameter '{parameter.name}', type 'string' {parameter.string_value}"
-                )
-            elif parameter.HasField("vector3_value"):
+                print(f"\tparameter '{name}', type 'double' {value:.2f}")
+            elif valueType == "vector3":
                 # 3 dimensional vector
                 print(
-                    f"\tparameter '{parameter.name}', type 'vector3' ({parameter.vector3_value.GetX():.2f} {parameter.vector3_value.GetY():.2f} {parameter.vector3_value.GetZ():.2f})"
+                    f"\tparameter '{name}', type 'vector3' ({value.GetX():.2f} {value.GetY():.2f} {value.GetZ():.2f})"
                 )
-            elif parameter.HasField("cartesian_value"):
+            elif valueType == "cartesian":
                 # cartesian position and orientation
-                matrix = Matrix44(parameter.cartesian_value)
                 print(
-                    f"\tparameter '{parameter.name}', type 'cartesian' X={matrix.GetX():.2f}, Y={matrix.GetY():.2f}, Z={matrix.GetZ():.2f}, A={matrix.GetA():.2f}, B={matrix.GetB():.2f}, C={matrix.GetC():.2f}"
+                    f"\tparameter '{name}', type 'cartesian' X={value.GetX():.2f}, Y={value.GetY():.2f}, Z={value.GetZ():.2f}, A={value.GetA():.2f}, B={value.GetB():.2f}, C={value.GetC():.2f}"
                 )
+            else:
+                # bool, int64 or string
+                print(f"\tparameter '{name}', type '{valueType}' {value}")
 
     def ExampleExponentiation(self, function):
         """This example exponentiates the value of a number variable by a given exponent and assigns the result to a different number variable"""
-        # Get the function parameters by iterating over the list
-        for parameter in function.parameters:
-            if parameter.name == "base_variable" and parameter.HasField("string_value"):
-                baseVariableName = parameter.string_value
-            elif parameter.name == "result_variable" and parameter.HasField(
-                "string_value"
-            ):
-                resultVariableName = parameter.string_value
-            elif parameter.name == "exponent_number" and parameter.HasField(
-                "double_value"
-            ):
-                exponentValue = parameter.double_value
-
         try:
+            # Get the function parameters by name
+            parameters = self.GetParameters(function)
+            baseVariableName = parameters.GetString("base_variable")
+            resultVariableName = parameters.GetString("result_variable")
+            exponentValue = parameters.GetDouble("exponent_number")
+
             # Now request the value of the base number variable from the robot control
             baseVariable = self.GetNumberVariable(baseVariableName)
             baseValue = baseVariable.GetValue()
@@ -1,7 +1,7 @@
 import datetime
 import sys
 from time import sleep
-from AppClient import AppClient
+from rcapp.AppClient import AppClient
 from MinimalApp import MinimalApp
 
 # Below you will find examples for sending requests from the app to the robot control.
@@ -120,6 +120,7 @@ if len(sys.argv) > 1:
 
 # Create an instance of the app and connect. The name given here must be equal to the name in rcapp.xml.
 app = MinimalApp("MinimalApp-Python", connectionTarget)
+# Set app.logDebug = True to log each received app function call and UI update too, e.g. while developing the app
 app.Connect()
 
 # time of the last example run
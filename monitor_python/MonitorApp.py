@@ -1,6 +1,6 @@
-from AppClient import AppClient
-from DataTypes import RobotState
-from robotcontrolapp_pb2 import (
+from rcapp.AppClient import AppClient
+from rcapp.DataTypes import RobotState
+from rcapp.robotcontrolapp_pb2 import (
     AppFunction,
     AppUIElement,
     ButtonState,
@@ -15,6 +15,9 @@ if len(sys.argv) > 1:
 app = MonitorApp("MonitorApp-Python", connectionTarget)
 app.Connect()
 
+# Stream the robot state instead of polling it. The state is sent each 10 or 20ms, update the UI with every 20th state.
+app.StartRobotStateStream(decimation=20)
+
 # time of the last example run
 lastUpdate = datetime.datetime(2000, 1, 1)
 
@@ -23,8 +26,6 @@ try:
     while app.IsConnected():
         sleep(0.5)
 
-        app.ReadAndUpdateRobotState()
-
         # Run some examples every few seconds
         now = datetime.datetime.now()
         if now - lastUpdate > datetime.timedelta(seconds=10):
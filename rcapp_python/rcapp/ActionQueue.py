@@ -0,0 +1,326 @@
+"""
+The ActionQueue holds the actions waiting to be sent to the robot control. It has one lane per priority, so that
+function results are not delayed by large UI updates such as images. Each lane can be bounded, so that an app producing
+actions faster than they can be sent does not use more and more memory.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from queue import Empty
+import threading
+import time
+from . import robotcontrolapp_pb2
+
+LANE_FUNCTIONS = 0
+"""Finished and failed function calls and variables, the robot program may be waiting for these"""
+LANE_DEFAULT = 1
+"""Actions without function results or UI changes, e.g. UI state requests"""
+LANE_UI = 2
+"""UI changes, e.g. texts or images"""
+LANE_NAMES = ["functions", "default", "ui"]
+"""Lane names by lane number"""
+
+OVERFLOW_BLOCK = "block"
+"""Put() waits until there is space in the lane"""
+OVERFLOW_DROP_SUPERSEDED = "dropSuperseded"
+"""
+Put() drops the oldest queued UI update that is superseded by the new one (it sets the same states of the same
+elements), if there is none it waits like OVERFLOW_BLOCK
+"""
+OVERFLOW_RAISE = "raise"
+"""Put() raises an ActionQueueFullException"""
+
+
+class ActionQueueFullException(RuntimeError):
+    """the action queue is full"""
+
+
+def _GetUIChangeKeys(action: robotcontrolapp_pb2.AppAction) -> set:
+    """
+    Gets the UI element states set by an action, None if the action does more than changing the UI. An action whose
+    keys are a subset of a later action's keys is superseded by that action.
+    """
+    if (
+        len(action.done_functions) > 0
+        or len(action.failed_functions) > 0
+        or len(action.set_variables) > 0
+        or len(action.request_ui_state) > 0
+    ):
+        return None
+    keys = set()
+    for change in action.ui_changes:
+        if change.HasField("is_visible"):
+            keys.add((change.element_name, "is_visible"))
+        state = change.state.WhichOneof("state")
+        if state is not None:
+            keys.add((change.element_name, state))
+            # Setting the selected option keeps the list of options
+            if (
+                state == "dropdown_state"
+                and len(change.state.dropdown_state.options) > 0
+            ):
+                keys.add((change.element_name, "dropdown_state.options"))
+    return keys
+
+
+def GetActionLane(action: robotcontrolapp_pb2.AppAction) -> int:
+    """
+    Gets the lane of an action. Variables share the lane of the function results since a robot program usually reads
+    them after the function finished, so they must not overtake each other.
+    """
+    if (
+        len(action.done_functions) > 0
+        or len(action.failed_functions) > 0
+        or len(action.set_variables) > 0
+    ):
+        return LANE_FUNCTIONS
+    if len(action.ui_changes) > 0:
+        return LANE_UI
+    return LANE_DEFAULT
+
+
+@dataclass
+class QueuedAction:
+    """An action in the queue"""
+
+    action: robotcontrolapp_pb2.AppAction = None
+    """Action to send, None to wake up the sender"""
+    lane: int = LANE_DEFAULT
+    """Lane of the action"""
+    queuedTime: float = 0.0
+    """Time (time.perf_counter()) when the action was queued"""
+
+
+@dataclass
+class ActionLaneStatistics:
+    """Counters of a lane of the action queue"""
+
+    depth: int = 0
+    """Number of queued actions"""
+    maxDepth: int = 0
+    """Highest number of queued actions (high-water mark)"""
+    dropped: int = 0
+    """Number of superseded actions dropped because the lane was full"""
+    rejected: int = 0
+    """Number of actions rejected with an ActionQueueFullException because the lane was full"""
+
+
+class _LaneLimit:
+    """Size limit of a lane"""
+
+    def __init__(self, maxSize: int, policy: str, blockTimeout: float):
+        self.maxSize = maxSize
+        self.policy = policy
+        self.blockTimeout = blockTimeout
+
+
+DEFAULT_LANE_LIMITS = [
+    (None, OVERFLOW_BLOCK, None),
+    (1000, OVERFLOW_BLOCK, 10.0),
+    (200, OVERFLOW_DROP_SUPERSEDED, 10.0),
+]
+"""
+Default limit of each lane: maximum size, overflow policy and block timeout. Function results are never dropped, UI
+updates are dropped when newer updates of the same elements are queued.
+"""
+
+
+class ActionQueue:
+    """
+    Priority queue of the actions to send. The lanes are served by priority (LANE_FUNCTIONS first), actions in the same
+    lane keep their order. To prevent starvation, an action that waited longer than starvationTimeout is taken before
+    higher priority actions, but at most every second time, so the function results still get at least half of the
+    messages. This class is thread safe.
+    """
+
+    def __init__(self, starvationTimeout: float = 0.1):
+        """
+        Parameters:
+            starvationTimeout: time in s after which a lower priority action is sent before higher priority actions
+        """
+        self.starvationTimeout = starvationTimeout
+        """Time in s after which a lower priority action is sent before higher priority actions"""
+        self.__lanes = [deque() for _ in LANE_NAMES]
+        """Queued actions by lane"""
+        self.__wakeUps = 0
+        """Number of queued wake ups (None actions), these are returned before any action"""
+        self.__lastWasAged = False
+        """True if the last action was taken because it waited too long"""
+        self.__limits = [_LaneLimit(*limit) for limit in DEFAULT_LANE_LIMITS]
+        """Size limits by lane"""
+        self.__statistics = [ActionLaneStatistics() for _ in LANE_NAMES]
+        """Counters by lane"""
+        self.__mutex = threading.Lock()
+        self.__condition = threading.Condition(self.__mutex)
+        """Notified when an action was queued"""
+        self.__spaceCondition = threading.Condition(self.__mutex)
+        """Notified when an action was taken"""
+
+    def SetLaneLimit(
+        self,
+        lane: int,
+        maxSize: int,
+        policy: str = OVERFLOW_BLOCK,
+        blockTimeout: float = 10.0,
+    ):
+        """
+        Sets the size limit of a lane
+        Parameters:
+            lane: lane number, e.g. LANE_UI
+            maxSize: maximum number of queued actions, None for unlimited
+            policy: what Put() does if the lane is full: OVERFLOW_BLOCK, OVERFLOW_DROP_SUPERSEDED or OVERFLOW_RAISE
+            blockTimeout: maximum time in s Put() waits for space before it raises an ActionQueueFullException, None
+                to wait forever
+        """
+        if policy not in (OVERFLOW_BLOCK, OVERFLOW_DROP_SUPERSEDED, OVERFLOW_RAISE):
+            raise RuntimeError(f"unknown overflow policy '{policy}'")
+        if maxSize is not None and maxSize < 1:
+            raise RuntimeError("the lane size must be at least 1")
+        with self.__mutex:
+            self.__limits[lane] = _LaneLimit(maxSize, policy, blockTimeout)
+            self.__spaceCondition.notify_all()
+
+    def Put(self, action: robotcontrolapp_pb2.AppAction):
+        """
+        Queues an action
+        Parameters:
+            action: action to send, None to wake up a waiting Get()
+        """
+        if action is None:
+            self.Requeue(QueuedAction())
+            return
+        lane = GetActionLane(action)
+        with self.__mutex:
+            if not self.__WaitForSpace(action, lane):
+                self.__statistics[lane].rejected += 1
+                raise ActionQueueFullException(
+                    f"the action queue lane '{LANE_NAMES[lane]}' is full"
+                )
+            self.__lanes[lane].append(QueuedAction(action, lane, time.perf_counter()))
+            self.__UpdateDepth(lane)
+            self.__condition.notify()
+
+    def __WaitForSpace(self, action: robotcontrolapp_pb2.AppAction, lane: int) -> bool:
+        """
+        Makes space in a lane according to its overflow policy, call with the lock held
+        Returns:
+            false if the action must be rejected
+        """
+        limit = self.__limits[lane]
+        queued = self.__lanes[lane]
+        if limit.maxSize is None or len(queued) < limit.maxSize:
+            return True
+        if limit.policy == OVERFLOW_RAISE:
+            return False
+        if limit.policy == OVERFLOW_DROP_SUPERSEDED:
+            newKeys = _GetUIChangeKeys(action)
+            if newKeys is not None:
+                for entry in queued:
+                    keys = _GetUIChangeKeys(entry.action)
+                    if keys is not None and keys <= newKeys:
+                        queued.remove(entry)
+                        self.__statistics[lane].dropped += 1
+                        return True
+        return self.__spaceCondition.wait_for(
+            lambda: len(self.__lanes[lane]) < self.__MaxSize(lane),
+            limit.blockTimeout,
+        )
+
+    def __MaxSize(self, lane: int) -> float:
+        """Gets the current size limit of a lane, call with the lock held"""
+        maxSize = self.__limits[lane].maxSize
+        return float("inf") if maxSize is None else maxSize
+
+    def __UpdateDepth(self, lane: int):
+        """Updates the depth counters of a lane, call with the lock held"""
+        statistics = self.__statistics[lane]
+        statistics.depth = len(self.__lanes[lane])
+        statistics.maxDepth = max(statistics.maxDepth, statistics.depth)
+
+    def Requeue(self, entry: QueuedAction):
+        """Puts an action taken by Get() back to the front of its lane, e.g. if it could not be sent"""
+        with self.__mutex:
+            if entry.action is None:
+                self.__wakeUps += 1
+            else:
+                self.__lanes[entry.lane].appendleft(entry)
+                self.__UpdateDepth(entry.lane)
+            self.__condition.notify()
+
+    def Clear(self):
+        """Removes all queued actions and wake ups, e.g. when the app connects again"""
+        with self.__mutex:
+            for lane, queued in enumerate(self.__lanes):
+                queued.clear()
+                self.__UpdateDepth(lane)
+            self.__wakeUps = 0
+            self.__spaceCondition.notify_all()
+
+    def Get(self, timeout: float = None) -> QueuedAction:
+        """
+        Takes the next action
+        Parameters:
+            timeout: maximum time in s to wait for an action, None to wait forever
+        Returns:
+            the next action, its action is None for wake ups
+        Raises:
+            queue.Empty if the timeout expired
+        """
+        with self.__mutex:
+            if not self.__condition.wait_for(self.__HasEntries, timeout):
+                raise Empty()
+            if self.__wakeUps > 0:
+                self.__wakeUps -= 1
+                return QueuedAction()
+            entry = self.__TakeNext()
+            self.__UpdateDepth(entry.lane)
+            self.__spaceCondition.notify_all()
+            return entry
+
+    def __HasEntries(self) -> bool:
+        """Checks for queued actions, call with the lock held"""
+        return self.__wakeUps > 0 or any(self.__lanes)
+
+    def __TakeNext(self) -> QueuedAction:
+        """Takes the next action from the lanes, call with the lock held and at least one action queued"""
+        if not self.__lastWasAged:
+            # the oldest overdue action of the lower priority lanes
+            oldest = None
+            deadline = time.perf_counter() - self.starvationTimeout
+            for lane in self.__lanes[LANE_FUNCTIONS + 1 :]:
+                if len(lane) > 0 and lane[0].queuedTime < deadline:
+                    if oldest is None or lane[0].queuedTime < oldest[0].queuedTime:
+                        oldest = lane
+            if oldest is not None:
+                self.__lastWasAged = True
+                return oldest.popleft()
+
+        self.__lastWasAged = False
+        for lane in self.__lanes:
+            if len(lane) > 0:
+                return lane.popleft()
+        raise Empty()
+
+    def qsize(self) -> int:
+        """Gets the number of queued actions (without wake ups)"""
+        with self.__mutex:
+            return sum(map(len, self.__lanes))
+
+    def GetLaneSizes(self) -> list[int]:
+        """Gets the number of queued actions per lane"""
+        with self.__mutex:
+            return [len(lane) for lane in self.__lanes]
+
+    def GetLaneStatistics(self, reset: bool = False) -> list[ActionLaneStatistics]:
+        """
+        Gets the counters of each lane
+        Parameters:
+            reset: if true the high-water marks and the dropped and rejected counters are reset after reading
+        """
+        with self.__mutex:
+            result = [ActionLaneStatistics(**vars(s)) for s in self.__statistics]
+            if reset:
+                self.__statistics = [
+                    ActionLaneStatistics(s.depth, s.depth) for s in self.__statistics
+                ]
+            return result
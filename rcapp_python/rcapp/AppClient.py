@@ -0,0 +1,3527 @@
+"""
+The AppClient class provides a simple interface to the igus Robot Control App Interface.
+"""
+
+from dataclasses import dataclass, field
+from io import BufferedReader
+from queue import Empty
+import json
+import os
+import random
+from threading import Thread, Lock
+import threading
+import time
+from typing import Callable, List, TYPE_CHECKING
+import grpc
+from google.protobuf.internal import containers as protobufContainers
+from . import __version__
+from .ActionQueue import ActionQueue, LANE_NAMES, OVERFLOW_BLOCK, QueuedAction
+from .AppFuture import AppFuture, StreamFuture
+from .ChannelProfile import ChannelProfile
+from .FunctionTracer import FunctionTrace, FunctionTracer
+from .HandlerRegistry import HandlerMetrics, HandlerRegistry
+from .Interceptors import DeadlineInterceptor
+from .Log import GetLogger, LEVEL_DEBUG
+from .RpcMetrics import ActionLaneMetrics, MetricsInterceptor, RpcMetrics
+from .DataTypes.Matrix44 import Matrix44, Matrix44FromGrpc
+from .DataTypes.SystemInfo import SystemInfo, SystemInfoFromGrpc
+from .DataTypes.RobotState import RobotState, RobotStateFromGrpc
+from .DataTypes.MotionState import MotionState, MotionStateFromGrpc
+from . import robotcontrolapp_pb2
+from .robotcontrolapp_pb2_grpc import RobotControlAppStub
+
+if TYPE_CHECKING:
+    # Loaded on first use by the requests and features using them, e.g. ListFiles(), the timer functions, the UI
+    # update coalescing and the parameter classes
+    from .AppFunctionDispatcher import AppFunctionDispatcher
+    from .AppHost import AppHost
+    from .DataTypes import ProgramVariable
+    from .DataTypes.DirectoryContent import DirectoryContent
+    from .DataTypes.LicenseInfo import LicenseInfo
+    from .DataTypes.Statistics import Statistics
+    from .FunctionParameters import FunctionParameters
+    from .TimerService import TimerHandle, TimerService
+    from .UiEventCoalescer import UiCoalescingMetrics
+
+
+class NotConnectedException(RuntimeError):
+    """not connected"""
+
+
+class ConnectTimeoutException(RuntimeError):
+    """the robot control was not reachable within the connect timeout"""
+
+
+@dataclass
+class ActionStatistics:
+    """Counts the actions queued by the app and the messages sent to the robot control, see actionCoalesceWindow"""
+
+    duration: float = 0.0
+    """Time in s the counters cover"""
+    queuedActions: int = 0
+    """Number of actions queued by SendAction(), e.g. by SendFunctionDone() or SetText()"""
+    sentMessages: int = 0
+    """Number of messages sent via the actions stream"""
+
+    def GetQueuedActionsPerSecond(self) -> float:
+        """Gets the number of actions queued per second"""
+        if self.duration <= 0:
+            return 0.0
+        return self.queuedActions / self.duration
+
+    def GetSentMessagesPerSecond(self) -> float:
+        """Gets the number of messages sent per second"""
+        if self.duration <= 0:
+            return 0.0
+        return self.sentMessages / self.duration
+
+
+@dataclass
+class ConnectTiming:
+    """Time spent in the steps of Connect(), see GetConnectTiming()"""
+
+    channelReady: float = 0.0
+    """Time in s until the connection to the robot control was established"""
+    streamOpen: float = 0.0
+    """Time in s to open the actions stream and start the event reader thread"""
+    handshake: float = 0.0
+    """Time in s to send the capabilities and get the system info (both requests run concurrently)"""
+    versionCheck: float = 0.0
+    """Time in s to check the version of the robot control"""
+    versionCheckCached: bool = False
+    """True if the version was checked on a previous connect already"""
+    total: float = 0.0
+    """Total time in s of Connect()"""
+    firstEvent: float = None
+    """
+    Time in s from the start of Connect() until the first event (e.g. a UI update or an app function call) was
+    received, None if no event was received yet, see WaitFirstEvent()
+    """
+
+
+def _TargetVelocitiesFromGrpc(
+    response: robotcontrolapp_pb2.TargetVelocityResponse,
+) -> tuple[float, float, float]:
+    """Gets the velocities of e1, e2 and e3 from a target velocity response, 0 if not in velocity mode"""
+    e1 = 0
+    e2 = 0
+    e3 = 0
+    if response.HasField("velocity_e1"):
+        e1 = response.velocity_e1
+    if response.HasField("velocity_e2"):
+        e2 = response.velocity_e2
+    if response.HasField("velocity_e3"):
+        e3 = response.velocity_e3
+    return (e1, e2, e3)
+
+
+def _ProgramVariablesFromGrpc(
+    grpcVariables,
+) -> dict[str, "ProgramVariable.ProgramVariable"]:
+    """Converts the streamed program variables to a map, key is the variable name"""
+    from .DataTypes import ProgramVariable
+
+    resultVariables = dict()
+    for grpcVariable in grpcVariables:
+        variable = ProgramVariable.ProgramVariableFromGrpc(grpcVariable)
+        if variable is not None:
+            resultVariables[grpcVariable.name] = variable
+    return resultVariables
+
+
+def _SelectVariable(
+    variables: dict[str, "ProgramVariable.ProgramVariable"],
+    variableName: str,
+    variableClass: str,
+) -> "ProgramVariable.ProgramVariable":
+    """
+    Gets a variable from the result of GetProgramVariables(), raises if it is missing or has a different type.
+    variableClass is the name of the expected class in DataTypes.ProgramVariable, e.g. "NumberVariable".
+    """
+    from .DataTypes import ProgramVariable
+
+    if variableName not in variables:
+        raise RuntimeError(
+            f"failed to get variable '{variableName}': variable does not exist"
+        )
+    variable = variables[variableName]
+    if not isinstance(variable, getattr(ProgramVariable, variableClass)):
+        typeName = "number" if variableClass == "NumberVariable" else "position"
+        raise RuntimeError(
+            f"requested variable '{variableName}' is no {typeName} variable"
+        )
+    return variable
+
+
+def _LicenseInfoFromGrpc(
+    response: robotcontrolapp_pb2.LicenseInfoResponse,
+) -> "LicenseInfo":
+    """Converts the license info, the LicenseInfo module is loaded on first use"""
+    from .DataTypes.LicenseInfo import LicenseInfoFromGrpc
+
+    return LicenseInfoFromGrpc(response)
+
+
+SNAPSHOT_ROBOT_STATE = "robotState"
+"""Snapshot field: RobotState (GetRobotState request)"""
+SNAPSHOT_MOTION_STATE = "motionState"
+"""Snapshot field: MotionState (GetMotionState request)"""
+SNAPSHOT_TCP = "tcp"
+"""Snapshot field: tool center point as Matrix44 (GetTCP request)"""
+SNAPSHOT_TARGET_VELOCITIES = "targetVelocities"
+"""Snapshot field: tuple of the target velocities of e1, e2 and e3 (SetTargetVelocity request)"""
+SNAPSHOT_VELOCITY_OVERRIDE = "velocityOverride"
+"""Snapshot field: velocity override in percent, shares the GetRobotState request with SNAPSHOT_ROBOT_STATE"""
+SNAPSHOT_SYSTEM_INFO = "systemInfo"
+"""Snapshot field: SystemInfo (GetSystemInfo request)"""
+SNAPSHOT_LICENSE_INFO = "licenseInfo"
+"""Snapshot field: LicenseInfo (GetLicensedFeatures request)"""
+
+SNAPSHOT_DEFAULT_FIELDS = (SNAPSHOT_ROBOT_STATE, SNAPSHOT_MOTION_STATE)
+"""Fields of GetSnapshot() if none are given"""
+
+_SNAPSHOT_REQUESTS = {
+    SNAPSHOT_ROBOT_STATE: (
+        "GetRobotState",
+        robotcontrolapp_pb2.RobotStateRequest,
+        RobotStateFromGrpc,
+    ),
+    SNAPSHOT_MOTION_STATE: (
+        "GetMotionState",
+        robotcontrolapp_pb2.GetMotionStateRequest,
+        MotionStateFromGrpc,
+    ),
+    SNAPSHOT_TCP: ("GetTCP", robotcontrolapp_pb2.GetTCPRequest, Matrix44FromGrpc),
+    SNAPSHOT_TARGET_VELOCITIES: (
+        "SetTargetVelocity",
+        robotcontrolapp_pb2.TargetVelocityRequest,
+        _TargetVelocitiesFromGrpc,
+    ),
+    SNAPSHOT_VELOCITY_OVERRIDE: (
+        "GetRobotState",
+        robotcontrolapp_pb2.RobotStateRequest,
+        lambda response: response.velocity_override,
+    ),
+    SNAPSHOT_SYSTEM_INFO: (
+        "GetSystemInfo",
+        robotcontrolapp_pb2.SystemInfoRequest,
+        SystemInfoFromGrpc,
+    ),
+    SNAPSHOT_LICENSE_INFO: (
+        "GetLicensedFeatures",
+        robotcontrolapp_pb2.LicenseInfoRequest,
+        _LicenseInfoFromGrpc,
+    ),
+}
+"""Tuples of gRPC method, request type and response converter by snapshot field"""
+
+
+@dataclass
+class Snapshot:
+    """Values of several requests sent concurrently, see GetSnapshot(). Fields that were not requested are None."""
+
+    robotState: RobotState = None
+    """State of the robot, see GetRobotState()"""
+    motionState: MotionState = None
+    """State of the motion and logic programs, see GetMotionState()"""
+    tcp: Matrix44 = None
+    """Tool center point, see GetTCP()"""
+    targetVelocities: tuple = None
+    """Target velocities of e1, e2 and e3, see GetTargetVelocities()"""
+    velocityOverride: float = None
+    """Velocity override in percent, see GetVelocityOverride()"""
+    systemInfo: SystemInfo = None
+    """System information, see GetSystemInfo()"""
+    licenseInfo: "LicenseInfo" = None
+    """License information, see GetLicenseInfo()"""
+    requestTime: float = 0.0
+    """Time (time.time()) when the requests were sent"""
+    receiveTimes: dict = field(default_factory=dict)
+    """Time (time.time()) when the response of each requested field was received, by field name"""
+    requestCount: int = 0
+    """Number of requests sent, fields sharing a request are requested once"""
+
+
+class AppClient:
+    """This class is the interface between GRPC and the app logic."""
+
+    # Constructor, arguments are the name of the app, the target socket and optionally the channel settings
+    def __init__(
+        self, appName: str, target: str, channelProfile: ChannelProfile = None
+    ):
+        versionSplit = __version__.split(".")
+        self.VERSION_MAJOR_MIN = int(versionSplit[0])
+        """Minimum required major version of the RobotControl Core"""
+        self.VERSION_MINOR_MIN = int(versionSplit[1])
+        """Minimum required minor version of the RobotControl Core"""
+        self.VERSION_PATCH_MIN = int(versionSplit[2])
+        """Minimum required patch version of the RobotControl Core"""
+
+        self.logDebug = False
+        """
+        If set true before Connect() the debug records of the app are written too, this is the same as
+        GetLogger().SetLevel(appName, LEVEL_DEBUG), see Log.py
+        """
+        self.autoReconnect = False
+        """If set true the app reconnects automatically after the connection to the robot control was lost"""
+        self.reconnectDelayMin = 0.5
+        """Delay in s before the first reconnect attempt, this doubles with each failed attempt"""
+        self.reconnectDelayMax = 30.0
+        """Maximum delay in s between two reconnect attempts"""
+        self.actionCoalesceWindow = 0.0
+        """
+        If greater than 0, actions queued within this time in s are merged and sent as a single message. This reduces
+        the number of messages under load (e.g. many function calls or UI updates) but delays each action by up to this
+        time. See GetActionStatistics().
+        """
+        self.actionCoalesceMaxBytes = 64 * 1024
+        """Merged actions are sent immediately when they reach this size in bytes"""
+        self.connectTimeout = 10.0
+        """Time in s Connect() waits for the robot control to become reachable, None to wait forever"""
+        self.appDefinitionFile = "rcapp.xml"
+        """App definition file declaring the app functions, GetParameters() checks the parameters against it"""
+        self.functionDispatcher: "AppFunctionDispatcher" = None
+        """
+        If set, app function calls are run by this dispatcher's worker threads. Otherwise they are run by the event
+        reader thread one after another, which delays all following events while a function runs.
+        """
+        self.uiCoalescingWindow = 0.0
+        """
+        If > 0, UI updates are collected for this time in s and only the latest update per element and state kind is
+        handled, e.g. while an operator types into a number box. Button updates are always handled. The updates are
+        then handled by a separate thread instead of the event reader thread, see GetUiCoalescingMetrics().
+        """
+
+        self.__appName = appName
+        """Name of the app"""
+        self.log = GetLogger().GetSubsystem(appName)
+        """Logger of the app, e.g. self.log.Info("moved to '%s'", name), see Log.py"""
+        self.__connectionLog = GetLogger().GetSubsystem(appName + ".connection")
+        """Logger of the connection state"""
+        self.__eventLog = GetLogger().GetSubsystem(appName + ".events")
+        """Logger of the received events, app function calls and robot state stream"""
+        self.__targetSocket = target
+        self.__appNameRequests = dict()
+        """Shared requests that only contain the app name by request type, see __GetAppNameRequest()"""
+        self.__channelProfile = channelProfile or ChannelProfile()
+        """Channel settings, see ChannelProfile.MakeLoopbackChannelProfile() and MakeRemoteChannelProfile()"""
+        self.__metrics = MetricsInterceptor()
+        """Records counts, bytes and latencies of the calls, see GetMetrics()"""
+        self.__deadlines = DeadlineInterceptor()
+        """Sets the deadlines of the calls and cancels running calls, see CallTimeout() and CancelAll()"""
+        self.__functionTracer = FunctionTracer()
+        """Records the app function calls until they finished or failed, see GetFunctionTrace()"""
+        self.__handlers = HandlerRegistry(type(self))
+        """Handlers registered with @app_function and @ui_event, see GetHandlerMetrics()"""
+        self.__uiCoalescer = None
+        """Collects the UI updates if uiCoalescingWindow is set, created on first use"""
+        self.__grpcChannel = None
+        """GRPC channel, this is closed on disconnect and created again on connect"""
+        self.__grpcStub = None
+        """GRPC client stub: This is the generated GRPC client interface."""
+        self.__host = None
+        """AppHost sharing its channel and robot state stream with this app, see SetHost()"""
+        self.__CreateChannel()
+        self.__channelClosed = False
+        """True if the channel was closed by Disconnect()"""
+        self.__eventReaderThread = None
+        """Thread reading the events stream"""
+        self.__receivedActions = None
+        """Actions stream call, the event reader thread reads the events from it"""
+        self.__stopThreads = True
+        """Set this to true to request the threads to Stop"""
+        self.__stopEvent = threading.Event()
+        """Set on disconnect, this interrupts waiting for the next reconnect attempt"""
+        self.__streamGeneration = 0
+        """Incremented each time the actions stream is opened, older stream iterators end when they see a newer value"""
+        self.__actionsQueue = ActionQueue()
+        """Actions waiting to be sent, see SetActionQueueLimit()"""
+        self.__unconfirmedAction = None
+        """Action handed to the actions stream that was not confirmed as sent yet, this is replayed on reconnect"""
+        self.__reconnectCount = 0
+        """Number of successful reconnects"""
+        self.__connectTiming = ConnectTiming()
+        """Time spent in the steps of the last Connect()"""
+        self.__connectStartTime = 0.0
+        """Time (time.perf_counter()) when the last Connect() started"""
+        self.__firstEventTime = None
+        """Time (time.perf_counter()) when the first event after the last Connect() was received"""
+        self.__firstEventReceived = threading.Event()
+        """Set when the first event after the last Connect() was received"""
+        self.__systemInfo: SystemInfo = None
+        """System info received on the last connect"""
+        self.__checkedVersion = None
+        """Version (major, minor, patch) of the robot control checked on a previous connect"""
+        self.__actionStatistics = ActionStatistics()
+        """Counters of queued actions and sent messages"""
+        self.__actionStatisticsStart = time.perf_counter()
+        """Start time of the action statistics"""
+        self.__actionStatisticsMutex = Lock()
+        """Mutex for the action statistics"""
+        self.__robotStateStreamThread = None
+        """Thread reading the robot state stream, see StartRobotStateStream()"""
+        self.__robotStateStream = None
+        """Robot state stream call, cancel this to stop the stream"""
+        self.__robotStateStreamRequested = False
+        """True while the robot state stream should run"""
+        self.__robotStateDecimation = 1
+        """Only every n-th streamed robot state is passed to the subscribers"""
+        self.__robotStateCount = 0
+        """Number of streamed robot states received since the last one passed to the subscribers"""
+        self.__robotStateSubscribers = []
+        """Callbacks receiving the streamed robot state. This list is replaced on change, so it can be read without lock."""
+        self.__latestRobotState = None
+        """Latest streamed robot state (GRPC message), see GetLatestRobotState()"""
+        self.__latestRobotStateConverted = None
+        """Cached conversion of the latest streamed robot state, None if not converted yet"""
+        self.__timerService = None
+        """Runs deferred callbacks, created on first use, see CallAfter()"""
+        self.__timerServiceMutex = Lock()
+        self.__metricsDumpThread = None
+        """Thread writing the metrics to a file, see StartMetricsDump()"""
+        self.__metricsDumpStop = threading.Event()
+        """Set to stop the metrics dump thread"""
+        self.__robotStateMutex = Lock()
+        """Mutex for the robot state stream"""
+        self.__queuedUIUpdates = robotcontrolapp_pb2.AppAction()
+        """UI updates are queued here"""
+        self.__queuedUIUpdatesMutex = Lock()
+        """Mutex for adding UI updates to the queue"""
+
+    def __enter__(self):
+        pass  # do nothing
+
+    def __exit__(self, type, value, traceback):
+        self.Disconnect()
+
+    def __del__(self):
+        self.Disconnect()
+
+    def GetAppName(self) -> str:
+        """Gets the name of the app"""
+        return self.__appName
+
+    def SetHost(self, host: "AppHost"):
+        """
+        Runs the app in an AppHost, this is called by AppHost.AddApp(). The app keeps its own actions stream but uses
+        the channel and the robot state stream of the host, the target and channel profile of the app are not used.
+        Parameters:
+            host: the host, None to use an own channel again
+        """
+        if self.IsConnected():
+            raise RuntimeError("the host of a connected app cannot be changed")
+        if self.__host is None:
+            self.__grpcChannel.close()
+        self.__host = host
+        self.__CreateChannel()
+        self.__channelClosed = False
+
+    def GetHost(self) -> "AppHost":
+        """Gets the AppHost the app runs in, None if the app uses an own channel"""
+        return self.__host
+
+    def Connect(self):
+        """
+        Connects the app
+        Raises:
+            ParameterClasses.AppDefinitionException if the app function handlers do not match the app definition file
+        """
+        if not self.IsConnected():
+            self.__CheckAppDefinition()
+            if self.logDebug:
+                GetLogger().SetLevel(self.__appName, LEVEL_DEBUG)
+            self.__connectionLog.Debug("connecting to '%s'", self.__targetSocket)
+            self.__stopThreads = False
+            self.__stopEvent.clear()
+
+            # clear queue
+            self.__actionsQueue.Clear()
+            self.__unconfirmedAction = None
+            self.__functionTracer.Clear()
+
+            timing = ConnectTiming()
+            startTime = time.perf_counter()
+            self.__connectStartTime = startTime
+            self.__firstEventTime = None
+            self.__firstEventReceived.clear()
+            if self.__channelClosed:
+                self.__CreateChannel()
+                self.__channelClosed = False
+            try:
+                # Wait until the robot control is reachable, e.g. while it boots
+                if not self.__WaitChannelReady():
+                    raise ConnectTimeoutException(
+                        f"robot control at '{self.__targetSocket}' not reachable within {self.connectTimeout}s"
+                    )
+                stepTime = time.perf_counter()
+                timing.channelReady = stepTime - startTime
+
+                # Start threads
+                self.__OpenActionsStream()
+                self.__eventReaderThread = Thread(target=self.EventReaderThread)
+                self.__eventReaderThread.start()
+                timing.streamOpen = time.perf_counter() - stepTime
+                stepTime = time.perf_counter()
+
+                # Send the capabilities and get the system info concurrently
+                capabilitiesFuture = self.__grpcStub.SetCapabilities.future(
+                    self.__MakeCapabilitiesRequest()
+                )
+                systemInfo = self.GetSystemInfoAsync().Result()
+                capabilitiesFuture.result()
+                self.__systemInfo = systemInfo
+                timing.handshake = time.perf_counter() - stepTime
+                stepTime = time.perf_counter()
+
+                version = (
+                    systemInfo.versionMajor,
+                    systemInfo.versionMinor,
+                    systemInfo.versionPatch,
+                )
+                timing.versionCheckCached = version == self.__checkedVersion
+                if not timing.versionCheckCached:
+                    if not self.CheckCoreVersion(systemInfo):
+                        self.__connectionLog.Warning(
+                            "The connected robot does not support all features of this app API (V%d.%d.%d < "
+                            "V%d.%d.%d). This app may not work correctly.",
+                            systemInfo.versionMajor,
+                            systemInfo.versionMinor,
+                            systemInfo.versionPatch,
+                            self.VERSION_MAJOR_MIN,
+                            self.VERSION_MINOR_MIN,
+                            self.VERSION_PATCH_MIN,
+                        )
+                    self.__checkedVersion = version
+                timing.versionCheck = time.perf_counter() - stepTime
+                timing.total = time.perf_counter() - startTime
+                self.__connectTiming = timing
+                self.__connectionLog.Debug(
+                    "connected in %.1fms (channel ready %.1fms, stream %.1fms, handshake %.1fms, version check "
+                    "%.1fms)",
+                    timing.total * 1000,
+                    timing.channelReady * 1000,
+                    timing.streamOpen * 1000,
+                    timing.handshake * 1000,
+                    timing.versionCheck * 1000,
+                )
+            except Exception:
+                self.Disconnect()
+                raise
+        else:
+            self.__connectionLog.Warning(
+                "Connect requested but the app is still connected. Please call disconnect first!"
+            )
+
+    def __CheckAppDefinition(self):
+        """
+        Checks the registered app function handlers against the functions declared in the app definition file, so a
+        mismatch fails before the first call instead of on each call
+        """
+        if not self.__handlers.HasFunctionHandlers():
+            return
+        if self.appDefinitionFile is None or not os.path.exists(self.appDefinitionFile):
+            return
+        from .ParameterClasses import AppDefinitionException, LoadParameterClasses
+
+        parameterClasses = LoadParameterClasses(self.appDefinitionFile)
+        errors = self.__handlers.BindParameterClasses(parameterClasses)
+        if type(self)._AppFunctionHandler is AppClient._AppFunctionHandler:
+            # The default handler fails the calls of functions without handler
+            handled = set(self.__handlers.GetFunctionNames())
+            errors += [
+                f"app function '{name}' has no handler"
+                for name in parameterClasses
+                if name not in handled
+            ]
+        if len(errors) > 0:
+            raise AppDefinitionException(
+                f"{type(self).__name__} does not match '{self.appDefinitionFile}': "
+                + "; ".join(errors)
+            )
+
+    def Disconnect(self):
+        """Disconnects the app"""
+        if self.IsConnected():
+            self.__connectionLog.Debug("disconnecting")
+
+            self.StopRobotStateStream()
+            if self.__uiCoalescer is not None:
+                self.__uiCoalescer.Stop()
+            self.__handlers.Shutdown()
+            with self.__timerServiceMutex:
+                if self.__timerService is not None:
+                    self.__timerService.Shutdown()
+                    self.__timerService = None
+            self.__stopThreads = True
+            self.__stopEvent.set()
+            self.__actionsQueue.Put(None)
+            self.__CloseChannel()
+            if (
+                self.__eventReaderThread is not None
+                and threading.current_thread() != self.__eventReaderThread
+            ):
+                self.__eventReaderThread.join()
+
+            if self.__connectionLog.IsEnabled(LEVEL_DEBUG):
+                statistics = self.GetActionStatistics()
+                self.__connectionLog.Debug(
+                    "disconnected, actions queued: %.1f/s, messages sent: %.1f/s",
+                    statistics.GetQueuedActionsPerSecond(),
+                    statistics.GetSentMessagesPerSecond(),
+                )
+
+    def IsConnected(self) -> bool:
+        """Gets the connection state"""
+        return not self.__stopThreads
+
+    def SendAction(self, action: robotcontrolapp_pb2.AppAction):
+        """
+        Queues an action to be sent to the robot control. If the lane of the action is full this blocks, drops a
+        superseded UI update or raises an ActionQueue.ActionQueueFullException, see SetActionQueueLimit().
+        """
+        action.app_name = self.GetAppName()
+        with self.__actionStatisticsMutex:
+            self.__actionStatistics.queuedActions += 1
+        self.__actionsQueue.Put(action)
+        self.__metrics.RecordActionQueueDepth(self.__actionsQueue.qsize())
+
+    def SetActionQueueLimit(
+        self,
+        lane: int,
+        maxSize: int,
+        policy: str = OVERFLOW_BLOCK,
+        blockTimeout: float = 10.0,
+    ):
+        """
+        Sets the maximum number of queued actions of a lane. By default function results are unlimited, UI state
+        requests are limited to 1000 and UI updates to 200 (the oldest superseded UI update is dropped).
+        Parameters:
+            lane: ActionQueue.LANE_FUNCTIONS, LANE_DEFAULT or LANE_UI
+            maxSize: maximum number of queued actions, None for unlimited
+            policy: what SendAction() does if the lane is full: ActionQueue.OVERFLOW_BLOCK (wait for space),
+                OVERFLOW_DROP_SUPERSEDED (drop the oldest queued update of the same UI elements, otherwise wait) or
+                OVERFLOW_RAISE (raise an ActionQueueFullException)
+            blockTimeout: maximum time in s SendAction() waits for space before it raises an ActionQueueFullException,
+                None to wait forever
+        """
+        self.__actionsQueue.SetLaneLimit(lane, maxSize, policy, blockTimeout)
+
+    def GetActionStatistics(self, reset: bool = False) -> ActionStatistics:
+        """
+        Gets the number of queued actions and sent messages, compare these to see the effect of actionCoalesceWindow
+        Parameters:
+            reset: if true the counters are reset after reading
+        Returns:
+            counters since the app was created or since the last reset
+        """
+        with self.__actionStatisticsMutex:
+            now = time.perf_counter()
+            result = ActionStatistics(
+                now - self.__actionStatisticsStart,
+                self.__actionStatistics.queuedActions,
+                self.__actionStatistics.sentMessages,
+            )
+            if reset:
+                self.__actionStatistics = ActionStatistics()
+                self.__actionStatisticsStart = now
+            return result
+
+    def SetDefaultCallTimeout(self, timeout: float):
+        """
+        Sets the timeout of requests to the robot control, requests taking longer fail with a grpc.RpcError
+        (DEADLINE_EXCEEDED). The default is 10s, file transfers use longer timeouts (see SetCallTimeout()).
+        Parameters:
+            timeout: timeout in s, None for no timeout
+        """
+        self.__deadlines.defaultTimeout = timeout
+
+    def SetCallTimeout(self, method: str, timeout: float):
+        """
+        Sets the timeout of a gRPC method, this overrides the default timeout
+        Parameters:
+            method: gRPC method name as defined in robotcontrolapp.proto, e.g. "GetRobotState" or "UploadFile"
+            timeout: timeout in s, None for no timeout
+        """
+        self.__deadlines.methodTimeouts[method] = timeout
+
+    def CallTimeout(self, timeout: float):
+        """
+        Overrides the timeout of the requests sent by the current thread within a with block, e.g.:
+            with app.CallTimeout(0.05):
+                state = app.GetRobotState()
+        Parameters:
+            timeout: timeout in s, None for no timeout
+        """
+        return self.__deadlines.Timeout(timeout)
+
+    def CancelAll(self) -> int:
+        """
+        Cancels all running streaming requests and file transfers, e.g. DownloadFileToMemory() or
+        GetProgramVariables(). These return an error or raise a grpc.RpcError (CANCELLED). Other requests are limited
+        by their timeout.
+        Returns:
+            number of cancelled requests
+        """
+        return self.__deadlines.CancelAll()
+
+    def GetMetrics(self, reset: bool = False) -> RpcMetrics:
+        """
+        Gets the number of calls, errors, transferred bytes and latency percentiles of each gRPC method and the number
+        of actions waiting to be sent, sent, dropped and rejected per lane of the action queue
+        Parameters:
+            reset: if true the metrics are reset after reading
+        Returns:
+            metrics since the app was created or since the last reset
+        """
+        metrics = self.__metrics.GetMetrics(reset)
+        laneStatistics = self.__actionsQueue.GetLaneStatistics(reset)
+        for lane, statistics in enumerate(laneStatistics):
+            laneMetrics = metrics.actionLanes.setdefault(
+                LANE_NAMES[lane], ActionLaneMetrics()
+            )
+            laneMetrics.queueDepth = statistics.depth
+            laneMetrics.maxQueueDepth = statistics.maxDepth
+            laneMetrics.dropped = statistics.dropped
+            laneMetrics.rejected = statistics.rejected
+        return metrics
+
+    def SetMetricsEnabled(self, enabled: bool):
+        """Enables or disables recording the metrics, they are enabled by default"""
+        self.__metrics.enabled = enabled
+
+    def StartMetricsDump(self, fileName: str, interval: float = 10.0):
+        """
+        Periodically appends the metrics to a file, one JSON object per line. The metrics are reset after each dump, so
+        each line covers one interval.
+        Parameters:
+            fileName: file to append to
+            interval: time in s between two dumps
+        """
+        self.StopMetricsDump()
+        self.__metricsDumpStop.clear()
+        self.__metricsDumpThread = Thread(
+            target=self.__MetricsDumpThread,
+            args=(fileName, interval),
+            name="MetricsDump",
+            daemon=True,
+        )
+        self.__metricsDumpThread.start()
+
+    def StopMetricsDump(self):
+        """Stops writing the metrics to a file, see StartMetricsDump()"""
+        if self.__metricsDumpThread is not None:
+            self.__metricsDumpStop.set()
+            self.__metricsDumpThread.join()
+            self.__metricsDumpThread = None
+
+    def __MetricsDumpThread(self, fileName: str, interval: float):
+        """Appends the metrics to a file until StopMetricsDump() is called"""
+        stopped = False
+        while not stopped:
+            stopped = self.__metricsDumpStop.wait(interval)
+            metrics = self.GetMetrics(reset=True).ToDict()
+            metrics["app"] = self.GetAppName()
+            metrics["time"] = time.time()
+            try:
+                with open(fileName, "a") as file:
+                    file.write(json.dumps(metrics) + "\n")
+            except OSError as ex:
+                self.log.Error("Failed to write metrics to '%s': %s", fileName, ex)
+
+    def GetFunctionTrace(self, reset: bool = False) -> FunctionTrace:
+        """
+        Gets how long the robot programs waited on the app functions: the latency percentiles per function name, the
+        running calls and the slowest calls with their parameters. A call is measured from receiving it until
+        SendFunctionDone() or SendFunctionFailed().
+        Parameters:
+            reset: if true the latencies and the slowest calls are reset after reading
+        Returns:
+            trace since the app was created or since the last reset
+        """
+        return self.__functionTracer.GetTrace(reset)
+
+    def SetFunctionTracingEnabled(self, enabled: bool):
+        """Enables or disables tracing the app function calls, it is enabled by default"""
+        self.__functionTracer.enabled = enabled
+
+    def WriteFunctionTrace(self, fileName: str):
+        """
+        Writes the latest 10000 app function calls and the running calls to a file in the Chrome trace event format,
+        open it in chrome://tracing or https://ui.perfetto.dev to see when the calls ran and how they overlapped
+        Parameters:
+            fileName: file to write, it is replaced
+        """
+        self.__functionTracer.WriteTraceFile(fileName, self.GetAppName())
+
+    def GetHandlerMetrics(self, reset: bool = False) -> dict[str, HandlerMetrics]:
+        """
+        Gets the number of calls, errors and the time percentiles of each handler registered with @app_function or
+        @ui_event, measured from receiving the event until the handler returned
+        Parameters:
+            reset: if true the timings are reset after reading
+        Returns:
+            HandlerRegistry.HandlerMetrics by handler method name
+        """
+        return self.__handlers.GetMetrics(reset)
+
+    def GetUiCoalescingMetrics(self, reset: bool = False) -> "UiCoalescingMetrics":
+        """
+        Gets the number of received, handled and collapsed UI updates while uiCoalescingWindow is set
+        Parameters:
+            reset: if true the counts are reset after reading
+        """
+        from .UiEventCoalescer import UiCoalescingMetrics
+
+        if self.__uiCoalescer is None:
+            return UiCoalescingMetrics()
+        return self.__uiCoalescer.GetMetrics(reset)
+
+    def GetConnectTiming(self) -> ConnectTiming:
+        """Gets the time spent in the steps of the last Connect() and until the first event was received"""
+        timing = self.__connectTiming
+        firstEventTime = self.__firstEventTime
+        if timing.firstEvent is None and firstEventTime is not None:
+            timing.firstEvent = firstEventTime - self.__connectStartTime
+        return timing
+
+    def WaitFirstEvent(self, timeout: float = None) -> bool:
+        """
+        Waits until the first event (e.g. a UI update or an app function call) after Connect() was received
+        Parameters:
+            timeout: maximum time in s to wait, None to wait forever
+        Returns:
+            true if an event was received, false on timeout
+        """
+        return self.__firstEventReceived.wait(timeout)
+
+    def GetConnectedSystemInfo(self) -> SystemInfo:
+        """Gets the system info received on the last connect without sending a request, None if never connected"""
+        return self.__systemInfo
+
+    def GetReconnectCount(self) -> int:
+        """Gets the number of successful automatic reconnects since the app was created"""
+        return self.__reconnectCount
+
+    def __GetAppNameRequest(self, requestType: type):
+        """
+        Gets the shared request of the given type that only contains the app name. This saves creating a request for
+        each call. The request must not be modified, gRPC only reads it, so it can be used by several threads.
+        Parameters:
+            requestType: request message class, e.g. robotcontrolapp_pb2.GetTCPRequest
+        """
+        request = self.__appNameRequests.get(requestType)
+        if request is None:
+            request = requestType(app_name=self.GetAppName())
+            self.__appNameRequests[requestType] = request
+        return request
+
+    def __CreateChannel(self):
+        """Creates the channel and the stub, in an AppHost this adds the interceptors of the app to the shared channel"""
+        if self.__host is not None:
+            self.__grpcChannel = self.__host.InterceptChannel(
+                [self.__metrics, self.__deadlines]
+            )
+        else:
+            self.__grpcChannel = self.__channelProfile.CreateChannel(
+                self.__targetSocket, [self.__metrics, self.__deadlines]
+            )
+        self.__grpcStub = RobotControlAppStub(self.__grpcChannel)
+
+    def __WaitChannelReady(self) -> bool:
+        """Waits up to connectTimeout until the channel is connected, returns false on timeout"""
+        if self.__host is not None:
+            return self.__host.WaitChannelReady(self.connectTimeout)
+        try:
+            grpc.channel_ready_future(self.__grpcChannel).result(
+                timeout=self.connectTimeout
+            )
+            return True
+        except grpc.FutureTimeoutError:
+            return False
+
+    def __CloseChannel(self):
+        """
+        Closes the channel, this ends all calls. The shared channel of an AppHost stays open for the other apps, only
+        the calls of this app are cancelled.
+        """
+        if self.__host is not None:
+            self.__deadlines.CancelAll()
+            if self.__receivedActions is not None:
+                self.__receivedActions.cancel()
+        else:
+            self.__grpcChannel.close()
+        self.__channelClosed = True
+
+    def __OpenActionsStream(self):
+        """Opens the bidirectional actions stream. Actions that are still queued are sent via the new stream."""
+        self.__streamGeneration += 1
+        replayActions = []
+        if self.__unconfirmedAction is not None:
+            replayActions.append(self.__unconfirmedAction)
+            self.__unconfirmedAction = None
+
+        # Wake up the iterator of the previous stream (if it is still waiting) so that it ends
+        self.__actionsQueue.Put(None)
+
+        # Send an empty action at startup (this is sent first by the stream and tells the server the app name)
+        initialAction = robotcontrolapp_pb2.AppAction()
+        initialAction.app_name = self.GetAppName()
+        self.__receivedActions = self.__grpcStub.RecieveActions(
+            self.__ActionsIterator(
+                self.__streamGeneration, [initialAction] + replayActions
+            )
+        )
+
+    def __ActionsIterator(
+        self, generation: int, initialActions: List[robotcontrolapp_pb2.AppAction]
+    ):
+        """
+        Yields the actions to send for one actions stream. gRPC requests the next action only after the previous one
+        was sent, so only the last yielded action can be lost if the stream fails. This is replayed on reconnect.
+        Parameters:
+            generation: stream generation, the iterator ends when a newer stream was opened
+            initialActions: actions to send before the queued actions
+        """
+        for action in initialActions:
+            self.__unconfirmedAction = action
+            yield action
+            self.__unconfirmedAction = None
+
+        while True:
+            entry = self.__actionsQueue.Get()
+            # Set this before checking the generation, a concurrent reconnect then either replays it or we hand it over
+            self.__unconfirmedAction = entry.action
+            if generation != self.__streamGeneration:
+                # This stream was replaced, hand the action over to the new stream
+                self.__unconfirmedAction = None
+                if entry.action is not None:
+                    self.__actionsQueue.Requeue(entry)
+                return
+            if entry.action is None:
+                if self.__stopThreads:
+                    return
+                # wake up meant for the iterator of a previous stream
+                continue
+
+            entries = [entry]
+            action = entry.action
+            if self.actionCoalesceWindow > 0:
+                action = self.__CoalesceActions(entries, generation)
+                self.__unconfirmedAction = action
+
+            with self.__actionStatisticsMutex:
+                self.__actionStatistics.sentMessages += 1
+            now = time.perf_counter()
+            for sentEntry in entries:
+                self.__metrics.RecordActionSent(
+                    LANE_NAMES[sentEntry.lane],
+                    now - sentEntry.queuedTime,
+                    sentEntry.action.ByteSize(),
+                )
+            self.__metrics.RecordActionQueueDepth(self.__actionsQueue.qsize())
+            yield action
+            self.__unconfirmedAction = None
+
+    def __CoalesceActions(
+        self, entries: List[QueuedAction], generation: int
+    ) -> robotcontrolapp_pb2.AppAction:
+        """
+        Merges the actions of the same lane queued within actionCoalesceWindow into the given action. The repeated
+        fields (done and failed functions, variables, UI changes and UI state requests) keep their order.
+        Parameters:
+            entries: list containing the first action, the merged actions are appended
+            generation: stream generation, merging stops when a newer stream was opened
+        Returns:
+            merged action
+        """
+        first = entries[0]
+        merged = robotcontrolapp_pb2.AppAction()
+        merged.CopyFrom(first.action)
+        size = first.action.ByteSize()
+        endTime = time.perf_counter() + self.actionCoalesceWindow
+        while size < self.actionCoalesceMaxBytes:
+            remaining = endTime - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                entry = self.__actionsQueue.Get(timeout=remaining)
+            except Empty:
+                break
+            if (
+                entry.action is None
+                or entry.lane != first.lane
+                or generation != self.__streamGeneration
+            ):
+                # let the main loop handle wake ups, other lanes and stream changes
+                self.__actionsQueue.Requeue(entry)
+                break
+            merged.MergeFrom(entry.action)
+            size += entry.action.ByteSize()
+            entries.append(entry)
+        return merged
+
+    def __Reconnect(self) -> bool:
+        """
+        Reconnects after the connection was lost. The wait time between two attempts grows exponentially with random
+        jitter, so that many apps do not hit a restarting robot control at the same time.
+        Returns:
+            true if reconnected, false if the app was disconnected while trying
+        """
+        delay = self.reconnectDelayMin
+        while not self.__stopThreads:
+            # Wait a random time between half and the full delay
+            if self.__stopEvent.wait(random.uniform(delay / 2, delay)):
+                return False
+
+            try:
+                if self.__host is None:
+                    # The shared channel of an AppHost reconnects by itself
+                    self.__grpcChannel.close()
+                    self.__CreateChannel()
+
+                # Fails fast if the robot control is not available yet
+                self.SendCapabilities()
+                self.__OpenActionsStream()
+            except grpc.RpcError as ex:
+                self.__connectionLog.Debug(
+                    "reconnect failed, retrying in up to %.1fs: %s",
+                    delay * 2,
+                    ex.code(),
+                )
+                delay = min(delay * 2, self.reconnectDelayMax)
+                continue
+
+            if self.__stopThreads:
+                return False
+            self.__reconnectCount += 1
+            self.__connectionLog.Info("reconnected")
+            self._OnReconnected()
+            return True
+        return False
+
+    def EventReaderThread(self):
+        """This thread handles reading the received actions"""
+        while not self.__stopThreads:
+            try:
+                receivedAction = self.__receivedActions.next()
+            except grpc.RpcError as ex:
+                # Print error only if we did not disconnect first
+                if not self.__stopThreads:
+                    self.__connectionLog.Warning("lost connection: %s", ex.details())
+                    if not self.autoReconnect or not self.__Reconnect():
+                        self.__stopThreads = True
+                continue
+
+            if self.__firstEventTime is None:
+                self.__firstEventTime = time.perf_counter()
+                self.__firstEventReceived.set()
+
+            # The handlers report their own errors, a failed call in a handler does not affect the connection
+            if len(receivedAction.ui_updates) > 0:
+                self.__QueueUiUpdates(receivedAction.ui_updates)
+            if len(receivedAction.function.name) > 0:
+                self.__StartAppFunction(receivedAction.function)
+
+            if receivedAction.HasField("disconnect_request"):
+                self.__connectionLog.Warning(
+                    "Server requested disconnect, reason: %s",
+                    receivedAction.disconnect_request.reason,
+                )
+                self.__stopThreads = True
+                return
+
+    def __QueueUiUpdates(self, updates):
+        """Handles received UI updates now or, if uiCoalescingWindow is set, after the coalescing window"""
+        self.__eventLog.Debug("%d UI updates", len(updates))
+        if self.uiCoalescingWindow <= 0:
+            self.__HandleUiUpdates(updates)
+            return
+        if self.__uiCoalescer is None:
+            from .UiEventCoalescer import UiEventCoalescer
+
+            self.__uiCoalescer = UiEventCoalescer(self.__HandleUiUpdates)
+        self.__uiCoalescer.Add(updates, self.uiCoalescingWindow)
+
+    def __StartAppFunction(self, function: robotcontrolapp_pb2.AppFunction):
+        """Passes a received app function call to its registered handler, the dispatcher or _AppFunctionHandler()"""
+        self.__eventLog.Debug(
+            "app function '%s' called, call ID %d", function.name, function.call_id
+        )
+        self.__functionTracer.Start(function)
+        if self.__handlers.DispatchFunction(self, function):
+            return
+        if self.functionDispatcher is not None:
+            self.functionDispatcher.Dispatch(
+                function, self.__RunAppFunctionHandler, self.SendFunctionFailed
+            )
+        else:
+            self.__RunAppFunctionHandler(function)
+
+    def __HandleUiUpdates(self, updates):
+        """Runs the registered UI event handlers, the other updates are passed to _UiUpdateHandler()"""
+        try:
+            updates = self.__handlers.DispatchUIEvents(self, updates)
+            if len(updates) > 0:
+                self._UiUpdateHandler(updates)
+        except Exception as ex:
+            self.__eventLog.Error("UI update handler raised an exception: %r", ex)
+
+    def __RunAppFunctionHandler(self, function: robotcontrolapp_pb2.AppFunction):
+        """Runs the app function handler (in a dispatcher thread if one is set), exceptions let the function call fail"""
+        try:
+            self._AppFunctionHandler(function)
+        except Exception as ex:
+            self.__eventLog.Error(
+                "App function '%s' (call ID %d) raised an exception: %r",
+                function.name,
+                function.call_id,
+                ex,
+            )
+            if self.IsConnected():
+                self.SendFunctionFailed(function.call_id, repr(ex))
+
+    def GetTCP(self) -> Matrix44:
+        """Gets the tool center point position and orientation"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.GetTCPRequest)
+        response = self.__grpcStub.GetTCP(request)
+        return Matrix44FromGrpc(response)
+
+    def GetTCPAsync(self) -> AppFuture:
+        """Starts GetTCP() without waiting for the response, AppFuture.Result() returns the Matrix44"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.GetTCPRequest)
+        return AppFuture(self.__grpcStub.GetTCP.future(request), Matrix44FromGrpc)
+
+    def GetProgramVariable(
+        self, variableName: str
+    ) -> "ProgramVariable.ProgramVariable":
+        """
+        Gets the program variable, throws exception on error, e.g. if the variable does not exist
+        Parameters:
+            variableName: name of the variable
+        Returns:
+            NumberVariable or PositionVariable
+        """
+        return self.__GetVariable(variableName, "ProgramVariable")
+
+    def GetProgramVariableAsync(self, variableName: str) -> AppFuture:
+        """Starts GetProgramVariable() without waiting for the response, AppFuture.Result() returns the variable"""
+        return self.__GetVariableAsync(variableName, "ProgramVariable")
+
+    def GetNumberVariable(self, variableName: str) -> "ProgramVariable.NumberVariable":
+        """
+        Gets the given number variable, throws on error, e.g. if the variable does not exist or is of a different type
+        Parameters:
+            variableName: name of the variable
+        Returns:
+            number variable
+        """
+        return self.__GetVariable(variableName, "NumberVariable")
+
+    def GetNumberVariableAsync(self, variableName: str) -> AppFuture:
+        """Starts GetNumberVariable() without waiting for the response, AppFuture.Result() returns the variable"""
+        return self.__GetVariableAsync(variableName, "NumberVariable")
+
+    def GetPositionVariable(
+        self, variableName: str
+    ) -> "ProgramVariable.PositionVariable":
+        """
+        Gets the given position variable, throws on error, e.g. if the variable does not exist or is of a different type
+        Parameters:
+            variableName: name of the variable
+        Returns:
+            position variable
+        """
+        return self.__GetVariable(variableName, "PositionVariable")
+
+    def GetPositionVariableAsync(self, variableName: str) -> AppFuture:
+        """Starts GetPositionVariable() without waiting for the response, AppFuture.Result() returns the variable"""
+        return self.__GetVariableAsync(variableName, "PositionVariable")
+
+    def __GetVariable(
+        self, variableName: str, variableClass: str
+    ) -> "ProgramVariable.ProgramVariable":
+        """Reads a single variable, raises if it is missing or has a different type"""
+        if len(variableName) == 0:
+            raise RuntimeError("requested variable with empty name")
+
+        variables = self.GetProgramVariables({variableName})
+        return _SelectVariable(variables, variableName, variableClass)
+
+    def __GetVariableAsync(self, variableName: str, variableClass: str) -> AppFuture:
+        """Starts reading a single variable, AppFuture.Result() raises if it is missing or has a different type"""
+        if len(variableName) == 0:
+            raise RuntimeError("requested variable with empty name")
+
+        return AppFuture(
+            StreamFuture(
+                self.__grpcStub.GetProgramVariables(
+                    self.__ProgramVariablesRequest({variableName})
+                )
+            ),
+            lambda grpcVariables: _SelectVariable(
+                _ProgramVariablesFromGrpc(grpcVariables), variableName, variableClass
+            ),
+        )
+
+    def GetProgramVariables(
+        self, variableNames: set[str]
+    ) -> dict[str, "ProgramVariable.ProgramVariable"]:
+        """
+        Gets program variables
+        Parameters:
+            variableNames: set of program variables to request
+        Returns:
+            map of program variables, key is the variable name
+        """
+        request = self.__ProgramVariablesRequest(variableNames)
+        return _ProgramVariablesFromGrpc(self.__grpcStub.GetProgramVariables(request))
+
+    def GetProgramVariablesAsync(self, variableNames: set[str]) -> AppFuture:
+        """
+        Starts GetProgramVariables() without waiting for the response, AppFuture.Result() returns the map of program
+        variables. The response stream is read by a background thread.
+        """
+        request = self.__ProgramVariablesRequest(variableNames)
+        return AppFuture(
+            StreamFuture(self.__grpcStub.GetProgramVariables(request)),
+            _ProgramVariablesFromGrpc,
+        )
+
+    def __ProgramVariablesRequest(
+        self, variableNames: set[str]
+    ) -> robotcontrolapp_pb2.ProgramVariablesRequest:
+        """Creates the request of GetProgramVariables(), empty names are skipped"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.ProgramVariablesRequest()
+        request.app_name = self.GetAppName()
+        for variableName in variableNames:
+            if len(variableName) > 0:
+                request.variable_names.append(variableName)
+        return request
+
+    def SetNumberVariable(self, name: str, value: float):
+        """
+        Sets a number variable
+        Parameters:
+            name: name of the variable
+            value: value to set
+        """
+        request, variable = self.__SetVariableRequest(name)
+        variable.number = value
+        self.__grpcStub.SetProgramVariables(request)
+
+    def SetNumberVariableAsync(self, name: str, value: float) -> AppFuture:
+        """Starts SetNumberVariable() without waiting for the response"""
+        request, variable = self.__SetVariableRequest(name)
+        variable.number = value
+        return AppFuture(self.__grpcStub.SetProgramVariables.future(request))
+
+    def __SetVariableRequest(self, name: str) -> tuple[
+        robotcontrolapp_pb2.SetProgramVariablesRequest,
+        robotcontrolapp_pb2.ProgramVariable,
+    ]:
+        """Creates the request of SetProgramVariables() with one variable, the caller sets the value"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+        if not name:
+            raise RuntimeError("empty variable name")
+        if " " in name:
+            raise RuntimeError("space in variable name")
+
+        request = robotcontrolapp_pb2.SetProgramVariablesRequest()
+        request.app_name = self.GetAppName()
+        variable = request.variables.add()
+        variable.name = name
+        return request, variable
+
+    def SetPositionVariableJoints(
+        self,
+        name: str,
+        a1: float,
+        a2: float,
+        a3: float,
+        a4: float,
+        a5: float,
+        a6: float,
+        e1: float,
+        e2: float,
+        e3: float,
+    ):
+        """
+        Sets a position variable with joint angles. The robot control will try to convert these to cartesian.
+        Parameters:
+            name: name of the variable
+            a1: position of robot axis 1 in degrees or mm
+            a2: position of robot axis 2 in degrees or mm
+            a3: position of robot axis 3 in degrees or mm
+            a4: position of robot axis 4 in degrees or mm
+            a5: position of robot axis 5 in degrees or mm
+            a6: position of robot axis 6 in degrees or mm
+            e1: position of external axis 1 in degrees, mm or user defined units
+            e2: position of external axis 2 in degrees, mm or user defined units
+            e3: position of external axis 3 in degrees, mm or user defined units
+        """
+        request = self.__PositionVariableRequest(
+            name, None, [a1, a2, a3, a4, a5, a6], [e1, e2, e3]
+        )
+        self.__grpcStub.SetProgramVariables(request)
+
+    def SetPositionVariableJointsAsync(
+        self,
+        name: str,
+        a1: float,
+        a2: float,
+        a3: float,
+        a4: float,
+        a5: float,
+        a6: float,
+        e1: float,
+        e2: float,
+        e3: float,
+    ) -> AppFuture:
+        """Starts SetPositionVariableJoints() without waiting for the response"""
+        request = self.__PositionVariableRequest(
+            name, None, [a1, a2, a3, a4, a5, a6], [e1, e2, e3]
+        )
+        return AppFuture(self.__grpcStub.SetProgramVariables.future(request))
+
+    def SetPositionVariableCart(
+        self, name: str, cartesianPosition: Matrix44, e1: float, e2: float, e3: float
+    ):
+        """
+        Sets a position variable with a cartesian position. The robot control will try to convert this to joint angles
+        Parameters:
+            name: name of the variable
+            cartesianPosition: cartesian position and orientation
+            e1: position of external axis 1 in degrees, mm or user defined units
+            e2: position of external axis 2 in degrees, mm or user defined units
+            e3: position of external axis 3 in degrees, mm or user defined units
+        """
+        request = self.__PositionVariableRequest(
+            name, cartesianPosition, None, [e1, e2, e3]
+        )
+        self.__grpcStub.SetProgramVariables(request)
+
+    def SetPositionVariableCartAsync(
+        self, name: str, cartesianPosition: Matrix44, e1: float, e2: float, e3: float
+    ) -> AppFuture:
+        """Starts SetPositionVariableCart() without waiting for the response"""
+        request = self.__PositionVariableRequest(
+            name, cartesianPosition, None, [e1, e2, e3]
+        )
+        return AppFuture(self.__grpcStub.SetProgramVariables.future(request))
+
+    def SetPositionVariableBoth(
+        self,
+        name: str,
+        cartesianPosition: Matrix44,
+        a1: float,
+        a2: float,
+        a3: float,
+        a4: float,
+        a5: float,
+        a6: float,
+        e1: float,
+        e2: float,
+        e3: float,
+    ):
+        """
+        Sets a position variable with joint angles and cartesian position. Warning: joint angles and cartesian may refer to
+        different positions!
+        Parameters:
+            name: name of the variable
+            cartesianPosition: cartesian position and orientation
+            a1: position of robot axis 1 in degrees or mm
+            a2: position of robot axis 2 in degrees or mm
+            a3: position of robot axis 3 in degrees or mm
+            a4: position of robot axis 4 in degrees or mm
+            a5: position of robot axis 5 in degrees or mm
+            a6: position of robot axis 6 in degrees or mm
+            e1: position of external axis 1 in degrees, mm or user defined units
+            e2: position of external axis 2 in degrees, mm or user defined units
+            e3: position of external axis 3 in degrees, mm or user defined units
+        """
+        request = self.__PositionVariableRequest(
+            name, cartesianPosition, [a1, a2, a3, a4, a5, a6], [e1, e2, e3]
+        )
+        self.__grpcStub.SetProgramVariables(request)
+
+    def SetPositionVariableBothAsync(
+        self,
+        name: str,
+        cartesianPosition: Matrix44,
+        a1: float,
+        a2: float,
+        a3: float,
+        a4: float,
+        a5: float,
+        a6: float,
+        e1: float,
+        e2: float,
+        e3: float,
+    ) -> AppFuture:
+        """Starts SetPositionVariableBoth() without waiting for the response"""
+        request = self.__PositionVariableRequest(
+            name, cartesianPosition, [a1, a2, a3, a4, a5, a6], [e1, e2, e3]
+        )
+        return AppFuture(self.__grpcStub.SetProgramVariables.future(request))
+
+    def __PositionVariableRequest(
+        self,
+        name: str,
+        cartesianPosition: Matrix44,
+        joints: list[float],
+        externalJoints: list[float],
+    ) -> robotcontrolapp_pb2.SetProgramVariablesRequest:
+        """
+        Creates the request of SetProgramVariables() with one position variable
+        Parameters:
+            name: name of the variable
+            cartesianPosition: cartesian position and orientation, None to set only the joints
+            joints: positions of the robot axes, None to set only the cartesian position
+            externalJoints: positions of the external axes
+        """
+        request, variable = self.__SetVariableRequest(name)
+        if cartesianPosition is not None and joints is not None:
+            variable.position.both.cartesian.CopyFrom(cartesianPosition.ToGrpc())
+            variable.position.both.robot_joints.joints.extend(joints)
+        elif cartesianPosition is not None:
+            variable.position.cartesian.CopyFrom(cartesianPosition.ToGrpc())
+        else:
+            variable.position.robot_joints.joints.extend(joints)
+        variable.position.external_joints.extend(externalJoints)
+        return request
+
+    def GetParameters(
+        self, function: robotcontrolapp_pb2.AppFunction
+    ) -> "FunctionParameters":
+        """
+        Gets the parameters of an app function call by name. If the function is declared in the app definition file
+        (see appDefinitionFile) the parameters are checked against its declaration.
+        Parameters:
+            function: function call received from the robot control
+        Returns:
+            the parameters, use e.g. GetString() or GetMatrix44() to get their values
+        Raises:
+            FunctionParameters.ParameterException if a declared parameter is missing or has the wrong type
+        """
+        from .FunctionParameters import FunctionParameters, LoadFunctionSchemas
+
+        schema = None
+        if self.appDefinitionFile is not None:
+            schema = LoadFunctionSchemas(self.appDefinitionFile).get(function.name)
+        return FunctionParameters(function, schema)
+
+    def SendFunctionDone(self, callId: int):
+        """
+        Announces to the robot control that the app function call finished. This allows the robot program to continue
+        with the next command.
+        Parameters:
+            callId: function call ID from the function call request
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        response = robotcontrolapp_pb2.AppAction()
+        response.done_functions.append(callId)
+        self.SendAction(response)
+        self.__functionTracer.Finish(callId)
+
+    def SendFunctionFailed(self, callId: int, reason: str):
+        """
+        Announces to the robot control that the app function call failed. This will abort the program with an error message.
+        This is supported from V14-003
+        Parameters:
+            callId: function call ID from the function call request
+            reason: error message
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        response = robotcontrolapp_pb2.AppAction()
+        failedFunction = robotcontrolapp_pb2.FailedFunction()
+        failedFunction.call_id = callId
+        failedFunction.reason = reason
+        response.failed_functions.append(failedFunction)
+        self.SendAction(response)
+        self.__functionTracer.Finish(callId, reason)
+
+    # =========================================================================
+    # Timers
+    # =========================================================================
+    def __GetTimerService(self) -> "TimerService":
+        """Gets the timer service, creates it on first use"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+        with self.__timerServiceMutex:
+            if self.__timerService is None:
+                from .TimerService import TimerService
+
+                self.__timerService = TimerService()
+            return self.__timerService
+
+    def CallAfter(self, delay: float, callback: Callable[[], None]) -> "TimerHandle":
+        """
+        Calls a function after a delay without blocking a thread. All timers are run by a single thread, so the
+        callback must return quickly. Pending timers are dropped on disconnect.
+        Parameters:
+            delay: delay in s
+            callback: function to call
+        Returns:
+            handle to cancel the call
+        """
+        return self.__GetTimerService().CallLater(delay, callback)
+
+    def CallWhen(
+        self,
+        predicate: Callable[[RobotState], bool],
+        callback: Callable[[], None],
+        timeout: float = None,
+        onTimeout: Callable[[], None] = None,
+    ) -> "TimerHandle":
+        """
+        Calls a function when a condition on the robot state becomes true, without blocking a thread. The condition is
+        checked on each state received by the robot state stream, which is started if necessary (see
+        StartRobotStateStream()).
+        Parameters:
+            predicate: function receiving the robot state, returns true when the callback should be called
+            callback: function to call in the robot state stream thread
+            timeout: time in s after which the wait is aborted, None to wait forever
+            onTimeout: function to call if the timeout expired
+        Returns:
+            handle to cancel the wait
+        """
+        handle = self.__GetTimerService().CallWhen(
+            predicate, callback, timeout, onTimeout
+        )
+        if not self.IsRobotStateStreamRunning():
+            self.StartRobotStateStream()
+        return handle
+
+    def SendFunctionDoneAfter(self, callId: int, delay: float) -> "TimerHandle":
+        """
+        Announces that the app function call finished after a delay, without blocking a thread like time.sleep()
+        Parameters:
+            callId: function call ID from the function call request
+            delay: delay in s
+        Returns:
+            handle to cancel
+        """
+        return self.CallAfter(delay, lambda: self.__SendDeferred(callId, None))
+
+    def SendFunctionFailedAfter(
+        self, callId: int, delay: float, reason: str
+    ) -> "TimerHandle":
+        """
+        Announces that the app function call failed after a delay, without blocking a thread
+        Parameters:
+            callId: function call ID from the function call request
+            delay: delay in s
+            reason: error message
+        Returns:
+            handle to cancel
+        """
+        return self.CallAfter(delay, lambda: self.__SendDeferred(callId, reason))
+
+    def SendFunctionDoneWhen(
+        self,
+        callId: int,
+        predicate: Callable[[RobotState], bool],
+        timeout: float = None,
+        timeoutReason: str = "timeout",
+    ) -> "TimerHandle":
+        """
+        Announces that the app function call finished when a condition on the robot state becomes true, see
+        CallWhen()
+        Parameters:
+            callId: function call ID from the function call request
+            predicate: function receiving the robot state, returns true when the function call is done
+            timeout: time in s after which the function call fails, None to wait forever
+            timeoutReason: error message if the timeout expired
+        Returns:
+            handle to cancel
+        """
+        return self.CallWhen(
+            predicate,
+            lambda: self.__SendDeferred(callId, None),
+            timeout,
+            lambda: self.__SendDeferred(callId, timeoutReason),
+        )
+
+    def __SendDeferred(self, callId: int, failureReason: str):
+        """Sends a deferred function result, this is skipped if the app disconnected in the meantime"""
+        if not self.IsConnected():
+            return
+        if failureReason is None:
+            self.SendFunctionDone(callId)
+        else:
+            self.SendFunctionFailed(callId, failureReason)
+
+    # =========================================================================
+    # Enabling / disabling motors
+    # =========================================================================
+    def ResetErrors(self):
+        """Resets hardware errors and disables the motors"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.ResetErrorsRequest)
+        self.__grpcStub.ResetErrors(request)
+
+    def EnableMotors(self):
+        """Resets hardware errors and enables the motors"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.EnableMotorsRequest()
+        request.app_name = self.GetAppName()
+        request.enable = True
+        self.__grpcStub.EnableMotors(request)
+
+    def DisableMotors(self):
+        """Disables the motors and IO"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.EnableMotorsRequest()
+        request.app_name = self.GetAppName()
+        request.enable = False
+        self.__grpcStub.EnableMotors(request)
+
+    # =========================================================================
+    # Referencing
+    # =========================================================================
+    def ReferenceAllJoints(self, withReferencingProgram: bool):
+        """
+        Starts referencing all joints.
+        Note that axes will enter position lag error when successfully referenced, this is no issue,
+        simply re-enable the motors.
+        Parameters:
+            withReferencingProgram: if true: call referencing program after referencing, then reference again
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.ReferenceJointsRequest()
+        request.app_name = self.GetAppName()
+        request.reference_all = True
+        request.referencing_program = withReferencingProgram
+        self.__grpcStub.ReferenceJoints(request)
+
+    def ReferencingProgram(self):
+        """
+        Runs the referencing program, then references again. Does not reference before calling the program.
+        Note that axes will enter position lag error when successfully referenced, this is no issue,
+        simply re-enable the motors.
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.ReferenceJointsRequest()
+        request.app_name = self.GetAppName()
+        request.reference_all = False
+        request.referencing_program = True
+        self.__grpcStub.ReferenceJoints(request)
+
+    def ReferenceRobotJoint(self, n: int):
+        """
+        Starts referencing a robot joint.
+        Note that axes will enter position lag error when successfully referenced, this is no issue,
+        simply re-enable the motors.
+        Parameters:
+            n: joint number 0..5
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.ReferenceJointsRequest()
+        request.app_name = self.GetAppName()
+        request.reference_all = False
+        request.referencing_program = False
+        request.reference_robot_joints.append(n)
+        self.__grpcStub.ReferenceJoints(request)
+
+    def ReferenceExternalJoint(self, n: int):
+        """
+        Starts referencing an external joint.
+        Note that axes will enter position lag error when successfully referenced, this is no issue,
+        simply re-enable the motors.
+        Parameters:
+            n: joint number 0..3
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.ReferenceJointsRequest()
+        request.app_name = self.GetAppName()
+        request.reference_all = False
+        request.referencing_program = False
+        request.reference_external_joints.append(n)
+        self.__grpcStub.ReferenceJoints(request)
+
+    def ReferenceJoints(self, robotJoints: set[int], externalJoints: set[int]):
+        """
+        Starts referencing robot and external joints without delay.
+        Note that axes will enter position lag error when successfully referenced, this is no issue,
+        simply re-enable the motors.
+        Paramters:
+            robotJoints: set of robot joint numbers 0..6
+            externalJoints: set of external joint numbers 0..3
+
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.ReferenceJointsRequest()
+        request.app_name = self.GetAppName()
+        request.reference_all = False
+        request.referencing_program = False
+        request.reference_robot_joints.extend(robotJoints)
+        request.reference_external_joints.extend(externalJoints)
+        self.__grpcStub.ReferenceJoints(request)
+
+    # =========================================================================
+    # Robot state
+    # =========================================================================
+    def GetRobotState(self) -> RobotState:
+        """
+        Gets the current state
+        Returns:
+            robot state
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.RobotStateRequest)
+        return RobotStateFromGrpc(self.__grpcStub.GetRobotState(request))
+
+    def GetRobotStateAsync(self) -> AppFuture:
+        """Starts GetRobotState() without waiting for the response, AppFuture.Result() returns the RobotState"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.RobotStateRequest)
+        return AppFuture(
+            self.__grpcStub.GetRobotState.future(request), RobotStateFromGrpc
+        )
+
+    def GetSnapshot(self, fields=None, timeout: float = None) -> Snapshot:
+        """
+        Gets several values with one round trip: the needed requests are sent concurrently, fields that share a
+        request (e.g. SNAPSHOT_ROBOT_STATE and SNAPSHOT_VELOCITY_OVERRIDE) are requested once.
+        Parameters:
+            fields: names of the fields to get, e.g. [SNAPSHOT_ROBOT_STATE, SNAPSHOT_TCP], None for
+                SNAPSHOT_DEFAULT_FIELDS
+            timeout: maximum time in s to wait for all responses, None to wait until the deadlines expire
+        Returns:
+            the snapshot, with the time each response was received
+        Raises:
+            grpc.RpcError if a request failed, grpc.FutureTimeoutError if the timeout expired. The other requests are
+            cancelled then.
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+        if fields is None:
+            fields = SNAPSHOT_DEFAULT_FIELDS
+
+        for name in fields:
+            if name not in _SNAPSHOT_REQUESTS:
+                raise RuntimeError(f"unknown snapshot field '{name}'")
+
+        snapshot = Snapshot(requestTime=time.time())
+        futures = dict()
+        """gRPC futures by method name"""
+        receiveTimes = dict()
+        """Time the response was received by method name"""
+        for name in fields:
+            method, requestType, _ = _SNAPSHOT_REQUESTS[name]
+            if method not in futures:
+                future = getattr(self.__grpcStub, method).future(
+                    self.__GetAppNameRequest(requestType)
+                )
+                future.add_done_callback(
+                    lambda _, method=method: receiveTimes.setdefault(
+                        method, time.time()
+                    )
+                )
+                futures[method] = future
+        snapshot.requestCount = len(futures)
+
+        responses = self.__WaitSnapshotResponses(futures, receiveTimes, timeout)
+        for name in fields:
+            method, _, converter = _SNAPSHOT_REQUESTS[name]
+            setattr(snapshot, name, converter(responses[method]))
+            snapshot.receiveTimes[name] = receiveTimes[method]
+        return snapshot
+
+    @staticmethod
+    def __WaitSnapshotResponses(
+        futures: dict, receiveTimes: dict, timeout: float
+    ) -> dict:
+        """
+        Waits for the responses of GetSnapshot(), cancels the other requests if one fails or the timeout expires
+        Parameters:
+            futures: gRPC futures by method name
+            receiveTimes: time the response was received by method name, this adds missing times
+            timeout: maximum time in s to wait for all responses, None to wait until the deadlines expire
+        Returns:
+            responses by method name
+        """
+        endTime = None if timeout is None else time.perf_counter() + timeout
+        responses = dict()
+        try:
+            for method, future in futures.items():
+                remaining = (
+                    None if endTime is None else max(0.0, endTime - time.perf_counter())
+                )
+                responses[method] = future.result(remaining)
+                # The done callback may run after result() returned
+                receiveTimes.setdefault(method, time.time())
+        except BaseException:
+            # Don't leave the other requests running after a timeout or failure
+            for future in futures.values():
+                if not future.done():
+                    future.cancel()
+            raise
+        return responses
+
+    def StartRobotStateStream(self, decimation: int = 1):
+        """
+        Starts streaming the robot state. The robot control sends the state each cycle (usually each 10 or 20ms) which
+        is much cheaper than calling GetRobotState() that often. The state is passed to OnRobotStateUpdated() and to the
+        subscribers (see SubscribeRobotState()) in the stream reader thread, keep these callbacks short. The latest
+        state is also available via GetLatestRobotState().
+        Parameters:
+            decimation: only every n-th state is passed to the callbacks, the latest state is always updated
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+        if decimation < 1:
+            raise RuntimeError("robot state decimation must be at least 1")
+
+        with self.__robotStateMutex:
+            self.__robotStateDecimation = decimation
+            if self.__robotStateStreamRequested:
+                return
+            self.__robotStateStreamRequested = True
+            if self.__host is not None:
+                # The host reads one stream for all its apps
+                self.__host.SubscribeRobotState(
+                    self.GetAppName(), self.__HandleStreamedRobotState
+                )
+                return
+            self.__robotStateStreamThread = Thread(
+                target=self.__RobotStateStreamThread, daemon=True
+            )
+            self.__robotStateStreamThread.start()
+
+    def StopRobotStateStream(self):
+        """Stops streaming the robot state, see StartRobotStateStream()"""
+        with self.__robotStateMutex:
+            if not self.__robotStateStreamRequested:
+                return
+            self.__robotStateStreamRequested = False
+            host = self.__host
+            if host is None:
+                if self.__robotStateStream is not None:
+                    self.__robotStateStream.cancel()
+                thread = self.__robotStateStreamThread
+
+        if host is not None:
+            # Outside the lock, the host may wait for its stream thread running our callback
+            host.UnsubscribeRobotState(self.__HandleStreamedRobotState)
+        elif threading.current_thread() != thread:
+            thread.join()
+
+    def IsRobotStateStreamRunning(self) -> bool:
+        """Returns true if the robot state stream was started, see StartRobotStateStream()"""
+        return self.__robotStateStreamRequested
+
+    def SubscribeRobotState(self, callback: Callable[[RobotState], None]):
+        """
+        Adds a callback that receives the streamed robot state, see StartRobotStateStream(). The callback is called in
+        the stream reader thread.
+        """
+        with self.__robotStateMutex:
+            self.__robotStateSubscribers = self.__robotStateSubscribers + [callback]
+
+    def UnsubscribeRobotState(self, callback: Callable[[RobotState], None]):
+        """Removes a callback added by SubscribeRobotState()"""
+        with self.__robotStateMutex:
+            self.__robotStateSubscribers = [
+                subscriber
+                for subscriber in self.__robotStateSubscribers
+                if subscriber != callback
+            ]
+
+    def GetLatestRobotState(self) -> RobotState:
+        """
+        Gets the latest robot state received by the robot state stream without sending a request, see
+        StartRobotStateStream()
+        Returns:
+            robot state or None if no state was received yet
+        """
+        with self.__robotStateMutex:
+            if self.__latestRobotStateConverted is None:
+                if self.__latestRobotState is None:
+                    return None
+                self.__latestRobotStateConverted = RobotStateFromGrpc(
+                    self.__latestRobotState
+                )
+            return self.__latestRobotStateConverted
+
+    def __RobotStateStreamThread(self):
+        """This thread reads the robot state stream until it is stopped"""
+        request = robotcontrolapp_pb2.RobotStateRequest()
+        request.app_name = self.GetAppName()
+        while self.__robotStateStreamRequested and not self.__stopThreads:
+            try:
+                with self.__robotStateMutex:
+                    if not self.__robotStateStreamRequested:
+                        return
+                    self.__robotStateStream = self.__grpcStub.GetRobotStateStream(
+                        request
+                    )
+                for grpcState in self.__robotStateStream:
+                    self.__HandleStreamedRobotState(grpcState)
+            except grpc.RpcError as ex:
+                if not self.__robotStateStreamRequested or self.__stopThreads:
+                    return
+                if not self.autoReconnect:
+                    self.__eventLog.Warning(
+                        "lost the robot state stream: %s", ex.details()
+                    )
+                    self.__robotStateStreamRequested = False
+                    return
+
+            # The stream ended or failed, retry after the app reconnected
+            if self.__stopEvent.wait(self.reconnectDelayMin):
+                return
+
+    def __HandleStreamedRobotState(self, grpcState: robotcontrolapp_pb2.RobotState):
+        """Stores a streamed robot state and passes it to the callbacks, called by the stream reader thread"""
+        with self.__robotStateMutex:
+            self.__latestRobotState = grpcState
+            self.__latestRobotStateConverted = None
+            subscribers = self.__robotStateSubscribers
+
+        timerService = self.__timerService
+        if timerService is not None and timerService.HasConditions():
+            timerService.CheckConditions(self.GetLatestRobotState())
+
+        # Convert only the states passed to the callbacks, this is the expensive part
+        self.__robotStateCount += 1
+        if self.__robotStateCount < self.__robotStateDecimation:
+            return
+        self.__robotStateCount = 0
+
+        state = self.GetLatestRobotState()
+        try:
+            self.OnRobotStateUpdated(state)
+            for subscriber in subscribers:
+                subscriber(state)
+        except Exception as ex:
+            self.__eventLog.Error("Robot state callback raised an exception: %r", ex)
+
+    def __MakeIOStateRequest(
+        self, inputs: dict = None, outputs: dict = None, signals: dict = None
+    ) -> robotcontrolapp_pb2.IOStateRequest:
+        """
+        Creates a request setting digital inputs, outputs and global signals
+        Parameters:
+            inputs: map of digital input numbers to states (boolean)
+            outputs: map of digital output numbers to states (boolean)
+            signals: map of global signal numbers to states (boolean)
+        """
+        request = robotcontrolapp_pb2.IOStateRequest()
+        for key, state in (inputs or {}).items():
+            din = request.DIns.add()
+            din.id = key
+            if state:
+                din.state = robotcontrolapp_pb2.DIOState.HIGH
+            else:
+                din.state = robotcontrolapp_pb2.DIOState.LOW
+        for key, state in (outputs or {}).items():
+            dout = request.DOuts.add()
+            dout.id = key
+            if state:
+                dout.target_state = robotcontrolapp_pb2.DIOState.HIGH
+            else:
+                dout.target_state = robotcontrolapp_pb2.DIOState.LOW
+        for key, state in (signals or {}).items():
+            gsig = request.GSigs.add()
+            gsig.id = key
+            if state:
+                gsig.target_state = robotcontrolapp_pb2.DIOState.HIGH
+            else:
+                gsig.target_state = robotcontrolapp_pb2.DIOState.LOW
+
+        request.app_name = self.GetAppName()
+        return request
+
+    def SetDigitalInput(self, number: int, state: bool):
+        """
+        Sets the state of a digital input (only in simulation)
+        Parameters:
+            number: input number (0-63)
+            state: target state
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        self.__grpcStub.SetIOState(self.__MakeIOStateRequest(inputs={number: state}))
+
+    def SetDigitalInputs(self, inputs: dict):
+        """
+        Sets the states of the digital inputs (only in simulation). This bundles all changes in one request.
+        Parameters:
+            inputs: map of digital inputs to set. First element of each tuple is the signal number (0..99),
+                the second element is the requested state (boolean).
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        self.__grpcStub.SetIOState(self.__MakeIOStateRequest(inputs=inputs))
+
+    def SetDigitalInputsAsync(self, inputs: dict) -> AppFuture:
+        """Starts SetDigitalInputs() without waiting for the response"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__MakeIOStateRequest(inputs=inputs)
+        return AppFuture(self.__grpcStub.SetIOState.future(request))
+
+    def SetDigitalOutput(self, number: int, state: bool):
+        """
+        Sets the state of a digital output (only in simulation)
+        Parameters:
+            number: input number (0-63)
+            state: target state
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        self.__grpcStub.SetIOState(self.__MakeIOStateRequest(outputs={number: state}))
+
+    def SetDigitalOutputs(self, outputs: dict):
+        """
+        Sets the states of the digital outputs. This bundles all changes in one request.
+        Parameters:
+            outputs: map of digital outputs to set. First element of each tuple is the signal number (0..99),
+                the second element is the requested state (boolean).
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        self.__grpcStub.SetIOState(self.__MakeIOStateRequest(outputs=outputs))
+
+    def SetDigitalOutputsAsync(self, outputs: dict) -> AppFuture:
+        """Starts SetDigitalOutputs() without waiting for the response"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__MakeIOStateRequest(outputs=outputs)
+        return AppFuture(self.__grpcStub.SetIOState.future(request))
+
+    def SetGlobalSignal(self, number: int, state: bool):
+        """
+        Sets the state of a global signal (only in simulation)
+        Parameters:
+            number: input number (0-63)
+            state: target state
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        self.__grpcStub.SetIOState(self.__MakeIOStateRequest(signals={number: state}))
+
+    def SetGlobalSignals(self, signals: dict):
+        """
+        Sets the states of the global signals. This bundles all changes in one request.
+        Parameters:
+            signals: Set of tuples: first element of each tuple is the signal number (0..99), the second element is the
+                requested state (boolean)
+            signals: map of global signals to set. First element of each tuple is the signal number (0..99), the second
+                element is the requested state (boolean).
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        self.__grpcStub.SetIOState(self.__MakeIOStateRequest(signals=signals))
+
+    def SetGlobalSignalsAsync(self, signals: dict) -> AppFuture:
+        """Starts SetGlobalSignals() without waiting for the response"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__MakeIOStateRequest(signals=signals)
+        return AppFuture(self.__grpcStub.SetIOState.future(request))
+
+    def GetMotionState(self) -> MotionState:
+        """Gets the current motion state (program execution etc)"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.GetMotionStateRequest)
+        return MotionStateFromGrpc(self.__grpcStub.GetMotionState(request))
+
+    def GetMotionStateAsync(self) -> AppFuture:
+        """Starts GetMotionState() without waiting for the response, AppFuture.Result() returns the MotionState"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.GetMotionStateRequest)
+        return AppFuture(
+            self.__grpcStub.GetMotionState.future(request), MotionStateFromGrpc
+        )
+
+    def LoadMotionProgram(self, program: str) -> MotionState:
+        """
+        Loads a motion program synchronously
+        Parameters:
+            program: program to load, relative to the Data/Programs directory
+        Returns:
+            motion state, check request_successful and motionProgram.mainProgram for success
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.MotionInterpolatorRequest()
+        request.app_name = self.GetAppName()
+        request.main_program = program
+        return MotionStateFromGrpc(self.__grpcStub.SetMotionInterpolator(request))
+
+    def UnloadMotionProgram(self) -> MotionState:
+        """
+        Unloads the motion program
+        Returns:
+            motion state after executing the command
+        """
+        return self.LoadMotionProgram("")
+
+    def SetMotionProgramRunState(
+        self, replayMode: robotcontrolapp_pb2.RunState
+    ) -> MotionState:
+        """
+        Sets the run state (start / stop / pause) of the motion program
+        Parameters:
+            replayMode: replay mode to set
+        Returns:
+            motion state after executing the command
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.MotionInterpolatorRequest()
+        request.app_name = self.GetAppName()
+        request.runstate = replayMode
+        return MotionStateFromGrpc(self.__grpcStub.SetMotionInterpolator(request))
+
+    def StartMotionProgram(self) -> MotionState:
+        """
+        Starts or continues the motion program
+        Returns:
+            motion state after executing the command
+        """
+        return self.SetMotionProgramRunState(robotcontrolapp_pb2.RunState.RUNNING)
+
+    # def StartMotionProgramAt(self, commandIdx: int, subProgram: str) -> MotionState:
+    #     """
+    #     Pauses the motion program at a specific command. Note: if you pass a program that is not loaded as main or
+    #     sub-program it will be loaded as main
+    #     """
+    #     if not self.IsConnected():
+    #         raise NotConnectedException()
+
+    #     request = robotcontrolapp_pb2.MotionInterpolatorRequest()
+    #     request.app_name = self.GetAppName()
+    #     request.runstate = robotcontrolapp_pb2.RunState.RUNNING
+    #     request.start_at.program = subProgram
+    #     request.start_at.command = commandIdx
+    #     return MotionStateFromGrpc(self.__grpcStub.SetMotionInterpolator(request))
+
+    def PauseMotionProgram(self) -> MotionState:
+        """
+        Pauses the motion program
+        Returns:
+            motion state after executing the command
+        """
+        return self.SetMotionProgramRunState(robotcontrolapp_pb2.RunState.PAUSED)
+
+    def StopMotionProgram(self) -> MotionState:
+        """
+        Stops the motion program
+        Returns:
+            motion state after executing the command
+        """
+        return self.SetMotionProgramRunState(robotcontrolapp_pb2.RunState.NOT_RUNNING)
+
+    def SetMotionProgramReplayMode(
+        self, replayMode: robotcontrolapp_pb2.ReplayMode
+    ) -> MotionState:
+        """
+        Sets the replay mode (single / repeat / step) of the motion program
+        Parameters:
+            replayMode: replay mode to set
+        Returns:
+            motion state after executing the command
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.MotionInterpolatorRequest()
+        request.app_name = self.GetAppName()
+        request.replay_mode = replayMode
+        return MotionStateFromGrpc(self.__grpcStub.SetMotionInterpolator(request))
+
+    def SetMotionProgramSingle(self) -> MotionState:
+        """
+        Sets the motion program to run once
+        Returns:
+            motion state after executing the command
+        """
+        return self.SetMotionProgramReplayMode(robotcontrolapp_pb2.ReplayMode.SINGLE)
+
+    def SetMotionProgramRepeat(self) -> MotionState:
+        """
+        Sets the motion program to repeat
+        Returns:
+            motion state after executing the command
+        """
+        return self.SetMotionProgramReplayMode(robotcontrolapp_pb2.ReplayMode.REPEAT)
+
+    def SetMotionProgramStep(self) -> MotionState:
+        """
+        Sets the motion program to pause after each step
+        Returns:
+            motion state after executing the command
+        """
+        return self.SetMotionProgramReplayMode(robotcontrolapp_pb2.ReplayMode.STEP)
+
+    def LoadLogicProgram(self, program: str) -> MotionState:
+        """
+        Loads and starts a logic program synchronously
+        Parameters:
+            program: program to load, relative to the Data/Programs directory
+        Returns:
+            motion state, check request_successful and logicProgram.mainProgram for success
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.LogicInterpolatorRequest()
+        request.app_name = self.GetAppName()
+        request.main_program = program
+        return MotionStateFromGrpc(self.__grpcStub.SetLogicInterpolator(request))
+
+    def UnloadLogicProgram(self) -> MotionState:
+        """
+        Unloads the logic program
+        Returns:
+            motion state after executing the command
+        """
+        return self.LoadLogicProgram("")
+
+    def MoveToJoint(
+        self,
+        velocityPercent: float,
+        acceleration: float,
+        a1: float,
+        a2: float,
+        a3: float,
+        a4: float,
+        a5: float,
+        a6: float,
+        e1: float,
+        e2: float,
+        e3: float,
+    ) -> MotionState:
+        """
+        Starts a joint motion to the given position
+        Parameters:
+            velocityPercent: velocity in percent, 0.0..100.0
+            acceleration: acceleration in percent, 0.0..100.0, negative values result in default value 40%
+            a1: A1 target in degrees or mm
+            a2: A2 target in degrees or mm
+            a3: A3 target in degrees or mm
+            a4: A4 target in degrees or mm
+            a5: A5 target in degrees or mm
+            a6: A6 target in degrees or mm
+            e1: E1 target in degrees, mm or user defined units
+            e2: E2 target in degrees, mm or user defined units
+            e3: E3 target in degrees, mm or user defined units
+        Returns:
+            motion state after executing the command
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.MoveToRequest()
+        request.app_name = self.GetAppName()
+        request.joint.velocity = velocityPercent
+        request.joint.acceleration = acceleration
+        request.joint.robot_joints.append(a1)
+        request.joint.robot_joints.append(a2)
+        request.joint.robot_joints.append(a3)
+        request.joint.robot_joints.append(a4)
+        request.joint.robot_joints.append(a5)
+        request.joint.robot_joints.append(a6)
+        request.joint.external_joints.append(e1)
+        request.joint.external_joints.append(e2)
+        request.joint.external_joints.append(e3)
+        return MotionStateFromGrpc(self.__grpcStub.MoveTo(request))
+
+    def MoveToJointRelative(
+        self,
+        velocityPercent: float,
+        acceleration: float,
+        a1: float,
+        a2: float,
+        a3: float,
+        a4: float,
+        a5: float,
+        a6: float,
+        e1: float,
+        e2: float,
+        e3: float,
+    ) -> MotionState:
+        """
+        Starts a relative joint motion to the given position
+        Parameters:
+            velocityPercent: velocity in percent, 0.0..100.0
+            acceleration: acceleration in percent, 0.0..100.0, negative values result in default value 40%
+            a1: A1 target in degrees or mm
+            a2: A2 target in degrees or mm
+            a3: A3 target in degrees or mm
+            a4: A4 target in degrees or mm
+            a5: A5 target in degrees or mm
+            a6: A6 target in degrees or mm
+            e1: E1 target in degrees, mm or user defined units
+            e2: E2 target in degrees, mm or user defined units
+            e3: E3 target in degrees, mm or user defined units
+        Returns:
+            motion state after executing the command
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.MoveToRequest()
+        request.app_name = self.GetAppName()
+        request.joint_relative.velocity = velocityPercent
+        request.joint_relative.acceleration = acceleration
+        request.joint_relative.robot_joints.append(a1)
+        request.joint_relative.robot_joints.append(a2)
+        request.joint_relative.robot_joints.append(a3)
+        request.joint_relative.robot_joints.append(a4)
+        request.joint_relative.robot_joints.append(a5)
+        request.joint_relative.robot_joints.append(a6)
+        request.joint_relative.external_joints.append(e1)
+        request.joint_relative.external_joints.append(e2)
+        request.joint_relative.external_joints.append(e3)
+        return MotionStateFromGrpc(self.__grpcStub.MoveTo(request))
+
+    def MoveToLinear(
+        self,
+        velocityMms: float,
+        acceleration: float,
+        x: float,
+        y: float,
+        z: float,
+        a: float,
+        b: float,
+        c: float,
+        e1: float,
+        e2: float,
+        e3: float,
+        frame: str,
+    ) -> MotionState:
+        """
+        Starts a linear motion to the given position
+        Parameters:
+            velocityMms: velocity in mm/s
+            acceleration: acceleration in percent, 0.0..100.0, negative values result in default value 40%
+            x: X position in mm
+            y: Y position in mm
+            z: Z position in mm
+            a: A orientation in mm
+            b: B orientation in mm
+            c: C orientation in mm
+            e1: E1 target in degrees, mm or user defined units
+            e2: E2 target in degrees, mm or user defined units
+            e3: E3 target in degrees, mm or user defined units
+            frame: user frame or empty for base frame
+        Returns:
+            motion state after executing the command
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.MoveToRequest()
+        request.app_name = self.GetAppName()
+        request.cart.velocity = velocityMms
+        request.cart.acceleration = acceleration
+        request.cart.position.x = x
+        request.cart.position.y = y
+        request.cart.position.z = z
+        request.cart.orientation.x = a
+        request.cart.orientation.y = b
+        request.cart.orientation.z = c
+        request.cart.external_joints.append(e1)
+        request.cart.external_joints.append(e2)
+        request.cart.external_joints.append(e3)
+        request.cart.frame = frame
+        return MotionStateFromGrpc(self.__grpcStub.MoveTo(request))
+
+    def MoveToLinearRelativeBase(
+        self,
+        velocityMms: float,
+        acceleration: float,
+        x: float,
+        y: float,
+        z: float,
+        a: float,
+        b: float,
+        c: float,
+        e1: float,
+        e2: float,
+        e3: float,
+        frame: str,
+    ) -> MotionState:
+        """
+        Starts a linear motion to the given position
+        Parameters:
+            velocityMms: velocity in mm/s
+            acceleration: acceleration in percent, 0.0..100.0, negative values result in default value 40%
+            x: X position in mm
+            y: Y position in mm
+            z: Z position in mm
+            a: A orientation in mm, currently not used
+            b: B orientation in mm, currently not used
+            c: C orientation in mm, currently not used
+            e1: E1 target in degrees, mm or user defined units
+            e2: E2 target in degrees, mm or user defined units
+            e3: E3 target in degrees, mm or user defined units
+            frame: user frame or empty for base frame
+        Returns:
+            motion state after executing the command
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.MoveToRequest()
+        request.app_name = self.GetAppName()
+        request.cart_relative_base.velocity = velocityMms
+        request.cart_relative_base.acceleration = acceleration
+        request.cart_relative_base.position.x = x
+        request.cart_relative_base.position.y = y
+        request.cart_relative_base.position.z = z
+        request.cart_relative_base.orientation.x = a
+        request.cart_relative_base.orientation.y = b
+        request.cart_relative_base.orientation.z = c
+        request.cart_relative_base.external_joints.append(e1)
+        request.cart_relative_base.external_joints.append(e2)
+        request.cart_relative_base.external_joints.append(e3)
+        request.cart_relative_base.frame = frame
+        return MotionStateFromGrpc(self.__grpcStub.MoveTo(request))
+
+    def MoveToLinearRelativeTool(
+        self,
+        velocityMms: float,
+        acceleration: float,
+        x: float,
+        y: float,
+        z: float,
+        a: float,
+        b: float,
+        c: float,
+        e1: float,
+        e2: float,
+        e3: float,
+    ) -> MotionState:
+        """
+        Starts a linear motion to the given position
+        Parameters:
+        velocityMms: velocity in mm/s
+            acceleration: acceleration in percent, 0.0..100.0, negative values result in default value 40%
+            x: X position in mm
+            y: Y position in mm
+            z: Z position in mm
+            a: A orientation in mm, currently not used
+            b: B orientation in mm, currently not used
+            c: C orientation in mm, currently not used
+            e1: E1 target in degrees, mm or user defined units
+            e2: E2 target in degrees, mm or user defined units
+            e3: E3 target in degrees, mm or user defined units
+        Returns:
+            motion state after executing the command
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.MoveToRequest()
+        request.app_name = self.GetAppName()
+        request.cart_relative_tool.velocity = velocityMms
+        request.cart_relative_tool.acceleration = acceleration
+        request.cart_relative_tool.position.x = x
+        request.cart_relative_tool.position.y = y
+        request.cart_relative_tool.position.z = z
+        request.cart_relative_tool.orientation.x = a
+        request.cart_relative_tool.orientation.y = b
+        request.cart_relative_tool.orientation.z = c
+        request.cart_relative_tool.external_joints.append(e1)
+        request.cart_relative_tool.external_joints.append(e2)
+        request.cart_relative_tool.external_joints.append(e3)
+        return MotionStateFromGrpc(self.__grpcStub.MoveTo(request))
+
+    def MoveToStop(self) -> MotionState:
+        """
+        Stops a move-to motion
+        Returns:
+            motion state after executing the command
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.MoveToRequest()
+        request.app_name = self.GetAppName()
+        request.stop.SetInParent()
+        return MotionStateFromGrpc(self.__grpcStub.MoveTo(request))
+
+    def GetTargetVelocities(self) -> tuple[float, float, float]:
+        """
+        Gets the velocities of external axes in velocity mode (e.g. conveyor drives etc.)
+        Returns:
+            tuple of the velocities of e1, e2 and e3 if in velocity mode, otherwise 0. Values are in user-defined units.
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.TargetVelocityRequest)
+
+        response = self.__grpcStub.SetTargetVelocity(request)
+        return _TargetVelocitiesFromGrpc(response)
+
+    def GetTargetVelocitiesAsync(self) -> AppFuture:
+        """Starts GetTargetVelocities() without waiting for the response, AppFuture.Result() returns the tuple"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.TargetVelocityRequest)
+        return AppFuture(
+            self.__grpcStub.SetTargetVelocity.future(request),
+            _TargetVelocitiesFromGrpc,
+        )
+
+    def SetTargetVelocities(
+        self, e1: float, e2: float, e3: float
+    ) -> tuple[float, float, float]:
+        """
+        Sets the target velocities of external axes in velocity mode. Axes that are not in velocity mode are ignored.
+        Parameters:
+            e1: target velocity of external axis 1 in user-defined units
+            e2: target velocity of external axis 2 in user-defined units
+            e3: target velocity of external axis 3 in user-defined units
+        Returns:
+            tuple of the velocities of e1, e2 and e3 if in velocity mode, otherwise 0. Values are in user-defined units.
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.TargetVelocityRequest()
+        request.app_name = self.GetAppName()
+        request.velocity_e1 = e1
+        request.velocity_e2 = e2
+        request.velocity_e3 = e3
+
+        response = self.__grpcStub.SetTargetVelocity(request)
+        return _TargetVelocitiesFromGrpc(response)
+
+    def SetTargetVelocityE1(self, vel: float) -> float:
+        """
+        Sets the target velocity of external axis 1 in velocity mode
+        Parameters:
+            vel: target velocity in user-defined units
+        Returns:
+            new target velocity or 0 if not in velocity mode
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.TargetVelocityRequest()
+        request.app_name = self.GetAppName()
+        request.velocity_e1 = vel
+
+        response = self.__grpcStub.SetTargetVelocity(request)
+        if response.HasField("velocity_e1"):
+            return response.velocity_e1
+        else:
+            return 0
+
+    def SetTargetVelocityE2(self, vel: float) -> float:
+        """
+        Sets the target velocity of external axis 2 in velocity mode
+        Parameters:
+            vel: target velocity in user-defined units
+        Returns:
+            new target velocity or 0 if not in velocity mode
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.TargetVelocityRequest()
+        request.app_name = self.GetAppName()
+        request.velocity_e2 = vel
+
+        response = self.__grpcStub.SetTargetVelocity(request)
+        if response.HasField("velocity_e2"):
+            return response.velocity_e2
+        else:
+            return 0
+
+    def SetTargetVelocityE3(self, vel: float) -> float:
+        """
+        Sets the target velocity of external axis 3 in velocity mode
+        Parameters:
+            vel: target velocity in user-defined units
+        Returns:
+            new target velocity or 0 if not in velocity mode
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.TargetVelocityRequest()
+        request.app_name = self.GetAppName()
+        request.velocity_e3 = vel
+
+        response = self.__grpcStub.SetTargetVelocity(request)
+        if response.HasField("velocity_e3"):
+            return response.velocity_e3
+        else:
+            return 0
+
+    def IsAutomaticMotion(self) -> bool:
+        """
+        Returns true if the robot moves automatically. This does not indicate other motion types, like jog motion!
+        Returns:
+            true if a Move To command is being executed, if a motion program is running or if the position interface is used.
+        """
+        motionState = self.GetMotionState()
+        return (
+            motionState.motionProgram.runState == robotcontrolapp_pb2.RunState.RUNNING
+            or motionState.moveTo.runState == robotcontrolapp_pb2.RunState.RUNNING
+            or (
+                motionState.positionInterface.isEnabled
+                and motionState.positionInterface.isInUse
+            )
+        )
+
+    def WaitMotionDone(self, timeout: float) -> bool:
+        """
+        Waits until the Move-To command or motion program is done. See the criteria given for IsAutomaticMotion.
+        Parameters:
+            timeout: The function returns when the motion is done or when this timeout in s is exceeded
+        Returns:
+            true if motion is done, false on timeout
+        """
+        startTime = time.time()
+        while True:
+            if not self.IsAutomaticMotion():
+                return True
+            now = time.time()
+            if now - startTime > timeout:
+                break
+            time.sleep(0.02)
+        return False
+
+    def GetSystemInfo(self) -> SystemInfo:
+        """Gets the system information"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.SystemInfoRequest)
+        return SystemInfoFromGrpc(self.__grpcStub.GetSystemInfo(request))
+
+    def GetSystemInfoAsync(self) -> AppFuture:
+        """Starts GetSystemInfo() without waiting for the response, AppFuture.Result() returns the SystemInfo"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.SystemInfoRequest)
+        return AppFuture(
+            self.__grpcStub.GetSystemInfo.future(request), SystemInfoFromGrpc
+        )
+
+    def GetLicenseInfo(self) -> "LicenseInfo":
+        """Gets the license information"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.LicenseInfoRequest)
+        return _LicenseInfoFromGrpc(self.__grpcStub.GetLicensedFeatures(request))
+
+    def GetLicenseInfoAsync(self) -> AppFuture:
+        """Starts GetLicenseInfo() without waiting for the response, AppFuture.Result() returns the LicenseInfo"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.LicenseInfoRequest)
+        return AppFuture(
+            self.__grpcStub.GetLicensedFeatures.future(request), _LicenseInfoFromGrpc
+        )
+
+    def IsFeatureLicensed(self, id: str) -> bool:
+        """
+        Checks whether the given feature is licensed via the robot control and is not expired.
+        Parameters:
+            id: feature ID
+        Returns:
+            true if the feature is licensed, false if not licensed or expired
+        """
+        info = self.GetLicenseInfo()
+        if info.features.__contains__(id):
+            return info.features[id].isLicensed
+        return False
+
+    def IsFeatureLicensedAsync(self, id: str) -> AppFuture:
+        """Starts IsFeatureLicensed() without waiting for the response, AppFuture.Result() returns the bool"""
+
+        def IsLicensed(response: robotcontrolapp_pb2.LicenseInfoResponse) -> bool:
+            feature = _LicenseInfoFromGrpc(response).features.get(id)
+            return feature is not None and feature.isLicensed
+
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.LicenseInfoRequest)
+        return AppFuture(
+            self.__grpcStub.GetLicensedFeatures.future(request), IsLicensed
+        )
+
+    def GetVelocityOverride(self) -> float:
+        """
+        Gets the current velocity override
+        Returns:
+            velocity multiplier in percent 0.0..100.0
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.RobotStateRequest)
+        response = self.__grpcStub.GetRobotState(request)
+        return response.velocity_override
+
+    def GetVelocityOverrideAsync(self) -> AppFuture:
+        """Starts GetVelocityOverride() without waiting for the response, AppFuture.Result() returns the percentage"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__GetAppNameRequest(robotcontrolapp_pb2.RobotStateRequest)
+        return AppFuture(
+            self.__grpcStub.GetRobotState.future(request),
+            lambda response: response.velocity_override,
+        )
+
+    def SetVelocityOverride(self, velocityPercent: float) -> float:
+        """
+        Sets the velocity override
+        Parameters:
+            velocityPercent: requested velocity multiplier in percent 0.0..100.0
+        Returns:
+            actual velocity multiplier in percent 0.0..100.0
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.SetVelocityOverrideRequest()
+        request.app_name = self.GetAppName()
+        request.velocity_override = velocityPercent
+        result = self.__grpcStub.SetVelocityOverride(request)
+        return result.velocity_override
+
+    def SetVelocityOverrideAsync(self, velocityPercent: float) -> AppFuture:
+        """Starts SetVelocityOverride() without waiting for the response, AppFuture.Result() returns the percentage"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.SetVelocityOverrideRequest()
+        request.app_name = self.GetAppName()
+        request.velocity_override = velocityPercent
+        return AppFuture(
+            self.__grpcStub.SetVelocityOverride.future(request),
+            lambda response: response.velocity_override,
+        )
+
+    # =========================================================================
+    # Kinematics
+    # =========================================================================
+    def TranslateCartToJoint(
+        self,
+        x: float,
+        y: float,
+        z: float,
+        a: float,
+        b: float,
+        c: float,
+        initialJoints: list[float],
+    ) -> tuple[list[float], robotcontrolapp_pb2.KinematicState]:
+        """
+        Translates a cartesian position to joint positions
+        Parameters:
+            x: X coordinate of the TCP in mm
+            y: Y coordinate of the TCP in mm
+            z: Z coordinate of the TCP in mm
+            a: A orientation of the TCP in degrees
+            b: B orientation of the TCP in degrees
+            c: C orientation of the TCP in degrees
+            initialJoints: 6 robot joints and 3 external joints. These are used to derive the initial joint configuration,
+            e.g. whether the elbow points left or right. Set them to 0 if not relevant.
+        Returns:
+            tuple consisting of a list of joints (6 robot joints, 3 external joints) and the kinematic state. This is 0 if
+            the conversion was successful or a different value on error.
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__MakeCartToJointRequest(x, y, z, a, b, c, initialJoints)
+        response = self.__grpcStub.TranslateCartToJoint(request)
+        return (response.joints, response.kinematicState)
+
+    def TranslateCartToJointAsync(
+        self,
+        x: float,
+        y: float,
+        z: float,
+        a: float,
+        b: float,
+        c: float,
+        initialJoints: list[float],
+    ) -> AppFuture:
+        """Starts TranslateCartToJoint() without waiting for the response, AppFuture.Result() returns the tuple"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = self.__MakeCartToJointRequest(x, y, z, a, b, c, initialJoints)
+        return AppFuture(
+            self.__grpcStub.TranslateCartToJoint.future(request),
+            lambda response: (response.joints, response.kinematicState),
+        )
+
+    def __MakeCartToJointRequest(
+        self,
+        x: float,
+        y: float,
+        z: float,
+        a: float,
+        b: float,
+        c: float,
+        initialJoints: list[float],
+    ) -> robotcontrolapp_pb2.CartToJointRequest:
+        """Creates a request for TranslateCartToJoint(), see there for the parameters"""
+        request = robotcontrolapp_pb2.CartToJointRequest()
+        request.app_name = self.GetAppName()
+        request.joints.extend(initialJoints)
+        request.position.x = x
+        request.position.y = y
+        request.position.z = z
+        request.orientation.x = a
+        request.orientation.y = b
+        request.orientation.z = c
+        return request
+
+    def TranslateJointToCartXYZ(
+        self, joints: list[float]
+    ) -> tuple[
+        float, float, float, float, float, float, robotcontrolapp_pb2.KinematicState
+    ]:
+        """
+        Translates joint positions to a cartesian position
+        Parameters:
+            joints: joint positions to translate
+        Returns:
+            A tuple containing the following values in order:
+            result X coordinate of the TCP in mm,
+            result Y coordinate of the TCP in mm,
+            result Z coordinate of the TCP in mm,
+            result A orientation of the TCP in degrees,
+            result B orientation of the TCP in degrees,
+            result C orientation of the TCP in degrees,
+            the result state is written here. 0 on success, other value on error
+        """
+        (mat, state) = self.TranslateJointToCart(joints)
+        (a, b, c) = mat.GetOrientation()
+        return (mat.GetX(), mat.GetY(), mat.GetZ(), a, b, c, state)
+
+    def TranslateJointToCart(
+        self, joints: list[float]
+    ) -> tuple[Matrix44, robotcontrolapp_pb2.KinematicState]:
+        """
+        Translates joint positions to a cartesian position. Note that out-of-range joint values may give you a
+        successful result that may not be reachable or could cause collisions.
+        Parameters:
+            joints: joint positions to translate
+        Returns:
+            the matrix defining position and orientation of the TCP is written here,
+            the result state is written here. 0 on success, other value on error
+
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.JointToCartRequest()
+        request.app_name = self.GetAppName()
+        request.joints.extend(joints)
+
+        response = self.__grpcStub.TranslateJointToCart(request)
+        return (Matrix44FromGrpc(response.position), response.kinematicState)
+
+    def TranslateJointToCartAsync(self, joints: list[float]) -> AppFuture:
+        """Starts TranslateJointToCart() without waiting for the response, AppFuture.Result() returns the tuple"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.JointToCartRequest()
+        request.app_name = self.GetAppName()
+        request.joints.extend(joints)
+        return AppFuture(
+            self.__grpcStub.TranslateJointToCart.future(request),
+            lambda response: (
+                Matrix44FromGrpc(response.position),
+                response.kinematicState,
+            ),
+        )
+
+    # =========================================================================
+    # File access
+    # =========================================================================
+    class FileReadIterator:
+        """Iterator for reading a file into UploadFileRequests"""
+
+        def __init__(
+            self,
+            appName: str,
+            sourceFile: BufferedReader,
+            targetFile: str,
+            chunkSize: int,
+        ):
+            self.__file = sourceFile
+            self.__chunkSize = chunkSize
+            self.__request = robotcontrolapp_pb2.UploadFileRequest()
+            self.__request.app_name = appName
+            self.__request.binary_mode = True
+            self.__request.filename = targetFile
+            # Make sure at least one request is sent, even if empty. Otherwise we can not transmit empty files
+            self.__anyRequestSent = False
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            data = self.__file.read(self.__chunkSize)
+            # dataStr = data.decode("utf-8")
+            if len(data) > 0:
+                self.__anyRequestSent = True
+                self.__request.data = data
+                return self.__request
+
+            if not self.__anyRequestSent:
+                self.__anyRequestSent = True
+                self.__request.data = bytes()
+                return self.__request
+
+            raise StopIteration
+
+    class MemoryReadIterator:
+        """Iterator for reading data from memory into UploadFileRequests"""
+
+        def __init__(self, appName: str, data: bytes, targetFile: str, chunkSize: int):
+            self.__data = memoryview(data)
+            self.__chunkSize = chunkSize
+            self.__dataIndex = 0
+            self.__request = robotcontrolapp_pb2.UploadFileRequest()
+            self.__request.app_name = appName
+            self.__request.binary_mode = True
+            self.__request.filename = targetFile
+            # Make sure at least one request is sent, even if empty. Otherwise we can not transmit empty files
+            self.__anyRequestSent = False
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            start = self.__dataIndex
+            end = min(start + self.__chunkSize, len(self.__data))
+            self.__dataIndex = end
+            if start < end:
+                self.__anyRequestSent = True
+                # why can I not pass memoryview here?
+                # self.__request.data = self.__data[start:end]
+                self.__request.data = bytes(self.__data[start:end])
+                return self.__request
+
+            if not self.__anyRequestSent:
+                self.__anyRequestSent = True
+                self.__request.data = bytes()
+                return self.__request
+
+            raise StopIteration
+
+    def UploadFileFromFile(self, sourceFile: str, targetFile: str) -> tuple[bool, str]:
+        """
+        Uploads a file to the robot control from a file
+
+        Parameters:
+            sourceFile: local source file with path relative to the app's directory
+            targetFile: target file on the robot control, relative to the Data directory
+        Returns:
+            Tuple consisting of a boolean (true on success) and error string
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        with open(sourceFile, "rb") as file:
+            try:
+                CHUNK_SIZE = 8 * 1024
+                iterator = AppClient.FileReadIterator(
+                    self.GetAppName(), file, targetFile, CHUNK_SIZE
+                )
+                # Run as future, this allows cancelling the upload
+                result = self.__grpcStub.UploadFile.future(iterator).result()
+                return (result.success, result.error)
+            except FileNotFoundError:
+                raise
+            except Exception as ex:
+                return (False, ex)
+
+    def UploadFileFromMemory(self, data: bytes, targetFile: str) -> tuple[bool, str]:
+        """
+        Uploads a file to the robot control from memory
+
+        Parameters:
+            data: file content
+            targetFile: target file on the robot control, relative to the Data directory
+        Returns:
+            Tuple consisting of a boolean (true on success) and error string
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        try:
+            CHUNK_SIZE = 8 * 1024
+            iterator = AppClient.MemoryReadIterator(
+                self.GetAppName(), data, targetFile, CHUNK_SIZE
+            )
+            result = self.__grpcStub.UploadFile.future(iterator).result()
+            return (result.success, result.error)
+        except Exception as ex:
+            return (False, repr(ex))
+
+    def DownloadFileToFile(self, sourceFile: str, targetFile: str) -> tuple[bool, str]:
+        """
+        Downloads a file from the robot control to a file
+
+        Parameters:
+            sourceFile: source file on the robot control, relative to the Data directory
+            targetFile: local target, relative to the apps's directory
+        Returns:
+            Tuple consisting of a boolean (true on success) and error string
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        with open(targetFile, "wb") as file:
+            request = robotcontrolapp_pb2.DownloadFileRequest()
+            request.app_name = self.GetAppName()
+            request.filename = sourceFile
+            try:
+                for chunk in self.__grpcStub.DownloadFile(request):
+                    if chunk.success:
+                        file.write(chunk.data)
+                    else:
+                        file.close()
+                        return (False, chunk.error)
+            except Exception as ex:
+                return (False, repr(ex))
+        return (True, "")
+
+    def DownloadFileToMemory(self, sourceFile: str) -> tuple[bool, str, bytearray]:
+        """
+        Downloads a file from the robot control to memory
+
+        Parameters:
+            sourceFile: source file on the robot control, relative to the Data directory
+        Returns:
+            Tuple consisting of a boolean (true on success), error string and result data
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.DownloadFileRequest()
+        request.app_name = self.GetAppName()
+        request.filename = sourceFile
+        resultData = bytearray()
+        try:
+            for chunk in self.__grpcStub.DownloadFile(request):
+                if chunk.success:
+                    resultData.extend(chunk.data)
+                else:
+                    return (False, chunk.error, resultData)
+            return (True, "", resultData)
+        except Exception as ex:
+            return (False, repr(ex), bytearray())
+
+    def RemoveFile(self, file: str) -> tuple[bool, str]:
+        """
+        Removes a file from the robot control
+        Parameters:
+            file: file on the robot control, relative to the Data directory
+        Returns:
+            true on success
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.RemoveFilesRequest()
+        request.app_name = self.GetAppName()
+        request.files.append(file)
+        response = self.__grpcStub.RemoveFiles(request)
+
+        if len(response.results) > 0 and not response.results[0].success:
+            return (False, response.results[0].error)
+
+        if response.success:
+            return (True, "")
+
+        return (False, "unknown error")
+
+    def ListFiles(self, directory: str) -> "DirectoryContent":
+        """Gets the content of a directory"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+        from .DataTypes.DirectoryContent import DirectoryContentFromGrcp
+
+        request = robotcontrolapp_pb2.ListFilesRequest()
+        request.app_name = self.GetAppName()
+        request.path = directory
+        return DirectoryContentFromGrcp(self.__grpcStub.ListFiles(request))
+
+    def ListFilesAsync(self, directory: str) -> AppFuture:
+        """Starts ListFiles() without waiting for the response, AppFuture.Result() returns the DirectoryContent"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+        from .DataTypes.DirectoryContent import DirectoryContentFromGrcp
+
+        request = robotcontrolapp_pb2.ListFilesRequest()
+        request.app_name = self.GetAppName()
+        request.path = directory
+        return AppFuture(
+            self.__grpcStub.ListFiles.future(request), DirectoryContentFromGrcp
+        )
+
+    def GetStatistics(self, resetPartsCounters: bool) -> "Statistics":
+        """
+        Gets the statistics data
+        Parameters:
+            resetPartsCounter: Set true to reset the parts counters (number variables #parts-good and #parts-bad) to 0
+        Returns:
+            Statistics data
+        """
+        from .DataTypes.Statistics import StatisticsFromGrpc
+
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.StatisticsRequest()
+        request.app_name = self.GetAppName()
+        request.reset_parts_counter = resetPartsCounters
+        return StatisticsFromGrpc(self.__grpcStub.GetStatistics(request))
+
+    def GetStatisticsAsync(self, resetPartsCounters: bool) -> AppFuture:
+        """Starts GetStatistics() without waiting for the response, AppFuture.Result() returns the Statistics"""
+        from .DataTypes.Statistics import StatisticsFromGrpc
+
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.StatisticsRequest()
+        request.app_name = self.GetAppName()
+        request.reset_parts_counter = resetPartsCounters
+        return AppFuture(
+            self.__grpcStub.GetStatistics.future(request), StatisticsFromGrpc
+        )
+
+    # =========================================================================
+    # App UI
+    # =========================================================================
+    def SendQueuedUIUpdates(self):
+        """Send queued UI updates. Queueing benefits performance by sending all updates in a single message."""
+        with self.__queuedUIUpdatesMutex:
+            if len(self.__queuedUIUpdates.ui_changes) > 0:
+                self.SendAction(self.__queuedUIUpdates)
+                self.__queuedUIUpdates = robotcontrolapp_pb2.AppAction()
+
+    def RequestUIElementState(self, elementName: str):
+        """
+        Requests the state of a UI element. The robot control will respond with a call of UiUpdateHandler()
+        if the element exists and if it was changed after
+        """
+        request = robotcontrolapp_pb2.AppAction()
+        request.request_ui_state.append(elementName)
+        self.SendAction(request)
+
+    def RequestUIElementStates(self, elementNames: set[str]):
+        """
+        Requests the state of several UI elements. The robot control will respond with a call of UiUpdateHandler()
+        if the element exists and if it was changed
+        """
+        request = robotcontrolapp_pb2.AppAction()
+        request.request_ui_state.extend(elementNames)
+        self.SendAction(request)
+
+    def SetUIVisibility(self, elementName: str, visible: bool):
+        """Sets a UI element visible or hidden"""
+        request = robotcontrolapp_pb2.AppAction()
+        uiElement = request.ui_changes.add()
+        uiElement.element_name = elementName
+        uiElement.is_visible = visible
+        self.SendAction(request)
+
+    def QueueSetUIVisibility(self, elementName: str, visible: bool):
+        """Queues setting a UI element visible or hidden"""
+        with self.__queuedUIUpdatesMutex:
+            uiElement = self.__queuedUIUpdates.ui_changes.add()
+            uiElement.element_name = elementName
+            uiElement.is_visible = visible
+
+    def SetUIVisibilitySet(self, elements: set[tuple[str, bool]]):
+        """Set a list of UI element visible or hidden"""
+        request = robotcontrolapp_pb2.AppAction()
+        for element in elements:
+            uiElement = request.ui_changes.add()
+            uiElement.element_name = element[0]
+            uiElement.is_visible = element[1]
+        self.SendAction(request)
+
+    def QueueSetUIVisibilitySet(self, elements: set[tuple[str, bool]]):
+        """Queues setting a list of UI element visible or hidden"""
+        with self.__queuedUIUpdatesMutex:
+            for element in elements:
+                uiElement = self.__queuedUIUpdates.ui_changes.add()
+                uiElement.element_name = element[0]
+                uiElement.is_visible = element[1]
+
+    def SetCheckboxState(self, elementName: str, isChecked: bool):
+        """Sets the checked state of a checkbox"""
+        request = robotcontrolapp_pb2.AppAction()
+        uiElement = request.ui_changes.add()
+        uiElement.element_name = elementName
+        if isChecked:
+            uiElement.state.checkbox_state = robotcontrolapp_pb2.CHECKED
+        else:
+            uiElement.state.checkbox_state = robotcontrolapp_pb2.UNCHECKED
+        self.SendAction(request)
+
+    def QueueSetCheckboxState(self, elementName: str, isChecked: bool):
+        """Queues setting the checked state of a checkbox"""
+        with self.__queuedUIUpdatesMutex:
+            uiElement = self.__queuedUIUpdates.ui_changes.add()
+            uiElement.element_name = elementName
+            if isChecked:
+                uiElement.state.checkbox_state = robotcontrolapp_pb2.CHECKED
+            else:
+                uiElement.state.checkbox_state = robotcontrolapp_pb2.UNCHECKED
+
+    def SetDropDownState(self, elementName: str, selectedValue: str):
+        """Sets the selected value of a drop down box"""
+        request = robotcontrolapp_pb2.AppAction()
+        uiElement = request.ui_changes.add()
+        uiElement.element_name = elementName
+        uiElement.state.dropdown_state.selected_option = selectedValue
+        self.SendAction(request)
+
+    def QueueSetDropDownState(self, elementName: str, selectedValue: str):
+        """Queues setting the selected value of a drop down box"""
+        with self.__queuedUIUpdatesMutex:
+            uiElement = self.__queuedUIUpdates.ui_changes.add()
+            uiElement.element_name = elementName
+            uiElement.element_name = elementName
+        uiElement.state.dropdown_state.selected_option = selectedValue
+
+    def SetDropDownStateList(
+        self, elementName: str, selectedValue: str, selectableEntries: List[str]
+    ):
+        """Sets the selected value and the list of selectable values of a drop down box"""
+        request = robotcontrolapp_pb2.AppAction()
+        uiElement = request.ui_changes.add()
+        uiElement.element_name = elementName
+        uiElement.state.dropdown_state.selected_option = selectedValue
+        uiElement.state.dropdown_state.options.extend(selectableEntries)
+        self.SendAction(request)
+
+    def QueueSetDropDownStateList(
+        self, elementName: str, selectedValue: str, selectableEntries: List[str]
+    ):
+        """Queues setting the selected value and the list of selectable values of a drop down box"""
+        with self.__queuedUIUpdatesMutex:
+            uiElement = self.__queuedUIUpdates.ui_changes.add()
+            uiElement.element_name = elementName
+            uiElement.element_name = elementName
+            uiElement.state.dropdown_state.selected_option = selectedValue
+            uiElement.state.dropdown_state.options.extend(selectableEntries)
+
+    def SetText(self, elementName: str, value: str):
+        """Sets the text of a text box, label, etc."""
+        request = robotcontrolapp_pb2.AppAction()
+        uiElement = request.ui_changes.add()
+        uiElement.element_name = elementName
+        uiElement.state.textfield_state.current_text = value
+        self.SendAction(request)
+
+    def QueueSetText(self, elementName: str, value: str):
+        """Queues setting the text of a text box, label, etc."""
+        with self.__queuedUIUpdatesMutex:
+            uiElement = self.__queuedUIUpdates.ui_changes.add()
+            uiElement.element_name = elementName
+            uiElement.state.textfield_state.current_text = value
+
+    def SetNumber(self, elementName: str, value: float):
+        """Sets the number value of a number box, text box, label, etc."""
+        request = robotcontrolapp_pb2.AppAction()
+        uiElement = request.ui_changes.add()
+        uiElement.element_name = elementName
+        uiElement.state.numberfield_state.current_number = value
+        self.SendAction(request)
+
+    def QueueSetNumber(self, elementName: str, value: float):
+        """Queues setting the number value of a number box, text box, label, etc."""
+        with self.__queuedUIUpdatesMutex:
+            uiElement = self.__queuedUIUpdates.ui_changes.add()
+            uiElement.element_name = elementName
+            uiElement.state.numberfield_state.current_number = value
+
+    def SetImage(
+        self,
+        elementName: str,
+        uiWidth: int,
+        uiHeight: int,
+        imageData: bytearray,
+        encoding: robotcontrolapp_pb2.ImageState.ImageData.ImageEncoding,
+    ):
+        """
+        Sets the image of an image element in the UI
+        Parameters:
+            elementName: UI element name
+            uiWidth: Width of the image in the UI in pixels - currently not used yet
+            uiHeight: Height of the image in the UI in pixels - currently not used yet
+            imageData: Image bytes. All shown images combined must be less than 290kB, otherwise the UI may fail to
+                load after reconnect!
+            encoding: Image encoding
+        """
+        # Check the image size. The CRI input buffer currently is 400kB and image data is transmitted base64 encoded.
+        # This means an upper limit of less than 300kB.
+        # Note that this limit effectively decreases when using more images or UI elements! The entire UI XML including all
+        # images must fit, otherwise it will not be shown after reconnect.
+        if len(imageData) > (290 * 1024):
+            raise RuntimeError("Image too big! Images must be smaller than 290kB!")
+
+        request = robotcontrolapp_pb2.AppAction()
+        uiElement = request.ui_changes.add()
+        uiElement.element_name = elementName
+        uiElement.state.image_state.image_data.height = uiHeight
+        uiElement.state.image_state.image_data.width = uiWidth
+        uiElement.state.image_state.image_data.encoding = encoding
+        uiElement.state.image_state.image_data.data = imageData
+        self.SendAction(request)
+
+    def SetImageFromFile(
+        self, elementName: str, uiWidth: int, uiHeight: int, imageFile: str
+    ):
+        """
+        Sets the image of an image element in the UI
+        Parameters:
+            elementName: UI element name
+            uiWidth: Width of the image in the UI in pixels - currently not used yet
+            uiHeight: Height of the image in the UI in pixels - currently not used yet
+            imageFile: File name and path of the image file to load
+        """
+        with open(imageFile, "rb") as file:
+            imageBytes = file.read()
+            self.SetImage(
+                elementName,
+                uiWidth,
+                uiHeight,
+                imageBytes,
+                robotcontrolapp_pb2.ImageState.ImageData.ImageEncoding.JPEG,
+            )
+
+    def QueueSetImage(
+        self,
+        elementName: str,
+        uiWidth: int,
+        uiHeight: int,
+        imageData: bytearray,
+        encoding: robotcontrolapp_pb2.ImageState.ImageData.ImageEncoding,
+    ):
+        """Queues setting the image of an image element in the UI"""
+
+        # Check the image size. The CRI input buffer currently is 400kB and image data is transmitted base64 encoded.
+        # This means an upper limit of less than 300kB.
+        if len(imageData) > (290 * 1024):
+            raise RuntimeError("Image too big! Images must be smaller than 290kB!")
+
+        with self.__queuedUIUpdatesMutex:
+            uiElement = self.__queuedUIUpdates.ui_changes.add()
+            uiElement.element_name = elementName
+            uiElement.state.image_state.image_data.height = uiHeight
+            uiElement.state.image_state.image_data.width = uiWidth
+            uiElement.state.image_state.image_data.encoding = encoding
+            uiElement.state.image_state.image_data.data = imageData
+
+    def _ShowDialog(
+        self,
+        message: str,
+        title: str,
+        dlgType: robotcontrolapp_pb2.ShowDialogRequest.DialogType,
+    ):
+        """
+        Shows a dialog window to the user.
+        Note: If iRC is not connected the dialog will never be shown. Currently there is no way for the app to find out
+        whether this is the case. If iRC is older than V14-004 only error messages are shown.
+        Parameters:
+            message: The message to be displayed
+            title: The dialog title
+            dlgType: the dialog type (Info, Error, Warning)
+        """
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        request = robotcontrolapp_pb2.ShowDialogRequest()
+        request.app_name = self.GetAppName()
+        request.message_dialog.type = dlgType
+        request.message_dialog.title = title
+        request.message_dialog.message = message
+        self.__grpcStub.ShowDialog(request)
+
+    def ShowInfoDialog(self, message: str, title: str):
+        """
+        Shows an info dialog window to the user.
+        Note: If iRC is not connected or older than V14-004 the dialog will never be shown. Currently there is no way for
+        the app to find out whether this is the case.
+        Parameters:
+            message: The message to be displayed
+            title: The dialog title
+        """
+        self._ShowDialog(
+            message, title, robotcontrolapp_pb2.ShowDialogRequest.DialogType.INFO
+        )
+
+    def ShowWarningDialog(self, message: str, title: str):
+        """
+        Shows an info dialog window to the user.
+        Note: If iRC is not connected or older than V14-004 the dialog will never be shown. Currently there is no way for the
+        app to find out whether this is the case.
+        Parameters:
+            message: The message to be displayed
+            title: The dialog title
+        """
+        self._ShowDialog(
+            message, title, robotcontrolapp_pb2.ShowDialogRequest.DialogType.WARNING
+        )
+
+    def ShowErrorDialog(self, message: str, title: str):
+        """
+        Shows an info dialog window to the user.
+        Note: If iRC is not connected the dialog will never be shown. Currently there is no way for the app to find out
+        whether this is the case.
+        Parameters:
+            message: The message to be displayed
+            title: The dialog title
+        """
+        self._ShowDialog(
+            message, title, robotcontrolapp_pb2.ShowDialogRequest.DialogType.ERROR
+        )
+
+    # =========================================================================
+    # Internal helpers
+    # =========================================================================
+
+    def CheckCoreVersion(self, sysInfo: SystemInfo):
+        """Checks whether the connected robot supports all features of this AppClient"""
+        if sysInfo.versionMajor > self.VERSION_MAJOR_MIN:
+            return True
+
+        if sysInfo.versionMajor == self.VERSION_MAJOR_MIN:
+            if sysInfo.versionMinor > self.VERSION_MINOR_MIN:
+                return True
+
+            if sysInfo.versionMinor == self.VERSION_MINOR_MIN:
+                if sysInfo.versionPatch >= self.VERSION_PATCH_MIN:
+                    return True
+        return False
+
+    def SendCapabilities(self):
+        """Sends the apps capabilities / API version to the server"""
+        if not self.IsConnected():
+            raise NotConnectedException()
+
+        self.__grpcStub.SetCapabilities(self.__MakeCapabilitiesRequest())
+
+    def __MakeCapabilitiesRequest(self) -> robotcontrolapp_pb2.CapabilitiesRequest:
+        """Creates the request for SendCapabilities()"""
+        request = robotcontrolapp_pb2.CapabilitiesRequest()
+        request.app_name = self.GetAppName()
+        request.api_version_major = self.VERSION_MAJOR_MIN
+        request.api_version_minor = self.VERSION_MINOR_MIN
+        request.api_version_patch = self.VERSION_PATCH_MIN
+        return request
+
+    # =========================================================================
+    # Virtual methods to override
+    # =========================================================================
+
+    def _AppFunctionHandler(self, function: robotcontrolapp_pb2.AppFunction):
+        """
+        Gets called on remote app function calls received from the robot control that have no handler registered with
+        @app_function (see HandlerRegistry.py).
+        Override this in your app or register handlers!
+        """
+        if not self.__handlers.HasFunctionHandlers():
+            raise NotImplementedError()
+        self.SendFunctionFailed(
+            function.call_id, f"unknown app function '{function.name}'"
+        )
+
+    def _UiUpdateHandler(
+        self,
+        updates: protobufContainers.RepeatedCompositeFieldContainer[
+            robotcontrolapp_pb2.AppUIElement
+        ],
+    ):
+        """
+        Gets called on remote UI update requests received from the robot control that have no handler registered with
+        @ui_event (see HandlerRegistry.py).
+        Override this in your app or register handlers!
+        """
+        if not self.__handlers.HasUIHandlers():
+            raise NotImplementedError()
+
+    def OnRobotStateUpdated(self, state: RobotState):
+        """
+        Is called when the robot state is updated (usually each 10 or 20ms). Override this method, start the stream by
+        calling StartRobotStateStream().
+        """
+        pass
+
+    def _OnReconnected(self):
+        """
+        Gets called after the app reconnected automatically, see autoReconnect. The robot control may have been
+        restarted, so override this to restore the UI state if needed.
+        """
+        pass
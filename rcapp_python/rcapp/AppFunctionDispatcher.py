@@ -0,0 +1,212 @@
+"""
+The AppFunctionDispatcher runs app function calls on a bounded thread pool. Without it the app functions are run by the
+event reader thread one after another, so a slow function delays all following function calls and UI events.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+import time
+from typing import Callable
+from .Log import GetLogger
+from . import robotcontrolapp_pb2
+
+_log = GetLogger().GetSubsystem("AppFunctionDispatcher")
+"""Logger of the function calls that failed"""
+
+SHUTDOWN_REASON = "app shutting down"
+"""Reason sent for the function calls dropped by AppFunctionDispatcher.Shutdown()"""
+
+
+@dataclass
+class DispatcherStatistics:
+    """This class contains the counters of an AppFunctionDispatcher"""
+
+    queueDepth: int = 0
+    """Number of function calls waiting for a worker"""
+    maxQueueDepth: int = 0
+    """Highest number of function calls waiting for a worker"""
+    inFlight: int = 0
+    """Number of function calls currently running"""
+    dispatched: int = 0
+    """Number of function calls started since the dispatcher was created"""
+    totalWaitTime: float = 0.0
+    """Sum of the wait times in s between receiving a function call and starting it"""
+    maxWaitTime: float = 0.0
+    """Longest wait time in s between receiving a function call and starting it"""
+
+    def GetAverageWaitTime(self) -> float:
+        """Gets the average wait time in s between receiving a function call and starting it"""
+        if self.dispatched == 0:
+            return 0.0
+        return self.totalWaitTime / self.dispatched
+
+
+class AppFunctionDispatcher:
+    """
+    Runs app function calls on a pool of worker threads. Calls of functions listed in orderedFunctions are run one after
+    another in the order they were received, all other calls may run concurrently. The dispatcher may be shared by
+    several apps.
+    """
+
+    def __init__(self, maxWorkers: int = 4, orderedFunctions: set[str] = None):
+        """
+        Parameters:
+            maxWorkers: maximum number of function calls running at the same time
+            orderedFunctions: names of the app functions whose calls must not overlap, e.g. because they change the
+                state of the app
+        """
+        if maxWorkers < 1:
+            raise RuntimeError("the dispatcher needs at least one worker")
+
+        self.__executor = ThreadPoolExecutor(
+            max_workers=maxWorkers, thread_name_prefix="AppFunction"
+        )
+        """Worker threads"""
+        self.__orderedFunctions = set(orderedFunctions or [])
+        """Names of the functions that are run in order"""
+        self.__waitingOrdered = dict()
+        """Calls of ordered functions waiting for the previous call of the same function, by function name"""
+        self.__inFlight = dict()
+        """Running function calls: call ID to function name"""
+        self.__statistics = DispatcherStatistics()
+        """Counters, access only with the mutex locked"""
+        self.__shutdown = False
+        """True after Shutdown() was called, following calls are failed instead of queued"""
+        self.__mutex = Lock()
+
+    def Dispatch(
+        self,
+        function: robotcontrolapp_pb2.AppFunction,
+        handler: Callable[[robotcontrolapp_pb2.AppFunction], None],
+        failed: Callable[[int, str], None] = None,
+    ):
+        """
+        Queues an app function call. This returns immediately.
+        Parameters:
+            function: function call received from the robot control
+            handler: function that handles the call, it is called by a worker thread
+            failed: called with the call ID and the reason if the call is dropped because the dispatcher shuts down,
+                usually AppClient.SendFunctionFailed
+        """
+        call = (function, handler, time.perf_counter(), failed)
+        with self.__mutex:
+            shutdown = self.__shutdown
+            if not shutdown and self.__Enqueue(call):
+                return
+        if shutdown:
+            self.__Drop(call)
+            return
+
+        self.__executor.submit(self.__Run, call)
+
+    def __Enqueue(self, call: tuple) -> bool:
+        """
+        Counts a dispatched call, the mutex must be locked
+        Returns:
+            true if the call waits for a previous call of the same ordered function, false if it can be started
+        """
+        function = call[0]
+        self.__statistics.queueDepth += 1
+        self.__statistics.maxQueueDepth = max(
+            self.__statistics.maxQueueDepth, self.__statistics.queueDepth
+        )
+
+        if function.name in self.__orderedFunctions:
+            # A deque for the name exists while a call of this function is queued or running
+            waiting = self.__waitingOrdered.get(function.name)
+            if waiting is not None:
+                waiting.append(call)
+                return True
+            self.__waitingOrdered[function.name] = deque()
+        return False
+
+    def __Run(self, call: tuple):
+        """Runs a function call in a worker thread, then starts the next call of the same ordered function"""
+        function, handler, queuedTime, _ = call
+        waitTime = time.perf_counter() - queuedTime
+        with self.__mutex:
+            self.__statistics.queueDepth -= 1
+            self.__statistics.inFlight += 1
+            self.__statistics.dispatched += 1
+            self.__statistics.totalWaitTime += waitTime
+            self.__statistics.maxWaitTime = max(self.__statistics.maxWaitTime, waitTime)
+            self.__inFlight[function.call_id] = function.name
+
+        try:
+            handler(function)
+        except Exception as ex:
+            _log.Error(
+                "App function '%s' (call ID %d) raised an exception: %r",
+                function.name,
+                function.call_id,
+                ex,
+            )
+        finally:
+            nextCall = None
+            with self.__mutex:
+                self.__statistics.inFlight -= 1
+                self.__inFlight.pop(function.call_id, None)
+                waiting = self.__waitingOrdered.get(function.name)
+                if waiting is not None:
+                    if len(waiting) > 0:
+                        nextCall = waiting.popleft()
+                    else:
+                        del self.__waitingOrdered[function.name]
+            if nextCall is not None:
+                try:
+                    self.__executor.submit(self.__Run, nextCall)
+                except RuntimeError:
+                    with self.__mutex:
+                        self.__statistics.queueDepth -= 1
+                    self.__Drop(nextCall)
+
+    def __Drop(self, call: tuple):
+        """Lets a function call that is not run fail, see Shutdown()"""
+        function, _, _, failed = call
+        _log.Warning(
+            "App function '%s' (call ID %d) dropped on shutdown",
+            function.name,
+            function.call_id,
+        )
+        if failed is None:
+            return
+        try:
+            failed(function.call_id, SHUTDOWN_REASON)
+        except Exception as ex:
+            _log.Warning(
+                "Failed to report dropped app function '%s' (call ID %d): %r",
+                function.name,
+                function.call_id,
+                ex,
+            )
+
+    def GetInFlightCallIds(self) -> dict[int, str]:
+        """Gets the running function calls: call ID to function name"""
+        with self.__mutex:
+            return dict(self.__inFlight)
+
+    def GetStatistics(self) -> DispatcherStatistics:
+        """Gets a copy of the counters"""
+        with self.__mutex:
+            return DispatcherStatistics(**vars(self.__statistics))
+
+    def Shutdown(self, wait: bool = True):
+        """
+        Stops the worker threads. Queued calls are still run, except calls waiting for a previous call of the same
+        ordered function. These and calls dispatched after the shutdown are dropped, their failed callback (see
+        Dispatch()) is called with the reason SHUTDOWN_REASON.
+        Parameters:
+            wait: if true this waits until all calls are done
+        """
+        with self.__mutex:
+            self.__shutdown = True
+            dropped = []
+            for waiting in self.__waitingOrdered.values():
+                dropped.extend(waiting)
+                waiting.clear()
+            self.__statistics.queueDepth -= len(dropped)
+        for call in dropped:
+            self.__Drop(call)
+        self.__executor.shutdown(wait=wait)
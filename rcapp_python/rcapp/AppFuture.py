@@ -0,0 +1,162 @@
+"""
+Futures returned by the ...Async methods of the AppClient, e.g. GetRobotStateAsync(). Independent requests started one
+after another are sent concurrently via the same channel, so waiting for all of them takes about one round trip:
+
+    tcp, state = Gather(app.GetTCPAsync(), app.GetMotionStateAsync())
+
+Requests with a response stream (e.g. GetProgramVariablesAsync()) are read by a StreamFuture.
+"""
+
+from concurrent import futures
+from threading import Thread
+import time
+from typing import Callable
+import grpc
+
+_NOT_CONVERTED = object()
+"""Marks that the response was not converted yet"""
+
+
+class AppFuture:
+    """Result of a request that may still be running"""
+
+    def __init__(self, grpcFuture: grpc.Future, converter: Callable = None):
+        """
+        Parameters:
+            grpcFuture: future of the gRPC call
+            converter: converts the response message to the result, None to return the response message
+        """
+        self.__grpcFuture = grpcFuture
+        """Future of the gRPC call"""
+        self.__converter = converter
+        """Converts the response message to the result"""
+        self.__result = _NOT_CONVERTED
+        """Cached result"""
+
+    def Result(self, timeout: float = None):
+        """
+        Waits for the request and gets its result
+        Parameters:
+            timeout: maximum time in s to wait, None to wait until the request is done or its deadline expired
+        Returns:
+            the result, the same type the blocking method returns
+        Raises:
+            grpc.RpcError if the request failed, grpc.FutureTimeoutError if the timeout expired or
+            grpc.FutureCancelledError if the request was cancelled
+        """
+        if self.__result is _NOT_CONVERTED:
+            response = self.__grpcFuture.result(timeout)
+            if self.__converter is None:
+                self.__result = response
+            else:
+                self.__result = self.__converter(response)
+        return self.__result
+
+    def Done(self) -> bool:
+        """Checks whether the request finished, failed or was cancelled"""
+        return self.__grpcFuture.done()
+
+    def Cancel(self) -> bool:
+        """
+        Cancels the request
+        Returns:
+            true if the request was cancelled, false if it was done already
+        """
+        return self.__grpcFuture.cancel()
+
+    def GetException(self, timeout: float = None) -> Exception:
+        """
+        Waits for the request and gets its error
+        Parameters:
+            timeout: maximum time in s to wait, None to wait until the request is done or its deadline expired
+        Returns:
+            the grpc.RpcError if the request failed, None on success
+        """
+        return self.__grpcFuture.exception(timeout)
+
+    def AddDoneCallback(self, callback: Callable[["AppFuture"], None]):
+        """
+        Calls a function when the request is done. The callback runs in a gRPC thread, so it should return quickly.
+        Parameters:
+            callback: function receiving this future, called immediately if the request is done already
+        """
+        self.__grpcFuture.add_done_callback(lambda _: callback(self))
+
+
+class StreamFuture:
+    """
+    Reads the responses of a streaming gRPC call in a background thread, so the call can be used like the grpc.Future
+    of a request with one response. The result is the list of the received messages.
+    """
+
+    def __init__(self, call):
+        """
+        Parameters:
+            call: the streaming call returned by the gRPC stub
+        """
+        self.__call = call
+        """Streaming gRPC call"""
+        self.__future = futures.Future()
+        """Receives the messages when the stream ended"""
+        self.__future.set_running_or_notify_cancel()
+        self.__cancelled = False
+        """True if cancel() stopped the stream"""
+        Thread(target=self.__Read, name="StreamFuture", daemon=True).start()
+
+    def __Read(self):
+        """Reads the stream until it ends or fails"""
+        try:
+            self.__future.set_result(list(self.__call))
+        except grpc.RpcError as ex:
+            if self.__cancelled:
+                self.__future.set_exception(grpc.FutureCancelledError())
+            else:
+                self.__future.set_exception(ex)
+
+    def result(self, timeout: float = None) -> list:
+        """Waits for the stream to end and gets the received messages, see grpc.Future.result()"""
+        try:
+            return self.__future.result(timeout)
+        except futures.TimeoutError:
+            raise grpc.FutureTimeoutError()
+
+    def exception(self, timeout: float = None) -> Exception:
+        """Waits for the stream to end and gets its error, see grpc.Future.exception()"""
+        try:
+            return self.__future.exception(timeout)
+        except futures.TimeoutError:
+            raise grpc.FutureTimeoutError()
+
+    def done(self) -> bool:
+        """Checks whether the stream ended, failed or was cancelled"""
+        return self.__future.done()
+
+    def cancel(self) -> bool:
+        """Cancels the stream, returns false if it ended already"""
+        if self.__future.done():
+            return False
+        self.__cancelled = True
+        return self.__call.cancel()
+
+    def add_done_callback(self, callback: Callable[["StreamFuture"], None]):
+        """Calls a function with this future when the stream ended"""
+        self.__future.add_done_callback(lambda _: callback(self))
+
+
+def Gather(*futures: AppFuture, timeout: float = None) -> list:
+    """
+    Waits for several requests and gets their results
+    Parameters:
+        futures: futures returned by the ...Async methods
+        timeout: maximum time in s to wait for all requests, None to wait until they are done or their deadlines expired
+    Returns:
+        list of the results in the order of the futures
+    Raises:
+        the error of the first failed request, see AppFuture.Result()
+    """
+    endTime = None if timeout is None else time.perf_counter() + timeout
+    results = []
+    for future in futures:
+        remaining = None if endTime is None else max(0.0, endTime - time.perf_counter())
+        results.append(future.Result(remaining))
+    return results
@@ -0,0 +1,252 @@
+"""
+The AppHost runs several apps in one process. Each app keeps its own app name and actions stream, but the apps share one
+gRPC channel, one AppFunctionDispatcher and one robot state stream. This saves an interpreter, a channel and the threads
+per app, e.g. on a Raspberry Pi:
+
+    host = AppHost("localhost:5000")
+    monitor = host.AddApp(MonitorApp("MonitorApp-Python", "localhost:5000"))
+    control = host.AddApp(ControlApp("ControlApp-Python", "localhost:5000"))
+    host.Connect()
+    monitor.StartRobotStateStream(decimation=20)
+    try:
+        while host.IsConnected():
+            sleep(0.5)
+    finally:
+        host.Shutdown()
+"""
+
+from threading import Event, Lock, Thread, current_thread
+from typing import Callable
+import grpc
+from .AppClient import AppClient
+from .AppFunctionDispatcher import AppFunctionDispatcher
+from .ChannelProfile import ChannelProfile
+from .Log import GetLogger
+from . import robotcontrolapp_pb2
+from .robotcontrolapp_pb2_grpc import RobotControlAppStub
+
+_log = GetLogger().GetSubsystem("AppHost")
+"""Logger of the shared robot state stream"""
+
+
+class AppHost:
+    """Runs several AppClient instances in one process over a shared channel, see the module documentation"""
+
+    def __init__(
+        self, target: str, channelProfile: ChannelProfile = None, maxWorkers: int = 4
+    ):
+        """
+        Parameters:
+            target: the socket to connect to, e.g. "localhost:5000"
+            channelProfile: channel settings of all apps, see ChannelProfile.py
+            maxWorkers: number of worker threads of the shared function dispatcher
+        """
+        self.reconnectDelay = 0.5
+        """Delay in s before the robot state stream is opened again after it failed, e.g. while the apps reconnect"""
+        self.functionDispatcher = AppFunctionDispatcher(maxWorkers)
+        """Runs the app function calls of all apps that do not set their own dispatcher"""
+
+        self.__target = target
+        self.__channelProfile = channelProfile or ChannelProfile()
+        """Channel settings of all apps"""
+        self.__channel = self.__channelProfile.CreateBaseChannel(target)
+        """Channel shared by the apps, each app adds its own interceptors (metrics and deadlines)"""
+        self.__grpcStub = RobotControlAppStub(self.__channel)
+        """GRPC client stub of the robot state stream"""
+        self.__channelReady = Event()
+        """Set while the shared channel is connected, tracked from the first connect on"""
+        self.__channelWatched = False
+        """True if __OnConnectivityChanged() is subscribed to the channel state"""
+        self.__apps = []
+        """Hosted apps in the order they were added"""
+        self.__robotStateReceivers = []
+        """Callbacks receiving the streamed robot state. This list is replaced on change, so it can be read without lock."""
+        self.__robotStateStreamThread = None
+        """Thread reading the shared robot state stream"""
+        self.__robotStateStream = None
+        """Robot state stream call, cancel this to stop the stream"""
+        self.__robotStateStreamRequested = False
+        """True while at least one app subscribed to the robot state stream"""
+        self.__stopEvent = Event()
+        """Set when the robot state stream is stopped, this interrupts waiting for the next attempt"""
+        self.__mutex = Lock()
+
+    def GetTarget(self) -> str:
+        """Gets the socket the apps connect to"""
+        return self.__target
+
+    def AddApp(self, app: AppClient) -> AppClient:
+        """
+        Adds an app, it uses the shared channel and robot state stream from now on. The app keeps its own function
+        dispatcher if one is set.
+        Parameters:
+            app: the app, it must not be connected
+        Returns:
+            the app
+        """
+        app.SetHost(self)
+        if app.functionDispatcher is None:
+            app.functionDispatcher = self.functionDispatcher
+        with self.__mutex:
+            self.__apps.append(app)
+        return app
+
+    def GetApps(self) -> list[AppClient]:
+        """Gets the hosted apps"""
+        with self.__mutex:
+            return list(self.__apps)
+
+    def InterceptChannel(self, interceptors: list) -> grpc.Channel:
+        """
+        Adds the interceptors of an app to the shared channel. Closing the returned channel closes the shared channel.
+        Parameters:
+            interceptors: interceptors of the app
+        """
+        return self.__channelProfile.InterceptChannel(self.__channel, interceptors)
+
+    def WaitChannelReady(self, timeout: float = None) -> bool:
+        """
+        Waits until the shared channel is connected, this is called by AppClient.Connect(). Only the first app waits
+        for the connection, the others find the channel ready.
+        Parameters:
+            timeout: maximum time in s to wait, None to wait forever
+        Returns:
+            false on timeout
+        """
+        if self.__channelReady.is_set():
+            return True
+        try:
+            grpc.channel_ready_future(self.__channel).result(timeout=timeout)
+        except grpc.FutureTimeoutError:
+            return False
+        with self.__mutex:
+            if not self.__channelWatched:
+                self.__channelWatched = True
+                self.__channel.subscribe(self.__OnConnectivityChanged)
+        return True
+
+    def Connect(self):
+        """Connects all apps, if one fails the others are disconnected again"""
+        try:
+            for app in self.GetApps():
+                app.Connect()
+        except Exception:
+            self.Disconnect()
+            raise
+
+    def Disconnect(self):
+        """Disconnects all apps, the channel stays open so the apps can connect again"""
+        for app in self.GetApps():
+            app.Disconnect()
+        self.__StopRobotStateStream()
+
+    def IsConnected(self) -> bool:
+        """Returns true while at least one app is connected"""
+        return any(app.IsConnected() for app in self.GetApps())
+
+    def Shutdown(self, wait: bool = True):
+        """
+        Stops the function dispatcher, disconnects all apps and closes the channel. The dispatcher is stopped first so
+        the apps can still report the function calls it drops and the running calls as failed or done.
+        Parameters:
+            wait: if true this waits until the running app function calls are done
+        """
+        self.functionDispatcher.Shutdown(wait)
+        self.Disconnect()
+        if self.__channelWatched:
+            self.__channel.unsubscribe(self.__OnConnectivityChanged)
+        self.__channel.close()
+
+    def __OnConnectivityChanged(self, connectivity: grpc.ChannelConnectivity):
+        """Tracks the state of the shared channel, see WaitChannelReady()"""
+        if connectivity == grpc.ChannelConnectivity.READY:
+            self.__channelReady.set()
+        else:
+            self.__channelReady.clear()
+
+    def SubscribeRobotState(
+        self,
+        appName: str,
+        callback: Callable[[robotcontrolapp_pb2.RobotState], None],
+    ):
+        """
+        Adds a callback receiving the robot states (GRPC message) of the shared stream, this is called by
+        AppClient.StartRobotStateStream(). The first callback starts the stream.
+        Parameters:
+            appName: name of the app, this is sent with the stream request if the stream is started
+            callback: called in the stream reader thread for each state, keep it short since it delays the other apps
+        """
+        with self.__mutex:
+            self.__robotStateReceivers = self.__robotStateReceivers + [callback]
+            if self.__robotStateStreamRequested:
+                return
+            self.__robotStateStreamRequested = True
+            self.__stopEvent.clear()
+            self.__robotStateStreamThread = Thread(
+                target=self.__RobotStateStreamThread, args=(appName,), daemon=True
+            )
+            self.__robotStateStreamThread.start()
+
+    def UnsubscribeRobotState(
+        self, callback: Callable[[robotcontrolapp_pb2.RobotState], None]
+    ):
+        """Removes a callback added by SubscribeRobotState(), the stream stops with the last callback"""
+        with self.__mutex:
+            self.__robotStateReceivers = [
+                receiver
+                for receiver in self.__robotStateReceivers
+                if receiver != callback
+            ]
+            if len(self.__robotStateReceivers) > 0:
+                return
+        self.__StopRobotStateStream()
+
+    def IsRobotStateStreamRunning(self) -> bool:
+        """Returns true while the shared robot state stream runs"""
+        return self.__robotStateStreamRequested
+
+    def __StopRobotStateStream(self):
+        """Stops the shared robot state stream"""
+        with self.__mutex:
+            if not self.__robotStateStreamRequested:
+                return
+            self.__robotStateStreamRequested = False
+            self.__robotStateReceivers = []
+            self.__stopEvent.set()
+            if self.__robotStateStream is not None:
+                self.__robotStateStream.cancel()
+            thread = self.__robotStateStreamThread
+
+        if current_thread() != thread:
+            thread.join()
+
+    def __RobotStateStreamThread(self, appName: str):
+        """This thread reads the shared robot state stream and passes each state to all subscribed apps"""
+        request = robotcontrolapp_pb2.RobotStateRequest()
+        request.app_name = appName
+        while self.__robotStateStreamRequested:
+            try:
+                with self.__mutex:
+                    if not self.__robotStateStreamRequested:
+                        return
+                    self.__robotStateStream = self.__grpcStub.GetRobotStateStream(
+                        request
+                    )
+                for grpcState in self.__robotStateStream:
+                    self.__PassRobotState(grpcState)
+            except grpc.RpcError as ex:
+                if not self.__robotStateStreamRequested:
+                    return
+                _log.Debug("robot state stream failed, retrying: %s", ex.details())
+
+            # The stream ended or failed, retry after the apps reconnected
+            if self.__stopEvent.wait(self.reconnectDelay):
+                return
+
+    def __PassRobotState(self, grpcState: robotcontrolapp_pb2.RobotState):
+        """Passes a streamed robot state to all subscribed apps, an exception of one app does not affect the others"""
+        for receiver in self.__robotStateReceivers:
+            try:
+                receiver(grpcState)
+            except Exception as ex:
+                _log.Error("Robot state receiver raised an exception: %r", ex)
@@ -0,0 +1,131 @@
+"""
+The channel profile configures the gRPC connection to the robot control: keepalive, compression, message size limits and
+the socket to connect to. Use the presets MakeLoopbackChannelProfile() for apps running on the robot control and
+MakeRemoteChannelProfile() for apps connecting via network.
+"""
+
+from dataclasses import dataclass, field
+import grpc
+from .Interceptors import MethodCompressionInterceptor
+
+
+@dataclass
+class ChannelProfile:
+    """This class contains the settings of the gRPC channel, None values keep the gRPC defaults"""
+
+    keepaliveTimeMs: int = None
+    """Interval in ms of keepalive pings, this allows detecting dead connections without sending requests"""
+    keepaliveTimeoutMs: int = None
+    """Time in ms to wait for the keepalive response before the connection is considered dead"""
+    keepalivePermitWithoutCalls: bool = False
+    """If true keepalive pings are sent even if there is no active call"""
+    compression: grpc.Compression = grpc.Compression.NoCompression
+    """Default compression of all calls"""
+    methodCompression: dict = field(default_factory=dict)
+    """Compression by method name (e.g. "UploadFile"), this overrides the default compression for these calls"""
+    maxReceiveMessageLength: int = None
+    """Maximum size of a received message in bytes, -1 for unlimited"""
+    maxSendMessageLength: int = None
+    """Maximum size of a sent message in bytes, -1 for unlimited"""
+    unixSocketPath: str = None
+    """If set, the app connects to this Unix domain socket instead of the given target"""
+
+    def GetTarget(self, target: str) -> str:
+        """
+        Gets the target to connect to
+        Parameters:
+            target: target given to the app, e.g. "localhost:5000"
+        Returns:
+            the Unix domain socket if configured, otherwise the given target
+        """
+        if self.unixSocketPath:
+            return "unix:" + self.unixSocketPath
+        return target
+
+    def GetChannelOptions(self) -> list[tuple[str, object]]:
+        """Gets the gRPC channel options"""
+        options = []
+        if self.keepaliveTimeMs is not None:
+            options.append(("grpc.keepalive_time_ms", self.keepaliveTimeMs))
+            # Allow pings while the actions stream is open but idle
+            options.append(("grpc.http2.max_pings_without_data", 0))
+        if self.keepaliveTimeoutMs is not None:
+            options.append(("grpc.keepalive_timeout_ms", self.keepaliveTimeoutMs))
+        if self.keepalivePermitWithoutCalls:
+            options.append(("grpc.keepalive_permit_without_calls", 1))
+        if self.maxReceiveMessageLength is not None:
+            options.append(
+                ("grpc.max_receive_message_length", self.maxReceiveMessageLength)
+            )
+        if self.maxSendMessageLength is not None:
+            options.append(("grpc.max_send_message_length", self.maxSendMessageLength))
+        return options
+
+    def CreateChannel(
+        self, target: str, interceptors: list[grpc.UnaryUnaryClientInterceptor] = None
+    ) -> grpc.Channel:
+        """
+        Creates a channel with these settings
+        Parameters:
+            target: target given to the app, e.g. "localhost:5000"
+            interceptors: additional interceptors, e.g. for deadlines
+        """
+        return self.InterceptChannel(self.CreateBaseChannel(target), interceptors)
+
+    def CreateBaseChannel(self, target: str) -> grpc.Channel:
+        """
+        Creates a channel with these settings but without interceptors, e.g. the channel shared by the apps of an
+        AppHost. Closing an intercepted channel closes this channel too.
+        Parameters:
+            target: target given to the app, e.g. "localhost:5000"
+        """
+        return grpc.insecure_channel(
+            self.GetTarget(target),
+            options=self.GetChannelOptions(),
+            compression=self.compression,
+        )
+
+    def InterceptChannel(
+        self,
+        channel: grpc.Channel,
+        interceptors: list[grpc.UnaryUnaryClientInterceptor] = None,
+    ) -> grpc.Channel:
+        """
+        Adds the interceptors and the method compression to a channel created by CreateBaseChannel()
+        Parameters:
+            channel: the base channel
+            interceptors: additional interceptors, e.g. for deadlines
+        """
+        interceptors = list(interceptors or [])
+        if len(self.methodCompression) > 0:
+            interceptors.append(MethodCompressionInterceptor(self.methodCompression))
+        if len(interceptors) > 0:
+            channel = grpc.intercept_channel(channel, *interceptors)
+        return channel
+
+
+def MakeLoopbackChannelProfile() -> ChannelProfile:
+    """
+    Creates the profile for apps running on the robot control: no compression since it costs more CPU time than it
+    saves, no keepalive since the connection cannot break.
+    """
+    profile = ChannelProfile()
+    profile.maxReceiveMessageLength = 16 * 1024 * 1024
+    return profile
+
+
+def MakeRemoteChannelProfile() -> ChannelProfile:
+    """
+    Creates the profile for apps connecting via LAN or WAN: keepalive detects broken connections within about 40 s,
+    file transfers are compressed.
+    """
+    profile = ChannelProfile()
+    profile.keepaliveTimeMs = 30000
+    profile.keepaliveTimeoutMs = 10000
+    profile.keepalivePermitWithoutCalls = True
+    profile.methodCompression = {
+        "UploadFile": grpc.Compression.Gzip,
+        "DownloadFile": grpc.Compression.Gzip,
+    }
+    profile.maxReceiveMessageLength = 16 * 1024 * 1024
+    return profile
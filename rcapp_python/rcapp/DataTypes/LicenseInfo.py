@@ -1,7 +1,7 @@
 # This class contains information about the features that are licensed by the robot control's license
 from dataclasses import dataclass
 
-import robotcontrolapp_pb2
+from .. import robotcontrolapp_pb2
 
 
 @dataclass
@@ -1,8 +1,8 @@
 from math import atan2, cos, fabs, sin, sqrt
 import math
 
-from DataTypes.MathDefinitions import DEG2RAD, RAD2DEG
-import robotcontrolapp_pb2
+from .MathDefinitions import DEG2RAD, RAD2DEG
+from .. import robotcontrolapp_pb2
 
 
 class Matrix44:
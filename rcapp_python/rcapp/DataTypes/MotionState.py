@@ -1,7 +1,7 @@
 # This describes the state of one motion interpolator
 from dataclasses import dataclass
 
-import robotcontrolapp_pb2
+from .. import robotcontrolapp_pb2
 
 
 @dataclass
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from typing import List
 
-from DataTypes.Matrix44 import Matrix44
+from .Matrix44 import Matrix44, Matrix44FromGrpc
+from .. import robotcontrolapp_pb2
 
 
 @dataclass
@@ -114,3 +115,38 @@ def MakePositionVariableBoth(
     if externalAxes is not None:
         result.SetExternalAxes(externalAxes)
     return result
+
+
+def ProgramVariableFromGrpc(
+    grpc: robotcontrolapp_pb2.ProgramVariable,
+) -> ProgramVariable:
+    """
+    Creates a number or position variable from a GRPC program variable
+    Parameters:
+        grpc: program variable received from the robot control
+    Returns:
+        NumberVariable or PositionVariable, None if the variable has no value
+    """
+    if grpc.HasField("number"):
+        return NumberVariable(grpc.name, grpc.number)
+    elif grpc.HasField("position"):
+        if grpc.position.HasField("robot_joints"):
+            return MakePositionVariableJoint(
+                grpc.name,
+                grpc.position.robot_joints.joints,
+                grpc.position.external_joints,
+            )
+        elif grpc.position.HasField("both"):
+            return MakePositionVariableBoth(
+                grpc.name,
+                Matrix44FromGrpc(grpc.position.both.cartesian),
+                grpc.position.both.robot_joints.joints,
+                grpc.position.external_joints,
+            )
+        elif grpc.position.HasField("cartesian"):
+            return MakePositionVariableCartesian(
+                grpc.name,
+                Matrix44FromGrpc(grpc.position.cartesian),
+                grpc.position.external_joints,
+            )
+    return None
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
-from DataTypes.Matrix44 import Matrix44, Matrix44FromGrpc
-import robotcontrolapp_pb2
+from .Matrix44 import Matrix44, Matrix44FromGrpc
+from .. import robotcontrolapp_pb2
 
 
 @dataclass
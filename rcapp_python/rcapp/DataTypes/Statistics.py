@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 
-import robotcontrolapp_pb2
+from .. import robotcontrolapp_pb2
 
 
 @dataclass
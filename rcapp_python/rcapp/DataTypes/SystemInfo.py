@@ -1,5 +1,5 @@
 # This class contains system information that usually does not change (except for the cycle time statistics)
-import robotcontrolapp_pb2
+from .. import robotcontrolapp_pb2
 
 
 class SystemInfo:
@@ -0,0 +1,44 @@
+from .. import robotcontrolapp_pb2
+
+
+class Vector3:
+    """A 3 dimensional vector, e.g. a position in mm"""
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        """Initializes the vector with the given values"""
+        self._data = [x, y, z]
+
+    def ToGrpc(self) -> robotcontrolapp_pb2.Vector3:
+        """Creates a GRPC vector and copies the values"""
+        return robotcontrolapp_pb2.Vector3(
+            x=self._data[0], y=self._data[1], z=self._data[2]
+        )
+
+    def GetX(self) -> float:
+        """Gets the X value"""
+        return self._data[0]
+
+    def GetY(self) -> float:
+        """Gets the Y value"""
+        return self._data[1]
+
+    def GetZ(self) -> float:
+        """Gets the Z value"""
+        return self._data[2]
+
+    def SetX(self, x: float):
+        """Sets the X value"""
+        self._data[0] = x
+
+    def SetY(self, y: float):
+        """Sets the Y value"""
+        self._data[1] = y
+
+    def SetZ(self, z: float):
+        """Sets the Z value"""
+        self._data[2] = z
+
+
+def Vector3FromGrpc(grpcVector: robotcontrolapp_pb2.Vector3) -> Vector3:
+    """Constructor, copies values from GRPC vector"""
+    return Vector3(grpcVector.x, grpcVector.y, grpcVector.z)
@@ -0,0 +1,33 @@
+"""
+Data classes returned by the AppClient, the modules are loaded on first use, e.g. DirectoryContent only by apps listing
+files.
+"""
+
+import importlib
+
+_SUBMODULES = (
+    "DirectoryContent",
+    "LicenseInfo",
+    "MathDefinitions",
+    "Matrix44",
+    "MotionState",
+    "ProgramVariable",
+    "RobotState",
+    "Statistics",
+    "SystemInfo",
+    "Vector3",
+)
+"""Submodules loaded by __getattr__() on first access"""
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name: str):
+    """Loads a submodule on first access, later accesses find it in the module dictionary"""
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
@@ -0,0 +1,269 @@
+"""
+Typed access to the parameters of an app function call. Instead of searching the parameter list for each value, the
+parameters are indexed by name once and checked against the parameters declared in rcapp.xml:
+
+    parameters = self.GetParameters(function)
+    variableName = parameters.GetString("target_variable")
+    position = parameters.GetMatrix44("position")
+"""
+
+from dataclasses import dataclass, field
+import os
+import threading
+import xml.etree.ElementTree as ElementTree
+from .DataTypes.Matrix44 import Matrix44, Matrix44FromGrpc
+from .DataTypes.Vector3 import Vector3, Vector3FromGrpc
+from . import robotcontrolapp_pb2
+
+PARAMETER_TYPES = {
+    "string": "string",
+    "double": "double",
+    "bool": "bool",
+    "int": "int64",
+    "int64": "int64",
+    "vector3": "vector3",
+    "cartesian": "cartesian",
+}
+"""Value type of the received parameter by parameter type in rcapp.xml, other types are not checked"""
+
+_CONVERTERS = {
+    "vector3": Vector3FromGrpc,
+    "cartesian": Matrix44FromGrpc,
+}
+"""Converters of the message values, these are converted on first access"""
+
+
+class ParameterException(RuntimeError):
+    """the parameters of an app function call do not match its definition"""
+
+
+@dataclass
+class ParameterSchema:
+    """A parameter declared in rcapp.xml"""
+
+    name: str = ""
+    """Name of the parameter"""
+    type: str = ""
+    """Type as written in rcapp.xml, e.g. string or double"""
+    valueType: str = None
+    """Expected value type of the received parameter, see PARAMETER_TYPES, None if not checked"""
+    defaultValue: str = None
+    """Default value as written in rcapp.xml, None if not given"""
+    label: str = ""
+    """Human readable name"""
+
+
+@dataclass
+class FunctionSchema:
+    """An app function declared in rcapp.xml"""
+
+    name: str = ""
+    """Name of the app function"""
+    label: str = ""
+    """Human readable name"""
+    parameters: dict = field(default_factory=dict)
+    """ParameterSchema by parameter name, in the order of rcapp.xml"""
+
+
+def ParseFunctionSchemas(fileName: str) -> dict[str, FunctionSchema]:
+    """
+    Reads the app functions declared in an app definition file
+    Parameters:
+        fileName: path of the rcapp.xml file
+    Returns:
+        FunctionSchema by function name
+    """
+    schemas = dict()
+    for functionElement in ElementTree.parse(fileName).getroot().iter("function"):
+        schema = FunctionSchema(
+            functionElement.get("name", ""), functionElement.get("label", "")
+        )
+        for parameterElement in functionElement.iter("parameter"):
+            parameterType = parameterElement.get("type", "")
+            parameter = ParameterSchema(
+                parameterElement.get("name", ""),
+                parameterType,
+                PARAMETER_TYPES.get(parameterType),
+                parameterElement.get("value"),
+                parameterElement.get("label", ""),
+            )
+            schema.parameters[parameter.name] = parameter
+        schemas[schema.name] = schema
+    return schemas
+
+
+_schemaCache = dict()
+"""Parsed app definition files: absolute path to tuple of modification time and schemas"""
+_schemaCacheMutex = threading.Lock()
+
+
+def LoadFunctionSchemas(fileName: str) -> dict[str, FunctionSchema]:
+    """
+    Reads the app functions declared in an app definition file, the file is parsed again only if it changed
+    Parameters:
+        fileName: path of the rcapp.xml file
+    Returns:
+        FunctionSchema by function name, empty if the file does not exist
+    """
+    path = os.path.abspath(fileName)
+    try:
+        modified = os.path.getmtime(path)
+    except OSError:
+        return dict()
+    with _schemaCacheMutex:
+        cached = _schemaCache.get(path)
+        if cached is None or cached[0] != modified:
+            cached = (modified, ParseFunctionSchemas(path))
+            _schemaCache[path] = cached
+        return cached[1]
+
+
+class FunctionParameters:
+    """Parameters of an app function call by name"""
+
+    def __init__(
+        self,
+        function: robotcontrolapp_pb2.AppFunction,
+        schema: FunctionSchema = None,
+    ):
+        """
+        Indexes the parameters of a function call
+        Parameters:
+            function: function call received from the robot control
+            schema: definition of the function, if given the parameters are checked against it
+        Raises:
+            ParameterException if a declared parameter is missing or has the wrong type
+        """
+        self.__values = dict()
+        """Tuples of value type (e.g. "double") and value by parameter name, messages are not converted yet"""
+        self.__converted = dict()
+        """Converted message values by parameter name"""
+        for parameter in function.parameters:
+            valueType = parameter.WhichOneof("value")
+            if valueType is None:
+                self.__values[parameter.name] = (None, None)
+            else:
+                self.__values[parameter.name] = (
+                    valueType[: -len("_value")],
+                    getattr(parameter, valueType),
+                )
+        if schema is not None:
+            self.__Check(schema)
+
+    def __Check(self, schema: FunctionSchema):
+        """Checks the parameters against the function definition"""
+        errors = []
+        for parameter in schema.parameters.values():
+            value = self.__values.get(parameter.name)
+            if value is None:
+                errors.append(f"missing parameter '{parameter.name}'")
+            elif parameter.valueType is not None and value[0] != parameter.valueType:
+                errors.append(
+                    f"invalid parameter type '{value[0]}' for '{parameter.name}', expected '{parameter.type}'"
+                )
+        if len(errors) > 0:
+            raise ParameterException(
+                f"app function '{schema.name}': " + ", ".join(errors)
+            )
+
+    def Has(self, name: str) -> bool:
+        """Checks whether the function call contains a parameter"""
+        return name in self.__values
+
+    def GetNames(self) -> list[str]:
+        """Gets the parameter names in the order they were received"""
+        return list(self.__values)
+
+    def GetType(self, name: str) -> str:
+        """
+        Gets the value type of a parameter: "bool", "int64", "double", "string", "vector3" or "cartesian", None if the
+        parameter has no value
+        Raises:
+            ParameterException if the parameter is missing
+        """
+        return self.__GetEntry(name)[0]
+
+    def Get(self, name: str):
+        """
+        Gets the value of a parameter of any type, vectors are returned as Vector3 and cartesian positions as Matrix44
+        Raises:
+            ParameterException if the parameter is missing
+        """
+        valueType, value = self.__GetEntry(name)
+        converter = _CONVERTERS.get(valueType)
+        if converter is None:
+            return value
+        converted = self.__converted.get(name)
+        if converted is None:
+            converted = converter(value)
+            self.__converted[name] = converted
+        return converted
+
+    def GetString(self, name: str) -> str:
+        """
+        Gets the value of a string parameter
+        Raises:
+            ParameterException if the parameter is missing or has another type
+        """
+        return self.__GetTyped(name, "string")
+
+    def GetDouble(self, name: str) -> float:
+        """
+        Gets the value of a number parameter, integer parameters are accepted too
+        Raises:
+            ParameterException if the parameter is missing or has another type
+        """
+        valueType, value = self.__GetEntry(name)
+        if valueType == "int64":
+            return float(value)
+        return self.__GetTyped(name, "double")
+
+    def GetBool(self, name: str) -> bool:
+        """
+        Gets the value of a boolean parameter
+        Raises:
+            ParameterException if the parameter is missing or has another type
+        """
+        return self.__GetTyped(name, "bool")
+
+    def GetInt(self, name: str) -> int:
+        """
+        Gets the value of an integer parameter
+        Raises:
+            ParameterException if the parameter is missing or has another type
+        """
+        return self.__GetTyped(name, "int64")
+
+    def GetVector3(self, name: str) -> Vector3:
+        """
+        Gets the value of a vector parameter, this is converted on first access
+        Raises:
+            ParameterException if the parameter is missing or has another type
+        """
+        self.__GetTyped(name, "vector3")
+        return self.Get(name)
+
+    def GetMatrix44(self, name: str) -> Matrix44:
+        """
+        Gets the value of a cartesian parameter, this is converted on first access
+        Raises:
+            ParameterException if the parameter is missing or has another type
+        """
+        self.__GetTyped(name, "cartesian")
+        return self.Get(name)
+
+    def __GetEntry(self, name: str) -> tuple:
+        """Gets the value type and value of a parameter"""
+        entry = self.__values.get(name)
+        if entry is None:
+            raise ParameterException(f"missing parameter '{name}'")
+        return entry
+
+    def __GetTyped(self, name: str, valueType: str):
+        """Gets the unconverted value of a parameter and checks its type"""
+        entry = self.__GetEntry(name)
+        if entry[0] != valueType:
+            raise ParameterException(
+                f"invalid parameter type '{entry[0]}' for '{name}', expected '{valueType}'"
+            )
+        return entry[1]
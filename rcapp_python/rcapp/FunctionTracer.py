@@ -0,0 +1,302 @@
+"""
+The FunctionTracer measures how long the robot program waits on the app: from receiving an app function call until
+SendFunctionDone() or SendFunctionFailed(). Use AppClient.GetFunctionTrace() to get the latency per function name, the
+running calls and the slowest calls with their parameters, or AppClient.WriteFunctionTrace() to view the calls in a
+trace viewer like chrome://tracing or Perfetto.
+"""
+
+from collections import deque
+from dataclasses import asdict, dataclass, field
+import heapq
+import json
+import os
+import threading
+import time
+from .RpcMetrics import LatencyHistogram
+from . import robotcontrolapp_pb2
+
+
+def _ParametersToDict(function: robotcontrolapp_pb2.AppFunction) -> dict:
+    """Converts the parameters of an app function call to a dictionary of JSON compatible values"""
+    result = dict()
+    for parameter in function.parameters:
+        kind = parameter.WhichOneof("value")
+        if kind == "vector3_value":
+            value = parameter.vector3_value
+            result[parameter.name] = [value.x, value.y, value.z]
+        elif kind == "cartesian_value":
+            result[parameter.name] = list(parameter.cartesian_value.data)
+        elif kind is not None:
+            result[parameter.name] = getattr(parameter, kind)
+        else:
+            result[parameter.name] = None
+    return result
+
+
+@dataclass
+class FunctionCallRecord:
+    """A traced app function call"""
+
+    name: str = ""
+    """Name of the app function"""
+    callId: int = 0
+    """Call ID"""
+    parameters: dict = field(default_factory=dict)
+    """Parameter values by name, vectors and matrices are lists"""
+    duration: float = 0.0
+    """Time in s from receiving the call until it finished, for running calls until now"""
+    failed: bool = False
+    """True if the call failed"""
+    reason: str = ""
+    """Error message of a failed call"""
+
+
+@dataclass
+class FunctionMetrics:
+    """Metrics of an app function"""
+
+    calls: int = 0
+    """Number of finished calls"""
+    failed: int = 0
+    """Number of failed calls"""
+    inFlight: int = 0
+    """Number of running calls"""
+    latencyMean: float = 0.0
+    """Mean time in s from receiving a call until it finished"""
+    latencyP50: float = 0.0
+    """Median time in s"""
+    latencyP95: float = 0.0
+    """95th percentile of the time in s"""
+    latencyP99: float = 0.0
+    """99th percentile of the time in s"""
+    latencyMax: float = 0.0
+    """Longest time in s"""
+    totalTime: float = 0.0
+    """Sum of the times in s, this is the time the robot programs waited on this function"""
+
+
+@dataclass
+class FunctionTrace:
+    """Snapshot of the traced app function calls"""
+
+    duration: float = 0.0
+    """Time in s the metrics cover"""
+    functions: dict = field(default_factory=dict)
+    """FunctionMetrics by function name"""
+    running: list = field(default_factory=list)
+    """FunctionCallRecord of each running call, longest running first"""
+    slowest: list = field(default_factory=list)
+    """FunctionCallRecord of the slowest finished calls, slowest first"""
+
+    def ToDict(self) -> dict:
+        """Converts the trace to a dictionary, e.g. to write it as JSON"""
+        return asdict(self)
+
+
+class _RunningCall:
+    """A call that was received but not finished yet"""
+
+    def __init__(self, function: robotcontrolapp_pb2.AppFunction, track: int):
+        self.function = function
+        """Received function call, the parameters are converted only if needed"""
+        self.startTime = time.perf_counter()
+        self.track = track
+        """Row of the call in the trace file, running calls never share a row"""
+
+
+class FunctionTracer:
+    """
+    Records the app function calls of an app. Finished calls are counted in a histogram per function name, the slowest
+    calls and the latest calls (for the trace file) are kept in bounded buffers, so the memory use does not grow. This
+    class is thread safe.
+    """
+
+    def __init__(self, maxSlowestCalls: int = 20, maxTraceEvents: int = 10000):
+        """
+        Parameters:
+            maxSlowestCalls: number of slowest calls to keep
+            maxTraceEvents: number of latest finished calls kept for WriteTraceFile()
+        """
+        self.enabled = True
+        """If false no calls are recorded"""
+        self.__maxSlowestCalls = maxSlowestCalls
+        self.__running = dict()
+        """Running calls by call ID"""
+        self.__freeTracks = []
+        """Rows of the trace file not used by a running call (heap)"""
+        self.__trackCount = 0
+        """Number of rows used in the trace file"""
+        self.__histograms = dict()
+        """LatencyHistogram by function name"""
+        self.__failed = dict()
+        """Number of failed calls by function name"""
+        self.__slowest = []
+        """Heap of the slowest calls: tuples of duration, sequence number and FunctionCallRecord"""
+        self.__sequence = 0
+        """Sequence number of the finished calls, sorts calls with equal durations"""
+        self.__traceEvents = deque(maxlen=maxTraceEvents)
+        """Latest finished calls: tuples of _RunningCall, duration and failure reason"""
+        self.__traceStart = time.perf_counter()
+        """Time stamp 0 of the trace file"""
+        self.__startTime = time.perf_counter()
+        """Start time of the metrics"""
+        self.__mutex = threading.Lock()
+
+    def Start(self, function: robotcontrolapp_pb2.AppFunction):
+        """Records that an app function call was received"""
+        if not self.enabled:
+            return
+        with self.__mutex:
+            if len(self.__freeTracks) > 0:
+                track = heapq.heappop(self.__freeTracks)
+            else:
+                track = self.__trackCount
+                self.__trackCount += 1
+            previous = self.__running.get(function.call_id)
+            if previous is not None:
+                heapq.heappush(self.__freeTracks, previous.track)
+            self.__running[function.call_id] = _RunningCall(function, track)
+
+    def Finish(self, callId: int, failureReason: str = None):
+        """
+        Records that an app function call finished, calls that were not started (e.g. before tracing was enabled) are
+        ignored
+        Parameters:
+            callId: call ID of the function call
+            failureReason: error message if the call failed, None if it succeeded
+        """
+        endTime = time.perf_counter()
+        with self.__mutex:
+            call = self.__running.pop(callId, None)
+            if call is None:
+                return
+            heapq.heappush(self.__freeTracks, call.track)
+            duration = endTime - call.startTime
+            name = call.function.name
+            histogram = self.__histograms.get(name)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self.__histograms[name] = histogram
+            histogram.Record(duration)
+            if failureReason is not None:
+                self.__failed[name] = self.__failed.get(name, 0) + 1
+
+            # Parameters are converted only for the slowest calls, the trace file converts them when it is written
+            self.__sequence += 1
+            if len(self.__slowest) < self.__maxSlowestCalls:
+                record = self.__MakeRecord(call, duration, failureReason)
+                heapq.heappush(self.__slowest, (duration, self.__sequence, record))
+            elif self.__maxSlowestCalls > 0 and duration > self.__slowest[0][0]:
+                record = self.__MakeRecord(call, duration, failureReason)
+                heapq.heapreplace(self.__slowest, (duration, self.__sequence, record))
+            self.__traceEvents.append((call, duration, failureReason))
+
+    @staticmethod
+    def __MakeRecord(
+        call: _RunningCall, duration: float, failureReason: str
+    ) -> FunctionCallRecord:
+        """Creates the record of a call"""
+        return FunctionCallRecord(
+            call.function.name,
+            call.function.call_id,
+            _ParametersToDict(call.function),
+            duration,
+            failureReason is not None,
+            failureReason or "",
+        )
+
+    def Clear(self):
+        """Forgets the running calls, e.g. on connect since the robot control aborted them"""
+        with self.__mutex:
+            self.__running.clear()
+            self.__freeTracks = []
+            self.__trackCount = 0
+
+    def GetInFlightCount(self) -> int:
+        """Gets the number of running calls"""
+        with self.__mutex:
+            return len(self.__running)
+
+    def GetTrace(self, reset: bool = False) -> FunctionTrace:
+        """
+        Gets the metrics per function name, the running calls and the slowest calls
+        Parameters:
+            reset: if true the metrics and the slowest calls are reset after reading, running calls are kept
+        Returns:
+            trace since the tracer was created or since the last reset
+        """
+        now = time.perf_counter()
+        with self.__mutex:
+            trace = FunctionTrace(now - self.__startTime)
+            for name, histogram in self.__histograms.items():
+                trace.functions[name] = FunctionMetrics(
+                    calls=histogram.GetCount(),
+                    failed=self.__failed.get(name, 0),
+                    latencyMean=histogram.GetMean(),
+                    latencyP50=histogram.GetPercentile(50),
+                    latencyP95=histogram.GetPercentile(95),
+                    latencyP99=histogram.GetPercentile(99),
+                    latencyMax=histogram.GetMax(),
+                    totalTime=histogram.GetMean() * histogram.GetCount(),
+                )
+            for call in self.__running.values():
+                metrics = trace.functions.setdefault(
+                    call.function.name, FunctionMetrics()
+                )
+                metrics.inFlight += 1
+                trace.running.append(
+                    self.__MakeRecord(call, now - call.startTime, None)
+                )
+            trace.running.sort(key=lambda record: record.duration, reverse=True)
+            trace.slowest = [entry[2] for entry in sorted(self.__slowest, reverse=True)]
+            if reset:
+                self.__histograms = dict()
+                self.__failed = dict()
+                self.__slowest = []
+                self.__startTime = now
+            return trace
+
+    def WriteTraceFile(self, fileName: str, processName: str = "app"):
+        """
+        Writes the latest finished calls and the running calls to a file in the Chrome trace event format, which can be
+        opened in chrome://tracing or https://ui.perfetto.dev. Each call is shown as a bar on a row, calls running at
+        the same time are shown on separate rows.
+        Parameters:
+            fileName: file to write, it is replaced
+            processName: name shown for the process, e.g. the app name
+        """
+        now = time.perf_counter()
+        pid = os.getpid()
+        with self.__mutex:
+            calls = list(self.__traceEvents) + [
+                (call, now - call.startTime, None) for call in self.__running.values()
+            ]
+            traceStart = self.__traceStart
+
+        events = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": processName},
+            }
+        ]
+        for call, duration, failureReason in calls:
+            record = self.__MakeRecord(call, duration, failureReason)
+            args = {"callId": record.callId, "parameters": record.parameters}
+            if record.failed:
+                args["failed"] = record.reason
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": "appFunction",
+                    "ph": "X",
+                    "ts": (call.startTime - traceStart) * 1e6,
+                    "dur": duration * 1e6,
+                    "pid": pid,
+                    "tid": call.track,
+                    "args": args,
+                }
+            )
+        with open(fileName, "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
@@ -0,0 +1,522 @@
+"""
+Decorators to register the app function and UI event handlers of an app instead of overriding _AppFunctionHandler()
+and _UiUpdateHandler() with long if/elif chains:
+
+    class MyApp(AppClient):
+        @app_function("move_home")
+        def MoveHome(self, function: AppFunction):
+            ...
+            self.SendFunctionDone(function.call_id)
+
+        @ui_event("buttonStart")
+        def OnStartClicked(self, update: AppUIElement):
+            ...
+
+The handlers are looked up in a dictionary, so the dispatch time does not depend on the number of handlers. App function
+handlers taking a third argument receive the parameters decoded into the class generated from rcapp.xml, see
+ParameterClasses.py.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import inspect
+import threading
+import time
+from typing import Callable
+from .Log import GetLogger
+from .RpcMetrics import LatencyHistogram
+from . import robotcontrolapp_pb2
+
+_log = GetLogger().GetSubsystem("HandlerRegistry")
+"""Logger of the handlers that failed"""
+
+MODE_SYNC = "sync"
+"""The handler runs in the event reader thread, the following events wait until it returns"""
+MODE_POOL = "pool"
+"""The handler runs in a worker thread: app functions on AppClient.functionDispatcher if set, otherwise on a pool"""
+MODE_COROUTINE = "coroutine"
+"""The handler is a coroutine (async def), it runs on an event loop thread shared by the handlers of the app"""
+
+UI_CLICKED = "clicked"
+"""A button was clicked"""
+UI_BUTTON = "button_state"
+"""The state of a button changed (clicked or not clicked)"""
+UI_CHECKBOX = "checkbox_state"
+"""A checkbox was checked or unchecked"""
+UI_DROPDOWN = "dropdown_state"
+"""An entry of a dropdown was selected"""
+UI_TEXTFIELD = "textfield_state"
+"""The text of a text box changed"""
+UI_NUMBERFIELD = "numberfield_state"
+"""The number of a number box changed"""
+UI_IMAGE = "image_state"
+"""An image changed"""
+
+_REGISTRATIONS_ATTRIBUTE = "_handlerRegistrations"
+"""Attribute of the decorated functions containing their registrations"""
+
+
+class _Registration:
+    """Registration of a handler"""
+
+    def __init__(self, key, mode: str):
+        self.key = key
+        """Function name or tuple of element name and UI event kind"""
+        self.mode = mode
+        """MODE_SYNC, MODE_POOL, MODE_COROUTINE or None to choose automatically"""
+        self.attributeName = ""
+        """Name of the handler method in the app class, set when the class is scanned"""
+        self.typed = False
+        """True if the app function handler takes the decoded parameters as third argument"""
+        self.parametersClass = None
+        """Type annotation of the parameters argument if it is a class, e.g. from a generated AppParameters.py"""
+
+
+def _Register(key, mode: str) -> Callable:
+    """Creates a decorator that adds a registration to a function"""
+    if mode not in (None, MODE_SYNC, MODE_POOL, MODE_COROUTINE):
+        raise RuntimeError(f"unknown handler mode '{mode}'")
+
+    def Decorator(handler: Callable) -> Callable:
+        isCoroutine = asyncio.iscoroutinefunction(handler)
+        if mode == MODE_COROUTINE and not isCoroutine:
+            raise RuntimeError(
+                f"handler '{handler.__name__}' must be a coroutine (async def)"
+            )
+        if mode in (MODE_SYNC, MODE_POOL) and isCoroutine:
+            raise RuntimeError(
+                f"handler '{handler.__name__}' is a coroutine, use MODE_COROUTINE"
+            )
+        registrations = getattr(handler, _REGISTRATIONS_ATTRIBUTE, [])
+        setattr(
+            handler,
+            _REGISTRATIONS_ATTRIBUTE,
+            registrations
+            + [_Registration(key, MODE_COROUTINE if isCoroutine else mode)],
+        )
+        return handler
+
+    return Decorator
+
+
+def app_function(name: str, mode: str = None) -> Callable:
+    """
+    Registers a method of an AppClient subclass as handler of an app function. The method receives the AppFunction
+    and must call SendFunctionDone() or SendFunctionFailed(). If it raises an exception the call fails with the
+    exception message. If the method takes a third argument it receives the parameters decoded into the class
+    generated from rcapp.xml (see ParameterClasses.py), the annotated class is checked against rcapp.xml on connect.
+    Parameters:
+        name: name of the app function as defined in rcapp.xml
+        mode: MODE_SYNC, MODE_POOL or MODE_COROUTINE, by default coroutines run on the event loop and other handlers
+            run like calls without handler: on AppClient.functionDispatcher if set, otherwise in the event reader thread
+    """
+    return _Register(name, mode)
+
+
+def ui_event(element: str, kind: str = UI_CLICKED, mode: str = None) -> Callable:
+    """
+    Registers a method of an AppClient subclass as handler of a UI event. The method receives the AppUIElement.
+    Several decorators can be stacked to handle several elements with one method.
+    Parameters:
+        element: name of the UI element as defined in ui.xml
+        kind: UI_CLICKED (only button clicks) or the changed state, e.g. UI_TEXTFIELD or UI_NUMBERFIELD
+        mode: MODE_SYNC, MODE_POOL or MODE_COROUTINE, by default coroutines run on the event loop and other handlers
+            run in the event reader thread
+    """
+    return _Register((element, kind), mode)
+
+
+@dataclass
+class HandlerMetrics:
+    """Timings of a handler"""
+
+    calls: int = 0
+    """Number of finished calls"""
+    errors: int = 0
+    """Number of calls that raised an exception"""
+    latencyMean: float = 0.0
+    """Mean time in s from receiving the event until the handler returned"""
+    latencyP50: float = 0.0
+    """Median time in s"""
+    latencyP95: float = 0.0
+    """95th percentile of the time in s"""
+    latencyP99: float = 0.0
+    """99th percentile of the time in s"""
+    latencyMax: float = 0.0
+    """Longest time in s"""
+    totalTime: float = 0.0
+    """Sum of the times in s"""
+
+
+class _HandlerTable:
+    """Registered handlers of an app class"""
+
+    def __init__(self, cls: type):
+        self.functions = dict()
+        """Registrations by function name"""
+        self.uiEvents = dict()
+        """Registrations by tuple of element name and UI event kind"""
+        for attributeName in dir(cls):
+            registrations = getattr(
+                getattr(cls, attributeName, None), _REGISTRATIONS_ATTRIBUTE, None
+            )
+            for registration in registrations or []:
+                registration.attributeName = attributeName
+                if not isinstance(registration.key, tuple):
+                    _InspectFunctionHandler(registration, getattr(cls, attributeName))
+                table = (
+                    self.uiEvents
+                    if isinstance(registration.key, tuple)
+                    else self.functions
+                )
+                if registration.key in table:
+                    raise RuntimeError(
+                        f"{cls.__name__}: handlers '{table[registration.key].attributeName}' and '{attributeName}' "
+                        f"are registered for the same event {registration.key}"
+                    )
+                table[registration.key] = registration
+
+
+def _InspectFunctionHandler(registration: _Registration, handler: Callable):
+    """Checks whether an app function handler takes typed parameters"""
+    arguments = [
+        argument
+        for argument in inspect.signature(handler).parameters.values()
+        if argument.kind
+        in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    # self, function and parameters
+    registration.typed = len(arguments) >= 3
+    annotation = arguments[2].annotation if registration.typed else None
+    if isinstance(annotation, type) and annotation is not inspect.Parameter.empty:
+        registration.parametersClass = annotation
+
+
+_tables = dict()
+"""Handler tables by app class, each class is scanned once"""
+_tablesMutex = threading.Lock()
+
+
+def _GetHandlerTable(cls: type) -> _HandlerTable:
+    """Gets the handler table of an app class"""
+    table = _tables.get(cls)
+    if table is None:
+        with _tablesMutex:
+            table = _tables.get(cls)
+            if table is None:
+                table = _HandlerTable(cls)
+                _tables[cls] = table
+    return table
+
+
+class HandlerRegistry:
+    """
+    Dispatches the events of an app to the handlers registered with @app_function and @ui_event and measures the time
+    of each handler. The AppClient creates one registry per app.
+    """
+
+    def __init__(self, appClass: type, maxWorkers: int = 4):
+        """
+        Parameters:
+            appClass: app class whose methods are scanned for handlers
+            maxWorkers: number of worker threads running MODE_POOL handlers if there is no function dispatcher
+        """
+        self.__table = _GetHandlerTable(appClass)
+        self.__maxWorkers = maxWorkers
+        self.__executor = None
+        """Runs MODE_POOL handlers, created on first use"""
+        self.__loop = None
+        """Event loop running MODE_COROUTINE handlers, created on first use"""
+        self.__loopThread = None
+        self.__histograms = dict()
+        """LatencyHistogram by handler name"""
+        self.__errors = dict()
+        """Number of exceptions by handler name"""
+        self.__parameterClasses = dict()
+        """Classes decoding the parameters of the typed handlers by function name, see BindParameterClasses()"""
+        self.__mutex = threading.Lock()
+
+    def HasFunctionHandlers(self) -> bool:
+        """Checks whether app function handlers are registered"""
+        return len(self.__table.functions) > 0
+
+    def HasUIHandlers(self) -> bool:
+        """Checks whether UI event handlers are registered"""
+        return len(self.__table.uiEvents) > 0
+
+    def GetFunctionNames(self) -> list[str]:
+        """Gets the names of the app functions with registered handlers"""
+        return list(self.__table.functions)
+
+    def BindParameterClasses(self, parameterClasses: dict) -> list[str]:
+        """
+        Checks the app function handlers against the functions declared in rcapp.xml and sets the classes decoding
+        the parameters of the typed handlers
+        Parameters:
+            parameterClasses: parameter class by function name, see ParameterClasses.LoadParameterClasses()
+        Returns:
+            the error messages, empty if the handlers match
+        """
+        from .ParameterClasses import CheckParameterClass
+
+        errors = []
+        bound = dict()
+        for name, registration in self.__table.functions.items():
+            generated = parameterClasses.get(name)
+            if generated is None:
+                errors.append(
+                    f"handler '{registration.attributeName}' is registered for app function '{name}' which is not "
+                    f"declared"
+                )
+            elif registration.typed:
+                bound[name] = generated
+                if registration.parametersClass is not None:
+                    error = CheckParameterClass(registration.parametersClass, generated)
+                    if error is not None:
+                        errors.append(
+                            f"parameters of handler '{registration.attributeName}': {error}"
+                        )
+                    else:
+                        bound[name] = registration.parametersClass
+        self.__parameterClasses = bound
+        return errors
+
+    def DispatchFunction(self, app, function: robotcontrolapp_pb2.AppFunction) -> bool:
+        """
+        Runs the handler of an app function call
+        Parameters:
+            app: the AppClient that received the call
+            function: received call
+        Returns:
+            false if no handler is registered for the function
+        """
+        registration = self.__table.functions.get(function.name)
+        if registration is None:
+            return False
+        handler = getattr(app, registration.attributeName)
+        if registration.typed:
+            handler = self.__MakeTypedHandler(registration, handler)
+        startTime = time.perf_counter()
+        mode = registration.mode
+        if mode is None:
+            mode = MODE_SYNC if app.functionDispatcher is None else MODE_POOL
+
+        def OnError(ex: Exception):
+            _log.Error(
+                "App function '%s' (call ID %d) raised an exception: %r",
+                function.name,
+                function.call_id,
+                ex,
+            )
+            if app.IsConnected():
+                app.SendFunctionFailed(function.call_id, repr(ex))
+
+        if mode == MODE_POOL and app.functionDispatcher is not None:
+            app.functionDispatcher.Dispatch(
+                function,
+                lambda f: self.__Run(registration, handler, f, startTime, OnError),
+                app.SendFunctionFailed,
+            )
+        else:
+            self.__Start(mode, registration, handler, function, startTime, OnError)
+        return True
+
+    def __MakeTypedHandler(
+        self, registration: _Registration, handler: Callable
+    ) -> Callable:
+        """Wraps a handler taking typed parameters, the parameters are decoded in the thread running the handler"""
+        parametersClass = self.__parameterClasses.get(
+            registration.key, registration.parametersClass
+        )
+
+        def Decode(function: robotcontrolapp_pb2.AppFunction):
+            if parametersClass is None:
+                from .ParameterClasses import AppDefinitionException
+
+                raise AppDefinitionException(
+                    f"no parameter class for app function '{registration.key}', rcapp.xml not found"
+                )
+            return parametersClass.FromGrpc(function)
+
+        if registration.mode == MODE_COROUTINE:
+
+            async def TypedCoroutine(function: robotcontrolapp_pb2.AppFunction):
+                return await handler(function, Decode(function))
+
+            return TypedCoroutine
+        return lambda function: handler(function, Decode(function))
+
+    def DispatchUIEvents(self, app, updates) -> list:
+        """
+        Runs the handlers of UI events
+        Parameters:
+            app: the AppClient that received the events
+            updates: received UI updates (AppUIElement)
+        Returns:
+            the updates without handler
+        """
+        if len(self.__table.uiEvents) == 0:
+            return updates
+        unhandled = []
+        startTime = time.perf_counter()
+        for update in updates:
+            kind = update.state.WhichOneof("state")
+            registration = None
+            if (
+                kind == UI_BUTTON
+                and update.state.button_state == robotcontrolapp_pb2.ButtonState.CLICKED
+            ):
+                registration = self.__table.uiEvents.get(
+                    (update.element_name, UI_CLICKED)
+                )
+            if registration is None:
+                registration = self.__table.uiEvents.get((update.element_name, kind))
+            if registration is None:
+                unhandled.append(update)
+                continue
+
+            def OnError(ex: Exception, update=update, registration=registration):
+                _log.Error(
+                    "UI event handler '%s' of '%s' raised an exception: %r",
+                    registration.attributeName,
+                    update.element_name,
+                    ex,
+                )
+
+            handler = getattr(app, registration.attributeName)
+            self.__Start(
+                registration.mode or MODE_SYNC,
+                registration,
+                handler,
+                update,
+                startTime,
+                OnError,
+            )
+        return unhandled
+
+    def __Start(
+        self,
+        mode: str,
+        registration: _Registration,
+        handler: Callable,
+        argument,
+        startTime: float,
+        onError: Callable[[Exception], None],
+    ):
+        """Runs a handler in the thread of its mode"""
+        if mode == MODE_SYNC:
+            self.__Run(registration, handler, argument, startTime, onError)
+        elif mode == MODE_POOL:
+            self.__GetExecutor().submit(
+                self.__Run, registration, handler, argument, startTime, onError
+            )
+        else:
+            future = asyncio.run_coroutine_threadsafe(
+                handler(argument), self.__GetLoop()
+            )
+
+            def Done(future):
+                error = future.exception() if not future.cancelled() else None
+                if error is not None:
+                    onError(error)
+                self.__Record(registration, startTime, error is not None)
+
+            future.add_done_callback(Done)
+
+    def __Run(
+        self,
+        registration: _Registration,
+        handler: Callable,
+        argument,
+        startTime: float,
+        onError: Callable[[Exception], None],
+    ):
+        """Calls a handler and records its time"""
+        failed = False
+        try:
+            handler(argument)
+        except Exception as ex:
+            failed = True
+            onError(ex)
+        self.__Record(registration, startTime, failed)
+
+    def __Record(self, registration: _Registration, startTime: float, failed: bool):
+        """Records the time of a handler call"""
+        duration = time.perf_counter() - startTime
+        name = registration.attributeName
+        with self.__mutex:
+            histogram = self.__histograms.get(name)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                self.__histograms[name] = histogram
+            histogram.Record(duration)
+            if failed:
+                self.__errors[name] = self.__errors.get(name, 0) + 1
+
+    def __GetExecutor(self) -> ThreadPoolExecutor:
+        """Gets the worker threads, creates them on first use"""
+        with self.__mutex:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.__maxWorkers, thread_name_prefix="EventHandler"
+                )
+            return self.__executor
+
+    def __GetLoop(self) -> asyncio.AbstractEventLoop:
+        """Gets the event loop, starts it on first use"""
+        with self.__mutex:
+            if self.__loop is None:
+                self.__loop = asyncio.new_event_loop()
+                self.__loopThread = threading.Thread(
+                    target=self.__loop.run_forever, name="EventHandlerLoop", daemon=True
+                )
+                self.__loopThread.start()
+            return self.__loop
+
+    def GetMetrics(self, reset: bool = False) -> dict[str, HandlerMetrics]:
+        """
+        Gets the timings of the handlers
+        Parameters:
+            reset: if true the timings are reset after reading
+        Returns:
+            HandlerMetrics by handler method name
+        """
+        with self.__mutex:
+            result = dict()
+            for name, histogram in self.__histograms.items():
+                result[name] = HandlerMetrics(
+                    calls=histogram.GetCount(),
+                    errors=self.__errors.get(name, 0),
+                    latencyMean=histogram.GetMean(),
+                    latencyP50=histogram.GetPercentile(50),
+                    latencyP95=histogram.GetPercentile(95),
+                    latencyP99=histogram.GetPercentile(99),
+                    latencyMax=histogram.GetMax(),
+                    totalTime=histogram.GetMean() * histogram.GetCount(),
+                )
+            if reset:
+                self.__histograms = dict()
+                self.__errors = dict()
+            return result
+
+    def Shutdown(self):
+        """
+        Stops the worker threads and the event loop, e.g. on disconnect. Queued MODE_POOL handlers still run, running
+        coroutines are dropped. The threads are started again when the next handler needs them.
+        """
+        with self.__mutex:
+            executor = self.__executor
+            loop = self.__loop
+            loopThread = self.__loopThread
+            self.__executor = None
+            self.__loop = None
+            self.__loopThread = None
+        if executor is not None:
+            # Do not wait, Shutdown() may be called by a handler
+            executor.shutdown(wait=False)
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            if threading.current_thread() != loopThread:
+                loopThread.join()
+                loop.close()
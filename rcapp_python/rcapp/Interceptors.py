@@ -0,0 +1,202 @@
+"""
+gRPC client interceptors used by the AppClient. They change the calls in one place instead of in each AppClient
+method, e.g. to set the compression or deadline of a call.
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+import threading
+import grpc
+
+
+class ClientCallDetails(
+    namedtuple(
+        "ClientCallDetails",
+        (
+            "method",
+            "timeout",
+            "metadata",
+            "credentials",
+            "wait_for_ready",
+            "compression",
+        ),
+    ),
+    grpc.ClientCallDetails,
+):
+    """Modified call details"""
+
+
+def GetMethodName(details: grpc.ClientCallDetails) -> str:
+    """Gets the method name without service, e.g. "GetTCP" """
+    method = details.method
+    if isinstance(method, bytes):
+        method = method.decode()
+    return method.rsplit("/", 1)[-1]
+
+
+class ClientInterceptor(
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+    grpc.StreamStreamClientInterceptor,
+):
+    """Base class for interceptors that handle all call types the same way, override _Intercept()"""
+
+    def _Intercept(self, continuation, details: grpc.ClientCallDetails, request):
+        """
+        Intercepts a call
+        Parameters:
+            continuation: function that starts the call, pass the (modified) details and the request
+            details: call details
+            request: request message or request iterator for client streaming calls
+        Returns:
+            the result of continuation
+        """
+        return continuation(details, request)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return self._Intercept(continuation, client_call_details, request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return self._Intercept(continuation, client_call_details, request)
+
+    def intercept_stream_unary(
+        self, continuation, client_call_details, request_iterator
+    ):
+        return self._Intercept(continuation, client_call_details, request_iterator)
+
+    def intercept_stream_stream(
+        self, continuation, client_call_details, request_iterator
+    ):
+        return self._Intercept(continuation, client_call_details, request_iterator)
+
+
+class MethodCompressionInterceptor(ClientInterceptor):
+    """Sets the compression of the calls by method name"""
+
+    def __init__(self, methodCompression: dict):
+        """
+        Parameters:
+            methodCompression: compression (grpc.Compression) by method name
+        """
+        self.__methodCompression = methodCompression
+
+    def _Intercept(self, continuation, details: grpc.ClientCallDetails, request):
+        compression = self.__methodCompression.get(GetMethodName(details))
+        if compression is not None and details.compression is None:
+            details = ClientCallDetails(
+                details.method,
+                details.timeout,
+                details.metadata,
+                details.credentials,
+                details.wait_for_ready,
+                compression,
+            )
+        return continuation(details, request)
+
+
+LONG_LIVED_METHODS = {"RecieveActions", "GetRobotStateStream"}
+"""Streams that stay open while the app runs. These have no deadline and are not cancelled by CancelAll()."""
+
+DEFAULT_METHOD_TIMEOUTS = {
+    "UploadFile": 120.0,
+    "DownloadFile": 120.0,
+    "ListFiles": 30.0,
+    "RemoveFiles": 30.0,
+}
+"""Default timeouts in s of methods that may take longer than the default timeout"""
+
+_NO_OVERRIDE = object()
+"""Marks that no timeout override is set for the current thread"""
+
+
+class DeadlineInterceptor(ClientInterceptor):
+    """
+    Sets the deadline of each call and keeps track of the running streams and futures, so that these can be cancelled.
+    Blocking unary calls cannot be cancelled, they are limited by their deadline.
+    """
+
+    def __init__(self, defaultTimeout: float = 10.0):
+        """
+        Parameters:
+            defaultTimeout: timeout in s of calls to methods not listed in methodTimeouts, None for no timeout
+        """
+        self.defaultTimeout = defaultTimeout
+        """Timeout in s of calls to methods not listed in methodTimeouts, None for no timeout"""
+        self.methodTimeouts = dict(DEFAULT_METHOD_TIMEOUTS)
+        """Timeouts in s by method name, None for no timeout"""
+        self.__override = threading.local()
+        """Timeout override of the current thread, see Timeout()"""
+        self.__runningCalls = set()
+        """Running streams and futures"""
+        self.__mutex = threading.Lock()
+
+    def GetTimeout(self, method: str) -> float:
+        """Gets the timeout in s of the next call of the given method in the current thread"""
+        if method in LONG_LIVED_METHODS:
+            return None
+        override = getattr(self.__override, "timeout", _NO_OVERRIDE)
+        if override is not _NO_OVERRIDE:
+            return override
+        return self.methodTimeouts.get(method, self.defaultTimeout)
+
+    @contextmanager
+    def Timeout(self, timeout: float):
+        """
+        Overrides the timeout of all calls in the current thread within the with block
+        Parameters:
+            timeout: timeout in s, None for no timeout
+        """
+        previous = getattr(self.__override, "timeout", _NO_OVERRIDE)
+        self.__override.timeout = timeout
+        try:
+            yield
+        finally:
+            self.__override.timeout = previous
+
+    def CancelAll(self) -> int:
+        """
+        Cancels all running streams and futures, e.g. downloads. The cancelled calls raise a grpc.RpcError with status
+        CANCELLED.
+        Returns:
+            number of cancelled calls
+        """
+        with self.__mutex:
+            calls = list(self.__runningCalls)
+            self.__runningCalls.clear()
+        cancelled = 0
+        for call in calls:
+            if call.cancel():
+                cancelled += 1
+        return cancelled
+
+    def GetRunningCallCount(self) -> int:
+        """Gets the number of running streams and futures that can be cancelled"""
+        with self.__mutex:
+            return len(self.__runningCalls)
+
+    def __Remove(self, call):
+        """Removes a finished call"""
+        with self.__mutex:
+            self.__runningCalls.discard(call)
+
+    def _Intercept(self, continuation, details: grpc.ClientCallDetails, request):
+        method = GetMethodName(details)
+        if details.timeout is None:
+            timeout = self.GetTimeout(method)
+            if timeout is not None:
+                details = ClientCallDetails(
+                    details.method,
+                    timeout,
+                    details.metadata,
+                    details.credentials,
+                    details.wait_for_ready,
+                    details.compression,
+                )
+
+        call = continuation(details, request)
+        if method not in LONG_LIVED_METHODS and not call.done():
+            with self.__mutex:
+                self.__runningCalls.add(call)
+            call.add_done_callback(self.__Remove)
+        return call
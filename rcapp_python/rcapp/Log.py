@@ -0,0 +1,347 @@
+"""
+Logging with low overhead on the calling thread: a record is stored in a ring buffer without formatting the message
+and without locking, a background thread formats and writes the records. Records below the level of their subsystem
+are not written but kept in the buffer, so the records before an error can be written with the error:
+
+    log = GetLogger().GetSubsystem("MyApp.functions")
+    log.Debug("call %d of '%s'", function.call_id, function.name)  # formatted only if written
+
+Levels are set per subsystem, subsystem names are hierarchical: SetLevel("MyApp", LEVEL_DEBUG) also applies to
+"MyApp.functions".
+"""
+
+import atexit
+from collections import deque
+from dataclasses import dataclass
+import datetime
+import itertools
+import sys
+import threading
+import time
+
+LEVEL_DEBUG = 10
+"""Detailed diagnostics, not written by default"""
+LEVEL_INFO = 20
+"""Normal operation, e.g. connected"""
+LEVEL_WARNING = 30
+"""Unexpected but handled, e.g. connection lost"""
+LEVEL_ERROR = 40
+"""Failed operation, the records before an error are written with it"""
+
+LEVEL_NAMES = {
+    LEVEL_DEBUG: "DEBUG",
+    LEVEL_INFO: "INFO",
+    LEVEL_WARNING: "WARNING",
+    LEVEL_ERROR: "ERROR",
+}
+"""Level names by level"""
+
+
+@dataclass
+class LogRecord:
+    """A logged message"""
+
+    sequence: int = 0
+    """Number of the record, increases with each record"""
+    time: float = 0.0
+    """Time (time.time()) when the record was logged"""
+    level: int = LEVEL_INFO
+    """Level, e.g. LEVEL_INFO"""
+    subsystem: str = ""
+    """Name of the subsystem, e.g. MyApp.connection"""
+    message: str = ""
+    """Formatted message"""
+    threadName: str = ""
+    """Name of the thread that logged the record"""
+
+    def ToString(self) -> str:
+        """Formats the record as a line, without line break"""
+        timeString = datetime.datetime.fromtimestamp(self.time).strftime("%H:%M:%S.%f")
+        return f"{timeString[:-3]} {LEVEL_NAMES.get(self.level, self.level)} [{self.subsystem}] {self.message}"
+
+
+def _FormatMessage(message: str, args: tuple) -> str:
+    """Formats a message with its arguments (% style), errors in the format do not raise"""
+    if len(args) == 0:
+        return str(message)
+    try:
+        return message % args
+    except Exception:
+        return f"{message} {args!r}"
+
+
+class SubsystemLogger:
+    """Logs the records of a subsystem, see Logger.GetSubsystem()"""
+
+    def __init__(self, logger: "Logger", subsystem: str):
+        self.__logger = logger
+        self.__subsystem = subsystem
+
+    def GetName(self) -> str:
+        """Gets the name of the subsystem"""
+        return self.__subsystem
+
+    def IsEnabled(self, level: int) -> bool:
+        """Checks whether records of a level are written, e.g. to skip expensive arguments"""
+        return level >= self.__logger.GetLevel(self.__subsystem)
+
+    def Log(self, level: int, message: str, *args):
+        """Logs a record, the message is formatted with the arguments (% style) when it is written"""
+        self.__logger.Log(self.__subsystem, level, message, *args)
+
+    def Debug(self, message: str, *args):
+        """Logs a LEVEL_DEBUG record"""
+        self.__logger.Log(self.__subsystem, LEVEL_DEBUG, message, *args)
+
+    def Info(self, message: str, *args):
+        """Logs a LEVEL_INFO record"""
+        self.__logger.Log(self.__subsystem, LEVEL_INFO, message, *args)
+
+    def Warning(self, message: str, *args):
+        """Logs a LEVEL_WARNING record"""
+        self.__logger.Log(self.__subsystem, LEVEL_WARNING, message, *args)
+
+    def Error(self, message: str, *args):
+        """Logs a LEVEL_ERROR record, the writer is woken up immediately"""
+        self.__logger.Log(self.__subsystem, LEVEL_ERROR, message, *args)
+
+
+class Logger:
+    """
+    Stores log records in a ring buffer and writes them in a background thread. Logging does not take a lock: the
+    slot of a record is taken from an atomic counter (itertools.count). If the writer falls behind by more than the
+    capacity, the oldest records are dropped and counted. Records of LEVEL_WARNING and above are written to stderr,
+    the others to stdout. This class is thread safe.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4096,
+        flushInterval: float = 0.1,
+        dumpOnError: int = 20,
+        stdout=None,
+        stderr=None,
+    ):
+        """
+        Parameters:
+            capacity: number of records in the ring buffer
+            flushInterval: time in s between two writes of the background thread
+            dumpOnError: number of records that were not written (below the level of their subsystem) to write before
+                an error record, 0 to write only the error
+            stdout: stream for records below LEVEL_WARNING, default is sys.stdout at the time of writing
+            stderr: stream for records of LEVEL_WARNING and above, default is sys.stderr at the time of writing
+        """
+        if capacity < 1:
+            raise RuntimeError("invalid log capacity")
+        self.defaultLevel = LEVEL_INFO
+        """Level of the subsystems without own level"""
+        self.__capacity = capacity
+        self.__slots = [None] * capacity
+        """Ring buffer: tuples of sequence number, time, level, subsystem, message, arguments and thread name"""
+        self.__counter = itertools.count()
+        """Sequence numbers of the records, next() is atomic"""
+        self.__flushInterval = flushInterval
+        self.__dumpOnError = dumpOnError
+        self.__stdout = stdout
+        self.__stderr = stderr
+        self.__levels = (dict(), dict())
+        """
+        Tuple of the levels by subsystem name as set by SetLevel() and the levels including the inherited levels (filled
+        by GetLevel()). SetLevel() replaces the tuple instead of changing the dictionaries, so readers need no lock.
+        """
+        self.__nextToWrite = 0
+        """Sequence number of the next record to write"""
+        self.__dropped = 0
+        """Number of records overwritten before they were written"""
+        self.__hidden = deque(maxlen=max(1, dumpOnError))
+        """Latest records that were not written because of their level, written before an error"""
+        self.__writeMutex = threading.Lock()
+        """Serializes the writing, logging does not use it"""
+        self.__wakeUp = threading.Event()
+        """Set to write immediately, e.g. on an error"""
+        self.__thread = None
+        """Background writer, started by the first record"""
+        self.__threadMutex = threading.Lock()
+        self.__stop = False
+
+    def GetSubsystem(self, subsystem: str) -> SubsystemLogger:
+        """Gets a logger for the records of a subsystem"""
+        return SubsystemLogger(self, subsystem)
+
+    def SetLevel(self, subsystem: str, level: int):
+        """
+        Sets the level of a subsystem and its children (e.g. "MyApp" and "MyApp.connection"), records below the level
+        are not written but kept in the ring buffer
+        Parameters:
+            subsystem: name of the subsystem
+            level: e.g. LEVEL_DEBUG, None to inherit the level of the parent
+        """
+        levels = dict(self.__levels[0])
+        if level is None:
+            levels.pop(subsystem, None)
+        else:
+            levels[subsystem] = level
+        self.__levels = (levels, dict())
+
+    def GetLevel(self, subsystem: str) -> int:
+        """Gets the level of a subsystem, inherited from its parents or defaultLevel if not set"""
+        levels, effectiveLevels = self.__levels
+        level = effectiveLevels.get(subsystem)
+        if level is None:
+            name = subsystem
+            while True:
+                level = levels.get(name)
+                if level is not None or "." not in name:
+                    break
+                name = name.rsplit(".", 1)[0]
+            if level is None:
+                level = self.defaultLevel
+            effectiveLevels[subsystem] = level
+        return level
+
+    def Log(self, subsystem: str, level: int, message: str, *args):
+        """
+        Stores a record, the message is formatted with the arguments (% style) when it is written. The arguments must
+        not be changed afterwards.
+        """
+        sequence = next(self.__counter)
+        self.__slots[sequence % self.__capacity] = (
+            sequence,
+            time.time(),
+            level,
+            subsystem,
+            message,
+            args,
+            threading.current_thread().name,
+        )
+        if self.__thread is None:
+            self.__StartThread()
+        if level >= LEVEL_ERROR:
+            self.__wakeUp.set()
+
+    def __StartThread(self):
+        """Starts the background writer"""
+        with self.__threadMutex:
+            if self.__thread is None and not self.__stop:
+                self.__thread = threading.Thread(
+                    target=self.__Run, name="LogWriter", daemon=True
+                )
+                self.__thread.start()
+                atexit.register(self.Flush)
+
+    def __Run(self):
+        """Writes the records until Stop() is called"""
+        while not self.__stop:
+            self.__wakeUp.wait(self.__flushInterval)
+            self.__wakeUp.clear()
+            self.Flush()
+
+    def Flush(self):
+        """Writes the records logged so far, e.g. before the process exits"""
+        with self.__writeMutex:
+            written = set()
+            while True:
+                sequence = self.__nextToWrite
+                entry = self.__slots[sequence % self.__capacity]
+                if entry is None or entry[0] < sequence:
+                    # Not logged yet, or the slot was taken but the record is not stored yet
+                    break
+                self.__nextToWrite = sequence + 1
+                if entry[0] > sequence:
+                    # Overwritten before it was written
+                    self.__dropped += 1
+                    continue
+                if entry[2] < self.GetLevel(entry[3]):
+                    self.__hidden.append(entry)
+                    continue
+                if entry[2] >= LEVEL_ERROR and self.__dumpOnError > 0:
+                    stream = self.__stderr or sys.stderr
+                    if len(self.__hidden) > 0:
+                        stream.write(
+                            f"--- {len(self.__hidden)} records before the error ---\n"
+                        )
+                        for hidden in self.__hidden:
+                            stream.write(self.__ToRecord(hidden).ToString() + "\n")
+                        stream.write("---\n")
+                        self.__hidden.clear()
+                stream = self.__GetStream(entry[2])
+                stream.write(self.__ToRecord(entry).ToString() + "\n")
+                written.add(stream)
+            for stream in written:
+                stream.flush()
+
+    def __GetStream(self, level: int):
+        """Gets the stream of a level"""
+        if level >= LEVEL_WARNING:
+            return self.__stderr or sys.stderr
+        return self.__stdout or sys.stdout
+
+    @staticmethod
+    def __ToRecord(entry: tuple) -> LogRecord:
+        """Converts an entry of the ring buffer to a record, this formats the message"""
+        return LogRecord(
+            entry[0],
+            entry[1],
+            entry[2],
+            entry[3],
+            _FormatMessage(entry[4], entry[5]),
+            entry[6],
+        )
+
+    def GetRecords(self, count: int = None) -> list[LogRecord]:
+        """
+        Gets the latest records in the ring buffer of all levels, whether they were written or not
+        Parameters:
+            count: maximum number of records, None for all records in the buffer
+        Returns:
+            the records, oldest first
+        """
+        entries = [entry for entry in list(self.__slots) if entry is not None]
+        entries.sort(key=lambda entry: entry[0])
+        if count is not None:
+            entries = entries[-count:] if count > 0 else []
+        return [self.__ToRecord(entry) for entry in entries]
+
+    def Dump(self, count: int = 100, stream=None):
+        """
+        Writes the latest records of all levels, e.g. in an exception handler
+        Parameters:
+            count: maximum number of records
+            stream: stream to write to, default is sys.stderr
+        """
+        stream = stream or sys.stderr
+        records = self.GetRecords(count)
+        stream.write(f"--- last {len(records)} log records ---\n")
+        for record in records:
+            stream.write(record.ToString() + "\n")
+        stream.write("---\n")
+        stream.flush()
+
+    def GetDroppedCount(self) -> int:
+        """Gets the number of records that were overwritten before they were written"""
+        return self.__dropped
+
+    def Stop(self):
+        """Writes the pending records and stops the background writer, later records are written by Flush() only"""
+        with self.__threadMutex:
+            self.__stop = True
+            thread = self.__thread
+        self.__wakeUp.set()
+        if thread is not None and thread != threading.current_thread():
+            thread.join()
+        self.Flush()
+
+
+_logger = None
+"""Logger shared by the apps of the process"""
+_loggerMutex = threading.Lock()
+
+
+def GetLogger() -> Logger:
+    """Gets the logger shared by the apps of the process, it is created on first use"""
+    global _logger
+    if _logger is None:
+        with _loggerMutex:
+            if _logger is None:
+                _logger = Logger()
+    return _logger
@@ -0,0 +1,461 @@
+"""
+Generates typed parameter classes and handler stubs from the app functions declared in rcapp.xml. Each parameter class
+is a dataclass with one field per parameter, its FromGrpc() decodes a call in one pass over the parameter list:
+
+    python -m rcapp.ParameterClasses rcapp.xml -o AppParameters.py
+    python -m rcapp.ParameterClasses rcapp.xml --stubs MyApp
+
+Handlers registered with @app_function receive the decoded parameters if they take a third argument:
+
+    @app_function("copy_position")
+    def CopyPosition(self, function: AppFunction, parameters: CopyPositionParameters):
+        ...
+
+The AppClient checks the handlers and the parameter classes against rcapp.xml on Connect(), so a mismatch fails before
+the first call.
+"""
+
+import argparse
+from dataclasses import fields
+import hashlib
+import json
+import keyword
+import os
+import re
+import sys
+import tempfile
+import threading
+import types
+from .FunctionParameters import (
+    FunctionParameters,
+    FunctionSchema,
+    ParameterException,
+    ParseFunctionSchemas,
+)
+from . import robotcontrolapp_pb2
+
+_PYTHON_TYPES = {
+    "string": ("str", '""'),
+    "double": ("float", "0.0"),
+    "bool": ("bool", "False"),
+    "int64": ("int", "0"),
+    "vector3": ("Vector3", "None"),
+    "cartesian": ("Matrix44", "None"),
+}
+"""Type annotation and default value of the fields by value type"""
+
+_DECODERS = {
+    "vector3": "Vector3FromGrpc({0})",
+    "cartesian": "Matrix44FromGrpc({0})",
+}
+"""Expressions converting the message values, other values are used as they are"""
+
+_DECODER_IMPORTS = {
+    "cartesian": "from rcapp.DataTypes.Matrix44 import Matrix44, Matrix44FromGrpc",
+    "vector3": "from rcapp.DataTypes.Vector3 import Vector3, Vector3FromGrpc",
+}
+"""Imports of the generated module by value type, only the used ones are added"""
+
+_LINE_LENGTH = 88
+"""Line length of black, the generated code is formatted as black would do it"""
+
+
+class AppDefinitionException(RuntimeError):
+    """the app code does not match the app definition file"""
+
+
+def _FieldName(name: str) -> str:
+    """Converts a parameter name to a valid field name, e.g. 'from' to 'from_'"""
+    name = re.sub(r"\W", "_", name)
+    if len(name) == 0 or name[0].isdigit():
+        name = "_" + name
+    if keyword.iskeyword(name):
+        name += "_"
+    return name
+
+
+def _MethodName(name: str) -> str:
+    """Converts a function name to a method name, e.g. 'copy_position' to 'CopyPosition'"""
+    parts = [part for part in re.split(r"[\W_]+", name) if len(part) > 0]
+    result = "".join(part[0].upper() + part[1:] for part in parts)
+    if len(result) == 0 or result[0].isdigit():
+        result = "Function" + result
+    return result
+
+
+def _ClassName(name: str) -> str:
+    """Gets the name of the parameter class of a function, e.g. 'CopyPositionParameters'"""
+    return _MethodName(name) + "Parameters"
+
+
+def _Literal(text: str) -> str:
+    """Converts a string to a Python string literal in double quotes"""
+    return json.dumps(text, ensure_ascii=False)
+
+
+def _DocString(text: str) -> str:
+    """Converts a text from rcapp.xml to a docstring"""
+    return '"""' + text.replace("\\", "/").replace('"', "'") + '"""'
+
+
+def _DefaultValue(valueType: str, value: str) -> str:
+    """Gets the default value of a field as Python code, the default from rcapp.xml is used if it is valid"""
+    default = _PYTHON_TYPES[valueType][1]
+    if value is None:
+        return default
+    try:
+        if valueType == "string":
+            return _Literal(value)
+        if valueType == "double":
+            return repr(float(value))
+        if valueType == "int64":
+            return repr(int(value))
+        if valueType == "bool" and value.lower() in ("true", "false"):
+            return repr(value.lower() == "true")
+    except ValueError:
+        pass
+    return default
+
+
+def _GenerateSignature(entries: list[str]) -> list[str]:
+    """Generates the source code lines of the SIGNATURE of a parameter class from its tuple entries"""
+    signature = "    SIGNATURE: ClassVar[tuple] = ("
+    if len(entries) == 0:
+        return [signature + ")"]
+    if len(entries) == 1 and len(signature + entries[0]) < _LINE_LENGTH:
+        # black keeps a tuple with one element on one line
+        return [signature + entries[0] + ")"]
+    return [signature] + ["        " + entry for entry in entries] + ["    )"]
+
+
+def _GenerateFromGrpc(className: str, arguments: list[str]) -> list[str]:
+    """
+    Generates the source code lines of FromGrpc() of a parameter class
+    Parameters:
+        className: name of the parameter class
+        arguments: expressions decoding the fields in one pass, None to look up the values by name
+    """
+    lines = ["", "    @staticmethod"]
+    definition = (
+        f'    def FromGrpc(function: robotcontrolapp_pb2.AppFunction) -> "{className}":'
+    )
+    if len(definition) <= _LINE_LENGTH:
+        lines.append(definition)
+    else:
+        lines += [
+            "    def FromGrpc(",
+            "        function: robotcontrolapp_pb2.AppFunction,",
+            f'    ) -> "{className}":',
+        ]
+    lines += [
+        '        """Decodes the parameters of a call, raises ParameterException if they do not match rcapp.xml"""',
+    ]
+    if arguments is None:
+        lines.append(f"        return DecodeParameters({className}, function)")
+        return lines
+    lines += [
+        "        parameters = function.parameters",
+        "        if (",
+        '            tuple((p.name, p.WhichOneof("value")) for p in parameters)',
+        f"            != {className}.SIGNATURE",
+        "        ):",
+        f"            return DecodeParameters({className}, function)",
+    ]
+    if len(arguments) == 0:
+        lines.append(f"        return {className}()")
+        return lines
+    lines.append(f"        return {className}(")
+    lines += [f"            {argument}," for argument in arguments]
+    lines.append("        )")
+    return lines
+
+
+def _GenerateClass(schema: FunctionSchema) -> list[str]:
+    """Generates the source code lines of the parameter class of a function"""
+    className = _ClassName(schema.name)
+    label = f" ({schema.label})" if len(schema.label) > 0 else ""
+    lines = [
+        "@dataclass",
+        f"class {className}:",
+        "    " + _DocString(f"Parameters of the app function '{schema.name}'{label}"),
+        "",
+        f"    FUNCTION_NAME: ClassVar[str] = {_Literal(schema.name)}",
+    ]
+    checked = True
+    entries = []
+    for parameter in schema.parameters.values():
+        valueField = (
+            None if parameter.valueType is None else parameter.valueType + "_value"
+        )
+        checked = checked and valueField is not None
+        valueLiteral = "None" if valueField is None else _Literal(valueField)
+        entries.append(f"({_Literal(parameter.name)}, {valueLiteral}),")
+    lines += _GenerateSignature(entries)
+    lines.append(
+        '    """Tuples of parameter name and value field as declared in rcapp.xml"""'
+    )
+    if len(entries) > 0:
+        lines.append("")
+
+    arguments = []
+    for index, parameter in enumerate(schema.parameters.values()):
+        annotation, default = _PYTHON_TYPES.get(parameter.valueType, ("object", "None"))
+        if parameter.valueType is not None:
+            default = _DefaultValue(parameter.valueType, parameter.defaultValue)
+        lines.append(f"    {_FieldName(parameter.name)}: {annotation} = {default}")
+        lines.append("    " + _DocString(parameter.label or parameter.name))
+        value = f"parameters[{index}].{parameter.valueType}_value"
+        arguments.append(_DECODERS.get(parameter.valueType, "{0}").format(value))
+
+    # Parameters of unknown types are not checked, the values are looked up by name
+    return lines + _GenerateFromGrpc(className, arguments if checked else None)
+
+
+def GenerateParameterModule(schemas: dict[str, FunctionSchema]) -> str:
+    """
+    Generates the source code of a module containing the parameter class of each app function
+    Parameters:
+        schemas: FunctionSchema by function name, see FunctionParameters.ParseFunctionSchemas()
+    Returns:
+        source code, the module contains PARAMETER_CLASSES (parameter class by function name)
+    Raises:
+        AppDefinitionException if two functions have the same class name
+    """
+    classNames = dict()
+    for name in schemas:
+        other = classNames.setdefault(_ClassName(name), name)
+        if other != name:
+            raise AppDefinitionException(
+                f"app functions '{other}' and '{name}' have the same class name {_ClassName(name)}"
+            )
+
+    lines = [
+        '"""',
+        "Parameter classes of the app functions declared in rcapp.xml. This file is generated, run",
+        "    python -m rcapp.ParameterClasses rcapp.xml -o AppParameters.py",
+        "again after changing rcapp.xml.",
+        '"""',
+        "",
+        "from dataclasses import dataclass",
+        "from typing import ClassVar",
+    ]
+    valueTypes = {
+        parameter.valueType
+        for schema in schemas.values()
+        for parameter in schema.parameters.values()
+    }
+    lines += [
+        line for valueType, line in _DECODER_IMPORTS.items() if valueType in valueTypes
+    ]
+    lines += [
+        "from rcapp.ParameterClasses import DecodeParameters",
+        "from rcapp import robotcontrolapp_pb2",
+    ]
+    for schema in schemas.values():
+        lines += ["", ""] + _GenerateClass(schema)
+    if len(schemas) == 0:
+        lines += ["", "", "PARAMETER_CLASSES = {}"]
+    else:
+        lines += ["", "", "PARAMETER_CLASSES = {"]
+        lines += [f"    {_Literal(name)}: {_ClassName(name)}," for name in schemas]
+        lines.append("}")
+    lines += ['"""Parameter class by app function name"""', ""]
+    return "\n".join(lines)
+
+
+def GenerateHandlerStubs(
+    schemas: dict[str, FunctionSchema],
+    className: str = "MyApp",
+    parameterModule: str = "AppParameters",
+) -> str:
+    """
+    Generates the source code of an app class with a handler for each app function
+    Parameters:
+        schemas: FunctionSchema by function name, see FunctionParameters.ParseFunctionSchemas()
+        className: name of the app class
+        parameterModule: name of the module generated by GenerateParameterModule()
+    Returns:
+        source code
+    """
+    lines = [
+        "from rcapp.AppClient import AppClient",
+        "from rcapp.HandlerRegistry import app_function",
+        "from rcapp.robotcontrolapp_pb2 import AppFunction",
+    ]
+    if len(schemas) > 0:
+        lines.append(f"from {parameterModule} import (")
+        lines += [f"    {_ClassName(name)}," for name in schemas]
+        lines.append(")")
+    lines += ["", "", f"class {className}(AppClient):"]
+    if len(schemas) == 0:
+        lines.append("    pass")
+    for schema in schemas.values():
+        lines += [
+            f"    @app_function({_Literal(schema.name)})",
+            f"    def {_MethodName(schema.name)}(self, function: AppFunction, parameters: {_ClassName(schema.name)}):",
+            "        " + _DocString(schema.label or schema.name),
+            '        self.SendFunctionFailed(function.call_id, "not implemented")',
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def DecodeParameters(cls: type, function: robotcontrolapp_pb2.AppFunction):
+    """
+    Decodes the parameters of a call by name, used by the generated classes if the parameters are not in the declared
+    order or have other types
+    Parameters:
+        cls: generated parameter class
+        function: function call received from the robot control
+    Returns:
+        instance of cls
+    Raises:
+        ParameterException if a declared parameter is missing or has the wrong type
+    """
+    parameters = FunctionParameters(function)
+    errors = []
+    for name, valueField in cls.SIGNATURE:
+        if not parameters.Has(name):
+            errors.append(f"missing parameter '{name}'")
+            continue
+        valueType = parameters.GetType(name)
+        if valueField is not None and f"{valueType}_value" != valueField:
+            errors.append(
+                f"invalid parameter type '{valueType}' for '{name}', expected '{valueField[: -len('_value')]}'"
+            )
+    if len(errors) > 0:
+        raise ParameterException(
+            f"app function '{cls.FUNCTION_NAME}': " + ", ".join(errors)
+        )
+    return cls(*[parameters.Get(name) for name, _ in cls.SIGNATURE])
+
+
+_loaded = dict()
+"""Loaded parameter classes: absolute path of rcapp.xml to tuple of modification time and classes"""
+_loadedMutex = threading.Lock()
+
+
+def _GeneratorVersion() -> bytes:
+    """Gets the version of this generator, it is part of the cache key, so an update generates the code again"""
+    from . import __version__
+
+    with open(__file__, "rb") as file:
+        return __version__.encode() + hashlib.sha1(file.read()).digest()
+
+
+def _LoadCachedModule(cacheFile: str, moduleName: str) -> dict:
+    """
+    Loads the parameter classes from the cache file
+    Returns:
+        parameter class by function name, None if the file is missing, incomplete or invalid
+    """
+    try:
+        with open(cacheFile) as file:
+            source = file.read()
+        module = types.ModuleType(moduleName)
+        exec(compile(source, cacheFile, "exec"), module.__dict__)
+    except Exception:
+        # e.g. a missing file or the syntax error of a partially written file
+        return None
+    classes = getattr(module, "PARAMETER_CLASSES", None)
+    return classes if isinstance(classes, dict) else None
+
+
+def _WriteCacheFile(cacheFile: str, source: str):
+    """Writes the generated code to a temporary file and moves it to the cache file, so no process reads a partial file"""
+    try:
+        os.makedirs(os.path.dirname(cacheFile), exist_ok=True)
+        handle, temporaryFile = tempfile.mkstemp(
+            suffix=".tmp", dir=os.path.dirname(cacheFile)
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(handle, "w") as file:
+            file.write(source)
+        os.replace(temporaryFile, cacheFile)
+    except OSError:
+        try:
+            os.remove(temporaryFile)
+        except OSError:
+            pass
+
+
+def LoadParameterClasses(fileName: str, cacheDirectory: str = None) -> dict:
+    """
+    Generates and loads the parameter classes of an app definition file. The generated code is written to the cache
+    directory and used again until rcapp.xml changes, in this process the classes are created only once per file.
+    Parameters:
+        fileName: path of the rcapp.xml file
+        cacheDirectory: directory of the generated code, default is __pycache__ next to rcapp.xml. If the directory
+            is not writable the code is generated on each start. A cache file that does not load (e.g. written
+            partially) is generated again, an update of rcapp generates all files again.
+    Returns:
+        parameter class by function name
+    """
+    path = os.path.abspath(fileName)
+    modified = os.path.getmtime(path)
+    with _loadedMutex:
+        loaded = _loaded.get(path)
+        if loaded is not None and loaded[0] == modified:
+            return loaded[1]
+
+        with open(path, "rb") as file:
+            digest = hashlib.sha1(_GeneratorVersion() + file.read()).hexdigest()[:16]
+        if cacheDirectory is None:
+            cacheDirectory = os.path.join(os.path.dirname(path), "__pycache__")
+        moduleName = f"rcapp_parameters_{digest}"
+        cacheFile = os.path.join(cacheDirectory, moduleName + ".py")
+        classes = _LoadCachedModule(cacheFile, moduleName)
+        if classes is None:
+            # Missing or broken (e.g. truncated) cache file, generate the code again
+            source = GenerateParameterModule(ParseFunctionSchemas(path))
+            _WriteCacheFile(cacheFile, source)
+            module = types.ModuleType(moduleName)
+            exec(compile(source, cacheFile, "exec"), module.__dict__)
+            classes = module.PARAMETER_CLASSES
+        _loaded[path] = (modified, classes)
+        return classes
+
+
+def CheckParameterClass(cls: type, generated: type) -> str:
+    """
+    Checks whether a parameter class (e.g. from a generated module added to the app) matches the class generated from
+    rcapp.xml
+    Returns:
+        error message, None if they match
+    """
+    if getattr(cls, "SIGNATURE", None) is None or not hasattr(cls, "FromGrpc"):
+        return f"{cls.__name__} is not a generated parameter class"
+    if cls.FUNCTION_NAME != generated.FUNCTION_NAME:
+        return f"{cls.__name__} belongs to app function '{cls.FUNCTION_NAME}'"
+    if cls.SIGNATURE != generated.SIGNATURE or [f.name for f in fields(cls)] != [
+        f.name for f in fields(generated)
+    ]:
+        return f"{cls.__name__} does not match rcapp.xml, generate it again"
+    return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generates typed parameter classes or handler stubs from rcapp.xml"
+    )
+    parser.add_argument("appDefinition", help="path of rcapp.xml")
+    parser.add_argument("-o", "--output", help="file to write, default is stdout")
+    parser.add_argument(
+        "--stubs",
+        metavar="CLASS",
+        help="generate an app class with handler stubs instead of the parameter classes",
+    )
+    arguments = parser.parse_args()
+
+    functionSchemas = ParseFunctionSchemas(arguments.appDefinition)
+    if arguments.stubs is not None:
+        output = GenerateHandlerStubs(functionSchemas, arguments.stubs)
+    else:
+        output = GenerateParameterModule(functionSchemas)
+    if arguments.output is None:
+        sys.stdout.write(output)
+    else:
+        with open(arguments.output, "w") as outputFile:
+            outputFile.write(output)
@@ -0,0 +1,484 @@
+"""
+Local proxy for the robot control: several tools (e.g. a monitor, a logger and an analytics script) connect to the proxy
+instead of the robot control, so they do not multiply the load on its gRPC server. The proxy speaks the same
+RobotControlApp interface:
+- GetRobotStateStream: one upstream stream is fanned out to all local subscribers, slow subscribers skip states
+- GetRobotState: answered from the upstream stream while it runs and the state is recent, otherwise passed through
+- GetSystemInfo and GetLicensedFeatures: the responses are cached, see RobotControlProxy.cacheTtls
+- all other calls, including the actions stream of apps, are passed through unchanged
+
+Start it next to the tools and connect them to the proxy port:
+
+    python -m rcapp.RobotControlProxy localhost:5000 --port 5001
+"""
+
+import argparse
+from concurrent import futures
+from dataclasses import dataclass
+from threading import Condition, Event, Lock, Thread, current_thread
+import time
+import grpc
+from .ChannelProfile import ChannelProfile
+from .Log import GetLogger
+from . import robotcontrolapp_pb2
+from .robotcontrolapp_pb2_grpc import RobotControlAppStub
+
+_log = GetLogger().GetSubsystem("RobotControlProxy")
+"""Logger of the upstream connection"""
+
+_NO_DEADLINE = 1e9
+"""gRPC reports a remaining time above this (about 31 years) for calls without deadline"""
+
+_PASS_THROUGH_HANDLERS = {
+    (False, False): ("unary_unary", grpc.unary_unary_rpc_method_handler),
+    (False, True): ("unary_stream", grpc.unary_stream_rpc_method_handler),
+    (True, False): ("stream_unary", grpc.stream_unary_rpc_method_handler),
+    (True, True): ("stream_stream", grpc.stream_stream_rpc_method_handler),
+}
+"""
+Channel method creating the upstream call and server handler factory by (client streaming, server streaming) of a
+passed through method
+"""
+
+SERVICE_NAME = "robotcontrolapp.RobotControlApp"
+"""Full name of the proxied gRPC service"""
+
+DEFAULT_CACHE_TTLS = {"GetSystemInfo": 5.0, "GetLicensedFeatures": 30.0}
+"""
+Default time in s the responses are cached by method name. The system info contains the cycle time statistics and the
+license info the remaining test period, so these change slowly.
+"""
+
+
+@dataclass
+class ProxyStatistics:
+    """This class contains the counters of a RobotControlProxy"""
+
+    stateSubscribers: int = 0
+    """Number of local robot state streams currently open"""
+    upstreamStateStreams: int = 0
+    """Number of robot state streams opened to the robot control"""
+    statesReceived: int = 0
+    """Number of robot states received from the robot control"""
+    statesSent: int = 0
+    """Number of robot states sent to the local subscribers"""
+    robotStatesFromStream: int = 0
+    """Number of GetRobotState calls answered from the upstream stream"""
+    cacheHits: int = 0
+    """Number of calls answered from the cache"""
+    cacheMisses: int = 0
+    """Number of cacheable calls passed to the robot control"""
+    passedThrough: int = 0
+    """Number of other calls passed to the robot control"""
+
+
+def _GetTimeout(context: grpc.ServicerContext) -> float:
+    """Gets the remaining time in s of a local call to pass on to the robot control, None if the call has no deadline"""
+    remaining = context.time_remaining()
+    if remaining is None or remaining > _NO_DEADLINE:
+        return None
+    return remaining
+
+
+class _CacheEntry:
+    """Cached response of a method, the lock lets only one caller refresh it"""
+
+    def __init__(self):
+        self.response = None
+        self.expiryTime = 0.0
+        self.lock = Lock()
+
+
+class RobotControlProxy:
+    """Proxies the RobotControlApp service of a robot control to local clients, see the module documentation"""
+
+    def __init__(self, upstreamTarget: str, channelProfile: ChannelProfile = None):
+        """
+        Parameters:
+            upstreamTarget: the socket of the robot control, e.g. "localhost:5000"
+            channelProfile: settings of the channel to the robot control, see ChannelProfile.py
+        """
+        self.cacheTtls = dict(DEFAULT_CACHE_TTLS)
+        """Time in s the responses are cached by method name, methods not listed here are not cached"""
+        self.robotStateMaxAge = 0.05
+        """Maximum age in s of a streamed robot state returned by GetRobotState, 0 to pass all calls through"""
+        self.reconnectDelay = 0.5
+        """Delay in s before the upstream robot state stream is opened again after it failed"""
+
+        self.__upstreamTarget = upstreamTarget
+        self.__channel = (channelProfile or ChannelProfile()).CreateBaseChannel(
+            upstreamTarget
+        )
+        """Channel to the robot control"""
+        self.__stub = RobotControlAppStub(self.__channel)
+        """GRPC client stub of the calls handled by the proxy"""
+        self.__server = None
+        """Local gRPC server"""
+        self.__cache = dict()
+        """Cached responses by method name and request without app name"""
+        self.__cacheMutex = Lock()
+        self.__statistics = ProxyStatistics()
+        """Counters, access only with the mutex locked"""
+        self.__statisticsMutex = Lock()
+        self.__stateCondition = Condition()
+        """Notified when a robot state was received, protects the fields of the state stream"""
+        self.__latestState = None
+        """Latest robot state received from the upstream stream (GRPC message)"""
+        self.__latestStateTime = 0.0
+        """Time (time.perf_counter()) when the latest state was received"""
+        self.__stateSequence = 0
+        """Incremented for each received state, subscribers send a state when this changed"""
+        self.__stateSubscribers = 0
+        """Number of open local robot state streams"""
+        self.__upstreamStream = None
+        """Upstream robot state stream call, cancel this to stop the stream"""
+        self.__upstreamThread = None
+        """Thread reading the upstream robot state stream"""
+        self.__upstreamStop = None
+        """Set to stop the current upstream stream thread, each thread gets its own event"""
+        self.__stopped = False
+        """True after Stop(), this ends the local robot state streams"""
+
+    def Start(self, port: int = 0, unixSocketPath: str = None) -> str:
+        """
+        Starts the local server, returns the connection target of the clients
+        Parameters:
+            port: port to listen on, 0 selects a free port
+            unixSocketPath: if set the server listens on this Unix domain socket instead of a port
+        """
+        self.__server = grpc.server(futures.ThreadPoolExecutor(max_workers=32))
+        self.__server.add_generic_rpc_handlers([_ProxyHandler(self)])
+        if unixSocketPath:
+            self.__server.add_insecure_port("unix:" + unixSocketPath)
+            self.__server.start()
+            return "unix:" + unixSocketPath
+        port = self.__server.add_insecure_port(f"localhost:{port}")
+        self.__server.start()
+        return f"localhost:{port}"
+
+    def Stop(self):
+        """Stops the local server, this closes the streams of all clients and the connection to the robot control"""
+        if self.__server is not None:
+            self.__server.stop(0).wait()
+            self.__server = None
+        with self.__stateCondition:
+            self.__stopped = True
+            thread = self.__DetachUpstreamStream()
+        if thread is not None:
+            thread.join()
+        self.__channel.close()
+
+    def Wait(self):
+        """Blocks until the server was stopped"""
+        if self.__server is not None:
+            self.__server.wait_for_termination()
+
+    def GetUpstreamTarget(self) -> str:
+        """Gets the socket of the robot control"""
+        return self.__upstreamTarget
+
+    def GetStatistics(self) -> ProxyStatistics:
+        """Gets a copy of the counters"""
+        with self.__statisticsMutex:
+            return ProxyStatistics(**vars(self.__statistics))
+
+    def ClearCache(self):
+        """Removes all cached responses, e.g. after the project of the robot control was changed"""
+        with self.__cacheMutex:
+            self.__cache.clear()
+
+    def _Count(self, name: str, increment: int = 1):
+        """Increments a counter of the statistics"""
+        with self.__statisticsMutex:
+            setattr(
+                self.__statistics, name, getattr(self.__statistics, name) + increment
+            )
+
+    def _GetCachedResponse(self, method: str, request, context: grpc.ServicerContext):
+        """
+        Handles a cacheable unary call: returns the cached response or calls the robot control if it expired
+        Parameters:
+            method: method name, e.g. "GetSystemInfo"
+            request: the request, the cache ignores the app name
+            context: context of the local call
+        """
+        key = type(request)()
+        key.CopyFrom(request)
+        key.app_name = ""
+        cacheKey = (method, key.SerializeToString(deterministic=True))
+        with self.__cacheMutex:
+            entry = self.__cache.get(cacheKey)
+            if entry is None:
+                entry = _CacheEntry()
+                self.__cache[cacheKey] = entry
+
+        # Concurrent callers wait for the first one instead of calling the robot control too
+        with entry.lock:
+            if time.perf_counter() < entry.expiryTime:
+                self._Count("cacheHits")
+                return entry.response
+            self._Count("cacheMisses")
+            response = self._CallUpstream(method, request, context)
+            entry.response = response
+            entry.expiryTime = time.perf_counter() + self.cacheTtls[method]
+            return response
+
+    def _GetRobotState(self, request, context: grpc.ServicerContext):
+        """Handles GetRobotState: returns the streamed state if it is recent enough, otherwise calls the robot control"""
+        with self.__stateCondition:
+            state = self.__latestState
+            age = time.perf_counter() - self.__latestStateTime
+        if state is not None and age <= self.robotStateMaxAge:
+            self._Count("robotStatesFromStream")
+            return state
+        self._Count("passedThrough")
+        return self._CallUpstream("GetRobotState", request, context)
+
+    def _CallUpstream(self, method: str, request, context: grpc.ServicerContext):
+        """Calls a unary method of the robot control, errors are passed to the local caller"""
+        try:
+            return getattr(self.__stub, method)(request, timeout=_GetTimeout(context))
+        except grpc.RpcError as ex:
+            context.abort(ex.code(), ex.details())
+
+    def _StreamRobotState(self, request, context: grpc.ServicerContext):
+        """Handles GetRobotStateStream: sends the states of the shared upstream stream until the client cancels"""
+        self.__Subscribe(request.app_name)
+        # Wake up the waiting loop when the client cancels
+        context.add_callback(self.__NotifyStateWaiters)
+        try:
+            sequence = 0
+            while context.is_active():
+                with self.__stateCondition:
+                    self.__stateCondition.wait_for(
+                        lambda: self.__HasNewState(sequence)
+                        or self.__stopped
+                        or not context.is_active(),
+                        timeout=1.0,
+                    )
+                    if self.__stopped:
+                        return
+                    if not self.__HasNewState(sequence):
+                        continue
+                    # A slow subscriber skips the states received meanwhile
+                    sequence = self.__stateSequence
+                    state = self.__latestState
+                self._Count("statesSent")
+                yield state
+        finally:
+            self.__Unsubscribe()
+
+    def _PassThrough(self, method: str, clientStreaming: bool, serverStreaming: bool):
+        """
+        Creates the handler of a method that is passed to the robot control unchanged. The messages are forwarded as
+        bytes without parsing them.
+        Parameters:
+            method: full method path, e.g. "/robotcontrolapp.RobotControlApp/GetTCP"
+            clientStreaming: true if the client sends a stream
+            serverStreaming: true if the robot control sends a stream
+        """
+        channelMethod, handlerFactory = _PASS_THROUGH_HANDLERS[
+            (clientStreaming, serverStreaming)
+        ]
+        upstream = getattr(self.__channel, channelMethod)(method)
+        if serverStreaming:
+            return handlerFactory(self.__PassThroughStreaming(upstream))
+        return handlerFactory(self.__PassThroughUnary(upstream))
+
+    def __PassThroughUnary(self, upstream):
+        """Creates the behavior of a passed through method with a single response, upstream is the call to the robot control"""
+
+        def Unary(request, context: grpc.ServicerContext):
+            self._Count("passedThrough")
+            try:
+                return upstream(request, timeout=_GetTimeout(context))
+            except grpc.RpcError as ex:
+                context.abort(ex.code(), ex.details())
+
+        return Unary
+
+    def __PassThroughStreaming(self, upstream):
+        """Creates the behavior of a passed through method with a response stream, upstream is the call to the robot control"""
+
+        def Streaming(request, context: grpc.ServicerContext):
+            self._Count("passedThrough")
+            call = upstream(request, timeout=_GetTimeout(context))
+            # Cancel the upstream call when the client cancels
+            context.add_callback(call.cancel)
+            try:
+                for response in call:
+                    yield response
+            except grpc.RpcError as ex:
+                if ex.code() != grpc.StatusCode.CANCELLED or context.is_active():
+                    context.abort(ex.code(), ex.details())
+
+        return Streaming
+
+    def __HasNewState(self, sequence: int) -> bool:
+        """Returns true if a state was received after the given sequence number, call this with the condition locked"""
+        return self.__latestState is not None and self.__stateSequence != sequence
+
+    def __NotifyStateWaiters(self):
+        """Wakes up all local robot state streams"""
+        with self.__stateCondition:
+            self.__stateCondition.notify_all()
+
+    def __Subscribe(self, appName: str):
+        """Adds a local robot state stream, the first one opens the upstream stream"""
+        self._Count("stateSubscribers")
+        with self.__stateCondition:
+            self.__stateSubscribers += 1
+            if self.__upstreamThread is not None:
+                return
+            self.__upstreamStop = Event()
+            self.__upstreamThread = Thread(
+                target=self.__UpstreamStreamThread,
+                args=(appName, self.__upstreamStop),
+                daemon=True,
+            )
+            self.__upstreamThread.start()
+
+    def __Unsubscribe(self):
+        """Removes a local robot state stream, the upstream stream is closed with the last one"""
+        self._Count("stateSubscribers", -1)
+        with self.__stateCondition:
+            self.__stateSubscribers -= 1
+            if self.__stateSubscribers > 0:
+                return
+            thread = self.__DetachUpstreamStream()
+        if thread is not None and current_thread() != thread:
+            thread.join()
+
+    def __DetachUpstreamStream(self) -> Thread:
+        """
+        Stops the upstream robot state stream, call this with the condition locked. A new subscriber can start a new
+        stream right away.
+        Returns:
+            the stopped thread to join or None if the stream was not running
+        """
+        thread = self.__upstreamThread
+        if thread is None:
+            return None
+        self.__upstreamThread = None
+        self.__upstreamStop.set()
+        if self.__upstreamStream is not None:
+            self.__upstreamStream.cancel()
+            self.__upstreamStream = None
+        self.__latestState = None
+        self.__stateCondition.notify_all()
+        return thread
+
+    def __UpstreamStreamThread(self, appName: str, stopEvent: Event):
+        """
+        This thread reads the upstream robot state stream and wakes up the local streams for each state
+        Parameters:
+            appName: app name of the first subscriber, this is sent with the stream request
+            stopEvent: set when this thread should stop
+        """
+        request = robotcontrolapp_pb2.RobotStateRequest(app_name=appName)
+        while not stopEvent.is_set():
+            try:
+                with self.__stateCondition:
+                    if stopEvent.is_set():
+                        return
+                    stream = self.__stub.GetRobotStateStream(request)
+                    self.__upstreamStream = stream
+                self._Count("upstreamStateStreams")
+                for state in stream:
+                    with self.__stateCondition:
+                        if stopEvent.is_set():
+                            return
+                        self.__latestState = state
+                        self.__latestStateTime = time.perf_counter()
+                        self.__stateSequence += 1
+                        self.__stateCondition.notify_all()
+                    self._Count("statesReceived")
+            except grpc.RpcError as ex:
+                if stopEvent.is_set():
+                    return
+                _log.Warning("robot state stream failed, retrying: %s", ex.details())
+
+            if stopEvent.wait(self.reconnectDelay):
+                return
+
+
+class _ProxyHandler(grpc.GenericRpcHandler):
+    """Selects the handler of each call: the robot state, the cached methods or passing the call through"""
+
+    def __init__(self, proxy: RobotControlProxy):
+        self.__proxy = proxy
+        self.__methods = {
+            method.name: method
+            for method in robotcontrolapp_pb2.DESCRIPTOR.services_by_name[
+                SERVICE_NAME.rsplit(".", 1)[1]
+            ].methods
+        }
+        """Method descriptors by name"""
+        self.__passThroughHandlers = dict()
+        """Pass through handlers by method path, created on first use"""
+        self.__mutex = Lock()
+
+    def service(self, handler_call_details: grpc.HandlerCallDetails):
+        path = handler_call_details.method
+        service, _, name = path.lstrip("/").partition("/")
+        method = self.__methods.get(name)
+        if service != SERVICE_NAME or method is None:
+            return None
+
+        requestClass = getattr(robotcontrolapp_pb2, method.input_type.name)
+        responseClass = getattr(robotcontrolapp_pb2, method.output_type.name)
+        if name == "GetRobotStateStream":
+            return grpc.unary_stream_rpc_method_handler(
+                self.__proxy._StreamRobotState,
+                request_deserializer=requestClass.FromString,
+                response_serializer=responseClass.SerializeToString,
+            )
+        if name == "GetRobotState" and self.__proxy.robotStateMaxAge > 0:
+            return grpc.unary_unary_rpc_method_handler(
+                self.__proxy._GetRobotState,
+                request_deserializer=requestClass.FromString,
+                response_serializer=responseClass.SerializeToString,
+            )
+        if name in self.__proxy.cacheTtls:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, context: self.__proxy._GetCachedResponse(
+                    name, request, context
+                ),
+                request_deserializer=requestClass.FromString,
+                response_serializer=responseClass.SerializeToString,
+            )
+
+        with self.__mutex:
+            handler = self.__passThroughHandlers.get(path)
+            if handler is None:
+                handler = self.__proxy._PassThrough(
+                    path, method.client_streaming, method.server_streaming
+                )
+                self.__passThroughHandlers[path] = handler
+            return handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Local proxy sharing one connection to the robot control between several tools"
+    )
+    parser.add_argument(
+        "upstream", help="socket of the robot control, e.g. localhost:5000"
+    )
+    parser.add_argument(
+        "--port", type=int, default=5001, help="local port to listen on"
+    )
+    parser.add_argument(
+        "--unix-socket", help="listen on this Unix domain socket instead"
+    )
+    arguments = parser.parse_args()
+
+    proxy = RobotControlProxy(arguments.upstream)
+    target = proxy.Start(arguments.port, arguments.unix_socket)
+    _log.Info("proxying '%s' on '%s'", arguments.upstream, target)
+    try:
+        proxy.Wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.Stop()
@@ -0,0 +1,346 @@
+"""
+Metrics of the requests sent by the AppClient: number of calls and errors, transferred bytes and latency percentiles per
+gRPC method. Use AppClient.GetMetrics() to find the requests that dominate the cycle time of your app.
+"""
+
+from dataclasses import asdict, dataclass, field
+import bisect
+import threading
+import time
+import grpc
+from .Interceptors import ClientInterceptor, GetMethodName, LONG_LIVED_METHODS
+
+
+class LatencyHistogram:
+    """Histogram with logarithmic buckets from 50µs to about 100s. Recording is O(1) in memory and O(log n) in time."""
+
+    BUCKET_BOUNDS = [0.00005 * (1.2**i) for i in range(80)]
+    """Upper bounds of the buckets in s, each bucket is 20% wider than the previous"""
+
+    def __init__(self):
+        self.__counts = [0] * (len(LatencyHistogram.BUCKET_BOUNDS) + 1)
+        self.__count = 0
+        self.__sum = 0.0
+        self.__max = 0.0
+
+    def Record(self, seconds: float):
+        """Adds a measured latency in s"""
+        self.__counts[bisect.bisect_left(LatencyHistogram.BUCKET_BOUNDS, seconds)] += 1
+        self.__count += 1
+        self.__sum += seconds
+        self.__max = max(self.__max, seconds)
+
+    def GetCount(self) -> int:
+        """Gets the number of recorded latencies"""
+        return self.__count
+
+    def GetMean(self) -> float:
+        """Gets the mean latency in s"""
+        if self.__count == 0:
+            return 0.0
+        return self.__sum / self.__count
+
+    def GetMax(self) -> float:
+        """Gets the highest latency in s"""
+        return self.__max
+
+    def GetPercentile(self, percent: float) -> float:
+        """
+        Gets a percentile of the latency, this is accurate to the bucket width (20%)
+        Parameters:
+            percent: percentile 0..100, e.g. 50 for the median
+        Returns:
+            latency in s, 0 if nothing was recorded
+        """
+        if self.__count == 0:
+            return 0.0
+        rank = percent / 100.0 * self.__count
+        cumulated = 0
+        for i, count in enumerate(self.__counts):
+            cumulated += count
+            if cumulated >= rank and count > 0:
+                if i >= len(LatencyHistogram.BUCKET_BOUNDS):
+                    return self.__max
+                return min(LatencyHistogram.BUCKET_BOUNDS[i], self.__max)
+        return self.__max
+
+
+@dataclass
+class MethodMetrics:
+    """Metrics of a gRPC method"""
+
+    calls: int = 0
+    """Number of calls"""
+    errors: int = 0
+    """Number of failed calls, including timeouts and cancelled calls"""
+    requestBytes: int = 0
+    """Serialized size of the sent messages"""
+    responseBytes: int = 0
+    """Serialized size of the received messages"""
+    latencyMean: float = 0.0
+    """Mean latency in s (time until the response or the end of the stream)"""
+    latencyP50: float = 0.0
+    """Median latency in s"""
+    latencyP95: float = 0.0
+    """95th percentile of the latency in s"""
+    latencyP99: float = 0.0
+    """99th percentile of the latency in s"""
+    latencyMax: float = 0.0
+    """Highest latency in s"""
+    totalTime: float = 0.0
+    """Sum of all latencies in s, this shows which calls dominate the cycle time"""
+
+
+@dataclass
+class ActionLaneMetrics:
+    """Metrics of the actions sent via a lane of the action queue"""
+
+    actions: int = 0
+    """Number of sent actions"""
+    bytes: int = 0
+    """Serialized size of the sent actions"""
+    latencyMean: float = 0.0
+    """Mean time in s between queueing and sending an action"""
+    latencyP50: float = 0.0
+    """Median time in s between queueing and sending an action"""
+    latencyP95: float = 0.0
+    """95th percentile of the time in s between queueing and sending an action"""
+    latencyP99: float = 0.0
+    """99th percentile of the time in s between queueing and sending an action"""
+    latencyMax: float = 0.0
+    """Longest time in s between queueing and sending an action"""
+    queueDepth: int = 0
+    """Number of actions waiting in the lane"""
+    maxQueueDepth: int = 0
+    """Highest number of actions waiting in the lane (high-water mark)"""
+    dropped: int = 0
+    """Number of superseded UI updates dropped because the lane was full"""
+    rejected: int = 0
+    """Number of actions rejected because the lane was full"""
+
+
+@dataclass
+class RpcMetrics:
+    """Snapshot of the metrics of all gRPC methods"""
+
+    duration: float = 0.0
+    """Time in s covered by the metrics"""
+    methods: dict[str, MethodMetrics] = field(default_factory=dict)
+    """Metrics by method name"""
+    actionQueueDepth: int = 0
+    """Number of actions waiting to be sent, see AppClient.SendAction()"""
+    maxActionQueueDepth: int = 0
+    """Highest number of actions waiting to be sent"""
+    actionLanes: dict[str, ActionLaneMetrics] = field(default_factory=dict)
+    """Metrics of the sent actions by lane name, see ActionQueue"""
+
+    def ToDict(self) -> dict:
+        """Converts the metrics to a dictionary, e.g. for JSON output"""
+        return asdict(self)
+
+
+class _MethodRecord:
+    """Counters of a method"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.requestBytes = 0
+        self.responseBytes = 0
+        self.latency = LatencyHistogram()
+
+
+class _CountingIterator:
+    """Counts the bytes of the messages of a request stream"""
+
+    def __init__(self, iterator, record: _MethodRecord, mutex: threading.Lock):
+        self.__iterator = iterator
+        self.__record = record
+        self.__mutex = mutex
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        message = next(self.__iterator)
+        size = message.ByteSize()
+        with self.__mutex:
+            self.__record.requestBytes += size
+        return message
+
+
+class _CountingResponseStream:
+    """Counts the bytes of the messages of a response stream, everything else is passed to the call"""
+
+    def __init__(self, call, record: _MethodRecord, mutex: threading.Lock):
+        self.__call = call
+        self.__record = record
+        self.__mutex = mutex
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        message = next(self.__call)
+        size = message.ByteSize()
+        with self.__mutex:
+            self.__record.responseBytes += size
+        return message
+
+    def next(self):
+        return self.__next__()
+
+    def __getattr__(self, name):
+        return getattr(self.__call, name)
+
+
+class MetricsInterceptor(ClientInterceptor):
+    """Records the metrics of all calls"""
+
+    def __init__(self):
+        self.enabled = True
+        """Set false to stop recording"""
+        self.__records = dict()
+        """Counters by method name"""
+        self.__laneRecords = dict()
+        """Counters of the sent actions by lane name"""
+        self.__actionQueueDepth = 0
+        self.__maxActionQueueDepth = 0
+        self.__startTime = time.perf_counter()
+        self.__mutex = threading.Lock()
+
+    def RecordActionQueueDepth(self, depth: int):
+        """Records the current number of actions waiting to be sent"""
+        self.__actionQueueDepth = depth
+        if depth > self.__maxActionQueueDepth:
+            self.__maxActionQueueDepth = depth
+
+    def RecordActionSent(self, lane: str, latency: float, size: int):
+        """
+        Records a sent action
+        Parameters:
+            lane: name of the lane the action was queued in
+            latency: time in s between queueing and sending the action
+            size: serialized size of the action in bytes
+        """
+        with self.__mutex:
+            record = self.__laneRecords.get(lane)
+            if record is None:
+                record = _MethodRecord()
+                self.__laneRecords[lane] = record
+            record.calls += 1
+            record.requestBytes += size
+            record.latency.Record(latency)
+
+    def GetMetrics(self, reset: bool = False) -> RpcMetrics:
+        """
+        Gets a snapshot of the metrics
+        Parameters:
+            reset: if true the metrics are reset after reading
+        """
+        with self.__mutex:
+            now = time.perf_counter()
+            result = RpcMetrics(
+                now - self.__startTime,
+                dict(),
+                self.__actionQueueDepth,
+                self.__maxActionQueueDepth,
+            )
+            for method, record in self.__records.items():
+                latency = record.latency
+                result.methods[method] = MethodMetrics(
+                    record.calls,
+                    record.errors,
+                    record.requestBytes,
+                    record.responseBytes,
+                    latency.GetMean(),
+                    latency.GetPercentile(50),
+                    latency.GetPercentile(95),
+                    latency.GetPercentile(99),
+                    latency.GetMax(),
+                    latency.GetMean() * latency.GetCount(),
+                )
+            for lane, record in self.__laneRecords.items():
+                latency = record.latency
+                result.actionLanes[lane] = ActionLaneMetrics(
+                    record.calls,
+                    record.requestBytes,
+                    latency.GetMean(),
+                    latency.GetPercentile(50),
+                    latency.GetPercentile(95),
+                    latency.GetPercentile(99),
+                    latency.GetMax(),
+                )
+            if reset:
+                self.__records = dict()
+                self.__laneRecords = dict()
+                self.__maxActionQueueDepth = self.__actionQueueDepth
+                self.__startTime = now
+            return result
+
+    def __GetRecord(self, method: str) -> _MethodRecord:
+        """Gets the counters of a method, call with the mutex locked"""
+        record = self.__records.get(method)
+        if record is None:
+            record = _MethodRecord()
+            self.__records[method] = record
+        return record
+
+    def __Intercept(
+        self,
+        continuation,
+        details: grpc.ClientCallDetails,
+        request,
+        responseStream: bool,
+    ):
+        """Records a call, response streams are wrapped to count the received bytes"""
+        if not self.enabled:
+            return continuation(details, request)
+
+        method = GetMethodName(details)
+        with self.__mutex:
+            record = self.__GetRecord(method)
+            record.calls += 1
+        if hasattr(request, "ByteSize"):
+            size = request.ByteSize()
+            with self.__mutex:
+                record.requestBytes += size
+        else:
+            request = _CountingIterator(request, record, self.__mutex)
+
+        startTime = time.perf_counter()
+        call = continuation(details, request)
+
+        def Done(call):
+            latency = time.perf_counter() - startTime
+            try:
+                failed = call.cancelled() or call.exception() is not None
+            except grpc.FutureCancelledError:
+                failed = True
+            responseSize = 0
+            if not failed and not responseStream:
+                responseSize = call.result().ByteSize()
+            with self.__mutex:
+                if failed:
+                    record.errors += 1
+                record.responseBytes += responseSize
+                if method not in LONG_LIVED_METHODS:
+                    record.latency.Record(latency)
+
+        call.add_done_callback(Done)
+        if responseStream:
+            return _CountingResponseStream(call, record, self.__mutex)
+        return call
+
+    def _Intercept(self, continuation, details: grpc.ClientCallDetails, request):
+        return self.__Intercept(continuation, details, request, False)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return self.__Intercept(continuation, client_call_details, request, True)
+
+    def intercept_stream_stream(
+        self, continuation, client_call_details, request_iterator
+    ):
+        return self.__Intercept(
+            continuation, client_call_details, request_iterator, True
+        )
@@ -0,0 +1,269 @@
+"""
+Measures the startup of an app: the imports of grpc, protobuf, the generated messages and the data types, Connect() and
+the time until the first event. Create the profiler before importing anything else, this module only uses the standard
+library and rcapp.Log, which only uses the standard library as well:
+
+    from rcapp.StartupProfiler import StartupProfiler
+    profiler = StartupProfiler("MyApp")
+    profiler.ImportModules()
+
+    from MyApp import MyApp
+    app = MyApp("MyApp", target)
+    profiler.MeasureConnect(app)
+    profiler.MeasureFirstEvent(app, 10)
+    report = profiler.Finish(app)  # logs the report
+"""
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+import importlib
+import json
+import os
+import sys
+import time
+from .Log import GetLogger
+
+PHASE_INTERPRETER = "interpreter"
+"""Time from the start of the process until the profiler was created, Linux only"""
+PHASE_IMPORT_GRPC = "import grpc"
+"""Import of the grpc package including its native library"""
+PHASE_IMPORT_PROTOBUF = "import protobuf"
+"""Import of the protobuf runtime used by the generated messages"""
+PHASE_IMPORT_MESSAGES = "import robotcontrolapp_pb2"
+"""Import of the generated messages and the client stub, this builds the message classes"""
+PHASE_IMPORT_DATATYPES = "import DataTypes"
+"""Import of the data types used by the AppClient"""
+PHASE_IMPORT_CLIENT = "import AppClient"
+"""Import of the AppClient and its helpers"""
+PHASE_CONNECT = "Connect"
+"""AppClient.Connect()"""
+PHASE_FIRST_EVENT = "first event"
+"""Time from the end of Connect() until the first event was received"""
+PHASE_TOTAL = "total"
+"""Key of the total startup time in the budgets, see StartupReport.GetExceeded()"""
+
+_IMPORTS = (
+    (PHASE_IMPORT_GRPC, ("grpc",)),
+    (
+        PHASE_IMPORT_PROTOBUF,
+        (
+            "google.protobuf.descriptor",
+            "google.protobuf.descriptor_pool",
+            "google.protobuf.symbol_database",
+            "google.protobuf.internal.builder",
+            "google.protobuf.internal.containers",
+        ),
+    ),
+    (
+        PHASE_IMPORT_MESSAGES,
+        ("rcapp.robotcontrolapp_pb2", "rcapp.robotcontrolapp_pb2_grpc"),
+    ),
+    (
+        PHASE_IMPORT_DATATYPES,
+        (
+            "rcapp.DataTypes.LicenseInfo",
+            "rcapp.DataTypes.Matrix44",
+            "rcapp.DataTypes.MotionState",
+            "rcapp.DataTypes.ProgramVariable",
+            "rcapp.DataTypes.RobotState",
+            "rcapp.DataTypes.Statistics",
+            "rcapp.DataTypes.SystemInfo",
+            "rcapp.DataTypes.Vector3",
+        ),
+    ),
+    (PHASE_IMPORT_CLIENT, ("rcapp.AppClient",)),
+)
+"""Modules imported by StartupProfiler.ImportModules(), by phase in import order"""
+
+
+@dataclass
+class StartupPhase:
+    """A measured step of the startup"""
+
+    name: str = ""
+    """Name of the phase, e.g. PHASE_IMPORT_GRPC"""
+    start: float = 0.0
+    """Time in s from the creation of the profiler until the phase started"""
+    duration: float = 0.0
+    """Duration in s"""
+    preloaded: bool = False
+    """True if the modules of an import phase were imported before, the duration does not include their import"""
+
+
+@dataclass
+class StartupReport:
+    """Result of a StartupProfiler"""
+
+    appName: str = ""
+    """Name of the app"""
+    phases: list = field(default_factory=list)
+    """StartupPhase in the order they were measured"""
+    total: float = 0.0
+    """Time in s from the start of the process (or the creation of the profiler if not known) until Finish()"""
+    connectTiming: dict = None
+    """Steps of Connect() (AppClient.ConnectTiming as dictionary), None if Connect() was not measured"""
+
+    def GetDuration(self, name: str) -> float:
+        """Gets the duration in s of a phase, the total for PHASE_TOTAL, None if the phase was not measured"""
+        if name == PHASE_TOTAL:
+            return self.total
+        for phase in self.phases:
+            if phase.name == name:
+                return phase.duration
+        return None
+
+    def GetExceeded(self, budgets: dict[str, float]) -> list[str]:
+        """
+        Checks the durations against a budget
+        Parameters:
+            budgets: maximum duration in s by phase name, PHASE_TOTAL for the total time
+        Returns:
+            a description of each phase over its budget, empty if all phases are within their budget
+        """
+        exceeded = []
+        for name, budget in budgets.items():
+            duration = self.GetDuration(name)
+            if duration is not None and duration > budget:
+                exceeded.append(
+                    f"{name} took {duration * 1000:.1f}ms, budget {budget * 1000:.1f}ms"
+                )
+        return exceeded
+
+    def ToString(self) -> str:
+        """Formats the report as a table, one line per phase"""
+        lines = [f"Startup of '{self.appName}': {self.total * 1000:.1f}ms"]
+        for phase in self.phases:
+            note = " (imported before)" if phase.preloaded else ""
+            lines.append(f"  {phase.name:<28}{phase.duration * 1000:9.1f}ms{note}")
+        return "\n".join(lines)
+
+
+def _GetProcessAge() -> float:
+    """Gets the time in s since the process started, None if not known (the /proc file system is Linux only)"""
+    try:
+        with open("/proc/self/stat") as statFile:
+            # The process name may contain spaces, the fields after it are separated by spaces
+            fields = statFile.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as uptimeFile:
+            uptime = float(uptimeFile.read().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class StartupProfiler:
+    """Measures the startup phases of an app, see the module documentation. This class is not thread safe."""
+
+    def __init__(self, appName: str = ""):
+        """
+        Starts measuring
+        Parameters:
+            appName: name of the app in the report
+        """
+        self.__appName = appName
+        self.__startTime = time.perf_counter()
+        """Time (time.perf_counter()) when the profiler was created"""
+        self.__processAge = _GetProcessAge()
+        """Time in s from the start of the process until the profiler was created, None if not known"""
+        self.__phases = []
+        if self.__processAge is not None:
+            self.__phases.append(
+                StartupPhase(PHASE_INTERPRETER, -self.__processAge, self.__processAge)
+            )
+        self.__connectTiming = None
+
+    @contextmanager
+    def Phase(self, name: str):
+        """
+        Measures a phase, e.g. the import of the app module or the initialization of the app:
+
+            with profiler.Phase("import MyApp"):
+                from MyApp import MyApp
+        """
+        startTime = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__phases.append(
+                StartupPhase(
+                    name,
+                    startTime - self.__startTime,
+                    time.perf_counter() - startTime,
+                )
+            )
+
+    def ImportModules(self):
+        """
+        Imports grpc, protobuf, the generated messages, the data types and the AppClient and measures each step. Call
+        this before importing them elsewhere, the phases of modules imported before are marked as preloaded.
+        """
+        for name, modules in _IMPORTS:
+            preloaded = all(module in sys.modules for module in modules)
+            with self.Phase(name):
+                for module in modules:
+                    importlib.import_module(module)
+            self.__phases[-1].preloaded = preloaded
+
+    def MeasureConnect(self, app):
+        """
+        Connects an app and measures Connect()
+        Parameters:
+            app: the AppClient to connect
+        """
+        with self.Phase(PHASE_CONNECT):
+            app.Connect()
+
+    def MeasureFirstEvent(self, app, timeout: float = None) -> bool:
+        """
+        Waits for the first event after Connect() and measures the time from the end of Connect() until it was received
+        Parameters:
+            app: the connected AppClient
+            timeout: maximum time in s to wait, None to wait forever
+        Returns:
+            true if an event was received, false on timeout (the phase is not added then)
+        """
+        if not app.WaitFirstEvent(timeout):
+            return False
+        timing = app.GetConnectTiming()
+        duration = max(0.0, timing.firstEvent - timing.total)
+        self.__phases.append(
+            StartupPhase(PHASE_FIRST_EVENT, self.GetElapsed() - duration, duration)
+        )
+        return True
+
+    def GetElapsed(self) -> float:
+        """Gets the time in s since the profiler was created"""
+        return time.perf_counter() - self.__startTime
+
+    def Finish(self, app=None) -> StartupReport:
+        """
+        Finishes measuring and logs the report (subsystem "<app name>.startup")
+        Parameters:
+            app: the AppClient, if given the steps of its last Connect() are added to the report
+        Returns:
+            the report
+        """
+        total = self.GetElapsed()
+        if self.__processAge is not None:
+            total += self.__processAge
+        report = StartupReport(self.__appName, list(self.__phases), total)
+        if app is not None:
+            report.connectTiming = asdict(app.GetConnectTiming())
+        GetLogger().GetSubsystem(self.__appName + ".startup").Info(
+            "%s", report.ToString()
+        )
+        return report
+
+    @staticmethod
+    def WriteReport(report: StartupReport, fileName: str):
+        """Writes a report as JSON, e.g. to compare the startup of several versions"""
+        with open(fileName, "w") as reportFile:
+            json.dump(asdict(report), reportFile, indent=2)
+
+    @staticmethod
+    def ReadReport(fileName: str) -> StartupReport:
+        """Reads a report written by WriteReport()"""
+        with open(fileName) as reportFile:
+            values = json.load(reportFile)
+        values["phases"] = [StartupPhase(**phase) for phase in values["phases"]]
+        return StartupReport(**values)
@@ -0,0 +1,248 @@
+"""
+The TimerService runs callbacks at a later time or when a condition on the streamed robot state becomes true, without
+blocking a thread per wait. The AppClient uses it to finish app function calls later, e.g. SendFunctionDoneAfter().
+"""
+
+import math
+import threading
+import time
+from typing import Callable
+from .Log import GetLogger
+
+_log = GetLogger().GetSubsystem("TimerService")
+"""Logger of the callbacks that failed"""
+
+
+class TimerHandle:
+    """Handle of a scheduled callback, use it to cancel the callback"""
+
+    def __init__(self, callback: Callable[[], None]):
+        self.__callback = callback
+        self.__done = False
+        self.__mutex = threading.Lock()
+        self._onCancel = None
+        """Called when the handle is cancelled, e.g. to cancel the timeout of a condition"""
+
+    def Cancel(self) -> bool:
+        """
+        Cancels the callback
+        Returns:
+            false if the callback ran or was cancelled already
+        """
+        if not self._Finish():
+            return False
+        if self._onCancel is not None:
+            self._onCancel()
+        return True
+
+    def IsDone(self) -> bool:
+        """Returns true if the callback ran or was cancelled"""
+        return self.__done
+
+    def _Finish(self) -> bool:
+        """Marks the handle as done, returns false if it was done already"""
+        with self.__mutex:
+            if self.__done:
+                return False
+            self.__done = True
+            return True
+
+    def _Run(self):
+        """Runs the callback unless it was cancelled"""
+        if self._Finish():
+            try:
+                self.__callback()
+            except Exception as ex:
+                _log.Error("Timer callback raised an exception: %r", ex)
+
+
+class _Condition:
+    """A callback waiting for a condition"""
+
+    def __init__(self, predicate: Callable, handle: TimerHandle):
+        self.predicate = predicate
+        self.handle = handle
+        self.timeoutHandle: TimerHandle = None
+
+
+class TimerService:
+    """
+    Hashed timer wheel: the timers are stored in slots by their due tick, so adding and cancelling is O(1) and each tick
+    only looks at one slot. A single thread runs all callbacks, so they must return quickly. The thread sleeps while no
+    timer is pending.
+    """
+
+    def __init__(self, resolution: float = 0.01, slots: int = 512):
+        """
+        Parameters:
+            resolution: tick length in s, timers run up to one tick late
+            slots: number of slots of the wheel, timers further than slots * resolution in the future stay in their
+                slot for several rounds
+        """
+        if resolution <= 0 or slots < 1:
+            raise RuntimeError("invalid timer wheel settings")
+        self.__resolution = resolution
+        self.__slots = [[] for _ in range(slots)]
+        """Timers by slot: tuples of due tick and handle"""
+        self.__startTime = time.perf_counter()
+        self.__currentTick = 0
+        """Last processed tick"""
+        self.__pendingTimers = 0
+        self.__conditions = []
+        """Callbacks waiting for a condition, this list is replaced on change so it can be read without lock"""
+        self.__stop = False
+        self.__mutex = threading.Lock()
+        self.__wakeUp = threading.Condition(self.__mutex)
+        """Notified when a timer was added or the service stops"""
+        self.__thread = threading.Thread(
+            target=self.__TimerThread, name="TimerService", daemon=True
+        )
+        self.__thread.start()
+
+    def CallLater(self, delay: float, callback: Callable[[], None]) -> TimerHandle:
+        """
+        Calls a function after a delay
+        Parameters:
+            delay: delay in s
+            callback: function to call in the timer thread
+        Returns:
+            handle to cancel the call
+        """
+        handle = TimerHandle(callback)
+        with self.__mutex:
+            if self.__stop:
+                raise RuntimeError("the timer service is stopped")
+            now = time.perf_counter()
+            if self.__pendingTimers == 0:
+                # The thread was idle, skip the ticks passed since then, there were no timers in them
+                self.__currentTick = max(self.__currentTick, self.__GetTick(now) - 1)
+            # Round up to the next tick, the timer must not run early. Processed ticks cannot be used anymore.
+            dueTick = max(
+                math.ceil(self.__ToTicks(now + delay - self.__startTime)),
+                self.__currentTick + 1,
+            )
+            self.__slots[dueTick % len(self.__slots)].append((dueTick, handle))
+            self.__pendingTimers += 1
+            self.__wakeUp.notify()
+        return handle
+
+    def CallWhen(
+        self,
+        predicate: Callable[[object], bool],
+        callback: Callable[[], None],
+        timeout: float = None,
+        onTimeout: Callable[[], None] = None,
+    ) -> TimerHandle:
+        """
+        Calls a function when a condition becomes true. The condition is checked on each call of CheckConditions().
+        Parameters:
+            predicate: function receiving the value passed to CheckConditions(), e.g. the robot state
+            callback: function to call when the predicate returned true
+            timeout: time in s after which the wait is aborted, None to wait forever
+            onTimeout: function to call if the timeout expired
+        Returns:
+            handle to cancel the wait
+        """
+        handle = TimerHandle(callback)
+        condition = _Condition(predicate, handle)
+
+        def OnCancel():
+            self.__RemoveCondition(condition)
+            if condition.timeoutHandle is not None:
+                condition.timeoutHandle.Cancel()
+
+        handle._onCancel = OnCancel
+        if timeout is not None:
+
+            def OnTimeout():
+                if handle._Finish():
+                    self.__RemoveCondition(condition)
+                    if onTimeout is not None:
+                        onTimeout()
+
+            condition.timeoutHandle = self.CallLater(timeout, OnTimeout)
+        with self.__mutex:
+            self.__conditions = self.__conditions + [condition]
+        return handle
+
+    def HasConditions(self) -> bool:
+        """Returns true if callbacks wait for a condition"""
+        return len(self.__conditions) > 0
+
+    def CheckConditions(self, value: object):
+        """
+        Checks the conditions of the callbacks added by CallWhen() and runs the callbacks of the fulfilled conditions in
+        the calling thread
+        Parameters:
+            value: value passed to the predicates, e.g. the robot state
+        """
+        for condition in self.__conditions:
+            try:
+                fulfilled = condition.predicate(value)
+            except Exception as ex:
+                _log.Error("Timer condition raised an exception: %r", ex)
+                continue
+            if fulfilled:
+                self.__RemoveCondition(condition)
+                if condition.timeoutHandle is not None:
+                    condition.timeoutHandle.Cancel()
+                condition.handle._Run()
+
+    def GetPendingCount(self) -> int:
+        """Gets the number of scheduled timers and conditions (including cancelled timers that are not due yet)"""
+        with self.__mutex:
+            return self.__pendingTimers + len(self.__conditions)
+
+    def Shutdown(self):
+        """Stops the timer thread, pending timers and conditions are dropped"""
+        with self.__mutex:
+            self.__stop = True
+            self.__conditions = []
+            self.__wakeUp.notify()
+        if threading.current_thread() != self.__thread:
+            self.__thread.join()
+
+    def __RemoveCondition(self, condition: _Condition):
+        """Removes a condition"""
+        with self.__mutex:
+            self.__conditions = [c for c in self.__conditions if c is not condition]
+
+    def __ToTicks(self, seconds: float) -> float:
+        return seconds / self.__resolution
+
+    def __GetTick(self, now: float) -> int:
+        """Gets the tick of a point in time"""
+        return int(self.__ToTicks(now - self.__startTime))
+
+    def __TimerThread(self):
+        """Processes the slots of the due ticks"""
+        while True:
+            due = []
+            with self.__mutex:
+                while self.__pendingTimers == 0 and not self.__stop:
+                    self.__wakeUp.wait()
+                if self.__stop:
+                    return
+
+                nowTick = self.__GetTick(time.perf_counter())
+                while self.__currentTick < nowTick:
+                    self.__currentTick += 1
+                    slot = self.__slots[self.__currentTick % len(self.__slots)]
+                    remaining = []
+                    for entry in slot:
+                        if entry[0] <= self.__currentTick:
+                            due.append(entry[1])
+                        else:
+                            remaining.append(entry)
+                    slot[:] = remaining
+                self.__pendingTimers -= len(due)
+
+                if len(due) == 0:
+                    nextTickTime = (
+                        self.__startTime + (self.__currentTick + 1) * self.__resolution
+                    )
+                    self.__wakeUp.wait(max(0.0, nextTickTime - time.perf_counter()))
+                    continue
+
+            for handle in due:
+                handle._Run()
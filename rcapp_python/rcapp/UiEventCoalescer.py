@@ -0,0 +1,147 @@
+"""
+The UiEventCoalescer reduces bursts of UI updates, e.g. while an operator types into a number box each change arrives
+as a separate update. Within a time window only the latest update per element and state kind is delivered, button
+updates are always delivered. Enable it with AppClient.uiCoalescingWindow.
+"""
+
+from dataclasses import dataclass
+import threading
+import time
+from typing import Callable
+from .HandlerRegistry import UI_BUTTON
+from .Log import GetLogger
+
+_log = GetLogger().GetSubsystem("UiEventCoalescer")
+"""Logger of the handlers that failed"""
+
+
+@dataclass
+class UiCoalescingMetrics:
+    """Counts of the coalesced UI updates"""
+
+    received: int = 0
+    """Number of updates received from the robot control"""
+    delivered: int = 0
+    """Number of updates delivered to the handlers"""
+    collapsed: int = 0
+    """Number of updates replaced by a later update of the same element and state kind"""
+
+
+class UiEventCoalescer:
+    """
+    Collects UI updates for a time window and delivers the latest update per element and state kind. The updates are
+    delivered in the order of their latest change by a single thread, so the handlers see them in the same order as
+    without coalescing. A button update delivers the collected updates first, so the handler of a button sees the
+    values entered before it was clicked. This class is thread safe.
+    """
+
+    def __init__(self, deliver: Callable[[list], None]):
+        """
+        Parameters:
+            deliver: called with a list of updates (AppUIElement) in the delivery thread
+        """
+        self.__deliver = deliver
+        self.__pending = dict()
+        """Collected updates by tuple of element name and state kind, ordered by their latest change"""
+        self.__deadline = 0.0
+        """Time when the collected updates are delivered"""
+        self.__ready = []
+        """Lists of updates to deliver now"""
+        self.__metrics = UiCoalescingMetrics()
+        self.__thread = None
+        """Delivery thread, started on first use"""
+        self.__generation = 0
+        """Incremented by Stop(), a delivery thread exits when the generation changed"""
+        self.__condition = threading.Condition()
+
+    def Add(self, updates, window: float):
+        """
+        Adds received updates, this does not block
+        Parameters:
+            updates: received UI updates (AppUIElement)
+            window: time in s the updates are collected, measured from the first collected update
+        """
+        now = time.perf_counter()
+        with self.__condition:
+            immediate = []
+            for update in updates:
+                self.__metrics.received += 1
+                kind = update.state.WhichOneof("state")
+                if kind == UI_BUTTON:
+                    immediate.extend(self.__pending.values())
+                    immediate.append(update)
+                    self.__pending.clear()
+                    continue
+                if len(self.__pending) == 0:
+                    self.__deadline = now + window
+                key = (update.element_name, kind)
+                if self.__pending.pop(key, None) is not None:
+                    self.__metrics.collapsed += 1
+                self.__pending[key] = update
+            if len(immediate) > 0:
+                self.__ready.append(immediate)
+            if self.__thread is None:
+                self.__thread = threading.Thread(
+                    target=self.__Run,
+                    args=(self.__generation,),
+                    name="UiEventCoalescer",
+                    daemon=True,
+                )
+                self.__thread.start()
+            self.__condition.notify()
+
+    def __Run(self, generation: int):
+        """Delivers the updates until Stop() is called"""
+        while True:
+            with self.__condition:
+                while True:
+                    if generation != self.__generation:
+                        return
+                    if len(self.__ready) > 0:
+                        updates = self.__ready.pop(0)
+                        break
+                    if len(self.__pending) > 0:
+                        timeout = self.__deadline - time.perf_counter()
+                        if timeout <= 0:
+                            updates = list(self.__pending.values())
+                            self.__pending.clear()
+                            break
+                        self.__condition.wait(timeout)
+                    else:
+                        self.__condition.wait()
+                self.__metrics.delivered += len(updates)
+            try:
+                self.__deliver(updates)
+            except Exception as ex:
+                _log.Error("UI update handler raised an exception: %r", ex)
+
+    def GetMetrics(self, reset: bool = False) -> UiCoalescingMetrics:
+        """
+        Gets the counts of the coalesced updates
+        Parameters:
+            reset: if true the counts are reset after reading
+        """
+        with self.__condition:
+            metrics = UiCoalescingMetrics(
+                self.__metrics.received,
+                self.__metrics.delivered,
+                self.__metrics.collapsed,
+            )
+            if reset:
+                self.__metrics = UiCoalescingMetrics()
+            return metrics
+
+    def Stop(self):
+        """
+        Stops the delivery thread, e.g. on disconnect. Collected updates are dropped, the thread is started again by
+        the next Add().
+        """
+        with self.__condition:
+            thread = self.__thread
+            self.__thread = None
+            self.__generation += 1
+            self.__pending.clear()
+            self.__ready = []
+            self.__condition.notify()
+        if thread is not None and thread != threading.current_thread():
+            thread.join()
@@ -0,0 +1,55 @@
+"""
+Python API for the igus Robot Control app interface, shared by the apps. The submodules are loaded on first use, so an
+app only loads the parts it uses:
+
+    from rcapp.AppClient import AppClient
+
+    import rcapp
+    rcapp.Log.GetLogger()  # loads rcapp.Log now
+
+Install the package once (python -m pip install rcapp_python) to let several apps on a robot control share the module
+files and their compiled bytecode.
+"""
+
+import importlib
+
+__version__ = "14.6.7"
+"""The app API version is equal to the minimum supported Robot Control version"""
+
+_SUBMODULES = (
+    "ActionQueue",
+    "AppClient",
+    "AppFunctionDispatcher",
+    "AppFuture",
+    "AppHost",
+    "AsyncAppClient",
+    "ChannelProfile",
+    "DataTypes",
+    "FunctionParameters",
+    "FunctionTracer",
+    "HandlerRegistry",
+    "Interceptors",
+    "Log",
+    "ParameterClasses",
+    "RobotControlProxy",
+    "RpcMetrics",
+    "StartupProfiler",
+    "TimerService",
+    "UiEventCoalescer",
+    "robotcontrolapp_pb2",
+    "robotcontrolapp_pb2_grpc",
+)
+"""Submodules loaded by __getattr__() on first access"""
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name: str):
+    """Loads a submodule on first access, later accesses find it in the module dictionary"""
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
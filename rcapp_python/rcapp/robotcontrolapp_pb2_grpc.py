@@ -3,7 +3,7 @@
 import grpc
 import warnings
 
-import robotcontrolapp_pb2 as robotcontrolapp__pb2
+from . import robotcontrolapp_pb2 as robotcontrolapp__pb2
 
 GRPC_GENERATED_VERSION = '1.64.1'
 GRPC_VERSION = grpc.__version__
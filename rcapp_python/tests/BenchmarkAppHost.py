@@ -0,0 +1,125 @@
+"""
+Benchmark of the AppHost: runs several apps streaming the robot state (like the monitor app) as separate processes and
+then in one process with an AppHost, and compares the memory and CPU time used. Run it from rcapp_python:
+
+    python tests/BenchmarkAppHost.py [number of apps]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DURATION = 5.0
+"""Time in s each run streams the robot state"""
+DECIMATION = 20
+"""Robot state decimation of the apps, the monitor app uses the same"""
+
+
+def GetRss() -> int:
+    """Gets the resident memory of this process in bytes (Linux), the peak resident memory elsewhere"""
+    try:
+        with open("/proc/self/status") as statusFile:
+            for line in statusFile:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def RunApps(target: str, count: int, hosted: bool):
+    """Runs the apps in this process and prints the used resources as JSON"""
+    from rcapp.AppClient import AppClient
+    from rcapp.AppHost import AppHost
+
+    host = AppHost(target) if hosted else None
+    apps = []
+    for i in range(count):
+        app = AppClient(f"BenchmarkApp{i}", target)
+        apps.append(host.AddApp(app) if hosted else app)
+    for app in apps:
+        app.Connect()
+        app.StartRobotStateStream(DECIMATION)
+
+    cpuStart = time.process_time()
+    time.sleep(DURATION)
+    cpu = time.process_time() - cpuStart
+    result = {"rss": GetRss(), "cpu": cpu, "threads": threading.active_count()}
+
+    if hosted:
+        host.Shutdown()
+    else:
+        for app in apps:
+            app.Disconnect()
+    print(json.dumps(result))
+
+
+def Measure(target: str, processes: int, appsPerProcess: int) -> dict:
+    """Starts the processes, returns the sum of their resources"""
+    children = [
+        subprocess.Popen(
+            [
+                sys.executable,
+                os.path.abspath(__file__),
+                "--run",
+                target,
+                str(appsPerProcess),
+                "host" if appsPerProcess > 1 else "single",
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(processes)
+    ]
+    total = {"rss": 0, "cpu": 0.0, "threads": 0}
+    for child in children:
+        output, _ = child.communicate()
+        result = json.loads(output.strip().splitlines()[-1])
+        for key in total:
+            total[key] += result[key]
+    return total
+
+
+def main():
+    from FakeRobotControl import FakeRobotControl
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    server = FakeRobotControl()
+    target = server.Start()
+    try:
+        separate = Measure(target, count, 1)
+        hosted = Measure(target, 1, count)
+        streams = server.GetCallCount("GetRobotStateStream")
+    finally:
+        server.Stop()
+
+    print(
+        f"{count} apps, robot state stream with decimation {DECIMATION}, {DURATION:.0f}s"
+    )
+    print(f"{'':<22}{'memory':>12}{'CPU time':>12}{'threads':>9}")
+    for name, result in [("separate processes", separate), ("AppHost", hosted)]:
+        print(
+            f"{name:<22}{result['rss'] / 1024 / 1024:10.1f}MB{result['cpu'] * 1000:10.0f}ms"
+            f"{result['threads']:9d}"
+        )
+    print(
+        f"{'saved':<22}{(separate['rss'] - hosted['rss']) / 1024 / 1024:10.1f}MB"
+        f"{(separate['cpu'] - hosted['cpu']) * 1000:10.0f}ms"
+        f"{separate['threads'] - hosted['threads']:9d}"
+    )
+    print(f"robot state streams opened: {streams} ({count} separate, 1 hosted)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--run":
+        RunApps(sys.argv[2], int(sys.argv[3]), sys.argv[4] == "host")
+    else:
+        main()
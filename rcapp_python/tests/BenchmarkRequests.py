@@ -0,0 +1,89 @@
+"""
+Micro-benchmark of the request overhead of the AppClient: compares creating a new request for each call with reusing a
+shared request that only contains the app name. Run it from rcapp_python:
+
+    PYTHONPATH=. python tests/BenchmarkRequests.py
+"""
+
+import os
+import sys
+import time
+import timeit
+
+import grpc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from rcapp.AppClient import AppClient  # noqa: E402
+from FakeRobotControl import FakeRobotControl  # noqa: E402
+from rcapp import robotcontrolapp_pb2  # noqa: E402
+from rcapp.robotcontrolapp_pb2_grpc import RobotControlAppStub  # noqa: E402
+
+APP_NAME = "BenchmarkApp"
+DURATION = 2.0
+"""Duration in s of each call benchmark"""
+
+
+def NewRequest() -> robotcontrolapp_pb2.RobotStateRequest:
+    """Creates the request like the AppClient did before, once per call"""
+    request = robotcontrolapp_pb2.RobotStateRequest()
+    request.app_name = APP_NAME
+    return request
+
+
+SHARED_REQUEST = NewRequest()
+
+
+def SharedRequest() -> robotcontrolapp_pb2.RobotStateRequest:
+    """Reuses the shared request"""
+    return SHARED_REQUEST
+
+
+def CallsPerSecond(call) -> float:
+    """Calls the given function for DURATION seconds"""
+    count = 0
+    startTime = time.perf_counter()
+    endTime = startTime + DURATION
+    while time.perf_counter() < endTime:
+        call()
+        count += 1
+    return count / (time.perf_counter() - startTime)
+
+
+def main():
+    number = 200000
+    for name, function in (
+        ("new request", NewRequest),
+        ("shared request", SharedRequest),
+    ):
+        duration = timeit.timeit(function, number=number)
+        print(f"{name:>20}: {duration / number * 1e6:.3f} µs per request")
+
+    server = FakeRobotControl()
+    target = server.Start()
+    try:
+        channel = grpc.insecure_channel(target)
+        stub = RobotControlAppStub(channel)
+        before = CallsPerSecond(lambda: stub.GetRobotState(NewRequest()))
+        after = CallsPerSecond(lambda: stub.GetRobotState(SharedRequest()))
+        print(f"{'stub, new request':>20}: {before:.0f} calls/s")
+        print(
+            f"{'stub, shared request':>20}: {after:.0f} calls/s ({(after / before - 1) * 100:+.1f}%)"
+        )
+        channel.close()
+
+        app = AppClient(APP_NAME, target)
+        app.Connect()
+        try:
+            print(f"{'AppClient.GetTCP':>20}: {CallsPerSecond(app.GetTCP):.0f} calls/s")
+            print(
+                f"{'AppClient.GetRobotState':>20}: {CallsPerSecond(app.GetRobotState):.0f} calls/s"
+            )
+        finally:
+            app.Disconnect()
+    finally:
+        server.Stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 import unittest
 
-from DataTypes.DirectoryContent import DirectoryContent, DirectoryContentFromGrcp
-import robotcontrolapp_pb2
+from rcapp.DataTypes.DirectoryContent import DirectoryContent, DirectoryContentFromGrcp
+from rcapp import robotcontrolapp_pb2
 
 
 class DirectoryContentTest(unittest.TestCase):
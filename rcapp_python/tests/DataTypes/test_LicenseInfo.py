@@ -1,7 +1,7 @@
 import unittest
 
-from DataTypes.LicenseInfo import LicenseInfo, LicenseDetails, LicenseInfoFromGrpc
-import robotcontrolapp_pb2
+from rcapp.DataTypes.LicenseInfo import LicenseInfo, LicenseDetails, LicenseInfoFromGrpc
+from rcapp import robotcontrolapp_pb2
 
 
 class LicenseInfoTest(unittest.TestCase):
@@ -1,6 +1,7 @@
 import unittest
 
-from DataTypes.ProgramVariable import NumberVariable
+from rcapp.DataTypes.ProgramVariable import NumberVariable, ProgramVariableFromGrpc
+from rcapp import robotcontrolapp_pb2
 
 
 class NumberVariableTest(unittest.TestCase):
@@ -16,6 +17,15 @@ class NumberVariableTest(unittest.TestCase):
         self.assertEqual(name, var2.name)
         self.assertEqual(0, var2.value)
 
+    def test_FromGrpc(self):
+        grpc = robotcontrolapp_pb2.ProgramVariable()
+        grpc.name = "varName"
+        grpc.number = 1234.5
+        var = ProgramVariableFromGrpc(grpc)
+        self.assertIsInstance(var, NumberVariable)
+        self.assertEqual("varName", var.name)
+        self.assertEqual(1234.5, var.value)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,14 @@
 import unittest
 
-from DataTypes.Matrix44 import Matrix44
-from DataTypes.ProgramVariable import (
+from rcapp.DataTypes.Matrix44 import Matrix44
+from rcapp.DataTypes.ProgramVariable import (
     MakePositionVariableBoth,
     MakePositionVariableCartesian,
     MakePositionVariableJoint,
     PositionVariable,
+    ProgramVariableFromGrpc,
 )
+from rcapp import robotcontrolapp_pb2
 
 
 class PositionVariableTest(unittest.TestCase):
@@ -111,6 +113,31 @@ class PositionVariableTest(unittest.TestCase):
         var.SetExternalAxes([100, 200, 300, 400])
         self.assertEqual([100, 200, 300], var.externalAxes)
 
+    def test_FromGrpc(self):
+        grpc = robotcontrolapp_pb2.ProgramVariable()
+        grpc.name = "varName"
+        grpc.position.robot_joints.joints.extend([10, 20, 30, 40, 50, 60])
+        grpc.position.external_joints.extend([100, 200, 300])
+        var = ProgramVariableFromGrpc(grpc)
+        self.assertIsInstance(var, PositionVariable)
+        self.assertEqual("varName", var.name)
+        self.assertEqual([10, 20, 30, 40, 50, 60], var.robotAxes)
+        self.assertEqual([100, 200, 300], var.externalAxes)
+
+        grpc = robotcontrolapp_pb2.ProgramVariable()
+        grpc.name = "varName"
+        for i in range(16):
+            grpc.position.both.cartesian.data.append(10 * (i + 1))
+        grpc.position.both.robot_joints.joints.extend([1, 2, 3, 4, 5, 6])
+        var = ProgramVariableFromGrpc(grpc)
+        self.assertEqual([1, 2, 3, 4, 5, 6], var.robotAxes)
+        self.assertEqual([10 * (i + 1) for i in range(16)], var.cartesian._data)
+
+        # no value
+        grpc = robotcontrolapp_pb2.ProgramVariable()
+        grpc.name = "varName"
+        self.assertIsNone(ProgramVariableFromGrpc(grpc))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,13 @@
 import unittest
 
-from DataTypes.Matrix44 import Matrix44
-from DataTypes.RobotState import JointFromGrpc, RobotState, Joint, RobotStateFromGrpc
-import robotcontrolapp_pb2
+from rcapp.DataTypes.Matrix44 import Matrix44
+from rcapp.DataTypes.RobotState import (
+    JointFromGrpc,
+    RobotState,
+    Joint,
+    RobotStateFromGrpc,
+)
+from rcapp import robotcontrolapp_pb2
 
 
 class JointTest(unittest.TestCase):
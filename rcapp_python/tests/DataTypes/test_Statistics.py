@@ -1,7 +1,7 @@
 import unittest
 
-from DataTypes import Statistics
-import robotcontrolapp_pb2
+from rcapp.DataTypes import Statistics
+from rcapp import robotcontrolapp_pb2
 
 
 class StatisticsTest(unittest.TestCase):
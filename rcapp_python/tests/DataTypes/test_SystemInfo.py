@@ -1,8 +1,8 @@
 import unittest
 import unittest
 
-from DataTypes.SystemInfo import SystemInfo, SystemInfoFromGrpc
-import robotcontrolapp_pb2
+from rcapp.DataTypes.SystemInfo import SystemInfo, SystemInfoFromGrpc
+from rcapp import robotcontrolapp_pb2
 
 
 class SystemInfoTest(unittest.TestCase):
@@ -0,0 +1,27 @@
+import unittest
+
+from rcapp.DataTypes.Vector3 import Vector3, Vector3FromGrpc
+from rcapp import robotcontrolapp_pb2
+
+
+class Vector3Test(unittest.TestCase):
+    def test_init(self):
+        result = Vector3()
+        self.assertEqual([0, 0, 0], [result.GetX(), result.GetY(), result.GetZ()])
+
+        result.SetX(1)
+        result.SetY(2)
+        result.SetZ(3)
+        self.assertEqual([1, 2, 3], [result.GetX(), result.GetY(), result.GetZ()])
+
+    def test_FromGrpc(self):
+        grpcVector = robotcontrolapp_pb2.Vector3(x=1.5, y=-2, z=3)
+        result = Vector3FromGrpc(grpcVector)
+        self.assertEqual(1.5, result.GetX())
+        self.assertEqual(-2, result.GetY())
+        self.assertEqual(3, result.GetZ())
+        self.assertEqual(grpcVector, result.ToGrpc())
+
+
+if __name__ == "__main__":
+    unittest.main()
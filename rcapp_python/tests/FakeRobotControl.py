@@ -0,0 +1,311 @@
+"""
+A minimal stand-in for the robot control's gRPC app interface. It runs a local server on a free port so that the app
+clients can be tested without a real robot control. Only the functionality needed by the tests is simulated.
+"""
+
+from concurrent import futures
+from queue import Empty, Queue
+import threading
+import time
+import grpc
+from rcapp import robotcontrolapp_pb2
+from rcapp.robotcontrolapp_pb2_grpc import (
+    RobotControlAppServicer,
+    add_RobotControlAppServicer_to_server,
+)
+
+
+class FakeRobotControl(RobotControlAppServicer):
+    """Simulates the robot control side of the app interface"""
+
+    def __init__(self):
+        self.receivedActions = Queue()
+        """AppActions received from the apps (excluding the empty action sent at startup)"""
+        self.capabilities = Queue()
+        """CapabilitiesRequests received from the apps"""
+        self.variables = dict()
+        """Program variables by name (robotcontrolapp_pb2.ProgramVariable)"""
+        self.robotState = robotcontrolapp_pb2.RobotState()
+        """Robot state returned by GetRobotState and GetRobotStateStream"""
+        self.robotState.tcp.data.extend(
+            [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1]
+        )
+        self.motionState = robotcontrolapp_pb2.MotionState()
+        """Motion state returned by GetMotionState, MoveTo etc."""
+        self.systemInfo = robotcontrolapp_pb2.SystemInfo()
+        """System info returned by GetSystemInfo"""
+        self.systemInfo.version_major = 14
+        self.systemInfo.version_minor = 6
+        self.systemInfo.version_patch = 7
+        self.systemInfo.version = "V14-006-7"
+        self.licenseInfo = robotcontrolapp_pb2.LicenseInfoResponse()
+        """License info returned by GetLicensedFeatures"""
+        self.files = dict()
+        """Files by name (bytes)"""
+        self.ioRequests = Queue()
+        """IOStateRequests received from the apps"""
+        self.rpcDelay = 0.0
+        """Delay in s added to each unary call, use this to simulate a slow robot control"""
+        self.stateStreamInterval = 0.01
+        """Interval in s between two robot states sent by GetRobotStateStream"""
+        self.callCounts = dict()
+        """Number of calls per method name"""
+        self.__callCountsMutex = threading.Lock()
+        self.__eventQueues = dict()
+        self.__eventQueuesMutex = threading.Lock()
+        self.__server = None
+
+    def Start(self, port: int = 0, unixSocketPath: str = None) -> str:
+        """
+        Starts the server, returns the connection target
+        Parameters:
+            port: port to listen on, 0 selects a free port. Use the port of a previous run to simulate a restart.
+            unixSocketPath: if set the server listens on this Unix domain socket instead of a port
+        """
+        self.__server = grpc.server(futures.ThreadPoolExecutor(max_workers=32))
+        add_RobotControlAppServicer_to_server(self, self.__server)
+        if unixSocketPath:
+            self.__server.add_insecure_port("unix:" + unixSocketPath)
+            self.__server.start()
+            return "unix:" + unixSocketPath
+        port = self.__server.add_insecure_port(f"localhost:{port}")
+        self.__server.start()
+        return f"localhost:{port}"
+
+    def Stop(self):
+        """Stops the server and closes all streams"""
+        if self.__server is not None:
+            self.__server.stop(0).wait()
+            self.__server = None
+        with self.__eventQueuesMutex:
+            self.__eventQueues.clear()
+
+    def SendEvent(self, event: robotcontrolapp_pb2.Event, appName: str = None):
+        """Sends an event to the given app or to all connected apps"""
+        with self.__eventQueuesMutex:
+            for name, queue in self.__eventQueues.items():
+                if appName is None or name == appName:
+                    queue.put(event)
+
+    def CallFunction(self, name: str, callId: int, appName: str = None, **parameters):
+        """Sends an app function call, parameters are given as keyword arguments"""
+        event = robotcontrolapp_pb2.Event()
+        event.function.name = name
+        event.function.call_id = callId
+        for parameterName, value in parameters.items():
+            parameter = event.function.parameters.add()
+            parameter.name = parameterName
+            if isinstance(value, bool):
+                parameter.bool_value = value
+            elif isinstance(value, int):
+                parameter.int64_value = value
+            elif isinstance(value, float):
+                parameter.double_value = value
+            else:
+                parameter.string_value = value
+        self.SendEvent(event, appName)
+
+    def WaitForApp(self, appName: str, timeout: float = 5) -> bool:
+        """Waits until the given app opened its event stream"""
+        endTime = time.time() + timeout
+        while time.time() < endTime:
+            with self.__eventQueuesMutex:
+                if appName in self.__eventQueues:
+                    return True
+            time.sleep(0.01)
+        return False
+
+    def GetCallCount(self, method: str) -> int:
+        """Gets the number of calls of a method"""
+        with self.__callCountsMutex:
+            return self.callCounts.get(method, 0)
+
+    def _Called(self, method: str):
+        """Counts a call and applies the simulated delay"""
+        with self.__callCountsMutex:
+            self.callCounts[method] = self.callCounts.get(method, 0) + 1
+        if self.rpcDelay > 0:
+            time.sleep(self.rpcDelay)
+
+    # =========================================================================
+    # RobotControlAppServicer
+    # =========================================================================
+    def SetCapabilities(self, request, context):
+        self._Called("SetCapabilities")
+        self.capabilities.put(request)
+        return robotcontrolapp_pb2.CapabilitiesResponse()
+
+    def RecieveActions(self, request_iterator, context):
+        self._Called("RecieveActions")
+        # The first action (sent on connect) tells us the name of the app
+        firstAction = next(request_iterator)
+        appName = firstAction.app_name
+        events = Queue()
+        with self.__eventQueuesMutex:
+            self.__eventQueues[appName] = events
+
+        def ReadActions():
+            try:
+                for action in request_iterator:
+                    self.receivedActions.put(action)
+            except Exception:
+                pass
+
+        reader = threading.Thread(target=ReadActions, daemon=True)
+        reader.start()
+        try:
+            while context.is_active():
+                try:
+                    yield events.get(timeout=0.02)
+                except Empty:
+                    pass
+        finally:
+            with self.__eventQueuesMutex:
+                if self.__eventQueues.get(appName) is events:
+                    del self.__eventQueues[appName]
+
+    def GetTCP(self, request, context):
+        self._Called("GetTCP")
+        return self.robotState.tcp
+
+    def GetRobotStateStream(self, request, context):
+        self._Called("GetRobotStateStream")
+        while context.is_active():
+            yield self.robotState
+            time.sleep(self.stateStreamInterval)
+
+    def GetRobotState(self, request, context):
+        self._Called("GetRobotState")
+        return self.robotState
+
+    def GetProgramVariables(self, request, context):
+        self._Called("GetProgramVariables")
+        for name in request.variable_names:
+            if name in self.variables:
+                yield self.variables[name]
+
+    def SetProgramVariables(self, request, context):
+        self._Called("SetProgramVariables")
+        for variable in request.variables:
+            self.variables[variable.name] = variable
+        return robotcontrolapp_pb2.SetProgramVariablesResponse()
+
+    def EnableMotors(self, request, context):
+        self._Called("EnableMotors")
+        return robotcontrolapp_pb2.EnableMotorsResponse()
+
+    def ResetErrors(self, request, context):
+        self._Called("ResetErrors")
+        return robotcontrolapp_pb2.ResetErrorsResponse()
+
+    def ReferenceJoints(self, request, context):
+        self._Called("ReferenceJoints")
+        return robotcontrolapp_pb2.ReferenceJointsResponse()
+
+    def GetMotionState(self, request, context):
+        self._Called("GetMotionState")
+        return self.motionState
+
+    def SetMotionInterpolator(self, request, context):
+        self._Called("SetMotionInterpolator")
+        return self.motionState
+
+    def SetLogicInterpolator(self, request, context):
+        self._Called("SetLogicInterpolator")
+        return self.motionState
+
+    def MoveTo(self, request, context):
+        self._Called("MoveTo")
+        return self.motionState
+
+    def SetTargetVelocity(self, request, context):
+        self._Called("SetTargetVelocity")
+        response = robotcontrolapp_pb2.TargetVelocityResponse()
+        if request.HasField("velocity_e1"):
+            response.velocity_e1 = request.velocity_e1
+        return response
+
+    def TranslateJointToCart(self, request, context):
+        self._Called("TranslateJointToCart")
+        response = robotcontrolapp_pb2.JointToCartResponse()
+        response.position.CopyFrom(self.robotState.tcp)
+        return response
+
+    def TranslateCartToJoint(self, request, context):
+        self._Called("TranslateCartToJoint")
+        response = robotcontrolapp_pb2.CartToJointResponse()
+        response.joints.extend(request.joints)
+        return response
+
+    def SetIOState(self, request, context):
+        self._Called("SetIOState")
+        self.ioRequests.put(request)
+        return robotcontrolapp_pb2.IOStateResponse()
+
+    def UploadFile(self, request_iterator, context):
+        self._Called("UploadFile")
+        data = bytearray()
+        filename = ""
+        for request in request_iterator:
+            filename = request.filename
+            data.extend(request.data)
+        self.files[filename] = bytes(data)
+        response = robotcontrolapp_pb2.UploadFileResponse()
+        response.success = True
+        return response
+
+    def DownloadFile(self, request, context):
+        self._Called("DownloadFile")
+        if request.filename not in self.files:
+            response = robotcontrolapp_pb2.DownloadFileResponse()
+            response.success = False
+            response.error = "file not found"
+            yield response
+            return
+        data = self.files[request.filename]
+        for start in range(0, max(len(data), 1), 8 * 1024):
+            response = robotcontrolapp_pb2.DownloadFileResponse()
+            response.success = True
+            response.data = data[start : start + 8 * 1024]
+            yield response
+
+    def ListFiles(self, request, context):
+        self._Called("ListFiles")
+        response = robotcontrolapp_pb2.ListFilesResponse()
+        response.success = True
+        for filename in self.files:
+            entry = response.entries.add()
+            entry.name = filename
+            entry.type = robotcontrolapp_pb2.ListFilesResponse.DirectoryEntry.Type.File
+        return response
+
+    def RemoveFiles(self, request, context):
+        self._Called("RemoveFiles")
+        response = robotcontrolapp_pb2.RemoveFilesResponse()
+        response.success = True
+        for file in request.files:
+            self.files.pop(file, None)
+        return response
+
+    def GetSystemInfo(self, request, context):
+        self._Called("GetSystemInfo")
+        return self.systemInfo
+
+    def GetLicensedFeatures(self, request, context):
+        self._Called("GetLicensedFeatures")
+        return self.licenseInfo
+
+    def SetVelocityOverride(self, request, context):
+        self._Called("SetVelocityOverride")
+        self.robotState.velocity_override = request.velocity_override
+        response = robotcontrolapp_pb2.SetVelocityOverrideResponse()
+        response.velocity_override = request.velocity_override
+        return response
+
+    def ShowDialog(self, request, context):
+        self._Called("ShowDialog")
+        return robotcontrolapp_pb2.ShowDialogResponse()
+
+    def GetStatistics(self, request, context):
+        self._Called("GetStatistics")
+        return robotcontrolapp_pb2.StatisticsResponse()
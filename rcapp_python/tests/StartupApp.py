@@ -0,0 +1,48 @@
+"""
+Test app for the startup budget test: starts in a new interpreter, connects to the target given as first argument, waits
+for the first event and writes the startup report to the file given as second argument. Run it from rcapp_python:
+
+    python tests/StartupApp.py localhost:5000 startup.json
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rcapp.StartupProfiler import StartupProfiler  # noqa: E402
+
+APP_NAME = "StartupApp"
+FIRST_EVENT_TIMEOUT = 10
+"""Maximum time in s to wait for the first event"""
+
+
+def main() -> int:
+    profiler = StartupProfiler(APP_NAME)
+    profiler.ImportModules()
+
+    from rcapp.AppClient import AppClient
+
+    class StartupApp(AppClient):
+        """Ignores the events, the test only measures when the first one arrives"""
+
+        def _AppFunctionHandler(self, function):
+            self.SendFunctionDone(function.call_id)
+
+        def _UiUpdateHandler(self, updates):
+            pass
+
+    app = StartupApp(APP_NAME, sys.argv[1])
+    try:
+        profiler.MeasureConnect(app)
+        if not profiler.MeasureFirstEvent(app, FIRST_EVENT_TIMEOUT):
+            print("No event received", file=sys.stderr)
+            return 1
+        StartupProfiler.WriteReport(profiler.Finish(app), sys.argv[2])
+    finally:
+        app.Disconnect()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
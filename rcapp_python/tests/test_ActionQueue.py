@@ -0,0 +1,187 @@
+from queue import Empty
+import threading
+import time
+import unittest
+
+from rcapp.ActionQueue import (
+    ActionQueue,
+    ActionQueueFullException,
+    GetActionLane,
+    LANE_DEFAULT,
+    LANE_FUNCTIONS,
+    LANE_UI,
+    OVERFLOW_BLOCK,
+    OVERFLOW_DROP_SUPERSEDED,
+    OVERFLOW_RAISE,
+)
+from rcapp import robotcontrolapp_pb2
+
+
+def MakeDone(callId: int) -> robotcontrolapp_pb2.AppAction:
+    action = robotcontrolapp_pb2.AppAction()
+    action.done_functions.append(callId)
+    return action
+
+
+def MakeImage(name: str) -> robotcontrolapp_pb2.AppAction:
+    action = robotcontrolapp_pb2.AppAction()
+    uiChange = action.ui_changes.add()
+    uiChange.element_name = name
+    uiChange.state.image_state.image_data.data = b"\0" * 1000
+    return action
+
+
+class ActionQueueTest(unittest.TestCase):
+    def test_GetActionLane(self):
+        self.assertEqual(LANE_FUNCTIONS, GetActionLane(MakeDone(1)))
+        variable = robotcontrolapp_pb2.AppAction()
+        variable.set_variables.add().name = "var"
+        self.assertEqual(LANE_FUNCTIONS, GetActionLane(variable))
+        self.assertEqual(LANE_UI, GetActionLane(MakeImage("image")))
+        request = robotcontrolapp_pb2.AppAction()
+        request.request_ui_state.append("text")
+        self.assertEqual(LANE_DEFAULT, GetActionLane(request))
+        # a combined action is sent with the highest priority
+        combined = MakeImage("image")
+        combined.done_functions.append(1)
+        self.assertEqual(LANE_FUNCTIONS, GetActionLane(combined))
+
+    def test_Priority(self):
+        queue = ActionQueue()
+        queue.Put(MakeImage("image1"))
+        queue.Put(MakeImage("image2"))
+        queue.Put(MakeDone(1))
+        queue.Put(MakeDone(2))
+        self.assertEqual([2, 0, 2], queue.GetLaneSizes())
+        self.assertEqual(4, queue.qsize())
+
+        self.assertEqual([1], queue.Get().action.done_functions)
+        self.assertEqual([2], queue.Get().action.done_functions)
+        self.assertEqual("image1", queue.Get().action.ui_changes[0].element_name)
+        entry = queue.Get()
+        self.assertEqual("image2", entry.action.ui_changes[0].element_name)
+        self.assertEqual(LANE_UI, entry.lane)
+        with self.assertRaises(Empty):
+            queue.Get(timeout=0.01)
+
+        # requeued actions are taken first
+        queue.Put(MakeImage("image3"))
+        queue.Requeue(entry)
+        self.assertEqual("image2", queue.Get().action.ui_changes[0].element_name)
+
+    def test_WakeUp(self):
+        queue = ActionQueue()
+        queue.Put(MakeDone(1))
+        queue.Put(None)
+        self.assertIsNone(queue.Get().action)
+        self.assertEqual(1, queue.qsize())
+
+        results = []
+        queue.Get()
+        thread = threading.Thread(target=lambda: results.append(queue.Get()))
+        thread.start()
+        time.sleep(0.05)
+        queue.Put(None)
+        thread.join(1)
+        self.assertIsNone(results[0].action)
+
+    def test_Starvation(self):
+        queue = ActionQueue(starvationTimeout=0.05)
+        queue.Put(MakeImage("image"))
+        for callId in range(3):
+            queue.Put(MakeDone(callId))
+        time.sleep(0.1)
+        queue.Put(MakeDone(3))
+
+        # the image waited too long, it is sent first but only once before the function results
+        self.assertEqual(LANE_UI, queue.Get().lane)
+        self.assertEqual(
+            [0, 1, 2, 3], [queue.Get().action.done_functions[0] for _ in range(4)]
+        )
+
+    def test_SetLaneLimit(self):
+        queue = ActionQueue()
+        with self.assertRaises(RuntimeError):
+            queue.SetLaneLimit(LANE_UI, 10, "unknown")
+        with self.assertRaises(RuntimeError):
+            queue.SetLaneLimit(LANE_UI, 0)
+
+    def test_OverflowRaise(self):
+        queue = ActionQueue()
+        queue.SetLaneLimit(LANE_FUNCTIONS, 2, OVERFLOW_RAISE)
+        queue.Put(MakeDone(1))
+        queue.Put(MakeDone(2))
+        with self.assertRaises(ActionQueueFullException):
+            queue.Put(MakeDone(3))
+        # other lanes are not affected
+        queue.Put(MakeImage("image"))
+
+        statistics = queue.GetLaneStatistics(reset=True)[LANE_FUNCTIONS]
+        self.assertEqual(2, statistics.depth)
+        self.assertEqual(2, statistics.maxDepth)
+        self.assertEqual(1, statistics.rejected)
+        queue.Get()
+        statistics = queue.GetLaneStatistics()[LANE_FUNCTIONS]
+        self.assertEqual(1, statistics.depth)
+        self.assertEqual(2, statistics.maxDepth)
+        self.assertEqual(0, statistics.rejected)
+
+    def test_OverflowBlock(self):
+        queue = ActionQueue()
+        queue.SetLaneLimit(LANE_FUNCTIONS, 1, OVERFLOW_BLOCK, 0.05)
+        queue.Put(MakeDone(1))
+        startTime = time.perf_counter()
+        with self.assertRaises(ActionQueueFullException):
+            queue.Put(MakeDone(2))
+        self.assertGreaterEqual(time.perf_counter() - startTime, 0.05)
+
+        queue.SetLaneLimit(LANE_FUNCTIONS, 1, OVERFLOW_BLOCK, None)
+        thread = threading.Thread(target=lambda: queue.Put(MakeDone(3)))
+        thread.start()
+        time.sleep(0.05)
+        self.assertTrue(thread.is_alive())
+        self.assertEqual([1], queue.Get().action.done_functions)
+        thread.join(1)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([3], queue.Get().action.done_functions)
+
+    def test_OverflowDropSuperseded(self):
+        queue = ActionQueue()
+        queue.SetLaneLimit(LANE_UI, 2, OVERFLOW_DROP_SUPERSEDED, 0.05)
+        queue.Put(MakeImage("image1"))
+        queue.Put(MakeImage("image2"))
+        queue.Put(MakeImage("image1"))
+        self.assertEqual(
+            ["image2", "image1"],
+            [queue.Get().action.ui_changes[0].element_name for _ in range(2)],
+        )
+        self.assertEqual(1, queue.GetLaneStatistics()[LANE_UI].dropped)
+
+        # an update of another element or another state is not superseding
+        queue.Put(MakeImage("image1"))
+        visibility = robotcontrolapp_pb2.AppAction()
+        change = visibility.ui_changes.add()
+        change.element_name = "image1"
+        change.is_visible = True
+        queue.Put(visibility)
+        with self.assertRaises(ActionQueueFullException):
+            queue.Put(MakeImage("image3"))
+        # setting the selected option does not replace the option list
+        queue.Clear()
+        dropDown = robotcontrolapp_pb2.AppAction()
+        change = dropDown.ui_changes.add()
+        change.element_name = "dropDown"
+        change.state.dropdown_state.options.append("a")
+        queue.Put(dropDown)
+        queue.Put(MakeImage("image1"))
+        selection = robotcontrolapp_pb2.AppAction()
+        change = selection.ui_changes.add()
+        change.element_name = "dropDown"
+        change.state.dropdown_state.selected_option = "a"
+        with self.assertRaises(ActionQueueFullException):
+            queue.Put(selection)
+        self.assertEqual(1, queue.GetLaneStatistics()[LANE_UI].dropped)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,619 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import grpc
+
+from rcapp.AppClient import (
+    AppClient,
+    ConnectTimeoutException,
+    NotConnectedException,
+    SNAPSHOT_MOTION_STATE,
+    SNAPSHOT_ROBOT_STATE,
+    SNAPSHOT_TARGET_VELOCITIES,
+    SNAPSHOT_TCP,
+    SNAPSHOT_VELOCITY_OVERRIDE,
+)
+from rcapp.AppFuture import Gather
+from rcapp.DataTypes import ProgramVariable
+from rcapp.DataTypes.Matrix44 import Matrix44
+from rcapp.DataTypes.MotionState import MotionState
+from rcapp.AppFunctionDispatcher import AppFunctionDispatcher
+from FakeRobotControl import FakeRobotControl
+from rcapp.HandlerRegistry import UI_TEXTFIELD, app_function, ui_event
+from rcapp.ParameterClasses import AppDefinitionException
+from rcapp import robotcontrolapp_pb2
+
+LAZY_MODULES = [
+    "rcapp.AppFunctionDispatcher",
+    "rcapp.AppHost",
+    "rcapp.DataTypes.DirectoryContent",
+    "rcapp.DataTypes.LicenseInfo",
+    "rcapp.DataTypes.ProgramVariable",
+    "rcapp.DataTypes.Statistics",
+    "rcapp.FunctionParameters",
+    "rcapp.ParameterClasses",
+    "rcapp.TimerService",
+    "rcapp.UiEventCoalescer",
+]
+"""Modules importing rcapp.AppClient must not load, they are imported on first use"""
+
+
+class AppClientTest(unittest.TestCase):
+    def test_init(self):
+        appClient = AppClient("TestAppName", "localhost:5000")
+
+        self.assertLessEqual(14, appClient.VERSION_MAJOR_MIN)
+        self.assertLessEqual(0, appClient.VERSION_MINOR_MIN)
+        self.assertLessEqual(0, appClient.VERSION_PATCH_MIN)
+
+        self.assertFalse(appClient.logDebug)
+        self.assertFalse(appClient.autoReconnect)
+
+        self.assertEqual("TestAppName", appClient.GetAppName())
+
+
+class ReconnectingApp(AppClient):
+    """Test app: finishes all app function calls and counts reconnects"""
+
+    def __init__(self, appName: str, target: str):
+        super().__init__(appName, target)
+        self.reconnected = 0
+
+    def _AppFunctionHandler(self, function: robotcontrolapp_pb2.AppFunction):
+        if function.name == "Raise":
+            raise RuntimeError("test")
+        if function.name == "Timeout":
+            with self.CallTimeout(0.001):
+                self.GetRobotState()
+        if function.name == "Slow":
+            time.sleep(0.2)
+        self.SendFunctionDone(function.call_id)
+
+    def _UiUpdateHandler(self, updates):
+        pass
+
+    def _OnReconnected(self):
+        self.reconnected += 1
+
+
+class RegisteredHandlersApp(AppClient):
+    """Test app: uses registered handlers instead of overriding the handler methods"""
+
+    def __init__(self, appName: str, target: str):
+        super().__init__(appName, target)
+        # The test functions are not declared in rcapp.xml
+        self.appDefinitionFile = None
+        self.texts = []
+
+    @app_function("Test")
+    def Test(self, function: robotcontrolapp_pb2.AppFunction):
+        self.SendFunctionDone(function.call_id)
+
+    @ui_event("text", UI_TEXTFIELD)
+    def OnText(self, update: robotcontrolapp_pb2.AppUIElement):
+        self.texts.append(update.state.textfield_state.current_text)
+
+
+class AppClientConnectionTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeRobotControl()
+        self.target = self.server.Start()
+        self.app = ReconnectingApp("TestAppName", self.target)
+
+    def tearDown(self):
+        self.app.Disconnect()
+        self.server.Stop()
+
+    def test_LazyImports(self):
+        # a fresh interpreter, the other tests have loaded the modules already
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, rcapp.AppClient; print('\\n'.join(sorted(sys.modules)))",
+            ],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        self.assertEqual(0, result.returncode, result.stderr)
+        loaded = set(result.stdout.split())
+        self.assertIn("rcapp.AppClient", loaded)
+        self.assertEqual([], [name for name in LAZY_MODULES if name in loaded])
+
+    def test_ConnectionLost(self):
+        self.app.Connect()
+        self.assertTrue(self.server.WaitForApp("TestAppName"))
+
+        # Without autoReconnect the app stops when the connection is lost
+        self.server.Stop()
+        endTime = time.time() + 5
+        while self.app.IsConnected() and time.time() < endTime:
+            time.sleep(0.01)
+        self.assertFalse(self.app.IsConnected())
+
+    def test_Reconnect(self):
+        self.app.autoReconnect = True
+        self.app.reconnectDelayMin = 0.05
+        self.app.reconnectDelayMax = 0.2
+        self.app.Connect()
+        self.assertTrue(self.server.WaitForApp("TestAppName"))
+        self.server.capabilities.get(timeout=1)
+
+        # Simulate a robot control restart, actions sent in between must not get lost
+        self.server.Stop()
+        time.sleep(0.1)
+        self.app.SendFunctionDone(1)
+        self.server.Start(int(self.target.split(":")[1]))
+
+        self.assertTrue(self.server.WaitForApp("TestAppName"))
+        self.assertEqual(
+            "TestAppName", self.server.capabilities.get(timeout=5).app_name
+        )
+        endTime = time.time() + 5
+        while self.app.GetReconnectCount() == 0 and time.time() < endTime:
+            time.sleep(0.01)
+        self.assertTrue(self.app.IsConnected())
+        self.assertEqual(1, self.app.GetReconnectCount())
+        self.assertEqual(1, self.app.reconnected)
+
+        # function calls work via the new stream
+        self.server.CallFunction("Test", 2, "TestAppName")
+        doneCalls = []
+        while 2 not in doneCalls:
+            doneCalls.extend(self.server.receivedActions.get(timeout=5).done_functions)
+        self.assertEqual([1, 2], doneCalls)
+
+    def test_HandlerRpcError(self):
+        self.app.autoReconnect = True
+        self.app.Connect()
+        self.assertTrue(self.server.WaitForApp("TestAppName"))
+
+        # A failed request in a handler fails the call, the connection stays up
+        self.server.rpcDelay = 0.2
+        self.server.CallFunction("Timeout", 1, "TestAppName")
+        action = self.server.receivedActions.get(timeout=5)
+        self.assertEqual([1], [f.call_id for f in action.failed_functions])
+        self.assertIn("DEADLINE_EXCEEDED", action.failed_functions[0].reason)
+
+        self.server.rpcDelay = 0.0
+        self.server.CallFunction("Test", 2, "TestAppName")
+        self.assertEqual([2], self.server.receivedActions.get(timeout=5).done_functions)
+        self.assertTrue(self.app.IsConnected())
+        self.assertEqual(0, self.app.GetReconnectCount())
+        self.assertEqual(1, self.server.GetCallCount("RecieveActions"))
+
+    def test_FunctionDispatcher(self):
+        self.app.functionDispatcher = AppFunctionDispatcher(2)
+        self.app.Connect()
+        self.assertTrue(self.server.WaitForApp("TestAppName"))
+
+        # The slow call must not delay the others, exceptions let the call fail
+        self.server.CallFunction("Slow", 1, "TestAppName")
+        self.server.CallFunction("Fast", 2, "TestAppName")
+        self.server.CallFunction("Raise", 3, "TestAppName")
+        doneCalls = []
+        failedCalls = []
+        while len(doneCalls) + len(failedCalls) < 3:
+            action = self.server.receivedActions.get(timeout=5)
+            doneCalls.extend(action.done_functions)
+            failedCalls.extend([f.call_id for f in action.failed_functions])
+        self.assertEqual([2, 1], doneCalls)
+        self.assertEqual([3], failedCalls)
+        self.app.functionDispatcher.Shutdown()
+
+    def test_RobotStateStream(self):
+        self.app.Connect()
+        self.assertIsNone(self.app.GetLatestRobotState())
+
+        states = []
+        decimatedStates = []
+        self.app.SubscribeRobotState(states.append)
+        self.app.StartRobotStateStream()
+        self.assertTrue(self.app.IsRobotStateStreamRunning())
+        time.sleep(0.2)
+        self.assertGreater(len(states), 5)
+        self.assertIsNotNone(self.app.GetLatestRobotState())
+
+        # Changing the decimation does not open a second stream
+        self.app.UnsubscribeRobotState(states.append)
+        self.app.SubscribeRobotState(decimatedStates.append)
+        self.app.StartRobotStateStream(decimation=5)
+        statesBefore = len(states)
+        time.sleep(0.2)
+        self.assertEqual(statesBefore, len(states))
+        self.assertGreater(len(decimatedStates), 0)
+        self.assertLess(len(decimatedStates), 7)
+        self.assertEqual(1, self.server.GetCallCount("GetRobotStateStream"))
+
+        self.app.StopRobotStateStream()
+        self.assertFalse(self.app.IsRobotStateStreamRunning())
+        decimatedStatesBefore = len(decimatedStates)
+        time.sleep(0.1)
+        self.assertEqual(decimatedStatesBefore, len(decimatedStates))
+
+    def test_CoalesceActions(self):
+        self.app.actionCoalesceWindow = 0.05
+        self.app.Connect()
+        self.assertTrue(self.server.WaitForApp("TestAppName"))
+        self.app.GetActionStatistics(reset=True)
+
+        for callId in range(100):
+            self.app.SendFunctionDone(callId)
+        self.app.SetText("text", "value")
+        self.app.RequestUIElementState("text")
+
+        doneCalls = []
+        uiChanges = []
+        uiRequests = []
+        messages = 0
+        # the lanes may reorder the UI change and the UI state request
+        while len(doneCalls) < 100 or len(uiChanges) == 0 or len(uiRequests) == 0:
+            action = self.server.receivedActions.get(timeout=5)
+            doneCalls.extend(action.done_functions)
+            uiChanges.extend([u.element_name for u in action.ui_changes])
+            uiRequests.extend(action.request_ui_state)
+            messages += 1
+        self.assertEqual(list(range(100)), doneCalls)
+        self.assertEqual(["text"], uiChanges)
+        self.assertEqual(["text"], uiRequests)
+        self.assertLess(messages, 10)
+
+        statistics = self.app.GetActionStatistics()
+        self.assertEqual(102, statistics.queuedActions)
+        self.assertEqual(messages, statistics.sentMessages)
+        self.assertGreater(
+            statistics.GetQueuedActionsPerSecond(),
+            statistics.GetSentMessagesPerSecond(),
+        )
+
+    def test_Deadlines(self):
+        self.app.Connect()
+        self.server.rpcDelay = 0.5
+
+        with self.app.CallTimeout(0.1):
+            with self.assertRaises(grpc.RpcError) as context:
+                self.app.GetRobotState()
+        self.assertEqual(grpc.StatusCode.DEADLINE_EXCEEDED, context.exception.code())
+
+        self.app.SetCallTimeout("GetRobotState", 0.1)
+        with self.assertRaises(grpc.RpcError):
+            self.app.GetRobotState()
+        self.app.SetCallTimeout("GetRobotState", None)
+        self.app.GetRobotState()
+
+    def test_CancelAll(self):
+        self.app.Connect()
+        self.server.files["file"] = b"data"
+        self.server.rpcDelay = 2
+
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(self.app.DownloadFileToMemory("file"))
+        )
+        startTime = time.time()
+        thread.start()
+        time.sleep(0.2)
+        self.assertEqual(1, self.app.CancelAll())
+        thread.join()
+        self.assertLess(time.time() - startTime, 1)
+        self.assertFalse(results[0][0])
+        self.assertIn("CANCELLED", results[0][1])
+        self.assertTrue(self.app.IsConnected())
+
+    def test_Metrics(self):
+        self.app.Connect()
+        for _ in range(10):
+            self.app.GetRobotState()
+        self.server.rpcDelay = 0.5
+        with self.app.CallTimeout(0.05):
+            with self.assertRaises(grpc.RpcError):
+                self.app.GetRobotState()
+        self.server.rpcDelay = 0
+        self.app.SendAction(robotcontrolapp_pb2.AppAction())
+
+        metrics = self.app.GetMetrics()
+        self.assertEqual(11, metrics.methods["GetRobotState"].calls)
+        self.assertEqual(1, metrics.methods["GetRobotState"].errors)
+        self.assertGreater(metrics.methods["GetRobotState"].responseBytes, 0)
+        self.assertGreaterEqual(metrics.methods["GetRobotState"].latencyMax, 0.05)
+        self.assertEqual(1, metrics.methods["SetCapabilities"].calls)
+        self.assertEqual(1, metrics.methods["RecieveActions"].calls)
+        self.assertGreaterEqual(metrics.maxActionQueueDepth, 1)
+        for _ in range(50):
+            if self.app.GetMetrics().actionLanes["default"].actions > 0:
+                break
+            time.sleep(0.01)
+        self.assertEqual(1, self.app.GetMetrics().actionLanes["default"].actions)
+
+        fileName = os.path.join(tempfile.mkdtemp(), "metrics.jsonl")
+        self.app.StartMetricsDump(fileName, 0.05)
+        time.sleep(0.2)
+        self.app.StopMetricsDump()
+        with open(fileName) as file:
+            lines = [json.loads(line) for line in file]
+        self.assertGreaterEqual(len(lines), 2)
+        self.assertEqual("TestAppName", lines[0]["app"])
+        self.assertEqual(11, lines[0]["methods"]["GetRobotState"]["calls"])
+
+    def test_Async(self):
+        self.app.Connect()
+        self.server.rpcDelay = 0.2
+
+        startTime = time.perf_counter()
+        tcp, robotState, motionState, systemInfo, joints = Gather(
+            self.app.GetTCPAsync(),
+            self.app.GetRobotStateAsync(),
+            self.app.GetMotionStateAsync(),
+            self.app.GetSystemInfoAsync(),
+            self.app.TranslateJointToCartAsync([0] * 9),
+        )
+        self.app.SetDigitalOutputsAsync({1: True}).Result()
+        # the requests ran concurrently
+        self.assertLess(time.perf_counter() - startTime, 0.7)
+
+        self.assertEqual(self.app.GetTCP().ToGrpc(), tcp.ToGrpc())
+        self.assertEqual(self.app.GetRobotState().tcp.ToGrpc(), robotState.tcp.ToGrpc())
+        self.assertIsInstance(motionState, MotionState)
+        self.assertEqual(14, systemInfo.versionMajor)
+        self.assertEqual(
+            self.app.TranslateJointToCart([0] * 9)[0].ToGrpc(), joints[0].ToGrpc()
+        )
+        self.assertEqual(1, self.server.ioRequests.get(timeout=1).DOuts[0].id)
+
+        self.app.Disconnect()
+        with self.assertRaises(NotConnectedException):
+            self.app.GetTCPAsync()
+
+    def test_AsyncVariables(self):
+        self.app.Connect()
+        self.app.SetNumberVariable("a", 1)
+        self.app.SetNumberVariable("b", 2)
+        self.app.SetPositionVariableJoints("p", 1, 2, 3, 4, 5, 6, 7, 8, 9)
+        self.server.files["file"] = b"data"
+        self.server.licenseInfo.licensed_features.add(
+            feature_id="feature", is_licensed=True
+        )
+        self.server.rpcDelay = 0.2
+
+        startTime = time.perf_counter()
+        a, b, variables, position, content, licensed = Gather(
+            self.app.GetNumberVariableAsync("a"),
+            self.app.GetProgramVariableAsync("b"),
+            self.app.GetProgramVariablesAsync({"a", "b", "unknown"}),
+            self.app.GetPositionVariableAsync("p"),
+            self.app.ListFilesAsync(""),
+            self.app.IsFeatureLicensedAsync("feature"),
+        )
+        Gather(
+            self.app.SetPositionVariableCartAsync("c", Matrix44(), 0, 0, 0),
+            self.app.SetPositionVariableBothAsync(
+                "d", Matrix44(), 1, 2, 3, 4, 5, 6, 0, 0, 0
+            ),
+            self.app.SetPositionVariableJointsAsync("e", 1, 2, 3, 4, 5, 6, 0, 0, 0),
+        )
+        # the requests ran concurrently
+        self.assertLess(time.perf_counter() - startTime, 0.7)
+
+        self.assertEqual((1, 2), (a.value, b.value))
+        self.assertEqual(["a", "b"], sorted(variables))
+        self.assertIsInstance(position, ProgramVariable.PositionVariable)
+        self.assertEqual(["file"], [entry.name for entry in content.entries])
+        self.assertTrue(licensed)
+        self.assertEqual(
+            [1, 2, 3, 4, 5, 6],
+            list(self.server.variables["d"].position.both.robot_joints.joints),
+        )
+        self.assertTrue(self.server.variables["c"].position.HasField("cartesian"))
+
+        # the type is checked when the result is read
+        with self.assertRaises(RuntimeError):
+            self.app.GetPositionVariableAsync("a").Result()
+        with self.assertRaises(RuntimeError):
+            self.app.GetNumberVariableAsync("unknown").Result()
+
+    def test_Snapshot(self):
+        self.app.Connect()
+        self.server.robotState.velocity_override = 42
+        self.server.rpcDelay = 0.2
+        robotStateCalls = self.server.GetCallCount("GetRobotState")
+
+        startTime = time.time()
+        snapshot = self.app.GetSnapshot(
+            [
+                SNAPSHOT_ROBOT_STATE,
+                SNAPSHOT_MOTION_STATE,
+                SNAPSHOT_TCP,
+                SNAPSHOT_TARGET_VELOCITIES,
+                SNAPSHOT_VELOCITY_OVERRIDE,
+            ]
+        )
+        # the requests ran concurrently and the robot state was requested once
+        self.assertLess(time.time() - startTime, 0.6)
+        self.assertEqual(4, snapshot.requestCount)
+        self.assertEqual(robotStateCalls + 1, self.server.GetCallCount("GetRobotState"))
+
+        self.assertEqual(42, snapshot.velocityOverride)
+        self.assertEqual(42, snapshot.robotState.velocityOverride)
+        self.assertIsInstance(snapshot.motionState, MotionState)
+        self.assertEqual(3, len(snapshot.targetVelocities))
+        self.assertIsNone(snapshot.systemInfo)
+        self.assertEqual(5, len(snapshot.receiveTimes))
+        for receiveTime in snapshot.receiveTimes.values():
+            self.assertGreaterEqual(receiveTime, snapshot.requestTime + 0.2)
+        self.assertEqual(
+            snapshot.receiveTimes[SNAPSHOT_ROBOT_STATE],
+            snapshot.receiveTimes[SNAPSHOT_VELOCITY_OVERRIDE],
+        )
+
+        with self.assertRaises(RuntimeError):
+            self.app.GetSnapshot(["unknown"])
+        with self.assertRaises(grpc.FutureTimeoutError):
+            self.app.GetSnapshot([SNAPSHOT_TCP, SNAPSHOT_MOTION_STATE], timeout=0.05)
+
+    def test_ConnectTiming(self):
+        self.app.Connect()
+        timing = self.app.GetConnectTiming()
+        self.assertGreater(timing.total, 0)
+        self.assertGreaterEqual(
+            timing.total,
+            timing.channelReady
+            + timing.streamOpen
+            + timing.handshake
+            + timing.versionCheck,
+        )
+        self.assertFalse(timing.versionCheckCached)
+        self.assertIsNone(timing.firstEvent)
+        self.assertEqual(14, self.app.GetConnectedSystemInfo().versionMajor)
+        self.server.capabilities.get(timeout=1)
+
+        self.assertFalse(self.app.WaitFirstEvent(0.05))
+        self.server.CallFunction("Test", 1, "TestAppName")
+        self.assertTrue(self.app.WaitFirstEvent(1))
+        self.assertGreater(self.app.GetConnectTiming().firstEvent, timing.total)
+
+        # the capabilities and the system info are requested concurrently
+        self.app.Disconnect()
+        self.server.rpcDelay = 0.2
+        self.app.Connect()
+        timing = self.app.GetConnectTiming()
+        self.assertTrue(timing.versionCheckCached)
+        self.assertLess(timing.handshake, 0.35)
+        self.server.capabilities.get(timeout=1)
+
+    def test_ConnectTimeout(self):
+        port = int(self.target.rsplit(":", 1)[1])
+        self.server.Stop()
+        self.app.connectTimeout = 0.2
+        startTime = time.perf_counter()
+        with self.assertRaises(ConnectTimeoutException):
+            self.app.Connect()
+        self.assertLess(time.perf_counter() - startTime, 1)
+        self.assertFalse(self.app.IsConnected())
+
+        # connecting again works when the robot control is up
+        self.server.Start(port)
+        self.app.connectTimeout = 5
+        self.app.Connect()
+        self.assertTrue(self.server.WaitForApp("TestAppName"))
+
+    def GetFunctionResults(self, count: int) -> list:
+        """Gets the done and failed function call IDs sent by the app"""
+        results = []
+        while len(results) < count:
+            action = self.server.receivedActions.get(timeout=5)
+            results.extend(("done", callId) for callId in action.done_functions)
+            results.extend(("failed", f.call_id) for f in action.failed_functions)
+        return results
+
+    def test_DeferredFunctionResults(self):
+        self.app.Connect()
+        self.assertTrue(self.server.WaitForApp("TestAppName"))
+
+        startTime = time.perf_counter()
+        self.app.SendFunctionDoneAfter(1, 0.1)
+        self.app.SendFunctionFailedAfter(2, 0.05, "failed")
+        self.app.SendFunctionDoneAfter(3, 0.05).Cancel()
+        self.assertEqual([("failed", 2), ("done", 1)], self.GetFunctionResults(2))
+        self.assertGreaterEqual(time.perf_counter() - startTime, 0.1)
+
+        self.app.SendFunctionDoneWhen(4, lambda state: state.velocityOverride > 50)
+        self.app.SendFunctionDoneWhen(5, lambda state: False, timeout=0.05)
+        self.assertTrue(self.app.IsRobotStateStreamRunning())
+        self.assertEqual([("failed", 5)], self.GetFunctionResults(1))
+        self.server.robotState.velocity_override = 60
+        self.assertEqual([("done", 4)], self.GetFunctionResults(1))
+
+    def test_FunctionTrace(self):
+        self.app.functionDispatcher = AppFunctionDispatcher(2)
+        self.app.Connect()
+        self.assertTrue(self.server.WaitForApp("TestAppName"))
+
+        self.server.CallFunction("Slow", 1, "TestAppName", speed=2.0)
+        self.server.CallFunction("Fast", 2, "TestAppName")
+        self.server.CallFunction("Raise", 3, "TestAppName")
+        self.GetFunctionResults(2)
+        self.assertEqual(1, self.app.GetFunctionTrace().functions["Slow"].inFlight)
+        self.GetFunctionResults(1)
+
+        trace = self.app.GetFunctionTrace()
+        self.assertEqual([], trace.running)
+        self.assertEqual(1, trace.functions["Raise"].failed)
+        self.assertGreaterEqual(trace.functions["Slow"].latencyMax, 0.2)
+        self.assertEqual("Slow", trace.slowest[0].name)
+        self.assertEqual({"speed": 2.0}, trace.slowest[0].parameters)
+
+        with tempfile.TemporaryDirectory() as directory:
+            fileName = os.path.join(directory, "trace.json")
+            self.app.WriteFunctionTrace(fileName)
+            with open(fileName) as file:
+                events = json.load(file)["traceEvents"]
+        self.assertEqual(4, len(events))
+        self.app.functionDispatcher.Shutdown()
+
+    def test_RegisteredHandlers(self):
+        app = RegisteredHandlersApp("RegisteredApp", self.target)
+        app.Connect()
+        try:
+            self.assertTrue(self.server.WaitForApp("RegisteredApp"))
+            event = robotcontrolapp_pb2.Event()
+            update = event.ui_updates.add(element_name="text")
+            update.state.textfield_state.current_text = "hello"
+            button = event.ui_updates.add(element_name="unknown")
+            button.state.button_state = robotcontrolapp_pb2.ButtonState.CLICKED
+            self.server.SendEvent(event, "RegisteredApp")
+            self.server.CallFunction("Test", 1, "RegisteredApp")
+            self.server.CallFunction("Unknown", 2, "RegisteredApp")
+            self.assertEqual([("done", 1), ("failed", 2)], self.GetFunctionResults(2))
+            self.assertEqual(["hello"], app.texts)
+            metrics = app.GetHandlerMetrics()
+            self.assertEqual(1, metrics["Test"].calls)
+            self.assertEqual(1, metrics["OnText"].calls)
+        finally:
+            app.Disconnect()
+
+    def test_UiCoalescing(self):
+        app = RegisteredHandlersApp("RegisteredApp", self.target)
+        app.uiCoalescingWindow = 0.05
+        app.Connect()
+        try:
+            self.assertTrue(self.server.WaitForApp("RegisteredApp"))
+            for text in ("a", "ab", "abc"):
+                event = robotcontrolapp_pb2.Event()
+                update = event.ui_updates.add(element_name="text")
+                update.state.textfield_state.current_text = text
+                self.server.SendEvent(event, "RegisteredApp")
+            for _ in range(100):
+                if len(app.texts) > 0 and app.texts[-1] == "abc":
+                    break
+                time.sleep(0.05)
+            metrics = app.GetUiCoalescingMetrics()
+            self.assertEqual(3, metrics.received)
+            self.assertEqual(metrics.received, metrics.delivered + metrics.collapsed)
+            self.assertEqual(metrics.delivered, len(app.texts))
+            self.assertEqual("abc", app.texts[-1])
+        finally:
+            app.Disconnect()
+
+    def test_AppDefinitionMismatch(self):
+        app = RegisteredHandlersApp("RegisteredApp", self.target)
+        with tempfile.TemporaryDirectory() as directory:
+            app.appDefinitionFile = os.path.join(directory, "rcapp.xml")
+            with open(app.appDefinitionFile, "w") as file:
+                file.write('<App name="RegisteredApp"><function name="Other"/></App>')
+            with self.assertRaises(AppDefinitionException) as context:
+                app.Connect()
+        self.assertIn("'Test' which is not declared", str(context.exception))
+        self.assertIn("'Other' has no handler", str(context.exception))
+        self.assertFalse(app.IsConnected())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import threading
+import time
+import unittest
+
+from rcapp.AppFunctionDispatcher import (
+    SHUTDOWN_REASON,
+    AppFunctionDispatcher,
+    DispatcherStatistics,
+)
+from rcapp import robotcontrolapp_pb2
+
+
+def MakeFunction(name: str, callId: int) -> robotcontrolapp_pb2.AppFunction:
+    function = robotcontrolapp_pb2.AppFunction()
+    function.name = name
+    function.call_id = callId
+    return function
+
+
+class AppFunctionDispatcherTest(unittest.TestCase):
+    def setUp(self):
+        self.dispatcher = AppFunctionDispatcher(4, {"Ordered"})
+        self.finished = []
+        self.finishedMutex = threading.Lock()
+
+    def tearDown(self):
+        self.dispatcher.Shutdown()
+
+    def Handler(self, function: robotcontrolapp_pb2.AppFunction):
+        if function.name == "Raise":
+            raise RuntimeError("test")
+        time.sleep(0.1 if function.call_id == 1 else 0.01)
+        with self.finishedMutex:
+            self.finished.append(function.call_id)
+
+    def test_init(self):
+        with self.assertRaises(RuntimeError):
+            AppFunctionDispatcher(0)
+        self.assertEqual(DispatcherStatistics(), self.dispatcher.GetStatistics())
+        self.assertEqual(0, self.dispatcher.GetStatistics().GetAverageWaitTime())
+
+    def test_Concurrent(self):
+        # The slow call 1 must not delay call 2
+        self.dispatcher.Dispatch(MakeFunction("Unordered", 1), self.Handler)
+        self.dispatcher.Dispatch(MakeFunction("Unordered", 2), self.Handler)
+        time.sleep(0.05)
+        self.assertEqual({1: "Unordered"}, self.dispatcher.GetInFlightCallIds())
+        self.dispatcher.Shutdown()
+        self.assertEqual([2, 1], self.finished)
+
+    def test_Ordered(self):
+        self.dispatcher.Dispatch(MakeFunction("Ordered", 1), self.Handler)
+        self.dispatcher.Dispatch(MakeFunction("Ordered", 2), self.Handler)
+        self.dispatcher.Dispatch(MakeFunction("Ordered", 3), self.Handler)
+        self.dispatcher.Dispatch(MakeFunction("Unordered", 4), self.Handler)
+        time.sleep(0.05)
+        self.assertEqual(2, self.dispatcher.GetStatistics().queueDepth)
+        self.assertEqual(
+            {1: "Ordered"},
+            self.dispatcher.GetInFlightCallIds(),
+        )
+        time.sleep(0.2)
+        self.dispatcher.Shutdown()
+        self.assertEqual([4, 1, 2, 3], self.finished)
+
+    def test_ShutdownFailsWaitingCalls(self):
+        failed = []
+        self.dispatcher.Dispatch(
+            MakeFunction("Ordered", 1), self.Handler, lambda *args: failed.append(args)
+        )
+        self.dispatcher.Dispatch(
+            MakeFunction("Ordered", 2), self.Handler, lambda *args: failed.append(args)
+        )
+        # without a failed callback the dropped call is only logged
+        self.dispatcher.Dispatch(MakeFunction("Ordered", 3), self.Handler)
+        time.sleep(0.05)
+        self.dispatcher.Shutdown()
+        self.assertEqual([1], self.finished)
+        self.assertEqual([(2, SHUTDOWN_REASON)], failed)
+        self.assertEqual(0, self.dispatcher.GetStatistics().queueDepth)
+
+        # calls dispatched after the shutdown fail too
+        self.dispatcher.Dispatch(
+            MakeFunction("Unordered", 4),
+            self.Handler,
+            lambda *args: failed.append(args),
+        )
+        self.assertEqual([(2, SHUTDOWN_REASON), (4, SHUTDOWN_REASON)], failed)
+        self.assertEqual([1], self.finished)
+
+    def test_Statistics(self):
+        dispatcher = AppFunctionDispatcher(1)
+        for callId in range(1, 4):
+            dispatcher.Dispatch(MakeFunction("Unordered", callId), self.Handler)
+        dispatcher.Dispatch(MakeFunction("Raise", 4), self.Handler)
+        dispatcher.Shutdown()
+
+        statistics = dispatcher.GetStatistics()
+        self.assertEqual(0, statistics.queueDepth)
+        self.assertGreaterEqual(statistics.maxQueueDepth, 3)
+        self.assertEqual(0, statistics.inFlight)
+        self.assertEqual(4, statistics.dispatched)
+        # the last call waited for the slow call 1 and the two others
+        self.assertGreaterEqual(statistics.maxWaitTime, 0.1)
+        self.assertGreater(statistics.GetAverageWaitTime(), 0)
+        self.assertEqual([1, 2, 3], self.finished)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+from concurrent.futures import Future
+import threading
+import unittest
+
+import grpc
+
+from rcapp.AppFuture import AppFuture, Gather, StreamFuture
+
+
+class FakeStreamCall(grpc.RpcError):
+    """Streaming call sending two messages, then it waits until released or cancelled"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.cancelled = False
+
+    def __iter__(self):
+        yield 1
+        yield 2
+        self.release.wait(5)
+        if self.cancelled:
+            raise self
+
+    def cancel(self) -> bool:
+        self.cancelled = True
+        self.release.set()
+        return True
+
+
+def MakeDone(result) -> Future:
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+class AppFutureTest(unittest.TestCase):
+    def test_Result(self):
+        converted = []
+
+        def Convert(response):
+            converted.append(response)
+            return response * 2
+
+        future = AppFuture(MakeDone(21), Convert)
+        self.assertTrue(future.Done())
+        self.assertEqual(42, future.Result())
+        # the conversion is cached
+        self.assertEqual(42, future.Result())
+        self.assertEqual([21], converted)
+        self.assertIsNone(future.GetException())
+        self.assertEqual("response", AppFuture(MakeDone("response")).Result())
+
+    def test_Pending(self):
+        grpcFuture = Future()
+        future = AppFuture(grpcFuture)
+        callbacks = []
+        future.AddDoneCallback(callbacks.append)
+        self.assertFalse(future.Done())
+        with self.assertRaises(Exception):
+            future.Result(0.01)
+
+        grpcFuture.set_exception(grpc.RpcError())
+        self.assertEqual([future], callbacks)
+        self.assertIsInstance(future.GetException(), grpc.RpcError)
+        with self.assertRaises(grpc.RpcError):
+            future.Result()
+
+    def test_Stream(self):
+        call = FakeStreamCall()
+        future = AppFuture(StreamFuture(call), sum)
+        self.assertFalse(future.Done())
+        with self.assertRaises(grpc.FutureTimeoutError):
+            future.Result(0.01)
+        call.release.set()
+        self.assertEqual(3, future.Result(1))
+        self.assertFalse(future.Cancel())
+
+        future = AppFuture(StreamFuture(FakeStreamCall()))
+        callbacks = []
+        future.AddDoneCallback(callbacks.append)
+        self.assertTrue(future.Cancel())
+        with self.assertRaises(grpc.FutureCancelledError):
+            future.Result(1)
+        self.assertEqual([future], callbacks)
+
+    def test_Gather(self):
+        self.assertEqual([], Gather())
+        self.assertEqual(
+            [1, 2], Gather(AppFuture(MakeDone(1)), AppFuture(MakeDone(2)), timeout=1)
+        )
+        with self.assertRaises(Exception):
+            Gather(AppFuture(MakeDone(1)), AppFuture(Future()), timeout=0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import threading
+import time
+import unittest
+
+from rcapp.AppClient import AppClient
+from rcapp.AppHost import AppHost
+from FakeRobotControl import FakeRobotControl
+from rcapp import robotcontrolapp_pb2
+
+
+class HostedApp(AppClient):
+    """Test app: finishes all app function calls and records the thread running them"""
+
+    def __init__(self, appName: str, target: str):
+        super().__init__(appName, target)
+        self.functionThreads = []
+
+    def _AppFunctionHandler(self, function: robotcontrolapp_pb2.AppFunction):
+        self.functionThreads.append(threading.current_thread().name)
+        self.SendFunctionDone(function.call_id)
+
+    def _UiUpdateHandler(self, updates):
+        pass
+
+
+class AppHostTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeRobotControl()
+        self.target = self.server.Start()
+        self.host = AppHost(self.target)
+        self.first = self.host.AddApp(HostedApp("FirstApp", self.target))
+        self.second = self.host.AddApp(HostedApp("SecondApp", self.target))
+
+    def tearDown(self):
+        self.host.Shutdown()
+        self.server.Stop()
+
+    def GetFunctionResults(self, count: int) -> list:
+        """Gets the done function call IDs sent by the apps"""
+        results = []
+        while len(results) < count:
+            action = self.server.receivedActions.get(timeout=5)
+            results.extend(
+                (action.app_name, callId) for callId in action.done_functions
+            )
+        return results
+
+    def test_Connect(self):
+        self.assertEqual([self.first, self.second], self.host.GetApps())
+        self.assertIs(self.host, self.first.GetHost())
+        self.assertIs(self.host.functionDispatcher, self.second.functionDispatcher)
+
+        self.host.Connect()
+        self.assertTrue(self.host.IsConnected())
+        self.assertTrue(self.server.WaitForApp("FirstApp"))
+        self.assertTrue(self.server.WaitForApp("SecondApp"))
+        with self.assertRaises(RuntimeError):
+            self.host.AddApp(self.first)
+
+        # each app keeps its own actions stream, the calls run on the shared dispatcher
+        self.server.CallFunction("Test", 1, "FirstApp")
+        self.server.CallFunction("Test", 2, "SecondApp")
+        self.assertEqual(
+            [("FirstApp", 1), ("SecondApp", 2)],
+            sorted(self.GetFunctionResults(2)),
+        )
+        self.assertTrue(self.first.functionThreads[0].startswith("AppFunction"))
+        self.assertEqual(2, self.host.functionDispatcher.GetStatistics().dispatched)
+
+        # disconnecting one app keeps the shared channel open for the other
+        self.first.Disconnect()
+        self.assertTrue(self.host.IsConnected())
+        self.assertEqual(14, self.second.GetSystemInfo().versionMajor)
+        self.first.Connect()
+        self.assertEqual(14, self.first.GetSystemInfo().versionMajor)
+
+        self.host.Disconnect()
+        self.assertFalse(self.host.IsConnected())
+
+    def test_RobotStateStream(self):
+        self.host.Connect()
+        firstStates = []
+        secondStates = []
+        self.first.SubscribeRobotState(firstStates.append)
+        self.second.SubscribeRobotState(secondStates.append)
+        self.first.StartRobotStateStream()
+        self.second.StartRobotStateStream(decimation=5)
+        self.assertTrue(self.host.IsRobotStateStreamRunning())
+        time.sleep(0.3)
+
+        # one stream for both apps
+        self.assertEqual(1, self.server.GetCallCount("GetRobotStateStream"))
+        self.assertGreater(len(firstStates), 5)
+        self.assertGreater(len(secondStates), 0)
+        self.assertLess(len(secondStates), len(firstStates))
+        self.assertIsNotNone(self.second.GetLatestRobotState())
+
+        self.first.StopRobotStateStream()
+        self.assertTrue(self.host.IsRobotStateStreamRunning())
+        firstStatesBefore = len(firstStates)
+        time.sleep(0.1)
+        self.assertEqual(firstStatesBefore, len(firstStates))
+
+        # the stream stops with the last app
+        self.second.Disconnect()
+        self.assertFalse(self.host.IsRobotStateStreamRunning())
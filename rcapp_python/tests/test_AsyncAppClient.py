@@ -0,0 +1,144 @@
+import asyncio
+import unittest
+
+from rcapp.AsyncAppClient import AsyncAppClient
+from rcapp.AppClient import NotConnectedException
+from rcapp.DataTypes.ProgramVariable import NumberVariable, PositionVariable
+from FakeRobotControl import FakeRobotControl
+from rcapp import robotcontrolapp_pb2
+
+
+class EchoApp(AsyncAppClient):
+    """Test app: finishes app functions after awaiting and records UI updates"""
+
+    def __init__(self, appName: str, target: str):
+        super().__init__(appName, target)
+        self.uiUpdates = asyncio.Queue()
+
+    async def _AppFunctionHandler(self, function: robotcontrolapp_pb2.AppFunction):
+        if function.name == "Fail":
+            self.SendFunctionFailed(function.call_id, "failed on purpose")
+            return
+        await asyncio.sleep(0.05 if function.name == "Slow" else 0)
+        self.SendFunctionDone(function.call_id)
+
+    async def _UiUpdateHandler(self, updates):
+        for update in updates:
+            await self.uiUpdates.put(update)
+
+
+class AsyncAppClientTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = FakeRobotControl()
+        self.target = self.server.Start()
+        self.app = EchoApp("TestAppName", self.target)
+        await self.app.Connect()
+        # WaitForApp blocks, run it outside the event loop which sends the actions
+        self.assertTrue(
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.server.WaitForApp, "TestAppName"
+            )
+        )
+
+    async def asyncTearDown(self):
+        await self.app.Disconnect()
+        self.server.Stop()
+
+    async def GetReceivedAction(self) -> robotcontrolapp_pb2.AppAction:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self.server.receivedActions.get(timeout=5)
+        )
+
+    def test_init(self):
+        appClient = AsyncAppClient("OtherApp", "localhost:5000")
+
+        self.assertEqual(appClient.VERSION_MAJOR_MIN, self.app.VERSION_MAJOR_MIN)
+        self.assertFalse(appClient.logDebug)
+        self.assertFalse(appClient.IsConnected())
+        self.assertEqual("OtherApp", appClient.GetAppName())
+
+    async def test_NotConnected(self):
+        appClient = AsyncAppClient("OtherApp", self.target)
+        with self.assertRaises(NotConnectedException):
+            await appClient.GetRobotState()
+
+    async def test_Connect(self):
+        self.assertTrue(self.app.IsConnected())
+        capabilities = self.server.capabilities.get(timeout=1)
+        self.assertEqual("TestAppName", capabilities.app_name)
+        self.assertEqual(self.app.VERSION_MAJOR_MIN, capabilities.api_version_major)
+        self.assertEqual(1, self.server.GetCallCount("GetSystemInfo"))
+
+    async def test_Variables(self):
+        await self.app.SetNumberVariable("n", 42.5)
+        await self.app.SetPositionVariableJoints("p", 1, 2, 3, 4, 5, 6, 7, 8, 9)
+
+        number = await self.app.GetNumberVariable("n")
+        self.assertIsInstance(number, NumberVariable)
+        self.assertEqual(42.5, number.value)
+        position = await self.app.GetPositionVariable("p")
+        self.assertIsInstance(position, PositionVariable)
+        self.assertEqual([1, 2, 3, 4, 5, 6], position.robotAxes)
+
+        with self.assertRaises(RuntimeError):
+            await self.app.GetProgramVariable("missing")
+        with self.assertRaises(RuntimeError):
+            await self.app.GetPositionVariable("n")
+
+    async def test_ConcurrentRequests(self):
+        self.server.rpcDelay = 0.2
+        results = await asyncio.wait_for(
+            asyncio.gather(*[self.app.GetRobotState() for _ in range(10)]), 1.5
+        )
+        self.assertEqual(10, len(results))
+
+    async def test_AppFunctions(self):
+        # The slow call must not block the second call
+        self.server.CallFunction("Slow", 1, "TestAppName")
+        self.server.CallFunction("Fast", 2, "TestAppName")
+        self.server.CallFunction("Fail", 3, "TestAppName")
+
+        doneCalls = []
+        failedCalls = []
+        while len(doneCalls) + len(failedCalls) < 3:
+            action = await self.GetReceivedAction()
+            doneCalls.extend(action.done_functions)
+            failedCalls.extend([f.call_id for f in action.failed_functions])
+        self.assertEqual([2, 1], doneCalls)
+        self.assertEqual([3], failedCalls)
+
+    async def test_UiUpdates(self):
+        event = robotcontrolapp_pb2.Event()
+        element = event.ui_updates.add()
+        element.element_name = "button"
+        self.server.SendEvent(event)
+        update = await asyncio.wait_for(self.app.uiUpdates.get(), 5)
+        self.assertEqual("button", update.element_name)
+
+        self.app.QueueSetText("label", "text")
+        self.app.QueueSetNumber("number", 5)
+        self.app.SendQueuedUIUpdates()
+        action = await self.GetReceivedAction()
+        self.assertEqual(
+            ["label", "number"], [u.element_name for u in action.ui_changes]
+        )
+
+    async def test_Files(self):
+        success, error = await self.app.UploadFileFromMemory(b"x" * 20000, "file")
+        self.assertTrue(success, error)
+        success, error, data = await self.app.DownloadFileToMemory("file")
+        self.assertTrue(success, error)
+        self.assertEqual(b"x" * 20000, data)
+        success, error, _ = await self.app.DownloadFileToMemory("missing")
+        self.assertFalse(success)
+
+    async def test_DisconnectRequest(self):
+        event = robotcontrolapp_pb2.Event()
+        event.disconnect_request.reason = "test"
+        self.server.SendEvent(event)
+        await asyncio.wait_for(self.app.WaitDisconnected(), 5)
+        self.assertFalse(self.app.IsConnected())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import grpc
+
+from rcapp.AppClient import AppClient
+from rcapp.ChannelProfile import (
+    ChannelProfile,
+    MakeLoopbackChannelProfile,
+    MakeRemoteChannelProfile,
+)
+from FakeRobotControl import FakeRobotControl
+from rcapp import robotcontrolapp_pb2
+
+
+class ProfileApp(AppClient):
+    def _AppFunctionHandler(self, function: robotcontrolapp_pb2.AppFunction):
+        pass
+
+    def _UiUpdateHandler(self, updates):
+        pass
+
+
+class ChannelProfileTest(unittest.TestCase):
+    def test_init(self):
+        profile = ChannelProfile()
+        self.assertEqual([], profile.GetChannelOptions())
+        self.assertEqual("localhost:5000", profile.GetTarget("localhost:5000"))
+        self.assertEqual(grpc.Compression.NoCompression, profile.compression)
+
+    def test_Options(self):
+        profile = ChannelProfile()
+        profile.keepaliveTimeMs = 1000
+        profile.keepaliveTimeoutMs = 500
+        profile.keepalivePermitWithoutCalls = True
+        profile.maxReceiveMessageLength = -1
+        profile.maxSendMessageLength = 1024
+        profile.unixSocketPath = "/tmp/robotcontrol.sock"
+
+        options = dict(profile.GetChannelOptions())
+        self.assertEqual(1000, options["grpc.keepalive_time_ms"])
+        self.assertEqual(500, options["grpc.keepalive_timeout_ms"])
+        self.assertEqual(1, options["grpc.keepalive_permit_without_calls"])
+        self.assertEqual(-1, options["grpc.max_receive_message_length"])
+        self.assertEqual(1024, options["grpc.max_send_message_length"])
+        self.assertEqual(
+            "unix:/tmp/robotcontrol.sock", profile.GetTarget("localhost:5000")
+        )
+
+    def test_Presets(self):
+        loopback = MakeLoopbackChannelProfile()
+        self.assertIsNone(loopback.keepaliveTimeMs)
+        self.assertEqual({}, loopback.methodCompression)
+
+        remote = MakeRemoteChannelProfile()
+        self.assertIsNotNone(remote.keepaliveTimeMs)
+        self.assertEqual(grpc.Compression.Gzip, remote.methodCompression["UploadFile"])
+
+    def test_RemoteProfile(self):
+        server = FakeRobotControl()
+        app = ProfileApp("TestAppName", server.Start(), MakeRemoteChannelProfile())
+        try:
+            app.Connect()
+            data = os.urandom(100) * 500
+            self.assertEqual((True, ""), app.UploadFileFromMemory(data, "file"))
+            self.assertEqual((True, "", data), app.DownloadFileToMemory("file"))
+        finally:
+            app.Disconnect()
+            server.Stop()
+
+    @unittest.skipIf(
+        sys.platform == "win32", "Unix domain sockets are not used on Windows"
+    )
+    def test_UnixSocket(self):
+        with tempfile.TemporaryDirectory() as directory:
+            profile = MakeLoopbackChannelProfile()
+            profile.unixSocketPath = os.path.join(directory, "robotcontrol.sock")
+            server = FakeRobotControl()
+            server.Start(unixSocketPath=profile.unixSocketPath)
+            app = ProfileApp("TestAppName", "localhost:0", profile)
+            try:
+                app.Connect()
+                self.assertTrue(server.WaitForApp("TestAppName"))
+                self.assertEqual(14, app.GetSystemInfo().versionMajor)
+            finally:
+                app.Disconnect()
+                server.Stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+
+from rcapp.FunctionParameters import (
+    FunctionParameters,
+    LoadFunctionSchemas,
+    ParameterException,
+    ParseFunctionSchemas,
+)
+from rcapp import robotcontrolapp_pb2
+
+APP_DEFINITION = """<?xml version="1.0" encoding="UTF-8"?>
+<App name="TestApp" version="1.0">
+    <function name="Move" label="Move">
+        <parameter name="target" type="string" />
+        <parameter name="speed" type="double" value="10" />
+        <parameter name="offset" type="vector3" />
+        <parameter name="position" type="cartesian" />
+    </function>
+    <function name="NoParameters" label="No parameters" />
+</App>
+"""
+
+
+def MakeFunction() -> robotcontrolapp_pb2.AppFunction:
+    function = robotcontrolapp_pb2.AppFunction(name="Move", call_id=1)
+    function.parameters.add(name="target", string_value="var1")
+    function.parameters.add(name="speed", double_value=12.5)
+    function.parameters.add(
+        name="offset", vector3_value=robotcontrolapp_pb2.Vector3(x=1, y=2, z=3)
+    )
+    matrix = function.parameters.add(name="position").cartesian_value
+    matrix.data.extend([1, 0, 0, 10, 0, 1, 0, 20, 0, 0, 1, 30, 0, 0, 0, 1])
+    function.parameters.add(name="count", int64_value=4)
+    function.parameters.add(name="enabled", bool_value=True)
+    return function
+
+
+class FunctionParametersTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.fileName = os.path.join(self.directory.name, "rcapp.xml")
+        with open(self.fileName, "w") as file:
+            file.write(APP_DEFINITION)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_TypedAccess(self):
+        parameters = FunctionParameters(MakeFunction())
+        self.assertEqual(
+            ["target", "speed", "offset", "position", "count", "enabled"],
+            parameters.GetNames(),
+        )
+        self.assertTrue(parameters.Has("speed"))
+        self.assertFalse(parameters.Has("missing"))
+        self.assertEqual("var1", parameters.GetString("target"))
+        self.assertEqual(12.5, parameters.GetDouble("speed"))
+        self.assertEqual(4.0, parameters.GetDouble("count"))
+        self.assertEqual(4, parameters.GetInt("count"))
+        self.assertTrue(parameters.GetBool("enabled"))
+        self.assertEqual("cartesian", parameters.GetType("position"))
+
+        with self.assertRaises(ParameterException):
+            parameters.GetString("speed")
+        with self.assertRaises(ParameterException):
+            parameters.GetInt("speed")
+        with self.assertRaises(ParameterException):
+            parameters.GetDouble("missing")
+
+    def test_LazyConversion(self):
+        parameters = FunctionParameters(MakeFunction())
+        vector = parameters.GetVector3("offset")
+        self.assertEqual([1, 2, 3], [vector.GetX(), vector.GetY(), vector.GetZ()])
+        self.assertIs(vector, parameters.Get("offset"))
+
+        matrix = parameters.GetMatrix44("position")
+        self.assertEqual([10, 20, 30], [matrix.GetX(), matrix.GetY(), matrix.GetZ()])
+        self.assertIs(matrix, parameters.GetMatrix44("position"))
+
+        with self.assertRaises(ParameterException):
+            parameters.GetVector3("position")
+
+    def test_ParseSchemas(self):
+        schemas = ParseFunctionSchemas(self.fileName)
+        self.assertEqual(["Move", "NoParameters"], list(schemas))
+        move = schemas["Move"]
+        self.assertEqual(
+            ["target", "speed", "offset", "position"], list(move.parameters)
+        )
+        self.assertEqual("double", move.parameters["speed"].valueType)
+        self.assertEqual("10", move.parameters["speed"].defaultValue)
+        self.assertEqual(0, len(schemas["NoParameters"].parameters))
+
+    def test_SchemaCheck(self):
+        schema = ParseFunctionSchemas(self.fileName)["Move"]
+        FunctionParameters(MakeFunction(), schema)
+
+        function = MakeFunction()
+        del function.parameters[0]
+        function.parameters[0].string_value = "fast"
+        with self.assertRaises(ParameterException) as context:
+            FunctionParameters(function, schema)
+        self.assertIn("missing parameter 'target'", str(context.exception))
+        self.assertIn(
+            "invalid parameter type 'string' for 'speed'", str(context.exception)
+        )
+
+    def test_LoadSchemasCache(self):
+        schemas = LoadFunctionSchemas(self.fileName)
+        self.assertIs(schemas, LoadFunctionSchemas(self.fileName))
+
+        with open(self.fileName, "w") as file:
+            file.write(APP_DEFINITION.replace('"NoParameters"', '"Other"'))
+        modified = os.path.getmtime(self.fileName) + 10
+        os.utime(self.fileName, (modified, modified))
+        reloaded = LoadFunctionSchemas(self.fileName)
+        self.assertIsNot(schemas, reloaded)
+        self.assertIn("Other", reloaded)
+
+        self.assertEqual(
+            {}, LoadFunctionSchemas(os.path.join(self.directory.name, "missing.xml"))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from rcapp.FunctionTracer import FunctionTracer
+from rcapp import robotcontrolapp_pb2
+
+
+def MakeFunction(
+    name: str, callId: int, **parameters
+) -> robotcontrolapp_pb2.AppFunction:
+    function = robotcontrolapp_pb2.AppFunction(name=name, call_id=callId)
+    for parameterName, value in parameters.items():
+        parameter = function.parameters.add()
+        parameter.name = parameterName
+        if isinstance(value, float):
+            parameter.double_value = value
+        else:
+            parameter.string_value = value
+    return function
+
+
+class FunctionTracerTest(unittest.TestCase):
+    def test_Metrics(self):
+        tracer = FunctionTracer()
+        tracer.Start(MakeFunction("Fast", 1))
+        tracer.Start(MakeFunction("Slow", 2))
+        tracer.Start(MakeFunction("Fast", 3))
+        tracer.Finish(1)
+        time.sleep(0.02)
+        tracer.Finish(2, "failed")
+        self.assertEqual(1, tracer.GetInFlightCount())
+
+        trace = tracer.GetTrace()
+        self.assertEqual(1, trace.functions["Fast"].calls)
+        self.assertEqual(1, trace.functions["Fast"].inFlight)
+        self.assertEqual(1, trace.functions["Slow"].calls)
+        self.assertEqual(1, trace.functions["Slow"].failed)
+        self.assertGreaterEqual(trace.functions["Slow"].latencyMax, 0.02)
+        self.assertLess(trace.functions["Fast"].latencyMax, 0.02)
+        self.assertEqual([3], [call.callId for call in trace.running])
+        self.assertEqual([2, 1], [call.callId for call in trace.slowest])
+        self.assertEqual("failed", trace.slowest[0].reason)
+
+        # unknown calls are ignored, reset keeps the running calls
+        tracer.Finish(42)
+        tracer.GetTrace(reset=True)
+        trace = tracer.GetTrace()
+        self.assertEqual(0, trace.functions["Fast"].calls)
+        self.assertEqual(1, trace.functions["Fast"].inFlight)
+        self.assertEqual([], trace.slowest)
+
+    def test_Slowest(self):
+        tracer = FunctionTracer(maxSlowestCalls=2)
+        for callId, delay in ((1, 0.05), (2, 0.15), (3, 0.0), (4, 0.1)):
+            tracer.Start(MakeFunction("Wait", callId, delay=delay, unit="s"))
+            time.sleep(delay)
+            tracer.Finish(callId)
+
+        slowest = tracer.GetTrace().slowest
+        self.assertEqual([2, 4], [call.callId for call in slowest])
+        self.assertEqual({"delay": 0.15, "unit": "s"}, slowest[0].parameters)
+
+    def test_Disabled(self):
+        tracer = FunctionTracer()
+        tracer.enabled = False
+        tracer.Start(MakeFunction("Test", 1))
+        tracer.Finish(1)
+        self.assertEqual({}, tracer.GetTrace().functions)
+
+    def test_TraceFile(self):
+        tracer = FunctionTracer(maxTraceEvents=2)
+        function = MakeFunction("Move", 1)
+        function.parameters.add(name="target").vector3_value.x = 1.5
+        tracer.Start(function)
+        tracer.Start(MakeFunction("Test", 2))
+        tracer.Finish(1)
+        tracer.Finish(2, "failed")
+        tracer.Start(MakeFunction("Test", 3))
+        tracer.Finish(3)
+        tracer.Start(MakeFunction("Running", 4))
+
+        with tempfile.TemporaryDirectory() as directory:
+            fileName = os.path.join(directory, "trace.json")
+            tracer.WriteTraceFile(fileName, "TestApp")
+            with open(fileName) as file:
+                events = json.load(file)["traceEvents"]
+
+        self.assertEqual("TestApp", events[0]["args"]["name"])
+        calls = events[1:]
+        # the oldest call was dropped from the buffer
+        self.assertEqual(["Test", "Test", "Running"], [e["name"] for e in calls])
+        self.assertEqual("failed", calls[0]["args"]["failed"])
+        self.assertTrue(all(e["ph"] == "X" and e["dur"] >= 0 for e in calls))
+        # calls running at the same time use different rows
+        self.assertEqual(1, calls[0]["tid"])
+        self.assertEqual(0, calls[1]["tid"])
+
+    def test_ParameterTypes(self):
+        function = MakeFunction("Test", 1)
+        function.parameters.add(name="flag").bool_value = True
+        function.parameters.add(name="count").int64_value = 3
+        function.parameters.add(name="pose").cartesian_value.data.extend([1.0, 2.0])
+        tracer = FunctionTracer()
+        tracer.Start(function)
+        tracer.Finish(1)
+        self.assertEqual(
+            {"flag": True, "count": 3, "pose": [1.0, 2.0]},
+            tracer.GetTrace().slowest[0].parameters,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from rcapp.HandlerRegistry import (
+    HandlerRegistry,
+    MODE_POOL,
+    MODE_SYNC,
+    UI_CHECKBOX,
+    UI_TEXTFIELD,
+    app_function,
+    ui_event,
+)
+from rcapp import robotcontrolapp_pb2
+
+
+class RecordingApp:
+    """Stands in for an AppClient with registered handlers"""
+
+    functionDispatcher = None
+
+    def __init__(self):
+        self.calls = []
+        self.failed = []
+        self.done = threading.Event()
+
+    def IsConnected(self) -> bool:
+        return True
+
+    def SendFunctionFailed(self, callId: int, reason: str):
+        self.failed.append((callId, reason))
+
+    @app_function("add")
+    def Add(self, function):
+        self.calls.append(("add", function.call_id, threading.current_thread().name))
+
+    @app_function("fail")
+    def Fail(self, function):
+        raise RuntimeError("test error")
+
+    @app_function("pooled", MODE_POOL)
+    def Pooled(self, function):
+        self.calls.append(("pooled", threading.current_thread().name))
+        self.done.set()
+
+    @app_function("async")
+    async def Async(self, function):
+        await asyncio.sleep(0.01)
+        self.calls.append(("async", function.call_id))
+        self.done.set()
+
+    @ui_event("buttonA")
+    @ui_event("buttonB")
+    def OnButton(self, update):
+        self.calls.append(("clicked", update.element_name))
+
+    @ui_event("textA", UI_TEXTFIELD)
+    def OnText(self, update):
+        self.calls.append(("text", update.state.textfield_state.current_text))
+
+
+def MakeFunction(name: str, callId: int = 1) -> robotcontrolapp_pb2.AppFunction:
+    return robotcontrolapp_pb2.AppFunction(name=name, call_id=callId)
+
+
+def MakeButton(name: str, clicked: bool = True) -> robotcontrolapp_pb2.AppUIElement:
+    update = robotcontrolapp_pb2.AppUIElement(element_name=name)
+    update.state.button_state = (
+        robotcontrolapp_pb2.ButtonState.CLICKED
+        if clicked
+        else robotcontrolapp_pb2.ButtonState.NOT_CLICKED
+    )
+    return update
+
+
+class HandlerRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.app = RecordingApp()
+        self.registry = HandlerRegistry(RecordingApp)
+
+    def tearDown(self):
+        self.registry.Shutdown()
+
+    def test_Functions(self):
+        self.assertTrue(self.registry.HasFunctionHandlers())
+        self.assertTrue(
+            self.registry.DispatchFunction(self.app, MakeFunction("add", 3))
+        )
+        self.assertEqual([("add", 3, threading.current_thread().name)], self.app.calls)
+        self.assertFalse(self.registry.DispatchFunction(self.app, MakeFunction("x")))
+
+        # exceptions let the call fail
+        self.assertTrue(
+            self.registry.DispatchFunction(self.app, MakeFunction("fail", 4))
+        )
+        self.assertEqual([(4, "RuntimeError('test error')")], self.app.failed)
+
+        metrics = self.registry.GetMetrics(reset=True)
+        self.assertEqual(1, metrics["Add"].calls)
+        self.assertEqual(0, metrics["Add"].errors)
+        self.assertEqual(1, metrics["Fail"].errors)
+        self.assertEqual({}, self.registry.GetMetrics())
+
+    def test_Modes(self):
+        self.registry.DispatchFunction(self.app, MakeFunction("pooled"))
+        self.assertTrue(self.app.done.wait(5))
+        self.assertTrue(self.app.calls[0][1].startswith("EventHandler"))
+
+        self.app.done.clear()
+        self.registry.DispatchFunction(self.app, MakeFunction("async", 5))
+        self.assertTrue(self.app.done.wait(5))
+        self.assertEqual(("async", 5), self.app.calls[1])
+        endTime = time.time() + 5
+        while "Async" not in self.registry.GetMetrics() and time.time() < endTime:
+            time.sleep(0.01)
+        self.assertGreaterEqual(self.registry.GetMetrics()["Async"].latencyMax, 0.01)
+
+    def test_UIEvents(self):
+        text = robotcontrolapp_pb2.AppUIElement(element_name="textA")
+        text.state.textfield_state.current_text = "hello"
+        checkbox = robotcontrolapp_pb2.AppUIElement(element_name="buttonA")
+        checkbox.state.checkbox_state = robotcontrolapp_pb2.CheckboxState.CHECKED
+        released = MakeButton("buttonB", False)
+        unhandled = self.registry.DispatchUIEvents(
+            self.app,
+            [MakeButton("buttonB"), text, MakeButton("buttonA"), checkbox, released],
+        )
+        self.assertEqual(
+            [("clicked", "buttonB"), ("text", "hello"), ("clicked", "buttonA")],
+            self.app.calls,
+        )
+        self.assertEqual([checkbox, released], unhandled)
+        self.assertEqual(2, self.registry.GetMetrics()["OnButton"].calls)
+
+    def test_NoHandlers(self):
+        registry = HandlerRegistry(object)
+        updates = [MakeButton("buttonA")]
+        self.assertIs(updates, registry.DispatchUIEvents(self.app, updates))
+        self.assertFalse(registry.HasUIHandlers())
+        self.assertFalse(registry.DispatchFunction(self.app, MakeFunction("add")))
+
+    def test_Overrides(self):
+        class DerivedApp(RecordingApp):
+            # overriding without decorator removes the handler
+            def Add(self, function):
+                pass
+
+            @ui_event("check", UI_CHECKBOX, MODE_SYNC)
+            def OnCheck(self, update):
+                pass
+
+        registry = HandlerRegistry(DerivedApp)
+        self.assertFalse(registry.DispatchFunction(DerivedApp(), MakeFunction("add")))
+        self.assertTrue(registry.DispatchFunction(DerivedApp(), MakeFunction("fail")))
+
+    def test_InvalidRegistrations(self):
+        with self.assertRaises(RuntimeError):
+            app_function("test", "unknown")
+        with self.assertRaises(RuntimeError):
+            app_function("test", MODE_SYNC)(RecordingApp.Async)
+
+        class DuplicateApp:
+            @app_function("test")
+            def A(self, function):
+                pass
+
+            @app_function("test")
+            def B(self, function):
+                pass
+
+        with self.assertRaises(RuntimeError):
+            HandlerRegistry(DuplicateApp)
+
+
+if __name__ == "__main__":
+    unittest.main()
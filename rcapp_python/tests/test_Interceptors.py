@@ -0,0 +1,107 @@
+import threading
+import unittest
+
+import grpc
+
+from rcapp.Interceptors import (
+    ClientCallDetails,
+    DeadlineInterceptor,
+    GetMethodName,
+    MethodCompressionInterceptor,
+)
+
+
+def MakeDetails(method: str) -> ClientCallDetails:
+    return ClientCallDetails(
+        "/robotcontrolapp.RobotControlApp/" + method, None, None, None, None, None
+    )
+
+
+class FakeCall:
+    """Stands in for a running gRPC call"""
+
+    def __init__(self, details, request):
+        self.details = details
+        self.cancelled = False
+        self.callbacks = []
+
+    def done(self):
+        return self.cancelled
+
+    def cancel(self):
+        self.cancelled = True
+        for callback in self.callbacks:
+            callback(self)
+        return True
+
+    def add_done_callback(self, callback):
+        self.callbacks.append(callback)
+
+
+class InterceptorsTest(unittest.TestCase):
+    def test_GetMethodName(self):
+        self.assertEqual("GetTCP", GetMethodName(MakeDetails("GetTCP")))
+
+    def test_MethodCompression(self):
+        interceptor = MethodCompressionInterceptor(
+            {"UploadFile": grpc.Compression.Gzip}
+        )
+        calls = []
+
+        def Continuation(details, request):
+            calls.append(details)
+
+        interceptor.intercept_stream_unary(
+            Continuation, MakeDetails("UploadFile"), iter([])
+        )
+        interceptor.intercept_unary_unary(Continuation, MakeDetails("GetTCP"), None)
+        self.assertEqual(grpc.Compression.Gzip, calls[0].compression)
+        self.assertIsNone(calls[1].compression)
+
+    def test_Timeouts(self):
+        interceptor = DeadlineInterceptor(5)
+        interceptor.methodTimeouts["GetTCP"] = 1
+
+        call = interceptor.intercept_unary_unary(FakeCall, MakeDetails("GetTCP"), None)
+        self.assertEqual(1, call.details.timeout)
+        call = interceptor.intercept_unary_stream(
+            FakeCall, MakeDetails("GetProgramVariables"), None
+        )
+        self.assertEqual(5, call.details.timeout)
+        call = interceptor.intercept_stream_stream(
+            FakeCall, MakeDetails("RecieveActions"), iter([])
+        )
+        self.assertIsNone(call.details.timeout)
+
+        # The override applies to the current thread only
+        overrideTimeouts = []
+        with interceptor.Timeout(0.5):
+            overrideTimeouts.append(interceptor.GetTimeout("GetTCP"))
+            thread = threading.Thread(
+                target=lambda: overrideTimeouts.append(interceptor.GetTimeout("GetTCP"))
+            )
+            thread.start()
+            thread.join()
+            with interceptor.Timeout(None):
+                overrideTimeouts.append(interceptor.GetTimeout("GetTCP"))
+        overrideTimeouts.append(interceptor.GetTimeout("GetTCP"))
+        self.assertEqual([0.5, 1, None, 1], overrideTimeouts)
+
+    def test_CancelAll(self):
+        interceptor = DeadlineInterceptor()
+        download = interceptor.intercept_unary_stream(
+            FakeCall, MakeDetails("DownloadFile"), None
+        )
+        actions = interceptor.intercept_stream_stream(
+            FakeCall, MakeDetails("RecieveActions"), iter([])
+        )
+        self.assertEqual(1, interceptor.GetRunningCallCount())
+
+        self.assertEqual(1, interceptor.CancelAll())
+        self.assertTrue(download.cancelled)
+        self.assertFalse(actions.cancelled)
+        self.assertEqual(0, interceptor.GetRunningCallCount())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import io
+import threading
+import unittest
+
+from rcapp.Log import Logger, LEVEL_DEBUG, LEVEL_ERROR, LEVEL_INFO, LEVEL_WARNING
+
+
+class Expensive:
+    """Counts how often it is formatted"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "expensive"
+
+
+class LogTest(unittest.TestCase):
+    def setUp(self):
+        self.stdout = io.StringIO()
+        self.stderr = io.StringIO()
+        self.logger = Logger(
+            capacity=64, flushInterval=10, stdout=self.stdout, stderr=self.stderr
+        )
+
+    def tearDown(self):
+        self.logger.Stop()
+
+    def test_LevelsAndStreams(self):
+        log = self.logger.GetSubsystem("App.connection")
+        log.Debug("hidden %d", 1)
+        log.Info("connected to '%s'", "localhost")
+        log.Warning("lost connection")
+        self.logger.Flush()
+
+        self.assertNotIn("hidden", self.stdout.getvalue())
+        self.assertIn(
+            "INFO [App.connection] connected to 'localhost'", self.stdout.getvalue()
+        )
+        self.assertIn(
+            "WARNING [App.connection] lost connection", self.stderr.getvalue()
+        )
+        self.assertNotIn("lost connection", self.stdout.getvalue())
+
+    def test_HierarchicalLevels(self):
+        self.logger.SetLevel("App", LEVEL_DEBUG)
+        self.logger.SetLevel("App.events", LEVEL_WARNING)
+        self.assertEqual(self.logger.GetLevel("App.connection"), LEVEL_DEBUG)
+        self.assertEqual(self.logger.GetLevel("App.events"), LEVEL_WARNING)
+        self.assertEqual(self.logger.GetLevel("App.events.ui"), LEVEL_WARNING)
+        self.assertEqual(self.logger.GetLevel("Other"), LEVEL_INFO)
+
+        self.logger.SetLevel("App.events", None)
+        self.assertEqual(self.logger.GetLevel("App.events"), LEVEL_DEBUG)
+        self.assertTrue(self.logger.GetSubsystem("App.events").IsEnabled(LEVEL_DEBUG))
+
+    def test_LazyFormatting(self):
+        value = Expensive()
+        log = self.logger.GetSubsystem("App")
+        log.Debug("value %s", value)
+        self.logger.Flush()
+        self.assertEqual(value.formatted, 0)
+
+        log.Info("value %s", value)
+        self.logger.Flush()
+        self.assertEqual(value.formatted, 1)
+        self.assertIn("value expensive", self.stdout.getvalue())
+
+        # Invalid format strings do not raise
+        log.Info("missing %d %d", 1)
+        self.logger.Flush()
+        self.assertIn("missing %d %d (1,)", self.stdout.getvalue())
+
+    def test_HiddenRecordsWrittenBeforeError(self):
+        log = self.logger.GetSubsystem("App")
+        for i in range(30):
+            log.Debug("step %d", i)
+        log.Error("failed")
+        self.logger.Flush()
+
+        output = self.stderr.getvalue()
+        self.assertIn("--- 20 records before the error ---", output)
+        self.assertNotIn("step 9\n", output)
+        self.assertIn("step 10\n", output)
+        self.assertIn("step 29\n", output)
+        self.assertLess(output.index("step 29"), output.index("ERROR [App] failed"))
+
+        # The dumped records are not written again with the next error
+        log.Error("failed again")
+        self.logger.Flush()
+        self.assertEqual(self.stderr.getvalue().count("step 29"), 1)
+
+    def test_DroppedRecords(self):
+        log = self.logger.GetSubsystem("App")
+        for i in range(100):
+            log.Info("record %d", i)
+        self.logger.Flush()
+
+        self.assertEqual(self.logger.GetDroppedCount(), 36)
+        self.assertNotIn("record 35\n", self.stdout.getvalue())
+        self.assertIn("record 36\n", self.stdout.getvalue())
+        self.assertIn("record 99\n", self.stdout.getvalue())
+
+    def test_GetRecordsAndDump(self):
+        log = self.logger.GetSubsystem("App")
+        log.Debug("first")
+        log.Info("second")
+        log.Error("third")
+
+        records = self.logger.GetRecords(2)
+        self.assertEqual([record.message for record in records], ["second", "third"])
+        self.assertEqual(records[1].level, LEVEL_ERROR)
+        self.assertEqual(records[1].threadName, threading.current_thread().name)
+
+        stream = io.StringIO()
+        self.logger.Dump(10, stream)
+        self.assertIn("--- last 3 log records ---", stream.getvalue())
+        self.assertIn("DEBUG [App] first", stream.getvalue())
+
+    def test_ConcurrentLogging(self):
+        logger = Logger(capacity=10000, stdout=self.stdout, stderr=self.stderr)
+        log = logger.GetSubsystem("App")
+
+        def Run(thread: int):
+            for i in range(1000):
+                log.Info("thread %d record %d", thread, i)
+
+        threads = [threading.Thread(target=Run, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.Stop()
+
+        self.assertEqual(logger.GetDroppedCount(), 0)
+        self.assertEqual(self.stdout.getvalue().count("\n"), 4000)
+
+
+if __name__ == "__main__":
+    unittest.main()
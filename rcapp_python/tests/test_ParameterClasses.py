@@ -0,0 +1,188 @@
+import os
+import tempfile
+import unittest
+
+from rcapp.FunctionParameters import ParameterException, ParseFunctionSchemas
+from rcapp.HandlerRegistry import HandlerRegistry, app_function
+from rcapp.ParameterClasses import (
+    CheckParameterClass,
+    GenerateHandlerStubs,
+    LoadParameterClasses,
+)
+from rcapp import robotcontrolapp_pb2
+
+APP_DEFINITION = """<?xml version="1.0" encoding="UTF-8"?>
+<App name="TestApp" version="1.0">
+    <function name="copy_position" label="Copy &quot;position&quot;">
+        <parameter name="from" type="string" label="From variable" />
+        <parameter name="copy_x" type="bool" value="true" />
+        <parameter name="count" type="int" value="3" />
+        <parameter name="offset" type="vector3" />
+        <parameter name="position" type="cartesian" />
+    </function>
+    <function name="untyped">
+        <parameter name="value" type="custom" />
+    </function>
+</App>
+"""
+
+
+def MakeFunction(reverse: bool = False) -> robotcontrolapp_pb2.AppFunction:
+    function = robotcontrolapp_pb2.AppFunction(name="copy_position", call_id=1)
+    function.parameters.add(name="from", string_value="var1")
+    function.parameters.add(name="copy_x", bool_value=False)
+    function.parameters.add(name="count", int64_value=7)
+    function.parameters.add(
+        name="offset", vector3_value=robotcontrolapp_pb2.Vector3(x=1, y=2, z=3)
+    )
+    matrix = function.parameters.add(name="position").cartesian_value
+    matrix.data.extend([1, 0, 0, 10, 0, 1, 0, 20, 0, 0, 1, 30, 0, 0, 0, 1])
+    if reverse:
+        parameters = list(reversed(function.parameters))
+        del function.parameters[:]
+        function.parameters.extend(parameters)
+    return function
+
+
+class TypedApp:
+    """Stands in for an AppClient with typed handlers"""
+
+    functionDispatcher = None
+
+    def __init__(self):
+        self.received = []
+        self.failed = []
+
+    def IsConnected(self) -> bool:
+        return True
+
+    def SendFunctionFailed(self, callId: int, reason: str):
+        self.failed.append((callId, reason))
+
+    @app_function("copy_position")
+    def CopyPosition(self, function, parameters):
+        self.received.append(parameters)
+
+    @app_function("untyped")
+    def Untyped(self, function):
+        pass
+
+
+class UndeclaredApp(TypedApp):
+    @app_function("undeclared")
+    def Undeclared(self, function):
+        pass
+
+
+class ParameterClassesTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.fileName = os.path.join(self.directory.name, "rcapp.xml")
+        self.cacheDirectory = os.path.join(self.directory.name, "cache")
+        with open(self.fileName, "w") as file:
+            file.write(APP_DEFINITION)
+        self.classes = LoadParameterClasses(self.fileName, self.cacheDirectory)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_Decode(self):
+        cls = self.classes["copy_position"]
+        self.assertEqual("CopyPositionParameters", cls.__name__)
+        defaults = cls()
+        self.assertEqual(
+            ("", True, 3), (defaults.from_, defaults.copy_x, defaults.count)
+        )
+
+        for function in (MakeFunction(), MakeFunction(reverse=True)):
+            parameters = cls.FromGrpc(function)
+            self.assertEqual("var1", parameters.from_)
+            self.assertFalse(parameters.copy_x)
+            self.assertEqual(7, parameters.count)
+            self.assertEqual(2, parameters.offset.GetY())
+            self.assertEqual(30, parameters.position.GetZ())
+
+        function = MakeFunction()
+        function.parameters[2].double_value = 1.5
+        del function.parameters[0]
+        with self.assertRaises(ParameterException) as context:
+            cls.FromGrpc(function)
+        self.assertIn("missing parameter 'from'", str(context.exception))
+        self.assertIn(
+            "invalid parameter type 'double' for 'count'", str(context.exception)
+        )
+
+        # parameters of unknown types are not checked
+        untyped = robotcontrolapp_pb2.AppFunction(name="untyped")
+        untyped.parameters.add(name="value", string_value="text")
+        self.assertEqual("text", self.classes["untyped"].FromGrpc(untyped).value)
+
+    def test_Cache(self):
+        self.assertIs(
+            self.classes, LoadParameterClasses(self.fileName, self.cacheDirectory)
+        )
+        self.assertEqual(1, len(os.listdir(self.cacheDirectory)))
+
+        with open(self.fileName, "w") as file:
+            file.write(APP_DEFINITION.replace('"untyped"', '"other"'))
+        modified = os.path.getmtime(self.fileName) + 10
+        os.utime(self.fileName, (modified, modified))
+        reloaded = LoadParameterClasses(self.fileName, self.cacheDirectory)
+        self.assertEqual(["copy_position", "other"], list(reloaded))
+        self.assertEqual(2, len(os.listdir(self.cacheDirectory)))
+
+        # a partially written cache file is generated again
+        for cacheFile in os.listdir(self.cacheDirectory):
+            with open(os.path.join(self.cacheDirectory, cacheFile), "r+") as file:
+                file.truncate(100)
+        os.utime(self.fileName, (modified + 10, modified + 10))
+        reloaded = LoadParameterClasses(self.fileName, self.cacheDirectory)
+        self.assertEqual(["copy_position", "other"], list(reloaded))
+        self.assertIs(
+            reloaded, LoadParameterClasses(self.fileName, self.cacheDirectory)
+        )
+        self.assertEqual(2, len(os.listdir(self.cacheDirectory)))
+
+    def test_CheckParameterClass(self):
+        cls = self.classes["copy_position"]
+        self.assertIsNone(CheckParameterClass(cls, cls))
+        self.assertIn("belongs to", CheckParameterClass(self.classes["untyped"], cls))
+        self.assertIn("not a generated", CheckParameterClass(int, cls))
+
+        with open(self.fileName, "w") as file:
+            file.write(APP_DEFINITION.replace('type="int"', 'type="double"'))
+        modified = os.path.getmtime(self.fileName) + 10
+        os.utime(self.fileName, (modified, modified))
+        changed = LoadParameterClasses(self.fileName, self.cacheDirectory)
+        self.assertIn(
+            "generate it again", CheckParameterClass(cls, changed["copy_position"])
+        )
+
+    def test_HandlerStubs(self):
+        source = GenerateHandlerStubs(ParseFunctionSchemas(self.fileName), "StubApp")
+        self.assertIn(
+            "def CopyPosition(self, function: AppFunction, parameters: CopyPositionParameters):",
+            source,
+        )
+        compile(source, "stubs", "exec")
+
+    def test_TypedHandlers(self):
+        registry = HandlerRegistry(TypedApp)
+        self.assertEqual([], registry.BindParameterClasses(self.classes))
+        app = TypedApp()
+        self.assertTrue(registry.DispatchFunction(app, MakeFunction()))
+        self.assertEqual("var1", app.received[0].from_)
+
+        function = MakeFunction()
+        del function.parameters[0]
+        registry.DispatchFunction(app, function)
+        self.assertEqual(1, len(app.failed))
+        self.assertIn("missing parameter 'from'", app.failed[0][1])
+
+        errors = HandlerRegistry(UndeclaredApp).BindParameterClasses(self.classes)
+        self.assertEqual(1, len(errors))
+        self.assertIn("'undeclared' which is not declared", errors[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import time
+import unittest
+
+import grpc
+
+from rcapp.AppClient import AppClient
+from FakeRobotControl import FakeRobotControl
+from rcapp.RobotControlProxy import RobotControlProxy
+from rcapp import robotcontrolapp_pb2
+
+
+class ProxiedApp(AppClient):
+    """Test app: finishes all app function calls"""
+
+    def _AppFunctionHandler(self, function: robotcontrolapp_pb2.AppFunction):
+        self.SendFunctionDone(function.call_id)
+
+    def _UiUpdateHandler(self, updates):
+        pass
+
+
+class RobotControlProxyTest(unittest.TestCase):
+    def setUp(self):
+        self.server = FakeRobotControl()
+        self.proxy = RobotControlProxy(self.server.Start())
+        self.target = self.proxy.Start()
+        self.apps = []
+
+    def tearDown(self):
+        for app in self.apps:
+            app.Disconnect()
+        self.proxy.Stop()
+        self.server.Stop()
+
+    def ConnectApp(self, appName: str) -> ProxiedApp:
+        """Connects an app to the proxy"""
+        app = ProxiedApp(appName, self.target)
+        self.apps.append(app)
+        app.Connect()
+        return app
+
+    def test_PassThrough(self):
+        app = self.ConnectApp("ProxiedApp")
+        self.assertTrue(self.server.WaitForApp("ProxiedApp"))
+        self.assertEqual("ProxiedApp", self.server.capabilities.get(timeout=1).app_name)
+
+        # the actions stream is passed through in both directions
+        self.server.CallFunction("Test", 1, "ProxiedApp")
+        action = self.server.receivedActions.get(timeout=5)
+        self.assertEqual([1], list(action.done_functions))
+
+        app.SetNumberVariable("number", 42)
+        self.assertEqual(42, app.GetNumberVariable("number").value)
+        self.assertEqual(1, self.server.GetCallCount("SetProgramVariables"))
+
+        # errors of the robot control are passed to the client
+        with self.assertRaises(RuntimeError):
+            app.GetNumberVariable("unknown")
+        self.assertGreater(self.proxy.GetStatistics().passedThrough, 3)
+
+    def test_Cache(self):
+        self.proxy.cacheTtls["GetSystemInfo"] = 0.2
+        first = self.ConnectApp("FirstApp")
+        second = self.ConnectApp("SecondApp")
+        systemInfoCalls = self.server.GetCallCount("GetSystemInfo")
+        self.assertEqual(1, systemInfoCalls)
+
+        for _ in range(5):
+            self.assertEqual(14, first.GetSystemInfo().versionMajor)
+            self.assertEqual(14, second.GetSystemInfo().versionMajor)
+            second.GetLicenseInfo()
+        self.assertEqual(1, self.server.GetCallCount("GetSystemInfo"))
+        self.assertEqual(1, self.server.GetCallCount("GetLicensedFeatures"))
+
+        # the response is requested again when it expired
+        self.server.systemInfo.version_minor = 7
+        time.sleep(0.25)
+        self.assertEqual(7, first.GetSystemInfo().versionMinor)
+        self.assertEqual(2, self.server.GetCallCount("GetSystemInfo"))
+        statistics = self.proxy.GetStatistics()
+        self.assertEqual(3, statistics.cacheMisses)
+        self.assertEqual(15, statistics.cacheHits)
+
+        self.proxy.ClearCache()
+        first.GetSystemInfo()
+        self.assertEqual(3, self.server.GetCallCount("GetSystemInfo"))
+
+    def test_RobotStateStream(self):
+        apps = [self.ConnectApp(f"App{i}") for i in range(3)]
+        states = [[] for _ in apps]
+        for app, appStates in zip(apps, states):
+            app.SubscribeRobotState(appStates.append)
+            app.StartRobotStateStream()
+        time.sleep(0.3)
+
+        # one upstream stream for all apps
+        self.assertEqual(1, self.server.GetCallCount("GetRobotStateStream"))
+        for appStates in states:
+            self.assertGreater(len(appStates), 5)
+        statistics = self.proxy.GetStatistics()
+        self.assertEqual(3, statistics.stateSubscribers)
+        self.assertEqual(1, statistics.upstreamStateStreams)
+
+        # polling is answered from the stream
+        self.server.robotState.velocity_override = 0.5
+        time.sleep(0.05)
+        self.assertEqual(0.5, apps[0].GetRobotState().velocityOverride)
+        self.assertEqual(0, self.server.GetCallCount("GetRobotState"))
+
+        # the upstream stream is closed with the last subscriber
+        for app in apps:
+            app.StopRobotStateStream()
+        time.sleep(0.1)
+        self.assertEqual(0, self.proxy.GetStatistics().stateSubscribers)
+        apps[0].GetRobotState()
+        self.assertEqual(1, self.server.GetCallCount("GetRobotState"))
+
+        apps[1].StartRobotStateStream()
+        time.sleep(0.1)
+        self.assertEqual(2, self.server.GetCallCount("GetRobotStateStream"))
+
+    def test_UpstreamUnavailable(self):
+        self.server.Stop()
+        channel = grpc.insecure_channel(self.target)
+        try:
+            with self.assertRaises(grpc.RpcError) as context:
+                channel.unary_unary("/robotcontrolapp.RobotControlApp/GetTCP")(
+                    b"", timeout=1
+                )
+            self.assertEqual(grpc.StatusCode.UNAVAILABLE, context.exception.code())
+        finally:
+            channel.close()
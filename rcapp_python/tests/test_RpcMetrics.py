@@ -0,0 +1,149 @@
+import unittest
+
+import grpc
+
+from rcapp.Interceptors import ClientCallDetails
+from rcapp.RpcMetrics import LatencyHistogram, MetricsInterceptor
+from rcapp import robotcontrolapp_pb2
+
+
+def MakeDetails(method: str) -> ClientCallDetails:
+    return ClientCallDetails(
+        "/robotcontrolapp.RobotControlApp/" + method, None, None, None, None, None
+    )
+
+
+class FakeOutcome:
+    """Stands in for a finished unary call"""
+
+    def __init__(self, response=None, error: Exception = None):
+        self.response = response
+        self.error = error
+
+    def cancelled(self):
+        return False
+
+    def exception(self):
+        return self.error
+
+    def result(self):
+        return self.response
+
+    def add_done_callback(self, callback):
+        callback(self)
+
+
+class FakeStream(FakeOutcome):
+    """Stands in for a finished response stream"""
+
+    def __init__(self, responses: list):
+        super().__init__()
+        self.responses = iter(responses)
+
+    def __next__(self):
+        return next(self.responses)
+
+
+class RpcMetricsTest(unittest.TestCase):
+    def test_Histogram(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(0, histogram.GetPercentile(50))
+        for i in range(1, 101):
+            histogram.Record(i * 0.001)
+
+        self.assertEqual(100, histogram.GetCount())
+        self.assertAlmostEqual(0.0505, histogram.GetMean())
+        self.assertEqual(0.1, histogram.GetMax())
+        # accurate to the bucket width
+        self.assertAlmostEqual(0.05, histogram.GetPercentile(50), delta=0.01)
+        self.assertAlmostEqual(0.095, histogram.GetPercentile(95), delta=0.02)
+        self.assertLessEqual(histogram.GetPercentile(99), 0.1)
+
+        histogram.Record(1000)
+        self.assertEqual(1000, histogram.GetPercentile(100))
+
+    def test_Unary(self):
+        interceptor = MetricsInterceptor()
+        request = robotcontrolapp_pb2.SystemInfoRequest(app_name="app")
+        response = robotcontrolapp_pb2.SystemInfo(version="14.6.7")
+
+        interceptor.intercept_unary_unary(
+            lambda details, request: FakeOutcome(response),
+            MakeDetails("GetSystemInfo"),
+            request,
+        )
+        interceptor.intercept_unary_unary(
+            lambda details, request: FakeOutcome(error=grpc.RpcError()),
+            MakeDetails("GetSystemInfo"),
+            request,
+        )
+
+        metrics = interceptor.GetMetrics(reset=True).methods["GetSystemInfo"]
+        self.assertEqual(2, metrics.calls)
+        self.assertEqual(1, metrics.errors)
+        self.assertEqual(2 * request.ByteSize(), metrics.requestBytes)
+        self.assertEqual(response.ByteSize(), metrics.responseBytes)
+        self.assertGreater(metrics.latencyP99, 0)
+        self.assertEqual({}, interceptor.GetMetrics().methods)
+
+    def test_Streams(self):
+        interceptor = MetricsInterceptor()
+        actions = [
+            robotcontrolapp_pb2.AppAction(app_name="app"),
+            robotcontrolapp_pb2.AppAction(app_name="app2"),
+        ]
+        events = [robotcontrolapp_pb2.Event()]
+        events[0].function.name = "Function"
+
+        def Continuation(details, requests):
+            # the requests are counted when they are consumed
+            list(requests)
+            return FakeStream(events)
+
+        stream = interceptor.intercept_stream_stream(
+            Continuation, MakeDetails("RecieveActions"), iter(actions)
+        )
+        self.assertEqual(events, list(stream))
+        self.assertFalse(stream.cancelled())
+
+        metrics = interceptor.GetMetrics().methods["RecieveActions"]
+        self.assertEqual(1, metrics.calls)
+        self.assertEqual(sum(a.ByteSize() for a in actions), metrics.requestBytes)
+        self.assertEqual(events[0].ByteSize(), metrics.responseBytes)
+        # long lived streams have no latency
+        self.assertEqual(0, metrics.latencyMax)
+
+    def test_ActionQueueDepth(self):
+        interceptor = MetricsInterceptor()
+        interceptor.RecordActionQueueDepth(5)
+        interceptor.RecordActionQueueDepth(2)
+        metrics = interceptor.GetMetrics(reset=True)
+        self.assertEqual(2, metrics.actionQueueDepth)
+        self.assertEqual(5, metrics.maxActionQueueDepth)
+        self.assertEqual(2, interceptor.GetMetrics().maxActionQueueDepth)
+        self.assertEqual(5, metrics.ToDict()["maxActionQueueDepth"])
+
+    def test_ActionLanes(self):
+        interceptor = MetricsInterceptor()
+        interceptor.RecordActionSent("functions", 0.001, 10)
+        interceptor.RecordActionSent("functions", 0.003, 20)
+        lane = interceptor.GetMetrics(reset=True).actionLanes["functions"]
+        self.assertEqual(2, lane.actions)
+        self.assertEqual(30, lane.bytes)
+        self.assertAlmostEqual(0.002, lane.latencyMean)
+        self.assertEqual(0.003, lane.latencyMax)
+        self.assertEqual({}, interceptor.GetMetrics().actionLanes)
+
+    def test_Disabled(self):
+        interceptor = MetricsInterceptor()
+        interceptor.enabled = False
+        interceptor.intercept_unary_unary(
+            lambda details, request: FakeOutcome(),
+            MakeDetails("GetTCP"),
+            robotcontrolapp_pb2.SystemInfoRequest(),
+        )
+        self.assertEqual({}, interceptor.GetMetrics().methods)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from FakeRobotControl import FakeRobotControl
+from rcapp.StartupProfiler import (
+    PHASE_CONNECT,
+    PHASE_FIRST_EVENT,
+    PHASE_IMPORT_CLIENT,
+    PHASE_IMPORT_DATATYPES,
+    PHASE_IMPORT_GRPC,
+    PHASE_IMPORT_MESSAGES,
+    PHASE_IMPORT_PROTOBUF,
+    PHASE_TOTAL,
+    StartupProfiler,
+    StartupReport,
+)
+from rcapp import robotcontrolapp_pb2
+
+STARTUP_BUDGETS = {
+    PHASE_TOTAL: float(os.environ.get("RCAPP_STARTUP_BUDGET", 5.0)),
+    PHASE_CONNECT: 1.0,
+    PHASE_FIRST_EVENT: 1.0,
+}
+"""Startup budget in s by phase, the total can be set by the environment variable RCAPP_STARTUP_BUDGET"""
+
+
+class StartupProfilerTest(unittest.TestCase):
+    def test_Phase(self):
+        profiler = StartupProfiler("TestApp")
+        with profiler.Phase("sleep"):
+            time.sleep(0.05)
+        with self.assertRaises(ValueError):
+            with profiler.Phase("failed"):
+                raise ValueError("test")
+        report = profiler.Finish()
+        self.assertGreaterEqual(report.GetDuration("sleep"), 0.05)
+        self.assertIsNotNone(report.GetDuration("failed"))
+        self.assertIsNone(report.GetDuration("unknown"))
+        self.assertGreaterEqual(report.GetDuration(PHASE_TOTAL), 0.05)
+        self.assertIsNone(report.connectTiming)
+        self.assertIn("sleep", report.ToString())
+
+    def test_ImportModules(self):
+        StartupProfiler("TestApp").ImportModules()
+        # everything was imported before, the phases are marked as preloaded
+        profiler = StartupProfiler("TestApp")
+        profiler.ImportModules()
+        report = profiler.Finish()
+        for name in [
+            PHASE_IMPORT_GRPC,
+            PHASE_IMPORT_PROTOBUF,
+            PHASE_IMPORT_MESSAGES,
+            PHASE_IMPORT_DATATYPES,
+            PHASE_IMPORT_CLIENT,
+        ]:
+            phase = next(phase for phase in report.phases if phase.name == name)
+            self.assertTrue(phase.preloaded, name)
+        self.assertIn("(imported before)", report.ToString())
+
+    def test_GetExceeded(self):
+        report = StartupProfiler("TestApp").Finish()
+        report.total = 2.0
+        self.assertEqual([], report.GetExceeded({PHASE_TOTAL: 3.0, "unknown": 0.0}))
+        self.assertEqual(
+            ["total took 2000.0ms, budget 1000.0ms"],
+            report.GetExceeded({PHASE_TOTAL: 1.0}),
+        )
+
+    def test_StartupBudget(self):
+        """Starts an app in a new interpreter and checks its startup against the budget"""
+        server = FakeRobotControl()
+        target = server.Start()
+        reportFile = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
+        reportFile.close()
+
+        def SendFirstEvent():
+            if server.WaitForApp("StartupApp", 30):
+                event = robotcontrolapp_pb2.Event()
+                update = event.ui_updates.add(element_name="text")
+                update.state.textfield_state.current_text = "hello"
+                server.SendEvent(event, "StartupApp")
+
+        sender = threading.Thread(target=SendFirstEvent)
+        sender.start()
+        try:
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    os.path.join(os.path.dirname(__file__), "StartupApp.py"),
+                    target,
+                    reportFile.name,
+                ],
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            self.assertEqual(0, result.returncode, result.stderr)
+            self.assertNotIn("ERROR", result.stderr)
+            report = StartupProfiler.ReadReport(reportFile.name)
+        finally:
+            sender.join()
+            server.Stop()
+            os.remove(reportFile.name)
+
+        self.assertIsInstance(report, StartupReport)
+        self.assertEqual("StartupApp", report.appName)
+        for name in [
+            PHASE_IMPORT_GRPC,
+            PHASE_IMPORT_MESSAGES,
+            PHASE_CONNECT,
+            PHASE_FIRST_EVENT,
+        ]:
+            self.assertIsNotNone(report.GetDuration(name), name)
+        self.assertFalse(report.phases[-1].preloaded)
+        # the first event phase starts when Connect() returned
+        phases = {phase.name: phase for phase in report.phases}
+        connect = phases[PHASE_CONNECT]
+        self.assertAlmostEqual(
+            connect.start + connect.duration, phases[PHASE_FIRST_EVENT].start, delta=0.1
+        )
+        self.assertGreater(report.connectTiming["total"], 0)
+        self.assertEqual([], report.GetExceeded(STARTUP_BUDGETS), report.ToString())
@@ -0,0 +1,104 @@
+import threading
+import time
+import unittest
+
+from rcapp.TimerService import TimerService
+
+
+class TimerServiceTest(unittest.TestCase):
+    def setUp(self):
+        self.timers = TimerService(resolution=0.005, slots=16)
+        self.called = []
+        self.calledEvent = threading.Event()
+
+    def tearDown(self):
+        self.timers.Shutdown()
+
+    def Callback(self, value):
+        def Call():
+            self.called.append((value, time.perf_counter()))
+            self.calledEvent.set()
+
+        return Call
+
+    def test_init(self):
+        with self.assertRaises(RuntimeError):
+            TimerService(resolution=0)
+        self.assertEqual(0, self.timers.GetPendingCount())
+
+    def test_CallLater(self):
+        startTime = time.perf_counter()
+        self.timers.CallLater(0.05, self.Callback(2))
+        self.timers.CallLater(0.01, self.Callback(1))
+        # longer than one round of the wheel (16 * 5ms)
+        self.timers.CallLater(0.15, self.Callback(3))
+        self.assertEqual(3, self.timers.GetPendingCount())
+
+        time.sleep(0.3)
+        self.assertEqual([1, 2, 3], [value for value, _ in self.called])
+        for (value, calledTime), delay in zip(self.called, (0.01, 0.05, 0.15)):
+            self.assertGreaterEqual(calledTime - startTime, delay)
+            self.assertLess(calledTime - startTime, delay + 0.05)
+        self.assertEqual(0, self.timers.GetPendingCount())
+
+    def test_Cancel(self):
+        handle = self.timers.CallLater(0.02, self.Callback(1))
+        self.assertTrue(handle.Cancel())
+        self.assertFalse(handle.Cancel())
+        self.assertTrue(handle.IsDone())
+        time.sleep(0.05)
+        self.assertEqual([], self.called)
+
+    def test_ManyTimers(self):
+        count = 5000
+        for i in range(count):
+            self.timers.CallLater((i % 50) * 0.001, self.Callback(i))
+        endTime = time.time() + 2
+        while len(self.called) < count and time.time() < endTime:
+            time.sleep(0.01)
+        self.assertEqual(count, len(self.called))
+        # all timers share one thread
+        self.assertLess(threading.active_count(), 10)
+
+    def test_CallWhen(self):
+        handle = self.timers.CallWhen(lambda value: value > 2, self.Callback("done"))
+        self.assertTrue(self.timers.HasConditions())
+        self.timers.CheckConditions(1)
+        self.assertEqual([], self.called)
+        self.timers.CheckConditions(3)
+        self.assertEqual(["done"], [value for value, _ in self.called])
+        self.assertTrue(handle.IsDone())
+        self.assertFalse(self.timers.HasConditions())
+
+        # a failing predicate does not stop the other conditions
+        self.timers.CallWhen(lambda value: value.missing, self.Callback("raised"))
+        handle = self.timers.CallWhen(lambda value: True, self.Callback("other"))
+        self.timers.CheckConditions(1)
+        self.assertEqual("other", self.called[-1][0])
+
+    def test_CallWhenTimeout(self):
+        handle = self.timers.CallWhen(
+            lambda value: False,
+            self.Callback("done"),
+            timeout=0.02,
+            onTimeout=self.Callback("timeout"),
+        )
+        self.assertTrue(self.calledEvent.wait(1))
+        self.assertEqual(["timeout"], [value for value, _ in self.called])
+        self.assertTrue(handle.IsDone())
+        self.assertFalse(self.timers.HasConditions())
+        # the condition is not checked anymore
+        self.timers.CheckConditions(1)
+        self.assertEqual(1, len(self.called))
+
+        handle = self.timers.CallWhen(
+            lambda value: False, self.Callback("done"), 0.02, self.Callback("timeout")
+        )
+        self.assertTrue(handle.Cancel())
+        time.sleep(0.05)
+        self.assertEqual(1, len(self.called))
+        self.assertEqual(0, self.timers.GetPendingCount())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import queue
+import time
+import unittest
+
+from rcapp.UiEventCoalescer import UiEventCoalescer
+from rcapp import robotcontrolapp_pb2
+
+
+def MakeNumber(element: str, value: float) -> robotcontrolapp_pb2.AppUIElement:
+    update = robotcontrolapp_pb2.AppUIElement(element_name=element)
+    update.state.numberfield_state.current_number = value
+    return update
+
+
+def MakeClick(element: str) -> robotcontrolapp_pb2.AppUIElement:
+    update = robotcontrolapp_pb2.AppUIElement(element_name=element)
+    update.state.button_state = robotcontrolapp_pb2.ButtonState.CLICKED
+    return update
+
+
+def Describe(update: robotcontrolapp_pb2.AppUIElement):
+    if update.state.WhichOneof("state") == "button_state":
+        return (update.element_name, "clicked")
+    return (update.element_name, update.state.numberfield_state.current_number)
+
+
+class UiEventCoalescerTest(unittest.TestCase):
+    def setUp(self):
+        self.delivered = queue.Queue()
+        self.coalescer = UiEventCoalescer(
+            lambda updates: self.delivered.put([Describe(u) for u in updates])
+        )
+
+    def tearDown(self):
+        self.coalescer.Stop()
+
+    def test_Collapse(self):
+        startTime = time.perf_counter()
+        self.coalescer.Add([MakeNumber("a1", 1), MakeNumber("a2", 5)], 0.1)
+        self.coalescer.Add([MakeNumber("a1", 12)], 0.1)
+        self.coalescer.Add([MakeNumber("a1", 123)], 0.1)
+        self.assertEqual([("a2", 5), ("a1", 123)], self.delivered.get(timeout=5))
+        self.assertGreaterEqual(time.perf_counter() - startTime, 0.1)
+
+        metrics = self.coalescer.GetMetrics(reset=True)
+        self.assertEqual(4, metrics.received)
+        self.assertEqual(2, metrics.delivered)
+        self.assertEqual(2, metrics.collapsed)
+        self.assertEqual(0, self.coalescer.GetMetrics().received)
+
+    def test_ButtonsAlwaysDelivered(self):
+        self.coalescer.Add([MakeNumber("a1", 1), MakeNumber("a1", 2)], 10)
+        self.coalescer.Add([MakeClick("move"), MakeClick("move")], 10)
+        # the button flushes the collected updates without waiting for the window
+        self.assertEqual(
+            [("a1", 2), ("move", "clicked"), ("move", "clicked")],
+            self.delivered.get(timeout=5),
+        )
+        self.assertEqual(1, self.coalescer.GetMetrics().collapsed)
+
+    def test_Stop(self):
+        self.coalescer.Add([MakeNumber("a1", 1)], 10)
+        self.coalescer.Stop()
+        self.coalescer.Add([MakeNumber("a1", 2)], 0.01)
+        self.assertEqual([("a1", 2)], self.delivered.get(timeout=5))
+        self.assertTrue(self.delivered.empty())
+
+
+if __name__ == "__main__":
+    unittest.main()
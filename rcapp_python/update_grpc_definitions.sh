@@ -0,0 +1,6 @@
+#!/bin/sh
+# Regenerates the GRPC Python definition files. Call this after updating protos/robotcontrolapp.proto
+../venv/Scripts/activate.bat
+py -V:3.9.2 -m grpc_tools.protoc -Iprotos --python_out=rcapp --pyi_out=rcapp --grpc_python_out=rcapp protos/robotcontrolapp.proto
+# The generated client imports the messages as a top level module, import them from the package instead
+sed -i "s/^import robotcontrolapp_pb2 as/from . import robotcontrolapp_pb2 as/" rcapp/robotcontrolapp_pb2_grpc.py